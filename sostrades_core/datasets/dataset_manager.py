@@ -14,7 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 import logging
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import Any, Dict, List, Optional
 
 from sostrades_core.datasets.dataset import Dataset
 from sostrades_core.datasets.dataset_info.abstract_dataset_info import AbstractDatasetInfo
@@ -56,37 +58,196 @@ class DatasetsManager:
         Returns:
             Dict[str, Dict[str, Any]]: Data dict of data names and retrieved values plus a DATASET_INFO field with DatasetInfo object.
         """
-        self.__logger.debug(f"Fetching data {data_dict.keys()} from datasets {datasets_info}")
-        data_retrieved = {}
+        return self.fetch_data_from_datasets_batch(namespaced_datasets_info={None: datasets_info},
+                                                   namespaced_data_dict={None: data_dict})[None]
 
-        for dataset_info, mapping_parameters in datasets_info.items():
+    def fetch_data_from_datasets_batch(self,
+                                       namespaced_datasets_info: Dict[str, Dict[AbstractDatasetInfo, Dict[str, str]]],
+                                       namespaced_data_dict: Dict[str, Dict[str, str]],
+                                       max_workers: Optional[int] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Fetches data of several namespaces from datasets. The parameters requested to a dataset by all the namespaces
+        are fetched in a single request, the datasets of a connector are fetched in a single call if the connector
+        supports bulk reads, and the datasets of different connectors are fetched concurrently.
+
+        Args:
+            namespaced_datasets_info (Dict[str, Dict[AbstractDatasetInfo, Dict[str, str]]]): Datasets associated to
+                each namespace with their parameters mapping.
+            namespaced_data_dict (Dict[str, Dict[str, str]]): Dict of data to be fetched in datasets with their types
+                for each namespace.
+            max_workers (int, optional): Maximal number of connectors fetched concurrently. Defaults to the number of
+                connectors.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: For each namespace, data dict of data names and retrieved values plus a
+            DATASET_INFO field with DatasetInfo object.
+        """
+        # requests of each namespace to each dataset, in the order of the datasets mapping
+        namespaced_requests = {}
+        # parameters to fetch in each dataset, several fetches for a dataset only if namespaces give different types
+        # to a same parameter
+        data_to_fetch_per_dataset = {}
+        for namespace, datasets_info in namespaced_datasets_info.items():
+            data_dict = namespaced_data_dict[namespace]
+            self.__logger.debug(f"Fetching data {data_dict.keys()} from datasets {datasets_info}")
+            namespaced_requests[namespace] = []
+            for dataset_info, mapping_parameters in datasets_info.items():
+                data_to_fetch, dataset_data_reverse_mapping = self.__get_data_to_fetch(mapping_parameters, data_dict)
+                fetches = data_to_fetch_per_dataset.setdefault(dataset_info, [])
+                fetch_index = self.__merge_data_to_fetch(fetches, data_to_fetch)
+                namespaced_requests[namespace].append((dataset_info, fetch_index, data_to_fetch,
+                                                       dataset_data_reverse_mapping))
+
+        fetched_values = self.__fetch_datasets(data_to_fetch_per_dataset, max_workers)
+
+        namespaced_data_retrieved = {}
+        # values already given to a namespace, the other namespaces get a copy so that variables do not share values
+        used_values = set()
+        for namespace, requests in namespaced_requests.items():
+            data_retrieved = {}
+            for dataset_info, fetch_index, data_to_fetch, dataset_data_reverse_mapping in requests:
+                dataset_values = fetched_values[dataset_info][fetch_index]
+                dataset_data = {}
+                for key, value in dataset_values.items():
+                    if key in data_to_fetch:
+                        if (dataset_info, fetch_index, key) in used_values:
+                            value = deepcopy(value)
+                        else:
+                            used_values.add((dataset_info, fetch_index, key))
+                        # Update internal dictionary adding provenance (DatasetInfo object) for tracking parameter changes
+                        dataset_data[dataset_data_reverse_mapping[key]] = {self.VALUE: value,
+                                                                           self.DATASET_INFO: dataset_info}
+                data_retrieved.update(dataset_data)
+            namespaced_data_retrieved[namespace] = data_retrieved
+        return namespaced_data_retrieved
+
+    @staticmethod
+    def __get_data_to_fetch(mapping_parameters: Dict[str, str], data_dict: Dict[str, str]):
+        """
+        Gets the parameters to fetch in a dataset for a namespace.
+
+        Args:
+            mapping_parameters (Dict[str, str]): Mapping of the namespace data names to the dataset data names.
+            data_dict (Dict[str, str]): Dict of data to be fetched with their types.
+
+        Returns:
+            tuple: Dict of dataset data names and types to fetch, dict of dataset data names to namespace data names.
+        """
+        data_to_fetch = {}
+        dataset_data_reverse_mapping = {}
+        # we get the data_dataset_key for each param that is in data_dict
+        # it is done in a loop so that it respect the order of appearance
+        # (ie: if there is a *:* and then a:b, the a:b replace the *:* for the 'a' parameter)
+        for data_key, data_dataset_key in mapping_parameters.items():
+            if data_dataset_key == AbstractDatasetInfo.WILDCARD:
+                dataset_data_reverse_mapping.update({key: key for key in data_dict.keys()})
+                data_to_fetch.update(data_dict)
+            elif data_key in data_dict.keys():
+                dataset_data_reverse_mapping.update({data_dataset_key: data_key})
+                data_to_fetch.update({data_dataset_key: data_dict[data_key]})
+        return data_to_fetch, dataset_data_reverse_mapping
+
+    @staticmethod
+    def __merge_data_to_fetch(fetches: List[Dict[str, str]], data_to_fetch: Dict[str, str]) -> int:
+        """
+        Merges the parameters to fetch in a dataset with the first fetch of this dataset with no type conflict.
+
+        Args:
+            fetches (List[Dict[str, str]]): Parameters and types of the fetches of the dataset, updated in place.
+            data_to_fetch (Dict[str, str]): Parameters and types to fetch.
+
+        Returns:
+            int: Index of the fetch in which the parameters are fetched.
+        """
+        for fetch_index, fetch in enumerate(fetches):
+            if all(fetch.get(key, data_type) == data_type for key, data_type in data_to_fetch.items()):
+                fetch.update(data_to_fetch)
+                return fetch_index
+        fetches.append(dict(data_to_fetch))
+        return len(fetches) - 1
+
+    def __fetch_datasets(self, data_to_fetch_per_dataset: Dict[AbstractDatasetInfo, List[Dict[str, str]]],
+                         max_workers: Optional[int]) -> Dict[AbstractDatasetInfo, List[Dict[str, Any]]]:
+        """
+        Fetches the datasets, connector by connector on a thread pool.
+
+        Args:
+            data_to_fetch_per_dataset (Dict[AbstractDatasetInfo, List[Dict[str, str]]]): Parameters and types of the
+                fetches of each dataset.
+            max_workers (int, optional): Maximal number of connectors fetched concurrently.
+
+        Returns:
+            Dict[AbstractDatasetInfo, List[Dict[str, Any]]]: Retrieved values of each fetch of each dataset.
+        """
+        # a connector is not thread safe (its serializer holds the dataset being read) so its datasets are fetched
+        # sequentially, only the different connectors are fetched concurrently
+        datasets_per_connector = {}
+        for dataset_info in data_to_fetch_per_dataset:
             try:
                 # Get the dataset, creates it if not exists
                 dataset = self.get_dataset(dataset_info=dataset_info)
-
-                # get the list of parameters to get
-                data_to_fetch = {}
-                dataset_data_reverse_mapping = {}
-                # we get the data_dataset_key for each param that is in data_dict
-                # it is done in a loop so that it respect the order of appearance
-                # (ie: if there is a *:* and then a:b, the a:b replace the *:* for the 'a' parameter)
-                for data_key, data_dataset_key in mapping_parameters.items():
-                    if data_dataset_key == AbstractDatasetInfo.WILDCARD:
-                        dataset_data_reverse_mapping.update({key: key for key in data_dict.keys()})
-                        data_to_fetch.update(data_dict)
-                    elif data_key in data_dict.keys():
-                        dataset_data_reverse_mapping.update({data_dataset_key: data_key})
-                        data_to_fetch.update({data_dataset_key: data_dict[data_key]})
-
-                # Retrieve values
-                dataset_values = dataset.get_values(data_dict=data_to_fetch)
-                # Update internal dictionary adding provenance (DatasetInfo object) for tracking parameter changes
-                dataset_data = {dataset_data_reverse_mapping[key]: {self.VALUE: value,
-                                    self.DATASET_INFO: dataset_info} for key, value in dataset_values.items()}
-                data_retrieved.update(dataset_data)
             except DatasetGenericException as exception:
                 raise DatasetGenericException(f'Error fetching dataset "{dataset_info.dataset_id}" of datasets connector "{dataset_info.connector_id}": {exception}')
-        return data_retrieved
+            datasets_per_connector.setdefault(id(dataset.connector), []).append(dataset)
+
+        connector_datasets_list = list(datasets_per_connector.values())
+        if max_workers is None:
+            max_workers = len(connector_datasets_list)
+        if max_workers > 1 and len(connector_datasets_list) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(lambda datasets: self.__fetch_connector_datasets(
+                    datasets, data_to_fetch_per_dataset), connector_datasets_list))
+        else:
+            results = [self.__fetch_connector_datasets(datasets, data_to_fetch_per_dataset)
+                       for datasets in connector_datasets_list]
+
+        fetched_values = {}
+        for result in results:
+            fetched_values.update(result)
+        return fetched_values
+
+    @staticmethod
+    def __fetch_connector_datasets(datasets: List[Dataset],
+                                   data_to_fetch_per_dataset: Dict[AbstractDatasetInfo, List[Dict[str, str]]]
+                                   ) -> Dict[AbstractDatasetInfo, List[Dict[str, Any]]]:
+        """
+        Fetches datasets of a same connector, in a single bulk read per round of fetches if the connector supports it.
+
+        Args:
+            datasets (List[Dataset]): Datasets of the connector.
+            data_to_fetch_per_dataset (Dict[AbstractDatasetInfo, List[Dict[str, str]]]): Parameters and types of the
+                fetches of each dataset.
+
+        Returns:
+            Dict[AbstractDatasetInfo, List[Dict[str, Any]]]: Retrieved values of each fetch of each dataset.
+        """
+        connector = datasets[0].connector
+        fetched_values = {dataset.dataset_info: [] for dataset in datasets}
+        n_rounds = max(len(data_to_fetch_per_dataset[dataset.dataset_info]) for dataset in datasets)
+        for fetch_round in range(n_rounds):
+            round_datasets = [dataset for dataset in datasets
+                              if fetch_round < len(data_to_fetch_per_dataset[dataset.dataset_info])]
+            bulk_values = None
+            if len(round_datasets) > 1:
+                data_to_get_per_dataset = {dataset.dataset_info: data_to_fetch_per_dataset[dataset.dataset_info][
+                    fetch_round] for dataset in round_datasets}
+                try:
+                    bulk_values = connector.get_values_for_datasets(data_to_get_per_dataset=data_to_get_per_dataset)
+                except DatasetGenericException as exception:
+                    datasets_ids = ', '.join(f'"{dataset.dataset_info.dataset_id}"' for dataset in round_datasets)
+                    raise DatasetGenericException(f'Error fetching datasets {datasets_ids} of datasets connector "{round_datasets[0].dataset_info.connector_id}": {exception}')
+            for dataset in round_datasets:
+                dataset_info = dataset.dataset_info
+                if bulk_values is not None:
+                    fetched_values[dataset_info].append(bulk_values.get(dataset_info, {}))
+                    continue
+                try:
+                    # Retrieve values
+                    fetched_values[dataset_info].append(dataset.get_values(
+                        data_dict=data_to_fetch_per_dataset[dataset_info][fetch_round]))
+                except DatasetGenericException as exception:
+                    raise DatasetGenericException(f'Error fetching dataset "{dataset_info.dataset_id}" of datasets connector "{dataset_info.connector_id}": {exception}')
+        return fetched_values
 
     def get_dataset(self, dataset_info: AbstractDatasetInfo) -> Dataset:
         """
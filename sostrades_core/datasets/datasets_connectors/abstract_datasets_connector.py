@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import abc
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from sostrades_core.datasets.dataset_info.dataset_info_versions import VERSION_V0
 
@@ -115,6 +115,38 @@ class AbstractDatasetsConnector(abc.ABC):
             Dict[str, Any]: Retrieved data
         """
 
+    def get_values_for_datasets(self, data_to_get_per_dataset: Dict[AbstractDatasetInfo, Dict[str, str]]) -> Optional[Dict[AbstractDatasetInfo, Dict[str, Any]]]:
+        """
+        Get lists of data from several datasets of the connector in a single read, if the connector supports it
+
+        Args:
+            data_to_get_per_dataset (Dict[AbstractDatasetInfo, Dict[str, str]]): for each dataset identifier, dict of
+                data name and type of data to get {name: type}
+
+        Returns:
+            Optional[Dict[AbstractDatasetInfo, Dict[str, Any]]]: Retrieved data for each dataset, None if the connector
+            does not support bulk reads
+        """
+        for dataset_identifier in data_to_get_per_dataset:
+            self.check_dataset_info_version(dataset_identifier)
+        return self._get_values_for_datasets(data_to_get_per_dataset=data_to_get_per_dataset)
+
+    def _get_values_for_datasets(self, data_to_get_per_dataset: Dict[AbstractDatasetInfo, Dict[str, str]]) -> Optional[Dict[AbstractDatasetInfo, Dict[str, Any]]]:
+        """
+        Method that can be overloaded by connectors able to get data from several datasets in a single read (bulk
+        query, single file...). By default the bulk read is not supported and the datasets are read one by one with
+        get_values
+
+        Args:
+            data_to_get_per_dataset (Dict[AbstractDatasetInfo, Dict[str, str]]): for each dataset identifier, dict of
+                data name and type of data to get {name: type}
+
+        Returns:
+            Optional[Dict[AbstractDatasetInfo, Dict[str, Any]]]: Retrieved data for each dataset, None if the connector
+            does not support bulk reads
+        """
+        return None
+
     def write_values(self, dataset_identifier: AbstractDatasetInfo, values_to_write: Dict[str, Any], data_types_dict: Dict[str, str]) -> Dict[str, Any]:
         """
         Write data to a specific API
@@ -52,14 +52,50 @@ def _load_dataframe(file_path: str) -> pd.DataFrame:
     """
     Load a DataFrame from a CSV file.
 
+    The numerical and boolean columns are parsed natively by pandas, only the cells of the object columns (strings,
+    arrays, lists...) are evaluated.
+
     Args:
         file_path (str): The path to the CSV file.
 
     Returns:
         pd.DataFrame: The loaded DataFrame.
     """
-    df_value = pd.read_csv(file_path, na_filter=False)
-    return df_value.map(isevaluatable)
+    return _evaluate_object_columns(pd.read_csv(file_path, na_filter=False))
+
+
+# results of the evaluation of a cell that can be shared by the cells with the same string
+_IMMUTABLE_EVALUATED_TYPES = (str, int, float, complex, bool, type(None))
+
+
+def _evaluate_object_columns(df_value: pd.DataFrame) -> pd.DataFrame:
+    """
+    Evaluate the cells of the object columns of a DataFrame read from a CSV file, the other columns are kept as parsed
+    since isevaluatable does not modify their values.
+
+    Args:
+        df_value (pd.DataFrame): The DataFrame read from the CSV file.
+
+    Returns:
+        pd.DataFrame: The DataFrame with evaluated object columns.
+    """
+    object_columns = [column for column, dtype in df_value.dtypes.items() if pd.api.types.is_object_dtype(dtype)]
+    if object_columns:
+        df_value = df_value.copy(deep=False)
+        for column in object_columns:
+            evaluated_cells = {}
+
+            def evaluate_cell(cell):
+                if cell in evaluated_cells:
+                    return evaluated_cells[cell]
+                evaluated_cell = isevaluatable(cell)
+                # mutable results (lists, arrays, dicts) are evaluated for each cell to avoid sharing them
+                if isinstance(evaluated_cell, _IMMUTABLE_EVALUATED_TYPES):
+                    evaluated_cells[cell] = evaluated_cell
+                return evaluated_cell
+
+            df_value[column] = df_value[column].map(evaluate_cell)
+    return df_value
 
 
 class FileSystemDatasetsSerializer(JSONDatasetsSerializer):
@@ -92,11 +92,20 @@ class DataManager:
                  root_dir=None,
                  rw_object=None,
                  study_filename=None,
-                 ns_manager=None):
+                 ns_manager=None,
+                 compact_data_dict=False):
         '''
         Constructor
+
+        compact_data_dict: if True, the metadata of each variable of the data_dict is stored in a VariableMetadata
+        (slots and shared defaults) instead of a dict
         '''
         self.no_change = True
+        # ids of the variables whose value has been set and ids of the disciplines configured since the last
+        # pop_configure_changes, used by the incremental configuration of the ExecutionEngine
+        self.changed_var_ids = set()
+        self.configured_disc_ids = set()
+        self.compact_data_dict = compact_data_dict
         self.name = name
         self.rw_object = rw_object
         self.root_dir = root_dir
@@ -104,6 +113,14 @@ class DataManager:
         self.ns_manager = ns_manager
         self.data_dict = None
         self.data_id_map = None
+        # (full_name, var_id, var_name) of the variables of data_dict, rebuilt only when variables are added or removed
+        self.__full_name_index = None
+        self.__full_name_index_token = None
+        self.__data_structure_version = 0
+        # short variable name (last segment of the full name) -> {full_name: var_id} in the order of data_id_map,
+        # updated incrementally when variables are added or removed
+        self.__short_name_index = None
+        self.__short_name_index_token = None
         self.disciplines_dict = None
         self.disciplines_id_map = None
         self.gemseo_disciplines_id_map = None
@@ -157,12 +174,13 @@ class DataManager:
         '''
         Fill gemseo discipline cache from cache_map using gemseo_disciplines_id_map
         '''
-        # update cache of all gemseo disciplines with loaded cache_map
-        for disc_id, serialized_cache in cache_map.items():
+        # update cache of all gemseo disciplines with loaded cache_map, the cache of a discipline is accessed only if
+        # the discipline exists since it may be read and unanonymized at its access
+        for disc_id in cache_map:
             if disc_id in self.gemseo_disciplines_id_map:
                 disc_cache = self.cache_map[disc_id]
                 self.fill_cache_with_serialized_cache(
-                    disc_cache, serialized_cache)
+                    disc_cache, cache_map[disc_id])
 
     #                 for disc in self.gemseo_disciplines_id_map[disc_id]:
     #                     disc.cache = disc_cache
@@ -192,6 +210,91 @@ class DataManager:
         self.disciplines_dict = {}
         self.disciplines_id_map = {}
         self.no_check_default_variables = []
+        self.invalidate_full_name_index()
+
+    def invalidate_full_name_index(self):
+        '''
+        Force the rebuild of the full name and short name indexes of the data_dict, to call after adding or removing
+        variables in the data_dict or data_id_map outside of the DataManager methods
+        '''
+        self.__invalidate_full_name_index()
+        self.__short_name_index = None
+
+    def __invalidate_full_name_index(self):
+        self.__data_structure_version += 1
+        self.__full_name_index = None
+
+    def __get_short_name_index(self):
+        '''
+        Return the dict {short_name: {full_name: var_id}} of the variables of data_id_map
+        '''
+        token = (id(self.data_id_map), len(self.data_id_map))
+        if self.__short_name_index is None or self.__short_name_index_token != token:
+            short_name_index = {}
+            for full_name, var_id in self.data_id_map.items():
+                short_name_index.setdefault(full_name.rsplit('.', 1)[-1], {})[full_name] = var_id
+            self.__short_name_index = short_name_index
+            self.__short_name_index_token = token
+        return self.__short_name_index
+
+    def __add_in_short_name_index(self, full_name, var_id):
+        '''
+        Add a variable just added in data_id_map to the short name index, which is rebuilt at next use if it was
+        already out of date
+        '''
+        token = (id(self.data_id_map), len(self.data_id_map))
+        if self.__short_name_index is not None and self.__short_name_index_token == (token[0], token[1] - 1):
+            self.__short_name_index.setdefault(full_name.rsplit('.', 1)[-1], {})[full_name] = var_id
+            self.__short_name_index_token = token
+        else:
+            self.__short_name_index = None
+
+    def __remove_from_short_name_index(self, full_name):
+        '''
+        Remove a variable just removed from data_id_map from the short name index, which is rebuilt at next use if it
+        was already out of date
+        '''
+        token = (id(self.data_id_map), len(self.data_id_map))
+        if self.__short_name_index is not None and self.__short_name_index_token == (token[0], token[1] + 1):
+            short_name = full_name.rsplit('.', 1)[-1]
+            full_names = self.__short_name_index.get(short_name, {})
+            full_names.pop(full_name, None)
+            if not full_names:
+                self.__short_name_index.pop(short_name, None)
+            self.__short_name_index_token = token
+        else:
+            self.__short_name_index = None
+
+    def __get_full_names_from_var_name(self, var_name):
+        '''
+        Return the full names of data_id_map ending with .var_name, var_name may contain dots
+        '''
+        full_names = self.__get_short_name_index().get(var_name.rsplit('.', 1)[-1], {})
+        suffix = f'.{var_name}'
+        return [full_name for full_name in full_names if full_name.endswith(suffix)]
+
+    def __get_full_name_index(self):
+        '''
+        Return the list of (full_name, var_id, var_name) of the variables of the data_dict in the order of data_id_map
+        For a full name mapped to a list of ids, the last id in data_dict is kept as in convert_dict_with_maps
+        '''
+        # the sizes and identities of the dicts also invalidate the index if they are modified outside of the DataManager
+        token = (self.__data_structure_version, id(self.data_dict), id(self.data_id_map),
+                 len(self.data_dict), len(self.data_id_map))
+        if self.__full_name_index is None or self.__full_name_index_token != token:
+            full_name_index = []
+            for full_name, var_id in self.data_id_map.items():
+                if isinstance(var_id, list):
+                    var_ids_in_dm = [val_element for val_element in var_id if val_element in self.data_dict]
+                    if not var_ids_in_dm:
+                        continue
+                    var_id = var_ids_in_dm[-1]
+                elif var_id not in self.data_dict:
+                    continue
+                full_name_index.append((full_name, var_id, full_name.split('.')[-1]))
+            self.__full_name_index = full_name_index
+            self.__full_name_index_token = token
+        return self.__full_name_index
 
     def get_data(self, var_f_name, attr=None):
         ''' Get attr value of var_f_name or all data_dict value of var_f_name (if attr=None)
@@ -238,13 +341,30 @@ class DataManager:
                 if self.data_dict[self.get_data_id(var_f_name)][attr] != val:
                     self.data_dict[self.get_data_id(var_f_name)][attr] = val
                     self.no_change = False
+                    if attr == VALUE:
+                        self.changed_var_ids.add(self.get_data_id(var_f_name))
             else:
                 self.data_dict[self.get_data_id(var_f_name)][attr] = val
+                if attr == VALUE:
+                    self.changed_var_ids.add(self.get_data_id(var_f_name))
         else:
             msg = f"Try to update metadata of variable {var_f_name} that does"
             msg += " not exists as I/O of any discipline"
             raise KeyError(msg)
 
+    def pop_configure_changes(self):
+        '''
+        Get and reset the ids of the variables whose value has been set and the ids of the disciplines configured since
+        the last call
+
+        Returns:
+            changed_var_ids (set[str]): ids of the variables whose value has been set
+            configured_disc_ids (set[str]): ids of the configured disciplines
+        '''
+        changed_var_ids, configured_disc_ids = self.changed_var_ids, self.configured_disc_ids
+        self.changed_var_ids, self.configured_disc_ids = set(), set()
+        return changed_var_ids, configured_disc_ids
+
     def get_io_data_of_disciplines(self, disciplines):
         ''' get i/o value and metadata of provided disciplines
         '''
@@ -305,19 +425,16 @@ class DataManager:
     def get_all_namespaces_from_var_name(self, var_name):
         ''' Get all namespaces containing var_name in data_dict
         '''
-        namespace_list = [key for key in self.data_id_map.keys() if key.endswith(f'.{var_name}')]
+        namespace_list = self.__get_full_names_from_var_name(var_name)
 
         return namespace_list
 
     def get_all_var_name_with_ns_key(self, var_name):
         ''' Get all namespaces containing var_name in data_dict plus their namespace key as a dict
         '''
-        namespace_list = [key for key in self.data_id_map.keys() if key.endswith('.' + var_name)]
-        if len(namespace_list) > 0:
-            ns_dict_obj = self.get_data_dict_attr('ns_reference')
-            return {ns: ns_dict_obj[ns].name for ns in namespace_list}
-        else:
-            return {}
+        namespace_list = self.__get_full_names_from_var_name(var_name)
+
+        return {ns: self.get_data(ns, NS_REFERENCE).name for ns in namespace_list}
 
     def get_data_id(self, var_f_name):
         ''' Get data id with var_f_name
@@ -337,6 +454,7 @@ class DataManager:
         for var_id in data_dict.keys():
             var_f_name = self.get_var_full_name(var_id)
             self.data_id_map[var_f_name] = var_id
+        self.invalidate_full_name_index()
 
     def generate_disciplines_id_map(self):
         ''' Generate disciplines_id_map with disciplines_dict
@@ -358,6 +476,7 @@ class DataManager:
             # if self.data_dict[k][ProxyDiscipline.VISIBILITY] == INTERNAL_VISIBILITY:
             #     raise Exception(f'It is not possible to update the variable {k} which has a visibility Internal')
             self.data_dict[k][VALUE] = value
+            self.changed_var_ids.add(k)
 
     def fill_data_dict_from_dict(self, values_dict: dict[str:Any],
                                  already_set_data: set[str], parameter_changes: list[ParameterChange],
@@ -459,15 +578,24 @@ class DataManager:
                 namespaced_data_dict[data_ns][DatasetsMapping.KEY][data_name] = key
                 namespaced_data_dict[data_ns][TYPE][data_name] = data_type
 
+        # retrieve the list of dataset associated to each namespace from the mapping
+        namespaced_datasets_info = {}
+        for namespace in namespaced_data_dict:
+            datasets_info = datasets_mapping.get_datasets_info_from_namespace(namespace, self.name)
+            if len(datasets_info) > 0:
+                namespaced_datasets_info[namespace] = datasets_info
+        # get data values of all the namespaces into the datasets into the right format, each dataset is read once
+        namespaced_updated_data = self.dataset_manager.fetch_data_from_datasets_batch(
+            namespaced_datasets_info=namespaced_datasets_info,
+            namespaced_data_dict={namespace: namespaced_data_dict[namespace][TYPE]
+                                  for namespace in namespaced_datasets_info})
+
         # iterate on each namespace to retrieve data in this namespace
         for namespace, data_dict in namespaced_data_dict.items():
 
-            datasets_info = datasets_mapping.get_datasets_info_from_namespace(namespace, self.name)
-            # retrieve the list of dataset associated to the namespace from the mapping
+            datasets_info = namespaced_datasets_info.get(namespace, {})
             if len(datasets_info) > 0:
-                # get data values into the dataset into the right format
-                updated_data = self.dataset_manager.fetch_data_from_datasets(
-                    datasets_info=datasets_info, data_dict=data_dict[TYPE])
+                updated_data = namespaced_updated_data[namespace]
                 self.logger.warning(f"Retrieved the namespace {namespace} with values: {list(updated_data.keys())}")
                 # update data values in dm
                 for data_name, new_data in updated_data.items():
@@ -535,6 +663,7 @@ class DataManager:
                                                          variable_key=variable_key))
 
         dm_data[VALUE] = new_value
+        self.changed_var_ids.add(key)
 
     def export_data_in_datasets(self, datasets_mapping: DatasetsMapping) -> list[ParameterChange]:
         '''
@@ -611,7 +740,8 @@ class DataManager:
     def convert_data_dict_with_full_name(self):
         ''' Return data_dict with namespaced keys
         '''
-        return self.convert_dict_with_maps(self.data_dict, self.data_id_map, keys='full_names')
+        data_dict = self.data_dict
+        return {full_name: data_dict[var_id] for full_name, var_id, _ in self.__get_full_name_index()}
 
     def convert_data_dict_with_display_name(self, exec_display=False):
         '''
@@ -640,32 +770,35 @@ class DataManager:
         '''
         Return a dictionaries with all full named keys in the dm and the value of each key from the dm
         '''
-        data_dict = self.convert_data_dict_with_full_name()
-        exception_list = []
-        if 'numerical' in excepted:
-            exception_list = list(ProxyDiscipline.NUM_DESC_IN.keys())
-
-        data_dict_values = {key: value.get(attr, None) for key, value in data_dict.items() if
-                            key.split('.')[-1] not in exception_list}
-
-        return data_dict_values
+        data_dict = self.data_dict
+        return {full_name: data_dict[var_id].get(attr, None)
+                for full_name, var_id in self.__get_filtered_full_name_index(excepted)}
 
     def get_data_dict_list_attr(self, list_attr, excepted=[]):
         """
          Return a dictionary of dictionary with all full named keys in the dm and the value of each key from the dm
          output : dict[key][attr] for each attr in list_attr
         """
+        # single pass over the variables, each metadata is read once for all the attributes
+        data_dict = self.data_dict
         data_dict_values_dict = {}
-        data_dict_values_list = [self.get_data_dict_attr(
-            attr, excepted) for attr in list_attr]
-
-        for key in data_dict_values_list[0].keys():
-            data_dict_values_dict[key] = {}
-            for index, attr in enumerate(list_attr):
-                data_dict_values_dict[key][attr] = data_dict_values_list[index][key]
+        for full_name, var_id in self.__get_filtered_full_name_index(excepted):
+            var_data = data_dict[var_id]
+            data_dict_values_dict[full_name] = {attr: var_data.get(attr, None) for attr in list_attr}
 
         return data_dict_values_dict
 
+    def __get_filtered_full_name_index(self, excepted):
+        '''
+        Return the (full_name, var_id) of the full name index without the numerical variables if 'numerical' is excepted
+        '''
+        full_name_index = self.__get_full_name_index()
+        if 'numerical' in excepted:
+            exception_list = ProxyDiscipline.NUM_DESC_IN.keys()
+            return [(full_name, var_id) for full_name, var_id, var_name in full_name_index
+                    if var_name not in exception_list]
+        return [(full_name, var_id) for full_name, var_id, _ in full_name_index]
+
     def convert_data_dict_with_ids(self, dict_to_convert):
         ''' Return data_dict with ids keys
         '''
@@ -795,6 +928,7 @@ class DataManager:
                         if self.data_dict[var_id][VALUE] is not None:
                             disc_dict[var_name][VALUE] = self.data_dict[var_id][VALUE]
                         self.data_dict[var_id] = disc_dict[var_name]
+                        self.changed_var_ids.add(var_id)
                 if disc_id not in self.data_dict[var_id][DISCIPLINES_DEPENDENCIES]:
                     self.data_dict[var_id][DISCIPLINES_DEPENDENCIES].append(
                         disc_id)
@@ -807,6 +941,8 @@ class DataManager:
                 self.no_change = False
                 self.data_dict[var_id] = disc_dict[var_name]
                 self.data_id_map[var_f_name] = var_id
+                self.__add_in_short_name_index(var_f_name, var_id)
+                self.__invalidate_full_name_index()
             # END update method
 
         for var_name in disc_dict.keys():
@@ -862,6 +998,8 @@ class DataManager:
         '''
         self.no_change = False
         self.data_dict[var_id].update(data_dict)
+        if VALUE in data_dict:
+            self.changed_var_ids.add(var_id)
 
     def create_treeview(self, root_process, process_module, no_data=False, read_only=False, exec_display=False):
         '''
@@ -922,6 +1060,8 @@ class DataManager:
                         # discipline dependency
                         del self.data_dict[var_id]
                         del self.data_id_map[var_f_name]
+                        self.__remove_from_short_name_index(var_f_name)
+                        self.__invalidate_full_name_index()
                     else:
                         # only one discipline can declare a variable as output then if this key is removed from the discipline and the variable still exists
                         # then the variable becomes an input
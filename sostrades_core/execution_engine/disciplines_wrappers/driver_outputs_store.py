@@ -0,0 +1,191 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+
+from __future__ import annotations
+
+import mmap
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# dtype kinds stored in buffers: booleans, integers, floats and complex numbers
+NUMERIC_KINDS = 'biufc'
+
+
+class _OutputBuffer:
+    """Buffer of the values of one output for all the scenarios, an array of shape (n_scenarios, *value_shape)."""
+
+    def __init__(self, n_scenarios: int, value: np.ndarray | float, shared: bool):
+        """
+        Arguments:
+            n_scenarios (int): number of scenarios
+            value (ndarray or float): value of a first scenario, that sets the shape and dtype of the buffer
+            shared (bool): whether to allocate the buffer in an anonymous shared memory mapping, so that the processes
+                forked afterwards write in the same buffer
+        """
+        self.is_float = isinstance(value, float)
+        value = np.asarray(value)
+        shape = (n_scenarios, *value.shape)
+        if shared:
+            self.array = np.frombuffer(mmap.mmap(-1, n_scenarios * value.nbytes), dtype=value.dtype).reshape(shape)
+        else:
+            self.array = np.empty(shape, dtype=value.dtype)
+
+    @staticmethod
+    def can_store(value: Any) -> bool:
+        """Return True if the value is a float or a non empty numeric array."""
+        return type(value) is float or (
+            type(value) is np.ndarray and value.dtype.kind in NUMERIC_KINDS and value.size > 0)
+
+    def accepts(self, value: Any) -> bool:
+        """Return True if the value has the type, shape and dtype of the buffer."""
+        if self.is_float:
+            return type(value) is float
+        return (type(value) is np.ndarray and value.shape == self.array.shape[1:]
+                and value.dtype == self.array.dtype)
+
+    def write(self, index: int, value: np.ndarray | float) -> None:
+        self.array[index] = value
+
+    def read(self, index: int) -> np.ndarray | float:
+        """Return the value of a scenario, a view of the buffer for the arrays."""
+        if self.is_float:
+            return float(self.array[index])
+        return self.array[index]
+
+
+class DriverOutputsStore:
+    """
+    Store of the selected outputs of the scenarios evaluated by a driver.
+
+    The floats and the numeric arrays of each output are written in a buffer of shape (n_scenarios, *value_shape)
+    allocated with the value of the first stored scenario. In a parallel evaluation, the buffers are allocated before
+    the workers are forked in a shared memory mapping, so that the workers write their outputs directly in them. The
+    gathered outputs and the samples outputs dataframe are built on views of these buffers. The values that do not fit
+    in the buffer of their output (other shape or dtype, dataframes, non numeric types...) are kept as Python objects.
+    """
+
+    def __init__(self, output_names: list[str], n_scenarios: int, shared: bool = False):
+        """
+        Arguments:
+            output_names (list[string]): full names of the outputs
+            n_scenarios (int): number of scenarios
+            shared (bool): whether to allocate the buffers in shared memory, for workers forked after the allocation
+        """
+        self.output_names = list(output_names)
+        self.n_scenarios = n_scenarios
+        self.shared = shared
+        self.__buffers: dict[str, _OutputBuffer] | None = None
+        self.__objects: dict[str, dict[int, Any]] = {output_name: {} for output_name in self.output_names}
+
+    @property
+    def is_allocated(self) -> bool:
+        """Whether the buffers have been allocated."""
+        return self.__buffers is not None
+
+    def allocate(self, values: dict[str, Any]) -> None:
+        """
+        Allocate the buffers of the outputs with the values of a first scenario.
+
+        Arguments:
+            values (dict): full names and values of the outputs of a scenario
+        """
+        self.__buffers = {output_name: _OutputBuffer(self.n_scenarios, values[output_name], self.shared)
+                          for output_name in self.output_names if _OutputBuffer.can_store(values.get(output_name))}
+
+    def write_in_buffers(self, index: int, values: dict[str, Any]) -> dict[str, Any]:
+        """
+        Write the values of a scenario that fit in the buffers of their output, in a worker process.
+
+        Arguments:
+            index (int): index of the scenario
+            values (dict): full names and values of the outputs of the scenario
+
+        Returns:
+            remaining_values (dict): full names and values of the outputs not written in the buffers
+        """
+        remaining_values = {}
+        for output_name, value in values.items():
+            buffer = self.__buffers.get(output_name) if self.__buffers is not None else None
+            if buffer is not None and buffer.accepts(value):
+                buffer.write(index, value)
+            else:
+                remaining_values[output_name] = value
+        return remaining_values
+
+    def store(self, index: int, values: dict[str, Any], written_in_buffers: bool = False) -> None:
+        """
+        Store the values of a scenario, the buffers are allocated with the first stored scenario.
+
+        Arguments:
+            index (int): index of the scenario
+            values (dict): full names and values of the outputs of the scenario
+            written_in_buffers (bool): whether the values of the outputs missing in values have been written in the
+                buffers by a worker
+        """
+        if not self.is_allocated:
+            self.allocate(values)
+        remaining_values = self.write_in_buffers(index, values)
+        for output_name in self.output_names:
+            if output_name in remaining_values:
+                self.__objects[output_name][index] = remaining_values[output_name]
+            elif output_name in values or written_in_buffers:
+                self.__objects[output_name].pop(index, None)
+
+    def get_value(self, output_name: str, index: int) -> Any:
+        """
+        Return the value of an output for a scenario, a view of its buffer for the arrays.
+
+        Arguments:
+            output_name (string): full name of the output
+            index (int): index of the scenario
+        """
+        objects = self.__objects[output_name]
+        if index in objects:
+            return objects[index]
+        return self.__buffers[output_name].read(index)
+
+    def get_values(self, index: int) -> dict[str, Any]:
+        """Return the full names and values of the outputs of a scenario."""
+        return {output_name: self.get_value(output_name, index) for output_name in self.output_names}
+
+    def get_gathered_output(self, output_name: str, scenario_names: list[str]) -> dict[str, Any]:
+        """
+        Return the values of an output for all the scenarios.
+
+        Arguments:
+            output_name (string): full name of the output
+            scenario_names (list[string]): names of the scenarios, in the order of their indices
+        """
+        return {scenario_name: self.get_value(output_name, index) for index, scenario_name in enumerate(scenario_names)}
+
+    def get_samples_outputs_df(self, scenario_names: list[str], columns: list[str]) -> pd.DataFrame:
+        """
+        Return the dataframe of the outputs with one row per scenario.
+
+        Arguments:
+            scenario_names (list[string]): names of the scenarios, in the order of their indices
+            columns (list[string]): names of the columns of the outputs, in the order of output_names
+        """
+        data = {'scenario_name': scenario_names}
+        for column, output_name in zip(columns, self.output_names):
+            buffer = self.__buffers.get(output_name) if self.__buffers is not None else None
+            if buffer is not None and buffer.is_float and not self.__objects[output_name]:
+                data[column] = buffer.array
+            else:
+                data[column] = [self.get_value(output_name, index) for index in range(self.n_scenarios)]
+        return pd.DataFrame(data)
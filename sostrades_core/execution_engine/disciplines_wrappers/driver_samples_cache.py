@@ -0,0 +1,183 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from sostrades_core.tools.value_fingerprint import update_hasher
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_discipline_structure(discipline: Any) -> list:
+    """Return the description of the structure of a GEMSEO discipline and of its sub-disciplines.
+
+    Args:
+        discipline: The discipline.
+
+    Returns:
+        The class names, names and input and output names of the discipline and of its sub-disciplines.
+    """
+    return [type(discipline).__qualname__, discipline.name,
+            sorted(discipline.input_grammar.names), sorted(discipline.output_grammar.names),
+            [get_discipline_structure(sub_discipline) for sub_discipline in getattr(discipline, 'disciplines', [])]]
+
+
+class DriverSamplesCache:
+    """
+    Persistent cache of the outputs of the samples evaluated by a driver.
+
+    The outputs of a sample are pickled in a file of the cache directory named after the hash of the structure of
+    the subprocess, of its reference inputs and of the sample values, so that the samples already evaluated by any
+    previous run using the same directory are not evaluated again. When the size of the files exceeds the maximum
+    size, the least recently used entries are removed.
+    """
+
+    FILE_SUFFIX = '.pkl'
+
+    def __init__(self, cache_dir: str | Path, max_size: float):
+        """
+        Args:
+            cache_dir: The directory of the cache files, created if needed.
+            max_size: The maximum size of the cache files in bytes.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__base_hasher = None
+        # key -> [size, last access time] of the cache files
+        self.__entries = {}
+        for file_path in self.cache_dir.glob(f'*/*{self.FILE_SUFFIX}'):
+            stat = file_path.stat()
+            self.__entries[file_path.stem] = [stat.st_size, stat.st_mtime]
+
+    @property
+    def size(self) -> int:
+        """The size of the cache files in bytes."""
+        return sum(size for size, _ in self.__entries.values())
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def set_reference(self, structure: Any, reference_input_data: dict[str, Any]) -> None:
+        """Set the structure and the reference inputs of the subprocess on which the keys of the samples depend.
+
+        Args:
+            structure: The description of the structure of the subprocess and of its evaluated outputs.
+            reference_input_data: The full names and values of the reference inputs of the subprocess.
+        """
+        self.__base_hasher = hashlib.sha256()
+        update_hasher(self.__base_hasher, structure)
+        update_hasher(self.__base_hasher, reference_input_data)
+
+    def get_key(self, sample: dict[str, Any]) -> str:
+        """Return the key of a sample.
+
+        Args:
+            sample: The full names and values of the inputs modified by the sample.
+
+        Returns:
+            The key of the sample.
+        """
+        hasher = self.__base_hasher.copy()
+        update_hasher(hasher, sample)
+        return hasher.hexdigest()
+
+    def __get_file_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}{self.FILE_SUFFIX}'
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the outputs stored for a key and count the hit or the miss.
+
+        Args:
+            key: The key of the sample.
+
+        Returns:
+            The full names and values of the outputs, None if the sample is not in the cache.
+        """
+        if key in self.__entries:
+            file_path = self.__get_file_path(key)
+            try:
+                with open(file_path, 'rb') as cache_file:
+                    output_data = pickle.load(cache_file)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                LOGGER.warning('The driver cache file %s cannot be read and is removed', file_path)
+                self.__remove(key)
+            else:
+                file_path.touch()
+                self.__entries[key][1] = file_path.stat().st_mtime
+                self.hits += 1
+                return output_data
+        self.misses += 1
+        return None
+
+    def put(self, key: str, output_data: dict[str, Any]) -> None:
+        """Store the outputs of a sample then remove the least recently used entries if the cache is too large.
+
+        Args:
+            key: The key of the sample.
+            output_data: The full names and values of the outputs.
+        """
+        file_path = self.__get_file_path(key)
+        file_path.parent.mkdir(exist_ok=True)
+        # the file is written under a temporary name so that an interrupted run does not leave a truncated entry
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as tmp_file:
+                pickle.dump(output_data, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        stat = file_path.stat()
+        self.__entries[key] = [stat.st_size, stat.st_mtime]
+        self.__evict(keep_key=key)
+
+    def __evict(self, keep_key: str) -> None:
+        size = self.size
+        if size <= self.max_size:
+            return
+        for key in sorted(self.__entries, key=lambda entry_key: self.__entries[entry_key][1]):
+            if size <= self.max_size:
+                break
+            if key != keep_key:
+                size -= self.__entries[key][0]
+                self.__remove(key)
+                self.evictions += 1
+
+    def __remove(self, key: str) -> None:
+        self.__get_file_path(key).unlink(missing_ok=True)
+        del self.__entries[key]
+
+    def get_stats(self) -> dict[str, int]:
+        """Return the statistics of the cache.
+
+        Returns:
+            The numbers of hits, misses and evictions since the creation of the cache, its number of entries and the
+            size of its files in bytes.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': len(self),
+                'size': self.size}
@@ -16,13 +16,26 @@ limitations under the License.
 
 from __future__ import annotations
 
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
 import numpy as np
 import pandas as pd
+from gemseo.core.parallel_execution.callable_parallel_execution import (
+    CallableParallelExecution,
+)
 from tqdm import tqdm
 
 from sostrades_core.execution_engine.disciplines_wrappers.driver_evaluator_wrapper import (
     DriverEvaluatorWrapper,
 )
+from sostrades_core.execution_engine.disciplines_wrappers.driver_outputs_store import (
+    DriverOutputsStore,
+)
+from sostrades_core.execution_engine.disciplines_wrappers.driver_samples_cache import (
+    DriverSamplesCache,
+    get_discipline_structure,
+)
 from sostrades_core.execution_engine.disciplines_wrappers.sample_generator_wrapper import (
     SampleGeneratorWrapper,
 )
@@ -31,109 +44,280 @@ from sostrades_core.tools.conversion.conversion_sostrades_sosgemseo import (
     convert_new_type_into_array,
 )
 
+if TYPE_CHECKING:
+    import logging
+
+
+class SubprocessSampleEvaluator:
+    """
+    Callable shipped to the parallel workers that evaluates one sample of the driver subprocess.
+
+    The subprocess root discipline and its reference input data are copied once into each worker (at fork), only the
+    sample values and the selected outputs then go through the multiprocessing queues. With an outputs store allocated
+    in shared memory before the fork, the outputs that fit in its buffers are written in them by the worker and only
+    the other ones are sent back.
+    """
+
+    def __init__(self, sub_discipline, reference_input_data, eval_out_list, outputs_store=None):
+        """
+        Constructor.
+
+        Arguments:
+            sub_discipline (Discipline): discipline at the root of the subprocess to evaluate
+            reference_input_data (dict): full names and reference values for the subprocess inputs
+            eval_out_list (list[string]): full names of the outputs to send back to the driver
+            outputs_store (DriverOutputsStore): store whose shared buffers receive the outputs, None to send back all
+                the outputs
+        """
+        self.sub_discipline = sub_discipline
+        self.reference_input_data = reference_input_data
+        self.eval_out_list = eval_out_list
+        self.outputs_store = outputs_store
+
+    def __call__(self, indexed_sample):
+        """
+        Execute the subprocess with the reference inputs updated with the sample values.
+
+        Arguments:
+            indexed_sample (tuple[int, dict]): index of the sample in the outputs store, full names and values of the
+                inputs modified by the driver
+
+        Returns:
+            out_local_data (dict): full names and values of the selected outputs not written in the outputs store
+        """
+        index, sample = indexed_sample
+        input_data = {**self.reference_input_data, **sample}
+        local_data = self.sub_discipline.execute(input_data)
+        out_local_data = {key: value for key, value in local_data.items() if key in self.eval_out_list}
+        if self.outputs_store is None:
+            return out_local_data
+        return self.outputs_store.write_in_buffers(index, out_local_data)
+
 
 class MonoInstanceDriverWrapper(DriverEvaluatorWrapper):
     """Class that executes a DOE."""
 
+    def __init__(self, sos_name, logger: logging.Logger):
+        """
+        Constructor.
+
+        Arguments:
+            sos_name (string): name of the discipline
+            logger (logging.Logger): logger to use
+        """
+        super().__init__(sos_name=sos_name, logger=logger)
+        # persistent cache of the samples outputs of the last run, if the evaluation_cache_dir input is set
+        self.samples_cache = None
+        # store of the outputs of the samples of the last evaluation, indexed as the samples
+        self.outputs_store = None
+
     def samples_evaluation(self, samples, convert_to_array=True):
         """
         This function executes a parallel execution of the function sample_evaluation
         over a list a samples. Depending on the numerical parameter n_processes it loops
-        on a sequential or parallel way over the list of samples to evaluate
+        on a sequential or parallel way over the list of samples to evaluate.
+        If the evaluation_cache_dir input is set, the samples whose outputs are in the persistent cache are not
+        evaluated, except the last one (the reference scenario) whose evaluation updates the local data of the
+        subprocess, and a sample that appears several times in the samples is evaluated only once.
+        The outputs of the samples are kept in self.outputs_store, indexed as the samples.
         """
         self._init_input_data()
+        cache_keys = self._init_samples_cache(samples)
 
-        evaluation_output = {}
         n_processes = self.get_sosdisc_inputs('n_processes')
         wait_time_between_samples = self.get_sosdisc_inputs('wait_time_between_fork')
-        # if platform.system() == 'Windows' or n_processes == 1:
-        if n_processes != 1:
-            self.logger.warning(
-                "multiprocessing is not possible yet for samples evaluation (need to check with GEMSEO parallel feature)")
-            n_processes = 1
-        self.logger.info("running sos eval in sequential")
-        scenario_nb = len(samples)
-        for i in tqdm(range(scenario_nb), ncols=100, position=0):
-            # time.sleep(0.1)
-            scenario_name = samples[i][SampleGeneratorWrapper.SCENARIO_NAME]
-            self.logger.info(f'   {scenario_name} is running.')
+        is_parallel = n_processes is not None and n_processes > 1
+        # the workers can only write in the shared buffers if they are forked after their allocation
+        self.outputs_store = DriverOutputsStore(
+            self.attributes['eval_out_list'], len(samples),
+            shared=is_parallel and (CallableParallelExecution.MULTI_PROCESSING_START_METHOD
+                                    == CallableParallelExecution.MultiProcessingStartMethod.FORK))
+
+        indices_to_evaluate = list(range(len(samples)))
+        # index of each duplicate sample and index of the evaluated sample with the same key
+        duplicate_indices = {}
+        if cache_keys is not None:
+            indices_to_evaluate = [len(samples) - 1]
+            evaluated_indices = {cache_keys[-1]: len(samples) - 1}
+            for i in range(len(samples) - 1):
+                if cache_keys[i] in evaluated_indices:
+                    duplicate_indices[i] = evaluated_indices[cache_keys[i]]
+                    continue
+                out_local_data = self.samples_cache.get(cache_keys[i])
+                if out_local_data is None:
+                    evaluated_indices[cache_keys[i]] = i
+                    indices_to_evaluate.insert(-1, i)
+                else:
+                    self.outputs_store.store(i, out_local_data)
+            self.logger.info("%d samples found in the driver cache, %d duplicate samples, %d samples to evaluate",
+                             len(samples) - len(indices_to_evaluate) - len(duplicate_indices),
+                             len(duplicate_indices), len(indices_to_evaluate))
+
+        if is_parallel and len(indices_to_evaluate) > 1:
+            self._samples_evaluation_parallel(samples, n_processes, wait_time_between_samples, indices_to_evaluate,
+                                              cache_keys)
+        else:
+            self.logger.info("running sos eval in sequential")
+            for i in tqdm(indices_to_evaluate, ncols=100, position=0):
+                # time.sleep(0.1)
+                scenario_name = samples[i][SampleGeneratorWrapper.SCENARIO_NAME]
+                self.logger.info(f'   {scenario_name} is running.')
+
+                self._store_output_data(i, self._evaluate_output_data(self._get_sample_values(samples[i])),
+                                        cache_keys)
+
+        for i, evaluated_index in duplicate_indices.items():
+            # the outputs are copied so that the scenarios do not share their values
+            self.outputs_store.store(i, deepcopy(self.outputs_store.get_values(evaluated_index)))
+
+        # return the outputs in the same order as the samples
+        return {sample[SampleGeneratorWrapper.SCENARIO_NAME]: (
+            self._get_sample_values(sample),
+            self._format_output_values(self.outputs_store.get_values(i), convert_to_array))
+            for i, sample in enumerate(samples)}
+
+    @staticmethod
+    def _get_sample_values(sample):
+        """
+        Return the values of the inputs modified by a sample.
+
+        Arguments:
+            sample (dict): full names and values of the inputs modified by the sample, with its scenario name
 
-            x = {key: value for key, value in samples[i].items() if key != SampleGeneratorWrapper.SCENARIO_NAME}
-
-            evaluation_output[scenario_name] = x, self.evaluation(x, convert_to_array)
-        return evaluation_output
-
-        # if n_processes > 1:
-        #     self.logger.info("Running SOS EVAL in parallel on n_processes = %s", str(n_processes))
-        #
-        #     # Create the parallel execution object. The function we want to
-        #     # parallelize is the sample_evaluation
-        #     def sample_evaluator(sample_to_evaluate):
-        #         """Evaluate a sample"""
-        #         return self.evaluation(sample_to_evaluate, convert_to_array=False)
-        #
-        #     parallel = ParallelExecution(
-        #         sample_evaluator, n_processes=n_processes, wait_time_between_fork=wait_time_between_samples
-        #     )
-        #
-        #     # Define a callback function to store the samples on the fly
-        #     # during the parallel execution
-        #     def store_callback(
-        #         index: int,
-        #         outputs: dict[str, Any],
-        #     ) -> None:
-        #         """Store the outputs in dedicated dictionnary:
-        #         - Here the dictionnary key is the sample evaluated and the value is the evaluation output
-        #         Args:
-        #             index: The sample index.
-        #             outputs: The outputs of the parallel execution.
-        #         """
-        #         scenario_name = samples[index][SampleGeneratorWrapper.SCENARIO_NAME]
-        #         evaluation_output[scenario_name] = (samples[index], outputs)
-        #         self.logger.info(
-        #             "%s has been run. computation progress: %d %% done.",
-        #             scenario_name,
-        #             int(((len(evaluation_output)) / len(samples)) * 100),
-        #         )
-        #         time.sleep(0.05)
-        #
-        #     try:
-        #         # execute all the scenarios (except the reference scenario)  in
-        #         # parallel
-        #         # remove the scenario_name key of each sample
-        #         x = [
-        #             {key: value for key, value in samples[i].items() if key != SampleGeneratorWrapper.SCENARIO_NAME}
-        #             for i in range(len(samples))
-        #         ]
-        #
-        #         parallel.execute(x[0:-1], exec_callback=store_callback)
-        #         # execute the reference scenario in a sequential way so that
-        #         # sostrades objects are updated
-        #         scenario_name = samples[-1][SampleGeneratorWrapper.SCENARIO_NAME]
-        #         evaluation_output[scenario_name] = samples[-1], self.evaluation(x[-1], convert_to_array)
-        #         self.proxy_disciplines[0]._update_status_recursive(self.STATUS_DONE)
-        #         dict_to_return = {}
-        #         # return the outputs in the same order of the scenario lists
-        #         for sample in samples:
-        #             scenario_name = sample[SampleGeneratorWrapper.SCENARIO_NAME]
-        #             if scenario_name in evaluation_output:
-        #                 dict_to_return[scenario_name] = evaluation_output[scenario_name]
-        #     except Exception:
-        #         self.proxy_disciplines[0]._update_status_recursive(self.STATUS_FAILED)  # FIXME: This won't work
-        #     else:
-        #         return dict_to_return
-        # return None
+        Returns:
+            x (dict): full names and values of the inputs modified by the sample
+        """
+        return {key: value for key, value in sample.items() if key != SampleGeneratorWrapper.SCENARIO_NAME}
+
+    def _init_samples_cache(self, samples):
+        """
+        Create the persistent cache of the samples outputs if the evaluation_cache_dir input is set, and compute the
+        keys of the samples. The inputs of the subprocess that are also its outputs (the initial values of its
+        couplings) only set the starting point of its MDA and are not part of the keys.
+
+        Arguments:
+            samples (list[dict]): samples to evaluate, with their scenario name
+
+        Returns:
+            cache_keys (list[string] or None): keys of the samples in the cache, None if there is no cache
+        """
+        self.samples_cache = None
+        cache_dir = self.get_sosdisc_inputs('evaluation_cache_dir')
+        if not cache_dir:
+            return None
+        self.samples_cache = DriverSamplesCache(cache_dir, self.get_sosdisc_inputs('evaluation_cache_max_size') * 2 ** 20)
+        sub_discipline = self.attributes['sub_disciplines'][0]
+        computed_inputs = set(sub_discipline.output_grammar.names)
+        reference_input_data = {key: value for key, value in self.input_data_for_disc[0].items()
+                                if key not in computed_inputs}
+        self.samples_cache.set_reference([get_discipline_structure(sub_discipline), self.attributes['eval_out_list']],
+                                         reference_input_data)
+        return [self.samples_cache.get_key(self._get_sample_values(sample)) for sample in samples]
+
+    def _store_output_data(self, index, out_local_data, cache_keys=None, written_in_buffers=False):
+        """
+        Store the outputs of an evaluated sample in the outputs store, then write them in the persistent cache if any.
+
+        Arguments:
+            index (int): index of the sample
+            out_local_data (dict): full names and values of the selected outputs of the sample
+            cache_keys (list[string]): keys of the samples in the cache, None if the outputs are not to be cached
+            written_in_buffers (bool): whether the outputs missing in out_local_data have been written in the shared
+                buffers of the outputs store by a worker
+        """
+        self.outputs_store.store(index, out_local_data, written_in_buffers=written_in_buffers)
+        if cache_keys is not None:
+            self.samples_cache.put(cache_keys[index], self.outputs_store.get_values(index))
+
+    def _samples_evaluation_parallel(self, samples, n_processes, wait_time_between_samples, indices_to_evaluate=None,
+                                     cache_keys=None):
+        """
+        Evaluate the samples on a pool of n_processes workers. The last sample (the reference scenario) is executed
+        first in the current process so that the sostrades objects and the local data of the subprocess are updated as
+        in the sequential evaluation, and so that the buffers of the outputs store are allocated with its outputs
+        before the workers are forked. All the other samples are sent to the workers, that write their outputs in the
+        shared buffers of the outputs store.
+
+        Arguments:
+            samples (list[dict]): samples to evaluate, with their scenario name
+            n_processes (int): maximum number of simultaneous worker processes
+            wait_time_between_samples (float): time to wait between two forks of the workers
+            indices_to_evaluate (list[int]): indices of the samples to evaluate, ending with the last one, all the
+                samples if None
+            cache_keys (list[string]): keys of the samples in the persistent cache, None if there is no cache
+        """
+        self.logger.info("running sos eval in parallel on %s processes", n_processes)
+        if indices_to_evaluate is None:
+            indices_to_evaluate = list(range(len(samples)))
+        scenario_nb = len(indices_to_evaluate)
+        progress_bar = tqdm(total=scenario_nb, ncols=100, position=0)
+        n_evaluated = 0
+
+        def store_callback(index: int, out_local_data: dict[str, Any]) -> None:
+            """Store the outputs of the sample of given index as soon as it is retrieved from a worker."""
+            nonlocal n_evaluated
+            self._store_output_data(indices_to_evaluate[index], out_local_data, cache_keys,
+                                    written_in_buffers=self.outputs_store.shared)
+            n_evaluated += 1
+            progress_bar.update()
+            self.logger.info(
+                "   %s has been run. computation progress: %d %% done.",
+                samples[indices_to_evaluate[index]][SampleGeneratorWrapper.SCENARIO_NAME],
+                int(n_evaluated / scenario_nb * 100),
+            )
+
+        try:
+            scenario_name = samples[indices_to_evaluate[-1]][SampleGeneratorWrapper.SCENARIO_NAME]
+            self.logger.info(f'   {scenario_name} is running.')
+            self._store_output_data(indices_to_evaluate[-1], self._evaluate_output_data(
+                self._get_sample_values(samples[indices_to_evaluate[-1]])), cache_keys)
+            n_evaluated += 1
+            progress_bar.update()
+
+            sample_evaluator = SubprocessSampleEvaluator(
+                self.attributes['sub_disciplines'][0], self.input_data_for_disc[0], self.attributes['eval_out_list'],
+                outputs_store=self.outputs_store if self.outputs_store.shared else None)
+            parallel = CallableParallelExecution([sample_evaluator],
+                                                 n_processes=n_processes,
+                                                 wait_time_between_fork=wait_time_between_samples,
+                                                 exceptions_to_re_raise=(Exception,))
+            parallel.execute([(i, self._get_sample_values(samples[i])) for i in indices_to_evaluate[:-1]],
+                             exec_callback=store_callback)
+        finally:
+            progress_bar.close()
 
     def evaluation(self, x, convert_to_array=True):
         """
         Call to the function to evaluate with x : values which are modified by the evaluator (only input values with a delta)
         Only these values are modified in the dm. Then the eval_process is executed and output values are convert into arrays.
         """
+        return self._format_output_values(self._evaluate_output_data(x), convert_to_array)
+
+    def _evaluate_output_data(self, x):
+        """
+        Execute the subprocess with the reference inputs updated with the values x modified by the evaluator.
+
+        Arguments:
+            x (dict): full names and values of the inputs modified by the evaluator
+
+        Returns:
+            out_local_data (dict): full names and values of the selected outputs
+        """
+        local_data = self.attributes['sub_disciplines'][0].execute(self._get_input_data(x))
+        return self._select_output_data(local_data, self.attributes['eval_out_list'])
+
+    def _format_output_values(self, out_local_data, convert_to_array=True):
+        """
+        Format the selected outputs of one evaluation either as a single array or as a list of values ordered as
+        eval_out_list.
 
-        values_dict = x
-        local_data = self.attributes['sub_disciplines'][0].execute(self._get_input_data(values_dict))
-        out_local_data = self._select_output_data(local_data, self.attributes['eval_out_list'])
+        Arguments:
+            out_local_data (dict): full names and values of the selected outputs
+            convert_to_array (bool): whether to convert the outputs into a single array
 
+        Returns:
+            out_values (ndarray or list): formatted outputs
+        """
         if convert_to_array:
             out_local_data_converted = convert_new_type_into_array(out_local_data, self.attributes['reduced_dm'])
             out_values = np.concatenate(list(out_local_data_converted.values())).ravel()
@@ -156,8 +340,6 @@ class MonoInstanceDriverWrapper(DriverEvaluatorWrapper):
         # upadte default inputs of children with dm values -> should not be necessary in EEV4
         # self.update_default_inputs(self.attributes['sub_disciplines'])
 
-        dict_output = {}
-
         # We first begin by sample generation
         samples_df = self.get_sosdisc_inputs(SampleGeneratorWrapper.SAMPLES_DF)
 
@@ -199,39 +381,19 @@ class MonoInstanceDriverWrapper(DriverEvaluatorWrapper):
         if 'reference_scenario' not in scenario_names:
             self.samples.append(reference_scenario)
 
-        # evaluation of the samples through a call to samples_evaluation
-        evaluation_outputs = self.samples_evaluation(self.samples, convert_to_array=False)
-
-        # we loop through the samples evaluated to build dictionaries needed
-        # for output generation
-
-        for scenario_name, evaluated_samples in evaluation_outputs.items():
-            # generation of the dictionary of outputs
-            dict_one_output = {}
-            current_output = evaluated_samples[1]
-            for idx, values in enumerate(current_output):
-                dict_one_output[self.attributes['eval_out_list'][idx]] = values
-            dict_output[scenario_name] = dict_one_output
+        # evaluation of the samples through a call to samples_evaluation, their outputs are kept in the outputs store
+        self.samples_evaluation(self.samples, convert_to_array=False)
 
         # construction of a dataframe of generated samples
         # columns are selected inputs
-
-        out_samples_all_row = []
-        for scenario in evaluation_outputs:
-            out_samples_row = [scenario]
-            out_samples_row += list(dict_output[scenario].values())
-            out_samples_all_row.append(out_samples_row)
-
-        output_columns = ['scenario_name']
-        output_columns.extend(self.attributes['selected_outputs'])
-        samples_output_df = pd.DataFrame(out_samples_all_row, columns=output_columns)
+        scenario_names = [sample[SampleGeneratorWrapper.SCENARIO_NAME] for sample in self.samples]
+        samples_output_df = self.outputs_store.get_samples_outputs_df(scenario_names,
+                                                                      self.attributes['selected_outputs'])
         # construction of a dictionary of dynamic outputs
         # The key is the output name and the value a dictionary of results
-        # with scenarii as keys
-        global_dict_output = {key: {} for key in self.attributes['eval_out_list']}
-        for scenario, scenario_output in dict_output.items():
-            for full_name_out in scenario_output:
-                global_dict_output[full_name_out][scenario] = scenario_output[full_name_out]
+        # with scenarii as keys, the arrays are views of the buffers of the outputs store
+        global_dict_output = {key: self.outputs_store.get_gathered_output(key, scenario_names)
+                              for key in self.attributes['eval_out_list']}
 
         # save data of last execution i.e. reference values # TODO: do this  better in refacto doe
         subprocess_ref_outputs = {key: self.attributes['sub_disciplines'][0].io.data[key]
@@ -251,5 +413,7 @@ class MonoInstanceDriverWrapper(DriverEvaluatorWrapper):
         self.store_sos_outputs_values({'samples_inputs_df': sample_input_df})
 
         self.store_sos_outputs_values({'samples_outputs_df': samples_output_df})
+        if self.samples_cache is not None:
+            self.store_sos_outputs_values({'evaluation_cache_stats': self.samples_cache.get_stats()})
         for dynamic_output, out_name in zip(self.attributes['eval_out_list'], self.attributes['eval_out_names']):
             self.store_sos_outputs_values({out_name: global_dict_output[dynamic_output]})
@@ -21,6 +21,7 @@ from typing import Any, Callable, Optional, Union
 from sostrades_core.datasets.dataset_mapping import DatasetsMapping
 from sostrades_core.execution_engine.builder_tools.tool_factory import ToolFactory
 from sostrades_core.execution_engine.data_manager import DataManager, ParameterChange
+from sostrades_core.execution_engine.execution_profiler import ExecutionProfiler
 from sostrades_core.execution_engine.ns_manager import NamespaceManager
 from sostrades_core.execution_engine.post_processing_manager import (
     PostProcessingManager,
@@ -28,7 +29,10 @@ from sostrades_core.execution_engine.post_processing_manager import (
 from sostrades_core.execution_engine.proxy_coupling import BaseDiscipline, BaseScenario, ProxyCoupling
 from sostrades_core.execution_engine.proxy_discipline import ProxyDiscipline
 from sostrades_core.execution_engine.scattermaps_manager import ScatterMapsManager
+from sostrades_core.execution_engine.sos_discipline import SoSDiscipline
 from sostrades_core.execution_engine.sos_factory import SosFactory
+from sostrades_core.execution_engine.sos_mda_chain import SoSMDAChain
+from sostrades_core.tools.rw.load_dump_dm_data import LazyConvertedCacheMap
 
 DEFAULT_FACTORY_NAME = 'default_factory'
 DEFAULT_NS_MANAGER_NAME = 'default_ns_namanger'
@@ -53,7 +57,8 @@ class ExecutionEngine:
                  root_dir=None,
                  study_filename=None,
                  yield_method=None,
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 compact_data_dict: bool = False):
 
         self.study_name = study_name
         self.study_filename = study_filename or study_name
@@ -74,7 +79,8 @@ class ExecutionEngine:
                               rw_object=rw_object,
                               study_filename=self.study_filename,
                               ns_manager=self.ns_manager,
-                              logger=self.logger.getChild("DataManager"))
+                              logger=self.logger.getChild("DataManager"),
+                              compact_data_dict=compact_data_dict)
         self.scattermap_manager = ScatterMapsManager(
             name=DEFAULT_scattermap_manager_NAME, ee=self)
 
@@ -87,7 +93,16 @@ class ExecutionEngine:
         self.root_process: Union[ProxyCoupling, None] = None
         self.root_builder_ist = None
         self.check_data_integrity: bool = True
+        # profiler of the disciplines execution steps, None if the profiling mode is not activated
+        self.profiler: Optional[ExecutionProfiler] = None
         self.wrapping_mode = 'SoSTrades'
+        # if True, the configuration loop only compares the structuring variables of the disciplines impacted by the
+        # variables changed or the disciplines configured at the previous step, and the couplings whose children are
+        # all unchanged do not build their coupling structure again
+        self.incremental_configure: bool = True
+        self.__structuring_check_token = None
+        # number of changed variables and reconfigured disciplines for each iteration of the last configuration loop
+        self.configure_iterations_report: list[dict[str, int]] = []
 
     @property
     def factory(self) -> SosFactory:
@@ -98,6 +113,14 @@ class ExecutionEngine:
         """
         return self.__factory
 
+    @property
+    def structuring_check_token(self) -> Optional[object]:
+        """ Token of the ongoing incremental configuration, None if there is no incremental configuration ongoing.
+            A discipline that found its structuring variables unchanged with the current token does not need to compare
+            them again until the token is invalidated for this discipline.
+        """
+        return self.__structuring_check_token
+
     @property
     def post_processing_manager(self) -> PostProcessingManager:
         """ Read-only accessor to the post_processing_manager object
@@ -178,6 +201,17 @@ class ExecutionEngine:
         self.__factory.init_execution()
         # - execution
         self.root_process.prepare_execution()
+        self.__set_profiler_in_disciplines(self.root_process)
+
+    def __set_profiler_in_disciplines(self, disc):
+        '''
+        Set recursively the profiler of the ExecutionEngine (or None) in the GEMSEO objects of <disc> and its children
+        '''
+        discipline_wrapp = getattr(disc, 'discipline_wrapp', None)
+        if discipline_wrapp is not None and isinstance(discipline_wrapp.discipline, (SoSDiscipline, SoSMDAChain)):
+            discipline_wrapp.discipline.set_profiler(self.profiler)
+        for sub_disc in disc.proxy_disciplines:
+            self.__set_profiler_in_disciplines(sub_disc)
 
     def __configure_io(self):
         self.logger.info('Configuring IO...')
@@ -185,6 +219,43 @@ class ExecutionEngine:
         self.factory.build()
         self.root_process.configure_io()
 
+    def __invalidate_structuring_checks(self) -> tuple[int, int]:
+        """
+        Invalidate the structuring variables check of the disciplines that may be impacted by the changes recorded by
+        the data manager since the last call: the disciplines using a changed variable, the disciplines sharing a
+        variable with a configured discipline (its configuration may have modified the variable in place) and
+        recursively their config dependent disciplines.
+
+        Returns:
+            the number of changed variables and the number of configured disciplines
+        """
+        changed_var_ids, configured_disc_ids = self.dm.pop_configure_changes()
+        if self.__structuring_check_token is None:
+            return len(changed_var_ids), len(configured_disc_ids)
+
+        disc_ids_to_invalidate = set()
+        for var_id in changed_var_ids:
+            if var_id in self.dm.data_dict:
+                disc_ids_to_invalidate.update(self.dm.data_dict[var_id][ProxyDiscipline.DISCIPLINES_DEPENDENCIES])
+        for disc_id in configured_disc_ids:
+            if disc_id in self.dm.disciplines_dict:
+                disc = self.dm.get_discipline(disc_id)
+                for data_io in (disc.get_data_in(), disc.get_data_out()):
+                    for var_data in data_io.values():
+                        disc_ids_to_invalidate.update(var_data.get(ProxyDiscipline.DISCIPLINES_DEPENDENCIES, []))
+
+        disciplines_to_invalidate = [self.dm.get_discipline(disc_id) for disc_id in disc_ids_to_invalidate
+                                     if disc_id in self.dm.disciplines_dict]
+        invalidated_disciplines = set()
+        while disciplines_to_invalidate:
+            disc = disciplines_to_invalidate.pop()
+            if disc not in invalidated_disciplines:
+                invalidated_disciplines.add(disc)
+                disc.invalidate_structuring_variables_check()
+                disciplines_to_invalidate.extend(disc.config_dependent_disciplines)
+
+        return len(changed_var_ids), len(configured_disc_ids)
+
     def update_from_dm(self):
         self.logger.info("Updating from DM.")
         self.root_process.update_from_dm()
@@ -200,107 +271,30 @@ class ExecutionEngine:
     def anonymize_caches_in_cache_map(self):
         """
         Anonymize each cache in the cache map by converting each variable key inside the cache
-        to its anonymized form. The returned cache map is a dictionary with the same structure,
-        but with anonymized keys.
+        to its anonymized form. The returned cache map has the structure
+        {disc_id: {index: {'inputs': {key: value}, 'outputs': {key: value}, 'jacobian': {key: {key: value}}}}}
+        with anonymized keys, the cache of a discipline is converted only when it is accessed and each key is
+        anonymized only once.
 
         Returns:
-        - dict: A dictionary with the same structure as cache_map, but with anonymized keys.
+        - LazyConvertedCacheMap: A read-only mapping with the structure above.
         """
-
-        def anonymize_dict(dict_to_anonymize):
-            """
-            Convert each key in the dictionary to its anonymized form.
-
-            Parameters:
-            - dict_to_anonymize (dict): A dictionary with original keys.
-
-            Returns:
-            - dict: A dictionary with anonymized keys.
-            """
-            return {self.anonymize_key(key): value for key, value in dict_to_anonymize.items()}
-
-        def anonymize_dict_of_dict(dict_to_anonymize):
-            """
-            Convert each key in a dictionary of dictionary to its anonymized form.
-
-            Parameters:
-            - dict_to_anonymize (dict): A dictionary with original keys.
-
-            Returns:
-            - dict: A dictionary with anonymized keys.
-            """
-            return {self.anonymize_key(key): anonymize_dict(value) for key, value in dict_to_anonymize.items()}
-
-        # Initialize an empty dictionary to store the anonymized cache map
-        anonymized_cache_map = {}
-
-        # If the cache map is not empty, process each entry
-        if self.dm.cache_map:
-            for key, serialized_new_cache in self.dm.cache_map.items():
-                anonymized_cache = {}
-                for index, cache in enumerate(serialized_new_cache, start=1):
-                    # Anonymize the keys for inputs, outputs, and jacobian of each cache
-                    anonymized_cache[index] = {
-                        'inputs': anonymize_dict(cache.inputs),
-                        'outputs': anonymize_dict(cache.outputs),
-                        'jacobian': anonymize_dict_of_dict(cache.jacobian)
-                    }
-                # Add the anonymized cache to the result dictionary
-                anonymized_cache_map[key] = anonymized_cache
-
-        return anonymized_cache_map
+        return LazyConvertedCacheMap(self.dm.cache_map or {}, self.anonymize_key)
 
     def unanonymize_caches_in_cache_map(self, cache_map):
         """
         Unanonymize each cache in the cache map by converting each key inside the cache
-        to its original form. The returned cache map is a dictionary with the same structure,
-        but with unanonymized keys.
+        to its original form. The returned cache map has the same structure, but with unanonymized keys, the cache
+        of a discipline is converted (and read from the file for a cache map loaded by StreamingCacheLoadDump) only
+        when it is accessed.
 
         Parameters:
-        - cache_map (dict): A dictionary where each value is a list of cache objects.
+        - cache_map (Mapping): A mapping of the serialized caches with anonymized keys.
 
         Returns:
-        - dict: A dictionary with the same structure as cache_map, but with unanonymized keys.
+        - LazyConvertedCacheMap: A read-only mapping with the same structure as cache_map, but with unanonymized keys.
         """
-
-        def un_anonymize_dict(dict_to_anonymize):
-            """
-            Convert each key in the dictionary to its original form.
-
-            Parameters:
-            - dict_to_anonymize (dict): A dictionary with anonymized keys.
-
-            Returns:
-            - dict: A dictionary with the original keys.
-            """
-            return {self.__unanonimize_key(key): value for key, value in dict_to_anonymize.items()}
-
-        def un_anonymize_dict_of_dict(dict_to_anonymize):
-            """
-            Convert each key in the dictionary to its original form.
-
-            Parameters:
-            - dict_to_anonymize (dict): A dictionary with anonymized keys.
-
-            Returns:
-            - dict: A dictionary with the original keys.
-            """
-            return {self.__unanonimize_key(key): un_anonymize_dict(value) for key, value in dict_to_anonymize.items()}
-
-        # Initialize an empty dictionary to store the unanonymized cache map
-
-        unanonymized_cache_map = {}
-        cache_unanonymize_func = {'inputs': un_anonymize_dict, 'outputs': un_anonymize_dict,
-                                  'jacobian': un_anonymize_dict_of_dict}
-        # If the cache map is not empty, process each entry
-        if cache_map:
-            # Unanonymize the keys for inputs, outputs, and jacobian of each cache
-            unanonymized_cache_map = {
-                key: {index: {cache_type: cache_func(cache[cache_type]) for cache_type, cache_func in
-                              cache_unanonymize_func.items()} for index, cache in serialized_cache.items()} for
-                key, serialized_cache in cache_map.items()}
-
-        return unanonymized_cache_map
+        return LazyConvertedCacheMap(cache_map or {}, self.__unanonimize_key)
 
     def get_cache_map_to_dump(self):
         '''
@@ -548,28 +542,46 @@ class ExecutionEngine:
         checked_keys = set()
         parameter_changes = []
 
-        while not loop_stop:
-            self.logger.info("Configuring loop iteration %i.", iteration)
-            if self.__yield_method is not None:
-                self.__yield_method()
+        # values may have been modified outside the data manager since the last configuration: the first iteration
+        # compares all the structuring variables
+        self.dm.pop_configure_changes()
+        self.__structuring_check_token = object() if self.incremental_configure else None
+        self.configure_iterations_report = []
 
-            self.dm.no_change = True
-            # call the function that will set data in dm
-            set_data_in_dm_function(dict_or_datasets_to_load, checked_keys, parameter_changes, in_vars=True,
-                                    init_coupling_vars=False, out_vars=False)
-
-            self.__configure_io()
-
-            if self.__yield_method is not None:
-                self.__yield_method()
-
-            iteration = iteration + 1
-
-            if self.root_process.is_configured():
-                loop_stop = True
-            elif iteration >= 100:
-                self.logger.warning('CONFIGURE WARNING: root process is not configured after 100 iterations')
-                raise ExecutionEngineException('Too many iterations')
+        try:
+            while not loop_stop:
+                self.logger.info("Configuring loop iteration %i.", iteration)
+                if self.__yield_method is not None:
+                    self.__yield_method()
+
+                self.dm.no_change = True
+                # call the function that will set data in dm
+                set_data_in_dm_function(dict_or_datasets_to_load, checked_keys, parameter_changes, in_vars=True,
+                                        init_coupling_vars=False, out_vars=False)
+                n_changed_variables = self.__invalidate_structuring_checks()[0]
+
+                self.__configure_io()
+
+                if self.__yield_method is not None:
+                    self.__yield_method()
+
+                n_changed_variables_in_configure, n_configured_disciplines = self.__invalidate_structuring_checks()
+                self.configure_iterations_report.append(
+                    {'iteration': iteration,
+                     'changed_variables': n_changed_variables + n_changed_variables_in_configure,
+                     'reconfigured_disciplines': n_configured_disciplines})
+                self.logger.info("Configuring loop iteration %i: %i disciplines reconfigured.", iteration,
+                                 n_configured_disciplines)
+
+                iteration = iteration + 1
+
+                if self.root_process.is_configured():
+                    loop_stop = True
+                elif iteration >= 100:
+                    self.logger.warning('CONFIGURE WARNING: root process is not configured after 100 iterations')
+                    raise ExecutionEngineException('Too many iterations')
+        finally:
+            self.__structuring_check_token = None
 
         # Convergence is ended
         # Set all output variables and strong couplings
@@ -664,6 +676,18 @@ class ExecutionEngine:
         for disc in disc.proxy_disciplines:
             self.set_debug_mode(mode, disc)
 
+    def set_profiling_mode(self, active=True):
+        ''' activate (or deactivate) the profiling of the execution : the wall time, the CPU time and the number of
+        calls of the run, the jacobian computation and the grammar data conversions of each discipline and of the
+        iterations of each inner MDA are stored after each execution in the numerical output profiling_results of the
+        root coupling
+        '''
+        self.profiler = ExecutionProfiler() if active else None
+        self.logger.info("Profiling mode %s", 'activated' if active else 'deactivated')
+        if self.root_process is not None:
+            # add or remove the profiling results output of the root coupling
+            self.configure()
+
     def get_input_data_for_gemseo(self, proxy_coupling):
         '''
         Get values of discipline input_grammar from data manager
@@ -696,6 +720,8 @@ class ExecutionEngine:
 
         # -- prepare execution
         self.prepare_execution()
+        if self.profiler is not None:
+            self.profiler.reset()
 
         if loaded_cache is not None:
             self.load_cache_from_map(loaded_cache)
@@ -733,6 +759,8 @@ class ExecutionEngine:
             self.logger.info("Storing local data in datamanager.")
             # -- store local data in datamanager
             io_data.pop("MDA residuals norm", None)
+            if self.profiler is not None and isinstance(ex_proc, ProxyCoupling):
+                ex_proc.discipline_wrapp.discipline.profiling_results = self.profiler.get_results()
         self.update_dm_with_local_data(io_data)
         # Add residuals_history and other numerical outputs that are not in GEMSEO grammar to the data manager
         self.update_dm_with_local_data(ex_proc.get_numerical_outputs_subprocess())
@@ -0,0 +1,161 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter, thread_time
+from typing import TYPE_CHECKING, Any
+
+from pandas import DataFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class ExecutionProfiler:
+    """
+    Accumulate the wall time, the CPU time and the number of calls of the execution steps of the disciplines.
+
+    The profiler is activated on an ExecutionEngine with set_profiling_mode, the SoSDiscipline and SoSMDAChain objects
+    record their steps in it during the execution. The CPU time is the one of the thread executing the step, the steps
+    executed in subprocesses are not recorded.
+    """
+
+    RUN = 'run'
+    JACOBIAN = 'jacobian'
+    CONVERSION = 'conversion'
+    MDA_ITERATION = 'mda_iteration'
+
+    DISCIPLINE = 'discipline'
+    STEP = 'step'
+    CALLS = 'calls'
+    WALL_TIME = 'wall_time'
+    CPU_TIME = 'cpu_time'
+    COLUMNS = (DISCIPLINE, STEP, CALLS, WALL_TIME, CPU_TIME)
+
+    def __init__(self):
+        # (discipline name, step) -> [calls, wall time, cpu time]
+        self.__records = {}
+        self.__lock = Lock()
+
+    def __getstate__(self):
+        # the lock cannot be pickled with the disciplines that refer to the profiler
+        return self.__records
+
+    def __setstate__(self, state):
+        self.__records = state
+        self.__lock = Lock()
+
+    @contextmanager
+    def profile(self, discipline_name: str, step: str) -> Iterator[None]:
+        """Record the duration of the code executed in the context as one call of a step.
+
+        Args:
+            discipline_name: The name of the discipline executing the step.
+            step: The name of the step.
+        """
+        wall_start, cpu_start = perf_counter(), thread_time()
+        try:
+            yield
+        finally:
+            self.record(discipline_name, step, perf_counter() - wall_start, thread_time() - cpu_start)
+
+    def record(self, discipline_name: str, step: str, wall_time: float, cpu_time: float, calls: int = 1) -> None:
+        """Add calls of a step to the records.
+
+        Args:
+            discipline_name: The name of the discipline executing the step.
+            step: The name of the step.
+            wall_time: The wall time of the calls in seconds.
+            cpu_time: The CPU time of the calls in seconds.
+            calls: The number of calls.
+        """
+        with self.__lock:
+            record = self.__records.setdefault((discipline_name, step), [0, 0.0, 0.0])
+            record[0] += calls
+            record[1] += wall_time
+            record[2] += cpu_time
+
+    def reset(self) -> None:
+        """Clear the records."""
+        with self.__lock:
+            self.__records = {}
+
+    def get_results(self) -> DataFrame:
+        """Return the records sorted by decreasing wall time.
+
+        Returns:
+            The dataframe with the discipline, the step, the number of calls and the wall and CPU times in seconds.
+        """
+        with self.__lock:
+            rows = [(discipline_name, step, *record) for (discipline_name, step), record in self.__records.items()]
+        results = DataFrame(rows, columns=list(self.COLUMNS))
+        return results.sort_values(self.WALL_TIME, ascending=False, ignore_index=True, kind='stable')
+
+
+class ProfiledMDAIteration:
+    """
+    Replacement of the _execute_disciplines_and_update_local_data method of a GEMSEO MDA instance that records each
+    iteration of the MDA in an ExecutionProfiler.
+    """
+
+    METHOD_NAME = '_execute_disciplines_and_update_local_data'
+
+    def __init__(self, mda: Any, profiler: ExecutionProfiler):
+        """
+        Args:
+            mda: The MDA whose iterations are profiled.
+            profiler: The profiler recording the iterations.
+        """
+        self.mda = mda
+        self.profiler = profiler
+
+    def __call__(self, *args, **kwargs):
+        with self.profiler.profile(self.mda.name, ExecutionProfiler.MDA_ITERATION):
+            return getattr(type(self.mda), self.METHOD_NAME)(self.mda, *args, **kwargs)
+
+    @classmethod
+    def is_supported(cls, mda: Any) -> bool:
+        """Whether the iterations of an MDA can be profiled.
+
+        The replaced method is private to GEMSEO and may be renamed or removed by a GEMSEO upgrade.
+
+        Args:
+            mda: The MDA.
+
+        Returns:
+            Whether the class of the MDA has the replaced method.
+        """
+        return callable(getattr(type(mda), cls.METHOD_NAME, None))
+
+    @classmethod
+    def set_profiler(cls, mda: Any, profiler: ExecutionProfiler | None) -> bool:
+        """Activate the profiling of the iterations of an MDA, or deactivate it if the profiler is None.
+
+        Args:
+            mda: The MDA.
+            profiler: The profiler recording the iterations.
+
+        Returns:
+            Whether the profiling is activated, False if the profiler is None or the MDA is not supported.
+        """
+        mda.__dict__.pop(cls.METHOD_NAME, None)
+        if profiler is None or not cls.is_supported(mda):
+            return False
+        setattr(mda, cls.METHOD_NAME, cls(mda, profiler))
+        return True
@@ -20,6 +20,7 @@ from gemseo.core.data_converters.simple import SimpleGrammarDataConverter
 from numpy import complex128 as np_complex128
 from numpy import ndarray
 
+from sostrades_core.execution_engine.execution_profiler import ExecutionProfiler
 from sostrades_core.tools.base_functions.compute_len import compute_len
 from sostrades_core.tools.conversion.conversion_sostrades_sosgemseo import (
     STANDARD_TYPES,
@@ -34,10 +35,26 @@ ValueTypes_Numeric = ['int', 'float']
 class SoSTradesDataConverter(SimpleGrammarDataConverter):
     """Data values to NumPy arrays and vice versa from a :class:`.SimpleGrammar`."""
 
+    # profiler recording the conversions under the name of the discipline owning the grammar, set by the discipline
+    profiler: ExecutionProfiler | None = None
+    profiled_name: str = ''
+
     def __init__(self, grammar):
         super().__init__(grammar)
         self.reduced_dm = defaultdict(dict)
 
+    def convert_array_to_data(self, array, names_to_slices):  # noqa: D102
+        if self.profiler is None:
+            return super().convert_array_to_data(array, names_to_slices)
+        with self.profiler.profile(self.profiled_name, ExecutionProfiler.CONVERSION):
+            return super().convert_array_to_data(array, names_to_slices)
+
+    def convert_data_to_array(self, names, data):  # noqa: D102
+        if self.profiler is None:
+            return super().convert_data_to_array(names, data)
+        with self.profiler.profile(self.profiled_name, ExecutionProfiler.CONVERSION):
+            return super().convert_data_to_array(names, data)
+
     def is_numeric(self, name: str) -> bool:  # noqa: D102
         element_type = self._grammar[name]
         return element_type is not None and (
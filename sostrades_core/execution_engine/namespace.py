@@ -29,7 +29,7 @@ class Namespace:
         self.name = name
         self.value = value
         self.__display_value = display_value
-        self.dependency_disc_list = []  # list of dependency disciplines
+        self.dependency_disc_ids = {}  # ids of dependency disciplines, ordered set with constant time removal
         self.database_infos = database_infos
 
     def to_dict(self):
@@ -80,6 +80,13 @@ class Namespace:
         '''
         return f'{self.name}{self.NS_NAME_SEPARATOR}{self.value}'
 
+    @property
+    def dependency_disc_list(self):
+        '''
+        List of dependency disciplines
+        '''
+        return list(self.dependency_disc_ids)
+
     def get_dependency_disc_list(self):
         '''
         Get the list of disciplines which use the namespace
@@ -90,15 +97,13 @@ class Namespace:
         '''
         Add namespace disciplinary dependency
         '''
-        if disc_id not in self.dependency_disc_list:
-            self.dependency_disc_list.append(disc_id)
+        self.dependency_disc_ids[disc_id] = None
 
     def remove_dependency(self, disc_id):
         '''
         Remove disciplinary dependency
         '''
-        if disc_id in self.dependency_disc_list:
-            self.dependency_disc_list.remove(disc_id)
+        self.dependency_disc_ids.pop(disc_id, None)
 
     def check_namespace_is_used(self):
         '''
@@ -107,7 +112,7 @@ class Namespace:
         False the namespace is not used anymore
 
         '''
-        if len(self.dependency_disc_list) == 0:
+        if len(self.dependency_disc_ids) == 0:
             return False
         else:
             return True
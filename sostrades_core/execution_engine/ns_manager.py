@@ -45,8 +45,11 @@ class NamespaceManager:
         self.name = name  # old habit
 
         self.ee = ee
-        # -- List where all namespaces are gathered (of all disciplines)
-        self.ns_list = []
+        # -- Dict where all namespaces are gathered (of all disciplines) with key = id of the namespace object, which
+        # keeps the ns_list order and allows to clean namespaces in constant time
+        self.__ns_registry = {}
+        # Dict with key = ns name and value = dict of the namespaces with this name by id of the namespace object
+        self.__ns_by_name = {}
         # Dict with key = ns name and value = ns value just for performances
         self.all_ns_dict = {}
         # Dict of shared namespaces which fills the others_ns key of the
@@ -90,6 +93,13 @@ class NamespaceManager:
         else:
             return NS_SEP.join(args)
 
+    @property
+    def ns_list(self):
+        '''
+        List where all namespaces are gathered (of all disciplines)
+        '''
+        return list(self.__ns_registry.values())
+
     @property
     def shared_ns_dict(self):
         '''
@@ -149,7 +159,7 @@ class NamespaceManager:
         else:
             ns = Namespace(name, ns_value, display_value, database_infos)
             # -- add in the list if created
-            self.ns_list.append(ns)
+            self.__register_namespace(ns)
             self.all_ns_dict[ns.get_ns_id()] = ns
 
         # This shared_ns_dict delete the namespace if already exist: new one
@@ -195,13 +205,7 @@ class NamespaceManager:
         '''
         Get all namespaces with same name
         '''
-        ns_list = [
-            namespace
-            for namespace in self.ns_list
-            if namespace.name == name
-        ]
-
-        return ns_list
+        return list(self.__ns_by_name.get(name, {}).values())
 
     def get_shared_ns_dict(self):
         '''
@@ -398,13 +402,10 @@ class NamespaceManager:
         Delete namespaces without dependency in ns_list
         '''
         for ns in self.ns_list:
-            dependendy_disc_id_list = ns.get_dependency_disc_list()
-            dependency_disc_list = [self.ee.dm.get_discipline(
-                disc_id) for disc_id in dependendy_disc_id_list]
-            if len(list(filter(None, dependency_disc_list))) == 0:
-                self.ns_list.remove(ns)
-                del self.all_ns_dict[f'{ns.name}{self.NS_NAME_SEPARATOR}{ns.value}']
-                del self.shared_ns_dict[ns.name]
+            if not any(self.ee.dm.get_discipline(disc_id) for disc_id in ns.dependency_disc_ids):
+                self.__unregister_namespace(ns)
+                self.all_ns_dict.pop(f'{ns.name}{self.NS_NAME_SEPARATOR}{ns.value}', None)
+                self.shared_ns_dict.pop(ns.name, None)
 
     def add_disc_ns_info(self, pt, disc_ns_info):
         '''
@@ -549,10 +550,9 @@ class NamespaceManager:
         '''
         Update all shared namespaces named shared_ns_name with extra_namespace
         '''
-        for namespace in deepcopy(self.ns_list):
-            if namespace.name == shared_ns_name:
-                self.__update_namespace_with_extra_ns(
-                    namespace, extra_ns, after_name)
+        for namespace in deepcopy(self.get_all_namespace_with_name(shared_ns_name)):
+            self.__update_namespace_with_extra_ns(
+                namespace, extra_ns, after_name)
 
     def __update_namespace_with_extra_ns(self, old_ns_object, extra_ns, after_name=None, clean_existing=True):
         '''
@@ -621,15 +621,46 @@ class NamespaceManager:
         ns (Namespace) : namespace to clean in different lists and dictionaries
         Protect this function to be used only wisely (in process or builder but NEVER in a discipline)
         """
-        if ns in self.shared_ns_dict.values():
+        # the shared namespaces are stored by name
+        shared_ns = self.shared_ns_dict.get(ns.name)
+        if shared_ns is not None and shared_ns == ns:
             del self.shared_ns_dict[ns.name]
 
         ns_id = ns.get_ns_id()
         if ns_id in self.all_ns_dict:
             del self.all_ns_dict[ns_id]
 
-        if ns in self.ns_list:
-            self.ns_list.remove(ns)
+        registered_ns = self.__get_registered_namespace(ns)
+        if registered_ns is not None:
+            self.__unregister_namespace(registered_ns)
+
+    def __register_namespace(self, ns):
+        '''
+        Add a namespace to the ns_list and to the namespaces by name
+        '''
+        self.__ns_registry[id(ns)] = ns
+        self.__ns_by_name.setdefault(ns.name, {})[id(ns)] = ns
+
+    def __unregister_namespace(self, ns):
+        '''
+        Remove a namespace from the ns_list and from the namespaces by name
+        '''
+        del self.__ns_registry[id(ns)]
+        ns_with_name = self.__ns_by_name[ns.name]
+        del ns_with_name[id(ns)]
+        if not ns_with_name:
+            del self.__ns_by_name[ns.name]
+
+    def __get_registered_namespace(self, ns):
+        '''
+        Get the namespace of ns_list equal to ns (same name and value), which may be a copy of it
+        '''
+        if self.__ns_registry.get(id(ns)) is ns:
+            return ns
+        for registered_ns in self.__ns_by_name.get(ns.name, {}).values():
+            if registered_ns == ns:
+                return registered_ns
+        return None
 
     def clean_namespace_from_process(self, ns):
         """
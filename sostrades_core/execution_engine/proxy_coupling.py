@@ -36,6 +36,7 @@ from numpy import ndarray
 from pandas import DataFrame, concat
 
 from sostrades_core.execution_engine.discipline_wrapp import DisciplineWrapp
+from sostrades_core.execution_engine.execution_profiler import ExecutionProfiler
 from sostrades_core.execution_engine.ns_manager import NS_SEP
 from sostrades_core.execution_engine.proxy_discipline import ProxyDiscipline
 from sostrades_core.execution_engine.proxy_discipline_builder import (
@@ -47,6 +48,7 @@ from sostrades_core.tools.post_processing.charts.two_axes_instanciated_chart imp
     InstanciatedSeries,
     TwoAxesInstanciatedChart,
 )
+from sostrades_core.tools.post_processing.tables.instanciated_table import InstanciatedTable
 
 N_CPUS = cpu_count()
 
@@ -88,6 +90,8 @@ class ProxyCoupling(ProxyDisciplineBuilder):
     }
     RESIDUALS_HISTORY = "residuals_history"
     RESIDUALS_HISTORY_PRETTY = "Residuals History"
+    PROFILING_RESULTS = "profiling_results"
+    PROFILING_RESULTS_PRETTY = "Execution Profiling"
     NORMALIZED_RESIDUAL_NORM = 'MDA residuals norm'
     # AUTHORIZE_SELF_COUPLED_DISCIPLINES = "authorize_self_coupled_disciplines"
 
@@ -287,6 +291,14 @@ class ProxyCoupling(ProxyDisciplineBuilder):
         #                                      ProxyDiscipline.STRUCTURING: True}
     }
 
+    # dynamic output of the root coupling when the profiling mode of the ExecutionEngine is activated
+    PROFILING_RESULTS_DESC = {
+        ProxyDiscipline.USER_LEVEL: 3,
+        ProxyDiscipline.TYPE: 'dataframe',
+        ProxyDiscipline.UNIT: '-',
+        ProxyDiscipline.NUMERICAL: True,
+    }
+
     DESC_OUT = {
         RESIDUALS_HISTORY: {
             ProxyDiscipline.USER_LEVEL: 3,
@@ -319,6 +331,8 @@ class ProxyCoupling(ProxyDisciplineBuilder):
         self.logger = self.ee.logger.getChild(self.__class__.__name__)
 
         self.residuals_dict = {}
+        # children of the last built coupling structure
+        self._coupling_structure_disciplines = None
 
         self.linear_solver_MDA = None
         self.linear_solver_settings_MDA = None
@@ -380,7 +394,13 @@ class ProxyCoupling(ProxyDisciplineBuilder):
         Set possible values of preconditioner in data manager, according to liner solver MDA/MDO value
         (available preconditioners are different if petsc linear solvers are used)
         And set default value of max_mda_iter_gs according to inner_mda_name
+        Add the profiling results output to the root coupling if the profiling mode of the ExecutionEngine is activated
         """
+        if self.ee.profiler is not None and self.ee.root_process is self:
+            self.add_outputs({self.PROFILING_RESULTS: self.PROFILING_RESULTS_DESC.copy()})
+        elif self.PROFILING_RESULTS in self.inst_desc_out:
+            self.add_outputs({})
+
         disc_in = self.get_data_in()
         # set possible values of linear solver MDA preconditioner
         if 'linear_solver_MDA' in disc_in:
@@ -398,14 +418,14 @@ class ProxyCoupling(ProxyDisciplineBuilder):
                     self.get_sosdisc_inputs('linear_solver_MDA_preconditioner')
                     not in disc_in['linear_solver_MDA_preconditioner'][self.POSSIBLE_VALUES]
                 ):
-                    disc_in['linear_solver_MDA_preconditioner'][self.VALUE] = 'gasm'
+                    self.set_value_in_data_io('linear_solver_MDA_preconditioner', self.IO_TYPE_IN, 'gasm')
             else:
                 disc_in['linear_solver_MDA_preconditioner'][self.POSSIBLE_VALUES] = ['None', 'ilu']
                 if (
                     self.get_sosdisc_inputs('linear_solver_MDA_preconditioner')
                     not in disc_in['linear_solver_MDA_preconditioner'][self.POSSIBLE_VALUES]
                 ):
-                    disc_in['linear_solver_MDA_preconditioner'][self.VALUE] = 'None'
+                    self.set_value_in_data_io('linear_solver_MDA_preconditioner', self.IO_TYPE_IN, 'None')
 
         # set possible values of linear solver MDO preconditioner
         if 'linear_solver_MDO' in disc_in:
@@ -423,14 +443,14 @@ class ProxyCoupling(ProxyDisciplineBuilder):
                     self.get_sosdisc_inputs('linear_solver_MDO_preconditioner')
                     not in disc_in['linear_solver_MDO_preconditioner'][self.POSSIBLE_VALUES]
                 ):
-                    disc_in['linear_solver_MDO_preconditioner'][self.VALUE] = 'gasm'
+                    self.set_value_in_data_io('linear_solver_MDO_preconditioner', self.IO_TYPE_IN, 'gasm')
             else:
                 disc_in['linear_solver_MDO_preconditioner'][self.POSSIBLE_VALUES] = ['None', 'ilu']
                 if (
                     self.get_sosdisc_inputs('linear_solver_MDO_preconditioner')
                     not in disc_in['linear_solver_MDO_preconditioner'][self.POSSIBLE_VALUES]
                 ):
-                    disc_in['linear_solver_MDO_preconditioner'][self.VALUE] = 'None'
+                    self.set_value_in_data_io('linear_solver_MDO_preconditioner', self.IO_TYPE_IN, 'None')
 
             # set default value of max_mda_iter_gs
             if 'max_mda_iter_gs' in disc_in and self.get_sosdisc_inputs('inner_mda_name') == 'GSorNewtonMDA':
@@ -441,7 +461,15 @@ class ProxyCoupling(ProxyDisciplineBuilder):
         Configure the ProxyCoupling by :
         - setting the discipline in the discipline_dict
         - configure all children disciplines
+        During an incremental configuration of the ExecutionEngine, the coupling structure and the data_io are not
+        built again if the coupling was configured with unchanged structuring variables and the same children
         """
+        is_structure_up_to_date = (
+            self.ee.structuring_check_token is not None
+            and self.get_configure_status()
+            and not self.check_structuring_variables_changes()
+            and self._coupling_structure_disciplines == self.proxy_disciplines
+        )
         ProxyDiscipline.configure(self)
         if self.ee.wrapping_mode == 'GEMSEO':
             # Use the IO of the gemseo object to populate the coupling inputs and outputs
@@ -462,13 +490,13 @@ class ProxyCoupling(ProxyDisciplineBuilder):
                 self.set_children_numerical_inputs()
                 # - all chidren are configured thus proxyCoupling can be configured
                 self.set_configure_status(True)
-                # - build the coupling structure
-
-                self._build_coupling_structure()
-                # - builds data_in/out according to the coupling structure
-                self._build_data_io()
-                # - Update coupling and editable flags in the datamanager for the GUI
-                self._update_coupling_flags_in_dm()
+                if not is_structure_up_to_date:
+                    # - build the coupling structure
+                    self._build_coupling_structure()
+                    # - builds data_in/out according to the coupling structure
+                    self._build_data_io()
+                    # - Update coupling and editable flags in the datamanager for the GUI
+                    self._update_coupling_flags_in_dm()
 
     def configure_coupling_with_gemseo_object(self):
         '''
@@ -584,6 +612,7 @@ class ProxyCoupling(ProxyDisciplineBuilder):
         for proxy_disc in self.proxy_disciplines:
             proxy_disc.initialize_gemseo_io()
         self.coupling_structure = CouplingStructure(self.proxy_disciplines)
+        self._coupling_structure_disciplines = list(self.proxy_disciplines)
         self.strong_couplings = filter_variables_to_convert(
             self.ee.dm.convert_data_dict_with_full_name(),
             self.coupling_structure.strong_couplings,
@@ -1003,6 +1032,9 @@ class ProxyCoupling(ProxyDisciplineBuilder):
         chart_filters = []
 
         chart_list = [self.RESIDUALS_HISTORY_PRETTY]
+        if self.PROFILING_RESULTS in self.get_data_out() and \
+                self.get_sosdisc_outputs(self.PROFILING_RESULTS) is not None:
+            chart_list.append(self.PROFILING_RESULTS_PRETTY)
 
         chart_filters.append(ChartFilter('Charts', chart_list, chart_list, 'charts'))
 
@@ -1047,4 +1079,50 @@ class ProxyCoupling(ProxyDisciplineBuilder):
 
                 instanciated_charts.append(new_chart)
 
+        if (select_all or self.PROFILING_RESULTS_PRETTY in chart_list) and \
+                self.PROFILING_RESULTS in self.get_data_out():
+            profiling_results = self.get_sosdisc_outputs(self.PROFILING_RESULTS)
+            if profiling_results is not None and not profiling_results.empty:
+                instanciated_charts.extend(self.get_profiling_charts(profiling_results))
+
         return instanciated_charts
+
+    def get_profiling_charts(self, profiling_results: DataFrame) -> list:
+        """
+        Build the bar chart of the wall time of each discipline per execution step and the table of the profiling
+        results
+
+        Args:
+            profiling_results: The profiling results of the ExecutionEngine.
+
+        Returns:
+            The chart and the table.
+        """
+        # discipline names relative to the root coupling to keep the labels short
+        full_name = self.get_disc_full_name()
+        prefix = f'{full_name}{NS_SEP}'
+        discipline_names = [
+            self.sos_name if name == full_name else name[len(prefix):] if name.startswith(prefix) else name
+            for name in profiling_results[ExecutionProfiler.DISCIPLINE]
+        ]
+        profiling_results = profiling_results.assign(**{ExecutionProfiler.DISCIPLINE: discipline_names})
+
+        new_chart = TwoAxesInstanciatedChart(
+            'Disciplines', 'Wall time [s]', chart_name=f'{self.PROFILING_RESULTS_PRETTY} : wall time per discipline',
+            stacked_bar=True,
+        )
+        for step, step_results in profiling_results.groupby(ExecutionProfiler.STEP, sort=False):
+            new_chart.series.append(
+                InstanciatedSeries(
+                    step_results[ExecutionProfiler.DISCIPLINE].tolist(),
+                    step_results[ExecutionProfiler.WALL_TIME].tolist(),
+                    step,
+                    InstanciatedSeries.BAR_DISPLAY,
+                )
+            )
+
+        table = InstanciatedTable.from_pd_df(
+            self.PROFILING_RESULTS_PRETTY,
+            profiling_results.round({ExecutionProfiler.WALL_TIME: 4, ExecutionProfiler.CPU_TIME: 4}),
+        )
+        return [new_chart, table]
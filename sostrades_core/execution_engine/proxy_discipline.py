@@ -38,8 +38,10 @@ from pandas import DataFrame
 from sostrades_core.execution_engine.discipline_wrapp import DisciplineWrapp
 from sostrades_core.execution_engine.sos_discipline import SoSDiscipline
 from sostrades_core.execution_engine.sos_wrapp import SoSWrapp
+from sostrades_core.execution_engine.variable_metadata import VariableMetadata
 from sostrades_core.tools.check_data_integrity.check_data_integrity import CheckDataIntegrity
 from sostrades_core.tools.compare_data_manager_tooling import dict_are_equal
+from sostrades_core.tools.value_fingerprint import compute_fingerprint, fingerprint_matches
 
 if TYPE_CHECKING:
     import logging
@@ -374,6 +376,10 @@ class ProxyDiscipline:
         self._io_ns_map_in = None
         self._io_ns_map_out = None  # used by ProxyCoupling, ProxyDriverEvaluator
         self._structuring_variables = None
+        # fingerprints of the values stored in _structuring_variables and _non_structuring_variables
+        self._structuring_variables_fingerprints = {}
+        # token of the incremental configuration during which the structuring variables were last found unchanged
+        self._structuring_check_token = None
         self.reset_data()
 
         self._non_structuring_variables = None
@@ -471,6 +477,7 @@ class ProxyDiscipline:
         else:
             msg = 'all_input_structuring should be a boolean'
             raise ValueError(msg)
+        self.invalidate_structuring_variables_check()
 
     def prepare_execution(self):
         """GEMSEO objects instanciation"""
@@ -1023,6 +1030,7 @@ class ProxyDiscipline:
 
             if var_name in self._structuring_variables:
                 del self._structuring_variables[var_name]
+                self._structuring_variables_fingerprints.pop(var_name, None)
 
         self.build_simple_data_io(io_type)
 
@@ -1037,7 +1045,23 @@ class ProxyDiscipline:
         """
         if var_name in self.get_data_io_dict(io_type):
             self.get_data_io_dict(io_type)[var_name][self.DEFAULT] = new_default_value
-            self.get_data_io_dict(io_type)[var_name][self.VALUE] = new_default_value
+            self.set_value_in_data_io(var_name, io_type, new_default_value)
+
+    def set_value_in_data_io(self, var_name: str, io_type: str, value):
+        """
+        Update VALUE of var_name in data_io and record the change in the data manager, so that the incremental
+        configuration of the ExecutionEngine checks again the disciplines using the variable
+
+        Arguments:
+            var_name (string): variable name
+            io_type (string): IO_TYPE_IN or IO_TYPE_OUT
+            value: value to set
+        """
+        data_io = self.get_data_io_dict(io_type)
+        data_io[var_name][self.VALUE] = value
+        var_f_name = self.get_var_full_name(var_name, data_io)
+        if self.dm.check_data_in_dm(var_f_name):
+            self.dm.changed_var_ids.add(self.dm.get_data_id(var_f_name))
 
     def assign_proxy_to_wrapper(self):
         """Assign the proxy (self) to the SoSWrapp for configuration actions."""
@@ -1074,6 +1098,10 @@ class ProxyDiscipline:
             for disc in self.config_dependent_disciplines:
                 disc.set_configure_status(False)
 
+            # structuring variables may have been added or modified by the configuration
+            self.invalidate_structuring_variables_check()
+            self.dm.configured_disc_ids.add(self.disc_id)
+
     def __check_all_data_integrity(self):
         """
         generic data integrity_check where we call different generic function to check integrity
@@ -1216,6 +1244,8 @@ class ProxyDiscipline:
         self._io_ns_map_out = {}
 
         self._structuring_variables = {}
+        self._structuring_variables_fingerprints = {}
+        self._structuring_check_token = None
 
     def get_data_in(self):
         """ "
@@ -1358,6 +1388,7 @@ class ProxyDiscipline:
             data_dict (Dict[dict]): the data dict to prepare
         """
         new_data_dict = {}
+        compact_data_dict = self.ee.dm.compact_data_dict
         for key, curr_data in data_dict.items():
             # Kill the potential object link here , better way to do that ?
             new_data = dict(curr_data.items())
@@ -1441,6 +1472,7 @@ class ProxyDiscipline:
             if self.STRUCTURING in data_keys and new_data[self.STRUCTURING] is True:
                 if new_data[self.IO_TYPE] == self.IO_TYPE_IN:
                     self._structuring_variables[key] = None
+                    self._structuring_variables_fingerprints.pop(key, None)
                 del new_data[self.STRUCTURING]
             if self.CHECK_INTEGRITY_MSG not in data_keys:
                 new_data[self.CHECK_INTEGRITY_MSG] = ''
@@ -1452,7 +1484,8 @@ class ProxyDiscipline:
                 new_data[self.IS_FORMULA] = False
             if self.IS_EVAL not in data_keys:
                 new_data[self.IS_EVAL] = False
-            new_data_dict[key] = new_data
+            # the metadata are completed in a plain dict, faster to fill, then stored at once in a VariableMetadata
+            new_data_dict[key] = VariableMetadata(new_data) if compact_data_dict else new_data
         return new_data_dict
 
     def get_sosdisc_inputs(self, keys=None, in_dict=False, full_name_keys=False):
@@ -1961,14 +1994,25 @@ class ProxyDiscipline:
         """
         Compare structuring variables stored in discipline with values in dm
         Return True if at least one structuring variable value has changed, False if not
+        During an incremental configuration, the comparison is skipped if the structuring variables have already been
+        found unchanged and the ExecutionEngine has not invalidated the check since
         """
+        check_token = self.ee.structuring_check_token
+        if check_token is not None and self._structuring_check_token is check_token:
+            return False
         _struct_var_changes = self._check_structuring_variables_changes(self._structuring_variables)
         if self.all_input_structuring:
             _struct_var_changes = _struct_var_changes or self._check_structuring_variables_changes(
                 self._non_structuring_variables, variables_keys=self._get_non_structuring_variables_keys()
             )
+        if not _struct_var_changes:
+            self._structuring_check_token = check_token
         return _struct_var_changes
 
+    def invalidate_structuring_variables_check(self):
+        """Force the next check_structuring_variables_changes to compare the structuring variables with the dm"""
+        self._structuring_check_token = None
+
     def set_structuring_variables_values(self):
         """Store structuring variables values from dm in self._structuring_variables"""
         self._set_structuring_variables_values(self._structuring_variables)
@@ -1980,25 +2024,41 @@ class ProxyDiscipline:
             )
 
     def _check_structuring_variables_changes(self, variables_dict, variables_keys=None):
-        dict_values_dm = {
-            key: self.get_sosdisc_inputs(key)
-            for key in (variables_dict.keys() if variables_keys is None else variables_keys)
-        }
-        try:
-            return dict_values_dm != variables_dict
-        except ValueError:
-            return not dict_are_equal(dict_values_dm, variables_dict)
+        """
+        Compare the values in dm with the fingerprints of the values stored in variables_dict, the value stored
+        is fingerprinted if it has been set without _set_structuring_variables_values (None at declaration)
+        """
+        keys_to_check = variables_dict.keys() if variables_keys is None else variables_keys
+        if len(keys_to_check) != len(variables_dict):
+            return True
+        for key in keys_to_check:
+            if key not in variables_dict:
+                return True
+            if key not in self._structuring_variables_fingerprints:
+                self._structuring_variables_fingerprints[key] = compute_fingerprint(variables_dict[key])
+            if not fingerprint_matches(self._structuring_variables_fingerprints[key], self.get_sosdisc_inputs(key)):
+                return True
+        return False
 
     def _set_structuring_variables_values(self, variables_dict, variables_keys=None, clear_variables_dict=False):
+        """
+        Store the values of the variables from dm in variables_dict with their fingerprints, the values are not copied
+        since the changes are detected with the fingerprints
+        """
         disc_in = self.get_data_in()
         keys_to_check = list(
             variables_dict.keys() if variables_keys is None else variables_keys
         )  # copy necessary in case dict is cleared
         if clear_variables_dict:
+            # the fingerprints of variables that became structuring are kept
+            for struct_var in variables_dict.keys() - self._structuring_variables.keys():
+                self._structuring_variables_fingerprints.pop(struct_var, None)
             variables_dict.clear()
         for struct_var in keys_to_check:
             if struct_var in disc_in:
-                variables_dict[struct_var] = deepcopy(self.get_sosdisc_inputs(struct_var))
+                value = self.get_sosdisc_inputs(struct_var)
+                variables_dict[struct_var] = value
+                self._structuring_variables_fingerprints[struct_var] = compute_fingerprint(value)
 
     def _get_non_structuring_variables_keys(self):
         """
@@ -37,6 +37,9 @@ class ProxyMonoInstanceDriver(ProxyDriverEvaluator):
     }
 
     SUBCOUPLING_NAME = 'subprocess'
+    EVALUATION_CACHE_DIR = 'evaluation_cache_dir'
+    EVALUATION_CACHE_MAX_SIZE = 'evaluation_cache_max_size'
+    EVALUATION_CACHE_STATS = 'evaluation_cache_stats'
     DESC_IN = {
         ProxyDriverEvaluator.GATHER_OUTPUTS: {ProxyDriverEvaluator.TYPE: 'dataframe',
                                               ProxyDriverEvaluator.DATAFRAME_DESCRIPTOR: {
@@ -46,9 +49,16 @@ class ProxyMonoInstanceDriver(ProxyDriverEvaluator):
                                               ProxyDriverEvaluator.DATAFRAME_EDITION_LOCKED: False,
                                               ProxyDriverEvaluator.STRUCTURING: True},
         'n_processes': {ProxyDriverEvaluator.TYPE: 'int', ProxyDriverEvaluator.NUMERICAL: True,
-                        ProxyDriverEvaluator.DEFAULT: 1},
+                        ProxyDriverEvaluator.RUN_NEEDED: True, ProxyDriverEvaluator.DEFAULT: 1},
         'wait_time_between_fork': {ProxyDriverEvaluator.TYPE: 'float', ProxyDriverEvaluator.NUMERICAL: True,
-                                   ProxyDriverEvaluator.DEFAULT: 0.0}
+                                   ProxyDriverEvaluator.RUN_NEEDED: True, ProxyDriverEvaluator.DEFAULT: 0.0},
+        # persistent cache of the samples outputs, deactivated if no directory is given
+        EVALUATION_CACHE_DIR: {ProxyDriverEvaluator.TYPE: 'string', ProxyDriverEvaluator.DEFAULT: '',
+                               ProxyDriverEvaluator.NUMERICAL: True, ProxyDriverEvaluator.RUN_NEEDED: True,
+                               ProxyDriverEvaluator.OPTIONAL: True, ProxyDriverEvaluator.STRUCTURING: True},
+        # maximum size of the cache files in MB
+        EVALUATION_CACHE_MAX_SIZE: {ProxyDriverEvaluator.TYPE: 'float', ProxyDriverEvaluator.NUMERICAL: True,
+                                    ProxyDriverEvaluator.RUN_NEEDED: True, ProxyDriverEvaluator.DEFAULT: 1024.0}
     }
 
     DESC_IN.update(ProxyDriverEvaluator.DESC_IN)
@@ -78,6 +88,9 @@ class ProxyMonoInstanceDriver(ProxyDriverEvaluator):
                     {out_name: {self.TYPE: 'dict'}
                      for out_name in selected_outputs_dict.values()})
                 dynamic_outputs.update({'samples_outputs_df': {self.TYPE: 'dataframe'}})
+                if self.EVALUATION_CACHE_DIR in disc_in and self.get_sosdisc_inputs(self.EVALUATION_CACHE_DIR):
+                    # numbers of hits, misses and evictions of the persistent cache of the samples outputs
+                    dynamic_outputs.update({self.EVALUATION_CACHE_STATS: {self.TYPE: 'dict'}})
 
                 self.add_outputs(dynamic_outputs)
 
@@ -408,7 +408,8 @@ class ProxySampleGenerator(ProxyDiscipline):
                 # warn and force config time sampling
                 self.logger.warning(f'Forcing {self.SAMPLING_GENERATION_MODE} to {expected_mode} for '
                                     f'{self.sampling_method} {self.SAMPLING_METHOD}.')
-                disc_in[self.SAMPLING_GENERATION_MODE][self.VALUE] = sampling_generation_mode = expected_mode
+                sampling_generation_mode = expected_mode
+                self.set_value_in_data_io(self.SAMPLING_GENERATION_MODE, self.IO_TYPE_IN, sampling_generation_mode)
         else:
             disc_in[self.SAMPLING_GENERATION_MODE][self.EDITABLE] = True
         return sampling_generation_mode
@@ -21,6 +21,7 @@ import logging
 from collections import ChainMap
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from gemseo import get_available_doe_algorithms
 from gemseo.algos.base_driver_settings import BaseDriverSettings
@@ -200,52 +201,44 @@ class DoeSampleGenerator(AbstractSampleGenerator):
     def _reformat_samples_from_design_space(self, samples, design_space):
         """
         Reformat samples based on the design space to take into account variables with dim >1
-        It uses methods from gemseo Design Space
+        The sample matrix is sliced once by the offsets of the design space variables
         For instance in case of variables of x of dim 1 and z of dim 2
-        [0.0,-10.0, 0.0] becomes [[0.0]   [-10.0, 0.0]]
+        [[0.0,-10.0, 0.0], [1.0, -5.0, 2.0]] becomes {'x': [0.0, 1.0], 'z': [[-10.0, 0.0], [-5.0, 2.0]]}
 
         Arguments:
             samples (numpy matrix of floats) : matrix of n raws  (each raw is an input point to be evaluated)
                                      any variable of dim m will be an array of dim m in a single column of the matrix
-            selected_inputs (list): list of selected variables (the true variables in eval_inputs Desc_in)
             design_space (gemseo DesignSpace): gemseo Design Space with names of variables based on selected_inputs
 
         Returns:
-            reformated_samples (numpy matrix of arrays) : Reformated samples that takes into account variables with dim >1
-                                    matrix of n raws  (each raw is an input point to be evaluated)
-                                    any variable of dim m is an array of dim m in a single column of the matrix
+            reformated_samples (dict) : Reformated samples that takes into account variables with dim >1
+                                    column of n values for each variable (each raw is an input point to be evaluated)
+                                    float, int and string variables are arrays of floats, list variables are lists of
+                                    lists and any other variable of dim m is a list of arrays of dim m
         """
-        selected_inputs = design_space.variable_names
-
-        reformated_samples = []
-        for current_point in samples:  # To be vectorized
-            # Current point  is an array with variables ordered as in selected_inputs
-            # Find the dictionary version of the current point sample
-            current_point_dict = design_space.convert_array_to_dict(current_point)
-
-            reformated_current_point = []
-            for in_variable in selected_inputs:
-                # convert array into data when needed
-                if in_variable in self.selected_inputs_types and (
-                    self.selected_inputs_types[in_variable] in ['float', 'int', 'string']
-                ):
-                    current_point_dict[in_variable] = current_point_dict[in_variable][0]
-                if in_variable in self.selected_inputs_types and (self.selected_inputs_types[in_variable] == 'list'):
-                    current_point_dict[in_variable] = list(current_point_dict[in_variable])
-
-                reformated_current_point.append(current_point_dict[in_variable])
-            reformated_samples.append(reformated_current_point)
+        samples_dict = design_space.convert_array_to_dict(np.asarray(samples))
+
+        reformated_samples = {}
+        for in_variable in design_space.variable_names:
+            variable_samples = samples_dict[in_variable]
+            variable_type = self.selected_inputs_types.get(in_variable)
+            if variable_type in ['float', 'int', 'string']:
+                # convert array into data
+                reformated_samples[in_variable] = variable_samples[:, 0]
+            elif variable_type == 'list':
+                reformated_samples[in_variable] = [list(variable_sample) for variable_sample in variable_samples]
+            else:
+                reformated_samples[in_variable] = list(variable_samples)
 
         return reformated_samples
 
     def _put_samples_in_df_format(self, samples, design_space):
         """
         construction of a dataframe of the generated samples
-        # To be vectorized
 
         Arguments:
-            samples (numpy matrix of arrays) : matrix of n raws  (each raw is an input point to be evaluated)
-                                               any variable of dim m will be an array of dim m in a single column of the matrix
+            samples (dict) : column of n values for each variable (each raw is an input point to be evaluated)
+                             any variable of dim m is an array of dim m in the column of the variable
             design_space (gemseo DesignSpace): gemseo Design Space with names of variables based on selected_inputs
         Returns:
             samples_df (data_frame) : dataframe of a matrix of n raws  (each raw is an input point to be evaluated)
@@ -32,6 +32,8 @@ from numpy import floating, ndarray
 from pandas import DataFrame
 from scipy.sparse import lil_matrix
 
+from sostrades_core.execution_engine.execution_profiler import ExecutionProfiler
+from sostrades_core.execution_engine.sos_wrapp import SparseJacobianBlocks
 from sostrades_core.tools.compare_data_manager_tooling import compare_dict
 from sostrades_core.tools.filter.filter import filter_variables_to_convert
 
@@ -77,6 +79,9 @@ class SoSDiscipline(Discipline):
 
     NUM_DESC_IN = {LINEARIZATION_MODE, 'cache_type', 'cache_file_path', DEBUG_MODE}
 
+    # profiler set by the ExecutionEngine in profiling mode, see set_profiler
+    profiler: ExecutionProfiler | None = None
+
     def __init__(
         self,
         full_name: str,
@@ -133,7 +138,11 @@ class SoSDiscipline(Discipline):
             }
 
         # SoSWrapp run
-        local_data = self.sos_wrapp._run()
+        if self.profiler is None:
+            local_data = self.sos_wrapp._run()
+        else:
+            with self.profiler.profile(self.name, ExecutionProfiler.RUN):
+                local_data = self.sos_wrapp._run()
 
         # debug modes
         if self.debug_mode in ['nan', 'all']:
@@ -158,6 +167,18 @@ class SoSDiscipline(Discipline):
             self.display_min_max_couplings()
         return local_data
 
+    def set_profiler(self, profiler: ExecutionProfiler | None) -> None:
+        """
+        Set the profiler recording the run, the jacobian computation and the grammar data conversions of the discipline
+
+        Args:
+            profiler: The profiler, None to deactivate the profiling.
+        """
+        self.profiler = profiler
+        for grammar in (self.input_grammar, self.output_grammar):
+            grammar.data_converter.profiler = profiler
+            grammar.data_converter.profiled_name = self.name
+
     def execute(
         self,
         input_data,  # type:Optional[Dict[str, Any]]
@@ -391,9 +412,15 @@ class SoSDiscipline(Discipline):
         Overload compute_sos_jacobian of Discipline to call the function in the discipline wrapp
         Then retrieves the 'jac_dict' attribute of the wrapp to update the self.jac
         """
-        self.sos_wrapp.compute_sos_jacobian()
+        if self.profiler is None:
+            self.sos_wrapp.compute_sos_jacobian()
+        else:
+            with self.profiler.profile(self.name, ExecutionProfiler.JACOBIAN):
+                self.sos_wrapp.compute_sos_jacobian()
         for y_key, x_key_dict in self.sos_wrapp.jac_dict.items():
             for x_key, value in x_key_dict.items():
+                if isinstance(value, SparseJacobianBlocks):
+                    value = value.tocsr()
                 self.set_partial_derivative(y_key, x_key, value)
         self.sos_wrapp.jac_dict = {}
 
@@ -14,8 +14,6 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
-import inspect
-import os
 from importlib import import_module
 
 from pandas.core.common import flatten
@@ -28,6 +26,7 @@ from sostrades_core.execution_engine.proxy_optim import ProxyOptim
 from sostrades_core.execution_engine.sos_builder import SoSBuilder
 from sostrades_core.sos_processes.processes_factory import BUILDERS_MODULE_NAME
 from sostrades_core.sos_wrapping.selector_discipline import SelectorDiscipline
+from sostrades_core.tools.class_location_index import get_module_class_path
 
 
 class SosFactoryException(Exception):
@@ -521,42 +520,7 @@ class SosFactory:
         Return the first found for now ..
         """
 
-        module_class_path = None
-        for folder in folder_list:
-            # Get the module of the folder
-            try:
-                module = import_module(folder)
-                folder_path = os.path.dirname(module.__file__)
-            except:
-                raise Warning(f'The folder {folder} is not a module')
-
-            # Get all files in the folder_path
-            file_list = os.listdir(folder_path)
-            # Find all submodules in the path
-            sub_module_list = [
-                import_module('.'.join([folder, file.split('.')[0]]))
-                for file in file_list
-            ]
-
-            for sub_module in sub_module_list:
-                # Find all members of each submodule which are classes
-                # belonging to the sub_module
-                class_list = [
-                    value
-                    for value, cls in inspect.getmembers(sub_module)
-                    if inspect.isclass(getattr(sub_module, value))
-                       and cls.__module__ == sub_module.__name__
-                ]
-                # CHeck if the following class is in the list
-                if class_name in class_list:
-                    module_class_path = '.'.join(
-                        [sub_module.__name__, class_name])
-                    break
-            else:
-                continue
-            break
-
-        return module_class_path
+        return get_module_class_path(class_name, folder_list)
 
     def get_builder_from_class_name(self, sos_name, mod_name, folder_list):
         """
@@ -31,6 +31,7 @@ from gemseo.utils.derivatives.approximation_modes import ApproximationMode
 from numpy import floating, ndarray
 from pandas import DataFrame
 
+from sostrades_core.execution_engine.execution_profiler import ExecutionProfiler, ProfiledMDAIteration
 from sostrades_core.execution_engine.sos_discipline import SoSDiscipline
 from sostrades_core.execution_engine.sos_discipline_driver import SoSDisciplineDriver
 from sostrades_core.tools.filter.filter import filter_variables_to_convert
@@ -87,6 +88,11 @@ class SoSMDAChain(MDAChain):
     }
     NEWTON_ALGO_LIST = ['MDANewtonRaphson', 'MDAGSNewton']
 
+    # profiler set by the ExecutionEngine in profiling mode, see set_profiler
+    profiler: ExecutionProfiler | None = None
+    # results of the profiler, set by the ExecutionEngine on the root coupling after the execution
+    profiling_results: DataFrame | None = None
+
     def __init__(
         self,
         disciplines: Sequence[Discipline],
@@ -179,6 +185,23 @@ class SoSMDAChain(MDAChain):
     def clear_jacobian(self):
         return SoSDiscipline.clear_jacobian(self)  # should rather be double inheritance
 
+    def set_profiler(self, profiler: ExecutionProfiler | None) -> None:
+        """
+        Set the profiler recording the iterations of the inner MDAs and the grammar data conversions of the coupling
+
+        Args:
+            profiler: The profiler, None to deactivate the profiling.
+        """
+        SoSDiscipline.set_profiler(self, profiler)
+        for mda in self.inner_mdas:
+            for sub_mda in [mda, *getattr(mda, 'mda_sequence', [])]:
+                # the inner MDAs convert the coupling variables with their own grammars
+                SoSDiscipline.set_profiler(sub_mda, profiler)
+                if not ProfiledMDAIteration.set_profiler(sub_mda, profiler) and profiler is not None:
+                    self.logger.warning(
+                        "The iterations of the MDA %s are not profiled, its class %s has no %s method.",
+                        sub_mda.name, type(sub_mda).__name__, ProfiledMDAIteration.METHOD_NAME)
+
     def _execute(self):
         """Call the _run method of MDAChain in case of SoSCoupling."""
         # set linear solver options for MDA
@@ -18,8 +18,7 @@ import logging
 from functools import wraps
 
 import numpy as np
-from numpy import array, complex128, ndarray
-from scipy.sparse import lil_matrix
+from scipy.sparse import coo_matrix, csr_matrix, issparse
 
 from sostrades_core.tools.base_functions.compute_len import compute_len
 
@@ -101,6 +100,8 @@ class SoSWrapp(object):
         self.local_data = {}
         self.jac_dict = {}
         self.jac_boundaries = {}
+        # (columns Index, index of each column) of the dataframes used in set_partial_derivative_for_other_types
+        self.__jac_columns_indices = {}
         self.inst_desc_in = {}
         self.inst_desc_out = {}
 
@@ -536,48 +537,24 @@ class SoSWrapp(object):
 
         x_key_full = self.attributes['input_full_name_map'][x_key]
 
-        if y_key_full not in self.jac_dict.keys():
-            self.jac_dict[y_key_full] = {}
-        if x_key_full not in self.jac_dict[y_key_full]:
-            # set to lil_matrix instead of zeros to save memory
-            self.jac_dict[y_key_full][x_key_full] = lil_matrix(
-                self.get_jac_matrix_shape(y_key, x_key))
-        # Check if value is or has complex
-        if type(value[0]) in [complex, complex128]:
-            # Create a new lil_matrix with the same shape but with complex dtype
-            complex_matrix = lil_matrix(self.jac_dict[y_key_full][x_key_full].shape, dtype=complex)
-
-            # Copy the data from the original matrix to the new complex matrix
-            complex_matrix[:, :] = self.jac_dict[y_key_full][x_key_full][:, :]
-            self.jac_dict[y_key_full][x_key_full] = complex_matrix
-        elif isinstance(value, np.ndarray) and type(value[0]) in [array, ndarray]:
-            if value.dtype in [complex, complex128]:
-                # Create a new lil_matrix with the same shape but with complex dtype
-                complex_matrix = lil_matrix(self.jac_dict[y_key_full][x_key_full].shape, dtype=complex)
-
-                # Copy the data from the original matrix to the new complex matrix
-                complex_matrix[:, :] = self.jac_dict[y_key_full][x_key_full][:, :]
-                self.jac_dict[y_key_full][x_key_full] = complex_matrix
-
         if index_y_column is not None and index_x_column is not None:
-            self.jac_dict[y_key_full][x_key_full][index_y_column * lines_nb_y:(index_y_column + 1) * lines_nb_y,
-            index_x_column * lines_nb_x:(index_x_column + 1) * lines_nb_x] = value
+            row_slice = slice(index_y_column * lines_nb_y, (index_y_column + 1) * lines_nb_y)
+            col_slice = slice(index_x_column * lines_nb_x, (index_x_column + 1) * lines_nb_x)
             self.jac_boundaries.update({f'{y_key_full},{y_column}': {'start': index_y_column * lines_nb_y,
                                                                      'end': (index_y_column + 1) * lines_nb_y},
                                         f'{x_key_full},{x_column}': {'start': index_x_column * lines_nb_x,
                                                                      'end': (index_x_column + 1) * lines_nb_x}})
 
         elif index_y_column is None and index_x_column is not None:
-            self.jac_dict[y_key_full][x_key_full][:, index_x_column *
-                                                     lines_nb_x:(index_x_column + 1) * lines_nb_x] = value
-
+            row_slice = slice(None)
+            col_slice = slice(index_x_column * lines_nb_x, (index_x_column + 1) * lines_nb_x)
             self.jac_boundaries.update({f'{y_key_full},{y_column}': {'start': 0,
                                                                      'end': -1},
                                         f'{x_key_full},{x_column}': {'start': index_x_column * lines_nb_x,
                                                                      'end': (index_x_column + 1) * lines_nb_x}})
         elif index_y_column is not None and index_x_column is None:
-            self.jac_dict[y_key_full][x_key_full][index_y_column * lines_nb_y:(index_y_column + 1) * lines_nb_y,
-            :] = value
+            row_slice = slice(index_y_column * lines_nb_y, (index_y_column + 1) * lines_nb_y)
+            col_slice = slice(None)
             self.jac_boundaries.update({f'{y_key_full},{y_column}': {'start': index_y_column * lines_nb_y,
                                                                      'end': (index_y_column + 1) * lines_nb_y},
                                         f'{x_key_full},{x_column}': {'start': 0,
@@ -586,6 +563,22 @@ class SoSWrapp(object):
             raise Exception(
                 'The type of a variable is not yet taken into account in set_partial_derivative_for_other_types')
 
+        if y_key_full not in self.jac_dict.keys():
+            self.jac_dict[y_key_full] = {}
+        if x_key_full not in self.jac_dict[y_key_full]:
+            # blocks are collected as COO triplets and assembled into a CSR matrix once by the discipline
+            self.jac_dict[y_key_full][x_key_full] = SparseJacobianBlocks(self.get_jac_matrix_shape(y_key, x_key))
+
+        jac_matrix = self.jac_dict[y_key_full][x_key_full]
+        if isinstance(jac_matrix, SparseJacobianBlocks):
+            jac_matrix.set_block((index_y_column, index_x_column), row_slice, col_slice, value)
+        else:
+            # the derivative has been set with set_partial_derivative, fill it in place
+            if np.iscomplexobj(value) and not np.iscomplexobj(jac_matrix):
+                jac_matrix = jac_matrix.astype(complex)
+                self.jac_dict[y_key_full][x_key_full] = jac_matrix
+            jac_matrix[row_slice, col_slice] = value
+
     def get_jac_matrix_shape(self, y_key, x_key):
         y_value = self.get_sosdisc_outputs(y_key)
         x_value = self.get_sosdisc_inputs(x_key)
@@ -644,9 +637,19 @@ class SoSWrapp(object):
         if key_type == 'dataframe':
             # Get the number of lines and the index of column from the metadata
             # for standard dataframe fill, there is one column of value per asset in the dataframe value
+            # the column indices are computed once per columns Index (immutable), not for each partial derivative
+            columns_index, column_indices = self.__jac_columns_indices.get((io_type, key), (None, None))
+            if columns_index is not value.columns:
+                value_columns = [column for column in value.columns if column not in self.DEFAULT_EXCLUDED_COLUMNS]
+                column_indices = {}
+                for index_column, value_column in enumerate(value_columns):
+                    column_indices.setdefault(value_column, index_column)
+                self.__jac_columns_indices[(io_type, key)] = (value.columns, column_indices)
             lines_nb = len(value)
-            index_column = [column for column in value.columns if column not in self.DEFAULT_EXCLUDED_COLUMNS].index(
-                column)
+            try:
+                index_column = column_indices[column]
+            except KeyError:
+                raise ValueError(f'{column} is not in list') from None
 
         elif key_type == 'array':
             lines_nb = None
@@ -664,6 +667,92 @@ class SoSWrapp(object):
         return lines_nb, index_column
 
 
+class SparseJacobianBlocks:
+    """
+    Sparse partial derivative assembled block by block by SoSWrapp.set_partial_derivative_for_other_types.
+
+    The non-zero values of each block are stored as COO triplets (rows, columns, data), a block set twice at the same
+    position is replaced, and the matrix is built in CSR format once by tocsr(). The dtype of the matrix is the result
+    dtype of all the blocks so that a complex block does not copy the blocks already set.
+    """
+
+    def __init__(self, shape):
+        """
+        Constructor.
+
+        Arguments:
+            shape (tuple[int, int]): shape of the partial derivative
+        """
+        self.shape = shape
+        # (index_y_column, index_x_column) -> (row_slice, col_slice, rows, cols, data) of the block
+        self.blocks = {}
+
+    def set_block(self, block_key, row_slice, col_slice, value):
+        """
+        Set the values of a block of the partial derivative.
+
+        Arguments:
+            block_key (tuple): index of the column of the output and of the input of the block, None for all
+            row_slice (slice): rows of the block in the partial derivative
+            col_slice (slice): columns of the block in the partial derivative
+            value (ndarray, sparse matrix, list or float): values of the block
+        """
+        row_start, row_stop, _ = row_slice.indices(self.shape[0])
+        col_start, col_stop, _ = col_slice.indices(self.shape[1])
+        block_shape = (row_stop - row_start, col_stop - col_start)
+        if issparse(value):
+            coo_value = coo_matrix(value)
+            if coo_value.shape != block_shape:
+                raise ValueError(f'Block of shape {coo_value.shape} does not fit in slice of shape {block_shape}')
+            nonzero = coo_value.data != 0
+            rows, cols, data = coo_value.row[nonzero], coo_value.col[nonzero], coo_value.data[nonzero]
+        else:
+            dense_value = np.broadcast_to(np.asarray(value), block_shape)
+            rows, cols = np.nonzero(dense_value)
+            data = dense_value[rows, cols]
+        # a block set again moves to the end of the blocks, so that it has the priority over the blocks it overlaps
+        self.blocks.pop(block_key, None)
+        self.blocks[block_key] = (slice(row_start, row_stop), slice(col_start, col_stop),
+                                  rows + row_start, cols + col_start, data)
+
+    def _has_overlapping_blocks(self):
+        """
+        Blocks with a column index None span all the rows or columns and may overlap the other blocks
+        """
+        for axis in (0, 1):
+            indices = {block_key[axis] for block_key in self.blocks}
+            if None in indices and len(indices) > 1:
+                return True
+        return False
+
+    def tocsr(self):
+        """
+        Assemble the partial derivative.
+
+        Returns:
+            csr_matrix: the partial derivative
+        """
+        if not self.blocks:
+            return csr_matrix(self.shape)
+        blocks = list(self.blocks.values())
+        dtype = np.result_type(*[data for _, _, _, _, data in blocks])
+        if self._has_overlapping_blocks():
+            # the last block set has the priority, as for assignments in a matrix: the values of a block that fall in
+            # the slices of a block set after it are dropped
+            masked_blocks = []
+            for i_block, (row_slice, col_slice, rows, cols, data) in enumerate(blocks):
+                kept = np.ones(len(data), dtype=bool)
+                for next_row_slice, next_col_slice, _, _, _ in blocks[i_block + 1:]:
+                    kept &= ~((next_row_slice.start <= rows) & (rows < next_row_slice.stop) &
+                              (next_col_slice.start <= cols) & (cols < next_col_slice.stop))
+                masked_blocks.append((row_slice, col_slice, rows[kept], cols[kept], data[kept]))
+            blocks = masked_blocks
+        rows = np.concatenate([block[2] for block in blocks])
+        cols = np.concatenate([block[3] for block in blocks])
+        data = np.concatenate([block[4] for block in blocks]).astype(dtype, copy=False)
+        return coo_matrix((data, (rows, cols)), shape=self.shape).tocsr()
+
+
 class AccessOnlyProxy:
     """
     Class that proxies an object providing access but avoiding its erroneous referencing. Unrelated to ProxyDiscipline.
@@ -0,0 +1,185 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+from __future__ import annotations
+
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+
+class _Missing:
+    """Marker of a VariableMetadata slot that holds no value."""
+
+    def __repr__(self):
+        return '<missing>'
+
+    def __reduce__(self):
+        # the marker is compared by identity, copies and unpickled objects must refer to the module singleton
+        return '_MISSING'
+
+
+_MISSING = _Missing()
+
+
+class VariableMetadata(MutableMapping):
+    """
+    Compact storage of the metadata of one variable of the DataManager.data_dict, used instead of a plain dict when the
+    DataManager is created with compact_data_dict=True.
+
+    It behaves as a mutable mapping with the same keys and the same semantics as the dict prepared by
+    ProxyDiscipline._prepare_data_dict (a key is in the mapping only if it has been set), but the attributes defined for
+    (almost) every variable are stored in __slots__ instead of a per-variable hash table. Any other attribute is stored
+    in a small dict allocated only when needed.
+    """
+
+    # the attributes with a dedicated slot, the order is the iteration order of the mapping
+    SLOT_ATTRIBUTES = (
+        'type',
+        'value',
+        'default',
+        'io_type',
+        'var_name',
+        'namespace',
+        'ns_reference',
+        'visibility',
+        'type_metadata',
+        'subtype_descriptor',
+        'user_level',
+        'range',
+        'unit',
+        'description',
+        'possible_values',
+        'dataframe_descriptor',
+        'dataframe_edition_locked',
+        'dataframe_excluded_columns',
+        'discipline_full_path_list',
+        'coupling',
+        'optional',
+        'numerical',
+        'run_needed',
+        'meta_input',
+        'editable',
+        'check_integrity_msg',
+        'formula',
+        'is_formula',
+        'is_eval',
+        'model_origin',
+        'disciplines_dependencies',
+    )
+
+    __slots__ = (*SLOT_ATTRIBUTES, '_extra')
+
+    _SLOT_SET = frozenset(SLOT_ATTRIBUTES)
+
+    def __init__(self, data=None, **kwargs):
+        """
+        Constructor.
+
+        Arguments:
+            data (Mapping): initial metadata of the variable
+        """
+        # the slots of the keys never set are left unassigned, which is how a missing key is stored
+        self._extra = None
+        if data is not None:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    def update(self, other=(), **kwargs) -> None:
+        # the items are stored without calling __setitem__ for each of them, as for the ~30 metadata of a new variable
+        for items in (other.items() if hasattr(other, 'items') else other, kwargs.items()):
+            for key, value in items:
+                if key in self._SLOT_SET:
+                    setattr(self, key, value)
+                elif self._extra is None:
+                    self._extra = {key: value}
+                else:
+                    self._extra[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._SLOT_SET:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._SLOT_SET:
+            return getattr(self, key, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._SLOT_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._SLOT_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._SLOT_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.SLOT_ATTRIBUTES:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self.items())})'
+
+    def copy(self) -> VariableMetadata:
+        """
+        Shallow copy of the metadata.
+        """
+        return self.__class__(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Plain dict version of the metadata.
+        """
+        return dict(self.items())
+
+    def __getstate__(self):
+        return tuple(getattr(self, key, _MISSING) for key in self.SLOT_ATTRIBUTES), self._extra
+
+    def __setstate__(self, state):
+        slot_values, extra = state
+        for key, value in zip(self.SLOT_ATTRIBUTES, slot_values):
+            if value is not _MISSING:
+                setattr(self, key, value)
+        self._extra = extra
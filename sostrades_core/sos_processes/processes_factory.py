@@ -26,6 +26,8 @@ from typing import Optional
 
 import yaml
 
+from sostrades_core.sos_processes.processes_index import PROCESSES_INDEX_ENV_VAR, SoSProcessIndex
+
 BUILDERS_MODULE_NAME = 'process'
 PROCESSES_MODULE_NAME = 'sos_processes'
 DEFAULT_RIGHTS_FILE_NAME = 'default_process_rights.yaml'
@@ -37,7 +39,8 @@ class SoSProcessFactory:
     '''Class to manager processes
     '''
 
-    def __init__(self, additional_repository_list=None, search_python_path=True, logger: Optional[logging.Logger] = None):
+    def __init__(self, additional_repository_list=None, search_python_path=True, logger: Optional[logging.Logger] = None,
+                 process_index_file=None):
         """ SoSProcessFactory constructor
 
         :params: additional_repository_list, list with additonal repository to load
@@ -45,6 +48,11 @@ class SoSProcessFactory:
 
         :params: search_python_path, look for process into python path library or not
         :type: boolean, default True
+
+        :params: process_index_file, json file indexing the processes of the libraries and repositories, which are
+        scanned again only when their directories are modified. Default to the SOS_TRADES_PROCESSES_INDEX environment
+        variable, no index is used if it is not set
+        :type: string, default None
         """
 
         self.__processes_dict = None
@@ -68,6 +76,13 @@ class SoSProcessFactory:
         self.__user_default_rights_dict = {}
         self.__group_default_rights_dict = {}
 
+        # processes found in each raw repository
+        self.__repositories_by_process_dict = {}
+
+        if process_index_file is None:
+            process_index_file = environ.get(PROCESSES_INDEX_ENV_VAR)
+        self.__process_index = SoSProcessIndex(process_index_file, self.logger) if process_index_file else None
+
         if additional_repository_list is not None and isinstance(additional_repository_list, list):
             self.__raw_repository_list.extend(additional_repository_list)
 
@@ -79,6 +94,9 @@ class SoSProcessFactory:
         # Set all the default rights in the dicts for each process
         self._set_processes_rights_from_file_dict()
 
+        if self.__process_index is not None:
+            self.__process_index.save()
+
     @property
     def processes_dict(self):
         return self.__processes_dict
@@ -118,12 +136,14 @@ class SoSProcessFactory:
         # -- re-initialize processes_list
         self.__processes_dict = {}
         self.__repository_list = []
+        self.__repositories_by_process_dict = {}
 
         # -- Set one dict per repo
         for repo_path in self.__raw_repository_list:
 
             resolve_raw_repository_processes = self.__get_repositories_by_process(
                 repo_path)
+            self.__repositories_by_process_dict[repo_path] = resolve_raw_repository_processes
 
             self.__repository_list.extend(
                 resolve_raw_repository_processes.keys())
@@ -139,8 +159,9 @@ class SoSProcessFactory:
                 yaml_data = self.__process_default_right_files[repo_path]
                 if yaml_data is not None:
 
-                    resolve_raw_repository_processes = self.__get_repositories_by_process(
-                        repo_path)
+                    resolve_raw_repository_processes = self.__repositories_by_process_dict.get(repo_path)
+                    if resolve_raw_repository_processes is None:
+                        resolve_raw_repository_processes = self.__get_repositories_by_process(repo_path)
 
                     for process in resolve_raw_repository_processes:
                         # fill the lists with the datas
@@ -167,25 +188,36 @@ class SoSProcessFactory:
             libraries = python_path_libraries.split(pathsep)
 
             for library in libraries:
-                self.logger.info(f"Scanning Library {library}. Paths {list(Path(library).rglob(f'*/{PROCESSES_MODULE_NAME}/'))}.")
-                processes_modules = [relpath(p, library).replace(sep, '.') for p in Path(
-                    library).rglob(f'*/{PROCESSES_MODULE_NAME}/')]
-
-                if processes_modules is not None and len(processes_modules) > 0:
-                    self.__raw_repository_list.extend(processes_modules)
-
-                    # From python path, add the automatic default right file if exists
-                    file_name = join(library, DEFAULT_RIGHTS_FILE_NAME)
-                    if Path(file_name).exists():
+                # From python path, add the automatic default right file if exists
+                file_name = join(library, DEFAULT_RIGHTS_FILE_NAME)
+                library_index = self.__process_index.get_library(library) if self.__process_index is not None else None
+                if library_index is not None:
+                    self.logger.info(f'Library {library} found unchanged in the processes index.')
+                    processes_modules = library_index['processes_modules']
+                    yaml_data = library_index['rights']
+                else:
+                    processes_paths = list(Path(library).rglob(f'*/{PROCESSES_MODULE_NAME}/'))
+                    self.logger.info(f"Scanning Library {library}. Paths {processes_paths}.")
+                    processes_modules = [relpath(p, library).replace(sep, '.') for p in processes_paths]
+
+                    yaml_data = None
+                    if len(processes_modules) > 0 and Path(file_name).exists():
                         self.logger.info('--found default right file--')
                         # Read the file
                         # Open and read the yaml file
                         with open(file_name) as stream:
                             yaml_data = yaml.load(stream, Loader=yaml.FullLoader)
                             self.logger.info(f'data from default file:{yaml_data}')
-                            if yaml_data is not None:
-                                for process_module in processes_modules:
-                                    self.__process_default_right_files[process_module] = yaml_data
+
+                    if self.__process_index is not None:
+                        self.__process_index.set_library(library, processes_modules, file_name, yaml_data)
+
+                if processes_modules is not None and len(processes_modules) > 0:
+                    self.__raw_repository_list.extend(processes_modules)
+
+                    if yaml_data is not None:
+                        for process_module in processes_modules:
+                            self.__process_default_right_files[process_module] = yaml_data
 
     def __get_repositories_by_process(self, repository_module_name):
         """ retrieve the list of process name into the specified module name
@@ -200,6 +232,12 @@ class SoSProcessFactory:
 
         repositories_by_process = {}
 
+        if self.__process_index is not None:
+            indexed_repositories_by_process = self.__process_index.get_repository(repository_module_name)
+            if indexed_repositories_by_process is not None:
+                self.logger.debug(f'Processes of module {repository_module_name} found in the processes index')
+                return indexed_repositories_by_process
+
         # Convert repository module to corresponding python module in order
         # to retrieve module path
         try:
@@ -235,6 +273,10 @@ class SoSProcessFactory:
                         process_name)
                     self.logger.debug(f'Find {process_module} / {process_name}')
 
+                if self.__process_index is not None:
+                    self.__process_index.set_repository(repository_module_name, repository_module_path,
+                                                        repositories_by_process)
+
             else:
                 self.logger.warning(
                     f'Unable to load the following module {repository_module_name}')
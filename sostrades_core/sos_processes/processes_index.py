@@ -0,0 +1,199 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# mode: python; py-indent-offset: 4; tab-width: 8; coding:utf-8
+# -- on-disk index of the processes found in the libraries and repositories
+
+PROCESSES_INDEX_ENV_VAR = 'SOS_TRADES_PROCESSES_INDEX'
+PROCESSES_INDEX_VERSION = 1
+LIBRARIES = 'libraries'
+REPOSITORIES = 'repositories'
+DIRECTORIES = 'directories'
+
+
+def get_directories_fingerprint(root_path):
+    """ Return the modification time of each directory of a tree
+
+    A file or a directory added, removed or renamed modifies the modification time of its parent directory, as used by
+    the python import system to invalidate its own caches. The hidden and __pycache__ directories are not tracked as
+    their content changes without any process being added or removed.
+
+    :params: root_path, root directory of the tree
+    :type: string
+
+    :return: dict {directory path: modification time in ns}
+    """
+    fingerprint = {}
+    for dir_path, dir_names, _ in os.walk(root_path):
+        dir_names[:] = [dir_name for dir_name in dir_names
+                        if not dir_name.startswith('.') and dir_name != '__pycache__']
+        try:
+            fingerprint[dir_path] = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            continue
+    return fingerprint
+
+
+def get_file_fingerprint(file_path):
+    """ Return the [modification time in ns, size] of a file, None if it does not exist
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return [file_stat.st_mtime_ns, file_stat.st_size]
+
+
+def is_fingerprint_unchanged(fingerprint):
+    """ Check that the directories of a fingerprint all exist with the same modification time
+    """
+    for dir_path, mtime_ns in fingerprint.items():
+        try:
+            if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def find_package_path(module_name):
+    """ Return the directory of a regular package without importing it, as it would be found from sys.path
+
+    :params: module_name, package name (import like name)
+    :type: string
+
+    :return: directory of the package, None if it cannot be resolved without importing it (namespace package, package
+    provided by an import hook...)
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        module_file = getattr(module, '__file__', None)
+        return os.path.dirname(os.path.abspath(module_file)) if module_file is not None else None
+
+    module_path_parts = module_name.split('.')
+    for path in sys.path:
+        if not isinstance(path, str):
+            continue
+        top_package_path = os.path.join(os.path.abspath(path), module_path_parts[0])
+        if os.path.isfile(os.path.join(top_package_path, '__init__.py')):
+            # the subpackages are searched in the first regular top package found
+            package_path = os.path.join(top_package_path, *module_path_parts[1:])
+            return package_path if os.path.isfile(os.path.join(package_path, '__init__.py')) else None
+        if os.path.isfile(f'{top_package_path}.py'):
+            return None
+    return None
+
+
+class SoSProcessIndex:
+    '''Index of the processes modules found in the PYTHONPATH libraries and of the processes of each repository, stored
+    in a json file and invalidated per library or repository when one of its directories is modified
+    '''
+
+    def __init__(self, file_path, logger: Optional[logging.Logger] = None):
+        """ SoSProcessIndex constructor
+
+        :params: file_path, path of the json file of the index, created at first save
+        :type: string
+        """
+        self.file_path = Path(file_path)
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.__modified = False
+        self.__index = self.__load()
+
+    def __load(self):
+        index = None
+        if self.file_path.exists():
+            try:
+                with open(self.file_path) as index_file:
+                    index = json.load(index_file)
+            except (OSError, ValueError) as error:
+                self.logger.warning(f'Unable to read the processes index {self.file_path} : {error}')
+        if not isinstance(index, dict) or index.get('version') != PROCESSES_INDEX_VERSION:
+            index = {'version': PROCESSES_INDEX_VERSION, LIBRARIES: {}, REPOSITORIES: {}}
+        return index
+
+    def get_library(self, library):
+        """ Return the indexed processes modules and rights of a library, None if it is not indexed or has been modified
+
+        :params: library, path of the PYTHONPATH library
+        :type: string
+
+        :return: dict with the 'processes_modules' list and the 'rights' read in the default rights file
+        """
+        entry = self.__index[LIBRARIES].get(library)
+        if entry is None or not is_fingerprint_unchanged(entry[DIRECTORIES]) or \
+                get_file_fingerprint(entry['rights_file_path']) != entry['rights_file']:
+            return None
+        return entry
+
+    def set_library(self, library, processes_modules, rights_file_path, rights):
+        """ Index the processes modules and the default rights read in a library
+        """
+        self.__index[LIBRARIES][library] = {DIRECTORIES: get_directories_fingerprint(library),
+                                            'processes_modules': processes_modules,
+                                            'rights_file_path': rights_file_path,
+                                            'rights_file': get_file_fingerprint(rights_file_path),
+                                            'rights': rights}
+        self.__modified = True
+
+    def get_repository(self, repository_module_name):
+        """ Return the indexed processes of a repository module, None if it is not indexed or has been modified
+
+        :params: repository_module_name, module name (import like name)
+        :type: string
+
+        :return: dict {process module: process name list}
+        """
+        entry = self.__index[REPOSITORIES].get(repository_module_name)
+        if entry is None or find_package_path(repository_module_name) != entry['path'] or \
+                not is_fingerprint_unchanged(entry[DIRECTORIES]):
+            return None
+        return entry['processes']
+
+    def set_repository(self, repository_module_name, repository_module_path, repositories_by_process):
+        """ Index the processes found in the directory of a repository module
+        """
+        self.__index[REPOSITORIES][repository_module_name] = {
+            'path': os.path.abspath(repository_module_path),
+            DIRECTORIES: get_directories_fingerprint(repository_module_path),
+            'processes': repositories_by_process}
+        self.__modified = True
+
+    def save(self):
+        """ Write the index if it has been modified, the file is replaced atomically so that concurrent processes read
+        either the previous or the new index
+        """
+        if not self.__modified:
+            return
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=self.file_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'w') as tmp_file:
+                    json.dump(self.__index, tmp_file)
+                os.replace(tmp_path, self.file_path)
+            finally:
+                Path(tmp_path).unlink(missing_ok=True)
+            self.__modified = False
+        except (OSError, TypeError, ValueError) as error:
+            self.logger.warning(f'Unable to write the processes index {self.file_path} : {error}')
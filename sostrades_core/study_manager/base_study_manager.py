@@ -256,6 +256,7 @@ class BaseStudyManager:
             self.execution_engine.display_treeview_nodes()
 
         # Retrieve data to load and make sure they have the correct type
+        reading_start_time = time()
         usecase_data = []
 
         if from_input_dict is not None:
@@ -271,6 +272,7 @@ class BaseStudyManager:
 
         for uc_d in usecase_data:
             input_dict_to_load.update(uc_d)
+        data_reading_time = time() - reading_start_time
 
         # Initialize execution engine with data
         # import ipdb
@@ -297,7 +299,10 @@ class BaseStudyManager:
             self.execution_engine.display_treeview_nodes()
 
         study_display_name = f"{self.repository_name}.{self.process_name}.{self.study_name}"
-        message = f"Study {study_display_name} loading time : {time() - start_time} seconds"
+        message = (
+            f"Study {study_display_name} loading time : {time() - start_time} seconds "
+            f"({len(input_dict_to_load)} variables read in {data_reading_time} seconds)"
+        )
         logger.info(message)
         return parameter_changes
 
@@ -344,7 +349,7 @@ class BaseStudyManager:
         if self.execution_engine.root_process.is_prepared:
             # Retrieve cache_map to dump
             self.dump_cache_map = self.execution_engine.get_cache_map_to_dump()
-            if self.dump_cache_map == {}:
+            if len(self.dump_cache_map) == 0:
                 # 2nd solution
                 self.dumped_cache = False
                 if self.study_cache_file_path.exists():
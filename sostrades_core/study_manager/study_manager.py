@@ -167,6 +167,14 @@ class StudyManager(BaseStudyManager):
         """Activate debug mode for the study."""
         self.execution_engine.set_debug_mode()
 
+    def set_profiling_mode(self, active: bool = True) -> None:
+        """Activate (or deactivate) the profiling of the execution of the study.
+
+        Args:
+            active: Whether to activate the profiling mode.
+        """
+        self.execution_engine.set_profiling_mode(active)
+
     def test(self, force_run: bool = False) -> None:
         """Test the usecase.
 
@@ -0,0 +1,56 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import time
+import unittest
+
+from sostrades_core.tools import class_location_index
+from sostrades_core.tools.class_location_index import clear_classes_index, get_module_class_path
+
+
+class TestPerfosClassLocationIndex(unittest.TestCase):
+    """
+    Benchmark of the location of the classes of the builders of an architecture: import of the modules of the folders
+    at each lookup vs classes index built from their sources
+    """
+
+    def setUp(self):
+        self.folder_list = ['sostrades_core.sos_wrapping', 'sostrades_core.sos_wrapping.test_discs']
+        self.class_names = ['SumValueBlockDiscipline', 'ValueBlockDiscipline', 'Disc1', 'Disc2', 'DiscAllTypes']
+        self.n_builders = 300
+
+    def test_01_perfos_class_location_index(self):
+        class_names = [self.class_names[i % len(self.class_names)] for i in range(self.n_builders)]
+
+        # the index is built first, before the import of the modules of the folders
+        clear_classes_index()
+        start_time = time.time()
+        module_class_paths = [get_module_class_path(class_name, self.folder_list) for class_name in class_names]
+        index_time = time.time() - start_time
+
+        start_time = time.time()
+        ref_module_class_paths = [class_location_index._find_module_class_path_by_import(class_name, self.folder_list)
+                                  for class_name in class_names]
+        import_time = time.time() - start_time
+
+        print(f'{self.n_builders} builders : import of the modules {import_time:.2f} s / '
+              f'classes index {index_time:.2f} s')
+        self.assertListEqual(module_class_paths, ref_module_class_paths)
+
+
+if '__main__' == __name__:
+    cls = TestPerfosClassLocationIndex()
+    cls.setUp()
+    cls.test_01_perfos_class_location_index()
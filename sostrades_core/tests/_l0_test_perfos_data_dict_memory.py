@@ -0,0 +1,81 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import sys
+import time
+import tracemalloc
+import unittest
+
+import pandas as pd
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+
+
+class TestPerfosDataDictMemory(unittest.TestCase):
+    """
+    Benchmark of the memory used by the variables metadata of the data manager with dict vs VariableMetadata storage
+    """
+
+    def setUp(self):
+        self.study_name = 'usecase'
+        self.repo = 'sostrades_core.sos_processes.test.tests_driver_eval.multi'
+        self.proc_name = 'test_multi_driver_simple'
+        self.n_scenarios = 500
+
+    def _configure_multi_scenario_study(self, compact_data_dict):
+        ee = ExecutionEngine(self.study_name, compact_data_dict=compact_data_dict)
+        builder = ee.factory.get_builder_from_process(self.repo, self.proc_name)
+        ee.factory.set_builders_to_coupling_builder(builder)
+        ee.configure()
+        scenario_df = pd.DataFrame({'selected_scenario': [True] * self.n_scenarios,
+                                    'scenario_name': [f'scenario_{i}' for i in range(self.n_scenarios)]})
+        ee.load_study_from_input_dict({f'{self.study_name}.multi_scenarios.samples_df': scenario_df})
+        return ee
+
+    @staticmethod
+    def _metadata_size(data_dict):
+        size = 0
+        for metadata in data_dict.values():
+            size += sys.getsizeof(metadata)
+            extra = getattr(metadata, '_extra', None)
+            if extra is not None:
+                size += sys.getsizeof(extra)
+        return size
+
+    def test_01_data_dict_memory_multi_scenario(self):
+        results = {}
+        for compact_data_dict in [False, True]:
+            tracemalloc.start()
+            start_time = time.time()
+            ee = self._configure_multi_scenario_study(compact_data_dict)
+            configure_time = time.time() - start_time
+            traced_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            results[compact_data_dict] = (len(ee.dm.data_dict), self._metadata_size(ee.dm.data_dict),
+                                          traced_memory, configure_time)
+            print(f'compact_data_dict={compact_data_dict} : {results[compact_data_dict][0]} variables, '
+                  f'metadata containers {results[compact_data_dict][1] / 1e6:.2f} MB, '
+                  f'total traced memory {traced_memory / 1e6:.2f} MB, configure {configure_time:.2f} s')
+            del ee
+
+        self.assertEqual(results[False][0], results[True][0])
+        self.assertLess(results[True][1], results[False][1])
+        self.assertLess(results[True][2], results[False][2])
+
+
+if '__main__' == __name__:
+    cls = TestPerfosDataDictMemory()
+    cls.setUp()
+    cls.test_01_data_dict_memory_multi_scenario()
@@ -0,0 +1,107 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from sostrades_core.execution_engine.proxy_discipline import ProxyDiscipline
+from sostrades_core.tools.check_data_integrity.check_data_integrity import CheckDataIntegrity
+
+
+def _check_column_element_by_element(self, column, column_descriptor, key):
+    # previous implementation of the check of a dataframe column, kept as a reference for the benchmark
+    column_type = column_descriptor[0]
+    column_range = column_descriptor[1]
+    values_in_column = column.values.tolist()
+    value_good_type = True
+    if column_type in self.VAR_TYPE_MAP.keys():
+        if not all(isinstance(item, self.VAR_TYPE_MAP[column_type]) for item in values_in_column):
+            self._CheckDataIntegrity__add_msg_to_check_integrity_msg_list(
+                f'Dataframe values in column {key} are not as type {column_type} requested in the dataframe descriptor')
+            value_good_type = False
+    if column_range is not None and value_good_type:
+        if column_type == 'string':
+            if not all(item in column_range for item in values_in_column):
+                self._CheckDataIntegrity__add_msg_to_check_integrity_msg_list(
+                    f'Dataframe values in column {key} are not in the possible list {column_range} requested in the '
+                    f'dataframe descriptor')
+        elif not all(item <= column_range[1] for item in values_in_column) and all(
+                column_range[0] <= item for item in values_in_column):
+            self._CheckDataIntegrity__add_msg_to_check_integrity_msg_list(
+                f'Dataframe values in column {key} are not in the range {column_range} requested in the dataframe '
+                f'descriptor')
+
+
+class TestPerfosDataIntegrityDataframes(unittest.TestCase):
+    """
+    Benchmark of the data integrity checks of a study with many dataframe inputs: checks element by element vs
+    vectorized checks, and checks of unchanged dataframes at a new configure
+    """
+
+    def setUp(self):
+        self.n_dataframes = 2000
+        self.n_years = 81
+        years = np.arange(2020, 2020 + self.n_years)
+        countries = ['France', 'Germany', 'Italy', 'Spain']
+        dataframe_descriptor = {'years': ('int', [2000, 2200], False),
+                                'production': ('float', [0., 1e6], True),
+                                'price': ('float', [0., 1e4], True),
+                                'share': ('float', [0., 1.], True),
+                                'country': ('string', countries, True)}
+        self.var_data_dicts = []
+        for i in range(self.n_dataframes):
+            df_value = pd.DataFrame({'years': years, 'production': np.linspace(0., 1e3 + i, self.n_years),
+                                     'price': np.full(self.n_years, 50.), 'share': np.linspace(0., 1., self.n_years),
+                                     'country': [countries[j % len(countries)] for j in range(self.n_years)]})
+            # one dataframe out of ten is out of the range of the descriptor
+            if i % 10 == 0:
+                df_value.loc[0, 'share'] = 2.
+            self.var_data_dicts.append({
+                ProxyDiscipline.VAR_NAME: f'df_{i}', ProxyDiscipline.IO_TYPE: ProxyDiscipline.IO_TYPE_IN,
+                ProxyDiscipline.TYPE: 'dataframe', ProxyDiscipline.OPTIONAL: False,
+                ProxyDiscipline.VALUE: df_value, ProxyDiscipline.RANGE: None,
+                ProxyDiscipline.POSSIBLE_VALUES: None, ProxyDiscipline.IS_FORMULA: False,
+                ProxyDiscipline.DATAFRAME_EDITION_LOCKED: False,
+                ProxyDiscipline.DATAFRAME_DESCRIPTOR: dataframe_descriptor})
+
+    def _check_all(self, check_data_integrity):
+        start_time = time.time()
+        messages = [check_data_integrity.check_variable_value(var_data_dict, True)
+                    for var_data_dict in self.var_data_dicts]
+        return messages, time.time() - start_time
+
+    def test_01_perfos_data_integrity_dataframes(self):
+        with patch.object(CheckDataIntegrity, '_CheckDataIntegrity__check_dataframe_column_with_df_descriptor',
+                          _check_column_element_by_element):
+            ref_messages, ref_time = self._check_all(CheckDataIntegrity(ProxyDiscipline, None))
+        check_data_integrity = CheckDataIntegrity(ProxyDiscipline, None)
+        messages, vectorized_time = self._check_all(check_data_integrity)
+        cached_messages, cached_time = self._check_all(check_data_integrity)
+
+        print(f'{self.n_dataframes} dataframes of {self.n_years} rows : element by element {ref_time:.2f} s / '
+              f'vectorized {vectorized_time:.2f} s / unchanged values {cached_time:.2f} s')
+        self.assertListEqual(messages, ref_messages)
+        self.assertListEqual(cached_messages, ref_messages)
+        self.assertEqual(sum(1 for message in messages if message), self.n_dataframes // 10)
+
+
+if '__main__' == __name__:
+    cls = TestPerfosDataIntegrityDataframes()
+    cls.setUp()
+    cls.test_01_perfos_data_integrity_dataframes()
@@ -0,0 +1,68 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import time
+import unittest
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+from sostrades_core.execution_engine.proxy_discipline import ProxyDiscipline
+
+
+class TestPerfosDataManagerShortNameIndex(unittest.TestCase):
+    """
+    Benchmark of the resolution of short variable names in a large data manager: linear scan of the data_id_map vs
+    short name index
+    """
+
+    def setUp(self):
+        self.study_name = 'usecase'
+        self.n_scenarios = 2000
+        self.n_variables = 100
+        self.n_lookups = 200
+
+    def _create_dm(self):
+        ee = ExecutionEngine(self.study_name)
+        dm = ee.dm
+        # variables added outside of the dm methods, the indexes are rebuilt at first use
+        for i in range(self.n_scenarios):
+            for j in range(self.n_variables):
+                var_id = dm.get_an_uuid()
+                dm.data_dict[var_id] = {ProxyDiscipline.VALUE: float(j)}
+                dm.data_id_map[f'{self.study_name}.multi_scenarios.scenario_{i}.Disc.var_{j}'] = var_id
+        dm.invalidate_full_name_index()
+        return dm
+
+    def test_01_perfos_short_name_index(self):
+        dm = self._create_dm()
+        var_names = [f'var_{j % self.n_variables}' for j in range(self.n_lookups)]
+
+        start_time = time.time()
+        ref_full_names = [[key for key in dm.data_id_map.keys() if key.endswith(f'.{var_name}')]
+                          for var_name in var_names]
+        scan_time = time.time() - start_time
+
+        start_time = time.time()
+        full_names = [dm.get_all_namespaces_from_var_name(var_name) for var_name in var_names]
+        index_time = time.time() - start_time
+
+        print(f'{len(dm.data_id_map)} variables, {self.n_lookups} lookups : linear scan {scan_time:.2f} s / '
+              f'short name index {index_time:.2f} s (including its build)')
+        self.assertListEqual(full_names, ref_full_names)
+
+
+if '__main__' == __name__:
+    cls = TestPerfosDataManagerShortNameIndex()
+    cls.setUp()
+    cls.test_01_perfos_short_name_index()
@@ -0,0 +1,103 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import time
+import tracemalloc
+import unittest
+
+import numpy as np
+from gemseo.core.parallel_execution.callable_parallel_execution import (
+    CallableParallelExecution,
+)
+
+from sostrades_core.execution_engine.disciplines_wrappers.driver_outputs_store import DriverOutputsStore
+from sostrades_core.execution_engine.disciplines_wrappers.mono_instance_driver_wrapper import (
+    SubprocessSampleEvaluator,
+)
+
+
+class LargeOutputsDiscipline:
+    """Discipline stub whose execution returns an array of output_size floats and a float"""
+
+    def __init__(self, output_size):
+        self.output_size = output_size
+
+    def execute(self, input_data):
+        return {'Eval.y': np.full(self.output_size, input_data['Eval.x']), 'Eval.objective': input_data['Eval.x']}
+
+
+class TestPerfosDoeOutputsStore(unittest.TestCase):
+    """
+    Benchmark of the parallel evaluation of a DOE whose workers write their outputs in the shared buffers of the
+    outputs store vs workers sending their outputs back through the multiprocessing queues. The memory is the peak of
+    the allocations of the driver process plus the size of the shared buffers.
+    """
+
+    def setUp(self):
+        self.n_scenarios = 1000
+        self.output_size = 10000
+        self.n_processes = 2
+        self.output_names = ['Eval.y', 'Eval.objective']
+        self.scenario_names = [f'scenario_{i}' for i in range(self.n_scenarios)]
+
+    def _evaluate(self, shared):
+        outputs_store = DriverOutputsStore(self.output_names, self.n_scenarios, shared=shared)
+        sub_discipline = LargeOutputsDiscipline(self.output_size)
+        # the reference scenario is evaluated in the driver process and allocates the buffers
+        outputs_store.store(self.n_scenarios - 1, sub_discipline.execute({'Eval.x': float(self.n_scenarios - 1)}))
+        sample_evaluator = SubprocessSampleEvaluator(sub_discipline, {}, self.output_names,
+                                                     outputs_store=outputs_store if shared else None)
+        parallel = CallableParallelExecution([sample_evaluator], n_processes=self.n_processes)
+
+        def store_callback(index, out_local_data):
+            outputs_store.store(index, out_local_data, written_in_buffers=shared)
+
+        parallel.execute([(i, {'Eval.x': float(i)}) for i in range(self.n_scenarios - 1)],
+                         exec_callback=store_callback)
+        samples_outputs_df = outputs_store.get_samples_outputs_df(self.scenario_names, ['y', 'objective'])
+        gathered_outputs = {output_name: outputs_store.get_gathered_output(output_name, self.scenario_names)
+                            for output_name in self.output_names}
+        return samples_outputs_df, gathered_outputs
+
+    def _measure(self, shared):
+        tracemalloc.start()
+        start_time = time.time()
+        results = self._evaluate(shared)
+        wall_time = time.time() - start_time
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if shared:
+            # the shared buffers are not traced by tracemalloc
+            peak_memory += self.n_scenarios * (self.output_size + 1) * np.dtype(np.float64).itemsize
+        return results, wall_time, peak_memory / 2 ** 20
+
+    def test_01_perfos_doe_outputs_store(self):
+        (queues_df, queues_gathered), queues_time, queues_memory = self._measure(shared=False)
+        (shared_df, shared_gathered), shared_time, shared_memory = self._measure(shared=True)
+
+        print(f'{self.n_scenarios} scenarios with outputs of {self.output_size} floats on {self.n_processes} '
+              f'processes : outputs sent through the queues {queues_time:.2f} s, peak {queues_memory:.0f} MiB / '
+              f'outputs written in shared buffers {shared_time:.2f} s, peak {shared_memory:.0f} MiB')
+        for scenario_name in self.scenario_names[::100]:
+            np.testing.assert_array_equal(queues_gathered['Eval.y'][scenario_name],
+                                          shared_gathered['Eval.y'][scenario_name])
+        self.assertDictEqual(queues_gathered['Eval.objective'], shared_gathered['Eval.objective'])
+        self.assertListEqual(queues_df['objective'].tolist(), shared_df['objective'].tolist())
+
+
+if '__main__' == __name__:
+    cls = TestPerfosDoeOutputsStore()
+    cls.setUp()
+    cls.test_01_perfos_doe_outputs_store()
@@ -0,0 +1,106 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import multiprocessing
+import time
+import unittest
+
+import numpy as np
+
+from sostrades_core.tools.grad_solvers.validgrad.FDGradient import FDGradient
+
+
+def _process_worker(f_pointer, index, x_in, return_dict):
+    return_dict[index] = f_pointer(x_in)
+
+
+def _evaluate_with_processes(f_pointer, samples):
+    """
+    Previous multi-process evaluation of FDGradient: one process started per perturbed point, by batches of cpu count
+    processes, with the outputs sent back through a manager dict
+    """
+    n_procs = multiprocessing.cpu_count()
+    return_dict = multiprocessing.Manager().dict()
+    for n in range(0, len(samples), n_procs):
+        jobs = [multiprocessing.Process(target=_process_worker, args=(f_pointer, index, samples[index], return_dict))
+                for index in range(n, min(n + n_procs, len(samples)))]
+        for job in jobs:
+            job.start()
+        for job in jobs:
+            job.join()
+    return [return_dict[i] for i in range(len(samples))]
+
+
+class TestPerfosFDGradient(unittest.TestCase):
+    """
+    Benchmark of the finite differences gradients of 1st and 2nd order schemes: one process per perturbed point vs
+    pool of worker processes vs one vectorized call on the stacked perturbed points
+    """
+
+    def setUp(self):
+        self.dimensions = [100, 1000]
+        self.scheme_orders = [1, 2]
+        self.n_outputs = 50
+        self.n_processes = multiprocessing.cpu_count()
+
+    def test_01_perfos_fd_gradient(self):
+        for n in self.dimensions:
+            matrix = np.random.default_rng(0).random((self.n_outputs, n))
+            x = np.linspace(0., 1., n)
+
+            def f(x_in):
+                return np.tanh(matrix @ x_in)
+
+            def f_stacked(x_stacked):
+                return np.tanh(x_stacked @ matrix.T)
+
+            for scheme_order in self.scheme_orders:
+                fd_gradient = FDGradient(scheme_order, f, fd_step=1e-6)
+                start_time = time.time()
+                ref_grad = fd_gradient.grad_f(x)
+                sequential_time = time.time() - start_time
+
+                fd_gradient.get_scheme().set_x(x)
+                fd_gradient.get_scheme().generate_samples()
+                start_time = time.time()
+                _evaluate_with_processes(f, fd_gradient.get_scheme().get_samples())
+                processes_time = time.time() - start_time
+
+                fd_gradient = FDGradient(scheme_order, f, fd_step=1e-6, n_processes=self.n_processes)
+                fd_gradient.set_multi_proc(True)
+                start_time = time.time()
+                pool_grad = fd_gradient.grad_f(x)
+                pool_time = time.time() - start_time
+                start_time = time.time()
+                fd_gradient.grad_f(x)
+                reused_pool_time = time.time() - start_time
+                fd_gradient.close_pool()
+
+                fd_gradient = FDGradient(scheme_order, f_stacked, fd_step=1e-6, vectorized=True)
+                start_time = time.time()
+                vectorized_grad = fd_gradient.grad_f(x)
+                vectorized_time = time.time() - start_time
+
+                print(f'order {scheme_order}, {n} inputs : sequential {sequential_time:.3f} s / one process per point '
+                      f'{processes_time:.3f} s / pool of {self.n_processes} {pool_time:.3f} s, reused '
+                      f'{reused_pool_time:.3f} s / vectorized {vectorized_time:.3f} s')
+                np.testing.assert_array_equal(pool_grad, ref_grad)
+                np.testing.assert_allclose(vectorized_grad, ref_grad, atol=1e-6)
+
+
+if '__main__' == __name__:
+    cls = TestPerfosFDGradient()
+    cls.setUp()
+    cls.test_01_perfos_fd_gradient()
@@ -0,0 +1,83 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from sostrades_core.datasets.datasets_serializers.filesystem_datasets_serializer import (
+    _load_dataframe,
+    _save_dataframe,
+)
+from sostrades_core.tools.compare_data_manager_tooling import dict_are_equal
+from sostrades_core.tools.tree.deserialization import isevaluatable
+
+
+class TestPerfosFileSystemDataframeLoading(unittest.TestCase):
+    """
+    Benchmark of the loading of dataframes csv files of the filesystem datasets serializer vs the evaluation of every
+    cell
+    """
+
+    def setUp(self):
+        self.n_rows = 10000
+        self.n_columns = 100
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _benchmark(self, df, case_name):
+        csv_path = os.path.join(self.tmp_dir, f'{case_name}.csv')
+        _save_dataframe(csv_path, df)
+
+        start_time = time.time()
+        evaluated_df = pd.read_csv(csv_path, na_filter=False).map(isevaluatable)
+        evaluated_time = time.time() - start_time
+
+        start_time = time.time()
+        loaded_df = _load_dataframe(csv_path)
+        loaded_time = time.time() - start_time
+
+        print(f'{case_name} : {df.size} cells, evaluation of every cell {evaluated_time:.2f} s, '
+              f'typed loading {loaded_time:.2f} s (speedup x{evaluated_time / loaded_time:.1f})')
+        self.assertTrue(dict_are_equal({'df': loaded_df}, {'df': evaluated_df}))
+
+    def test_01_perfos_numerical_dataframe(self):
+        df = pd.DataFrame(np.random.random((self.n_rows, self.n_columns)),
+                          columns=[f'column_{i}' for i in range(self.n_columns)])
+        df.insert(0, 'years', np.arange(self.n_rows))
+        self._benchmark(df, 'numerical')
+
+    def test_02_perfos_dataframe_with_object_columns(self):
+        n_object_columns = 10
+        df = pd.DataFrame(np.random.random((self.n_rows, self.n_columns - n_object_columns)),
+                          columns=[f'column_{i}' for i in range(self.n_columns - n_object_columns)])
+        for i in range(n_object_columns):
+            df[f'type_{i}'] = np.random.choice(['alpha', 'beta', 'gamma'], self.n_rows)
+        self._benchmark(df, 'with_object_columns')
+
+
+if '__main__' == __name__:
+    cls = TestPerfosFileSystemDataframeLoading()
+    cls.setUp()
+    cls.test_01_perfos_numerical_dataframe()
+    cls.test_02_perfos_dataframe_with_object_columns()
+    cls.tearDown()
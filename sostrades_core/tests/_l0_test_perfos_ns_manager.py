@@ -0,0 +1,77 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import time
+import unittest
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+
+
+class TestPerfosNamespaceManager(unittest.TestCase):
+    """
+    Benchmark of the namespace manager operations of a scatter with an increasing number of scenarios
+    """
+
+    def setUp(self):
+        self.study_name = 'usecase'
+        self.n_scenarios_list = [100, 1000, 10000]
+        self.ns_names = ['ns_ac', 'ns_disc1', 'ns_disc2']
+
+    def _scatter_namespaces(self, n_scenarios):
+        ee = ExecutionEngine(self.study_name)
+        ns_manager = ee.ns_manager
+        shared_ns_ids = [ns_manager.add_ns(ns_name, f'{self.study_name}.{ns_name}') for ns_name in self.ns_names]
+        start_time = time.time()
+
+        # namespaces of each scenario as built by the scatter tool
+        scenario_ns_ids = []
+        for i in range(n_scenarios):
+            for ns_name in self.ns_names:
+                ns_value = ns_manager.update_ns_value_with_extra_ns(f'{self.study_name}.{ns_name}',
+                                                                    f'multi_scenarios.scenario_{i}',
+                                                                    after_name=self.study_name)
+                ns_id = ns_manager.add_ns(ns_name, ns_value, add_in_shared_ns_dict=False, clean_existing=False)
+                ns_manager.add_disc_in_dependency_list_of_namespace(ns_id, f'disc_{i}')
+                scenario_ns_ids.append(ns_id)
+            # the namespaces of the disciplines still in the data manager are kept
+            ee.dm.disciplines_dict[f'disc_{i}'] = {ee.dm.DISC_REF: ns_manager}
+            for ns_id in shared_ns_ids:
+                ns_manager.add_disc_in_dependency_list_of_namespace(ns_id, f'disc_{i}')
+
+        # half of the scenarios are deleted
+        for ns_id in scenario_ns_ids[:len(scenario_ns_ids) // 2]:
+            ns_manager.get_ns_from_id(ns_id).remove_dependency(f'disc_{ns_id.split("scenario_")[1]}')
+        for i in range(n_scenarios // 2):
+            del ee.dm.disciplines_dict[f'disc_{i}']
+            for ns_id in shared_ns_ids:
+                ns_manager.get_ns_from_id(ns_id).remove_dependency(f'disc_{i}')
+        ns_manager.clean_ns_without_dependencies()
+        for ns_name in self.ns_names:
+            ns_manager.get_all_namespace_with_name(ns_name)
+        elapsed_time = time.time() - start_time
+
+        self.assertEqual(len(ns_manager.ns_list), len(self.ns_names) * (n_scenarios - n_scenarios // 2 + 1))
+        return elapsed_time
+
+    def test_01_perfos_ns_manager(self):
+        for n_scenarios in self.n_scenarios_list:
+            elapsed_time = self._scatter_namespaces(n_scenarios)
+            print(f'{n_scenarios} scenarios, {len(self.ns_names) * n_scenarios} namespaces : {elapsed_time:.2f} s')
+
+
+if '__main__' == __name__:
+    cls = TestPerfosNamespaceManager()
+    cls.setUp()
+    cls.test_01_perfos_ns_manager()
@@ -0,0 +1,83 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import time
+import unittest
+from multiprocessing import cpu_count
+
+import numpy as np
+import pandas as pd
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+from sostrades_core.sos_processes.test.tests_driver_eval.mono.test_mono_driver_sample_generator_sellar_coupling.usecase1_doe_mono import (
+    Study as StudySellarDoe,
+)
+from sostrades_core.sos_processes.test.tests_driver_eval.mono.test_mono_driver_simple.usecase_mono import (
+    Study as StudyDisc1Doe,
+)
+
+
+class TestPerfosParallelDoe(unittest.TestCase):
+    """
+    Benchmark of the sequential vs parallel evaluation of the samples of a mono-instance driver
+    """
+
+    def setUp(self):
+        self.study_name = 'usecase'
+        self.repo = 'sostrades_core.sos_processes.test.tests_driver_eval.mono'
+        self.n_samples = 200
+        self.n_processes_list = sorted({1, 2, 4, cpu_count()})
+
+    def _run_usecase(self, proc_name, usecase_cls, n_processes, update_dict):
+        ee = ExecutionEngine(self.study_name)
+        builder = ee.factory.get_builder_from_process(self.repo, proc_name)
+        ee.factory.set_builders_to_coupling_builder(builder)
+        ee.configure()
+        usecase = usecase_cls(execution_engine=ee)
+        usecase.study_name = self.study_name
+        values_dict = usecase.setup_usecase()[0]
+        values_dict.update(update_dict)
+        values_dict[f'{self.study_name}.Eval.n_processes'] = n_processes
+        ee.load_study_from_input_dict(values_dict)
+
+        start_time = time.time()
+        ee.execute()
+        return time.time() - start_time
+
+    def _benchmark(self, proc_name, usecase_cls, update_dict):
+        wall_times = {}
+        for n_processes in self.n_processes_list:
+            wall_times[n_processes] = self._run_usecase(proc_name, usecase_cls, n_processes, update_dict)
+            print(f'{proc_name} : {self.n_samples} samples on {n_processes} process(es) : '
+                  f'{wall_times[n_processes]:.2f} s (speedup x{wall_times[1] / wall_times[n_processes]:.2f})')
+        return wall_times
+
+    def test_01_perfos_parallel_doe_sellar(self):
+        update_dict = {f'{self.study_name}.SampleGenerator.algo_options': {'n_samples': self.n_samples}}
+        self._benchmark('test_mono_driver_sample_generator_sellar_coupling', StudySellarDoe, update_dict)
+
+    def test_02_perfos_parallel_doe_disc1(self):
+        samples_df = pd.DataFrame({'selected_scenario': [True] * self.n_samples,
+                                   'scenario_name': [f'scenario_{i}' for i in range(1, self.n_samples + 1)],
+                                   'Disc1.a': np.linspace(0., 10., self.n_samples)})
+        update_dict = {f'{self.study_name}.Eval.samples_df': samples_df}
+        self._benchmark('test_mono_driver_simple', StudyDisc1Doe, update_dict)
+
+
+if '__main__' == __name__:
+    cls = TestPerfosParallelDoe()
+    cls.setUp()
+    cls.test_01_perfos_parallel_doe_sellar()
+    cls.test_02_perfos_parallel_doe_disc1()
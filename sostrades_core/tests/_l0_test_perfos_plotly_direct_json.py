@@ -0,0 +1,78 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import json
+import time
+import unittest
+
+import numpy as np
+from plotly.utils import PlotlyJSONEncoder
+
+from sostrades_core.tools.post_processing.charts.two_axes_instanciated_chart import (
+    InstanciatedSeries,
+    TwoAxesInstanciatedChart,
+)
+from sostrades_core.tools.post_processing.pie_charts.instanciated_pie_chart import InstanciatedPieChart
+from sostrades_core.tools.post_processing.post_processing_factory import convert_post_processings_into_json
+from sostrades_core.tools.post_processing.tables.instanciated_table import InstanciatedTable
+
+
+class TestPerfosPlotlyDirectJson(unittest.TestCase):
+    """
+    Benchmark of the conversion of charts with many series into json: through the plotly objects vs written directly
+    """
+
+    def setUp(self):
+        self.n_charts = 100
+        self.n_series = 20
+        self.n_years = 81
+
+    def _create_post_processings(self):
+        years = np.arange(2020, 2020 + self.n_years)
+        display_types = [InstanciatedSeries.LINES_DISPLAY, InstanciatedSeries.BAR_DISPLAY,
+                         InstanciatedSeries.SCATTER_DISPLAY, InstanciatedSeries.DASH_LINES_DISPLAY]
+        post_processings = []
+        for i in range(self.n_charts):
+            chart = TwoAxesInstanciatedChart('years', 'production', chart_name=f'Chart {i}', stacked_bar=True)
+            for j in range(self.n_series):
+                chart.add_series(InstanciatedSeries(years, np.linspace(0., 1e3 + i + j, self.n_years), f'series {j}',
+                                                    display_types[j % len(display_types)]))
+            post_processings.append(chart)
+            post_processings.append(InstanciatedPieChart(f'Pie chart {i}', [f'series {j}' for j in range(self.n_series)],
+                                                         list(np.arange(self.n_series, dtype=float))))
+            post_processings.append(InstanciatedTable(f'Table {i}', ['years'] + [f'series {j}' for j in range(10)],
+                                                      [years.tolist()] + [np.linspace(0., 1., self.n_years).tolist()
+                                                                          for _ in range(10)]))
+        return post_processings
+
+    def _convert(self, direct):
+        post_processings = self._create_post_processings()
+        start_time = time.time()
+        json_objects = convert_post_processings_into_json(post_processings, direct=direct)
+        return json.loads(json.dumps(json_objects, cls=PlotlyJSONEncoder)), time.time() - start_time
+
+    def test_01_perfos_plotly_direct_json(self):
+        ref_json_objects, plotly_time = self._convert(False)
+        json_objects, direct_time = self._convert(True)
+
+        print(f'{self.n_charts} charts of {self.n_series} series, pie charts and tables : plotly objects '
+              f'{plotly_time:.2f} s / direct json {direct_time:.2f} s')
+        self.assertListEqual(json_objects, ref_json_objects)
+
+
+if '__main__' == __name__:
+    cls = TestPerfosPlotlyDirectJson()
+    cls.setUp()
+    cls.test_01_perfos_plotly_direct_json()
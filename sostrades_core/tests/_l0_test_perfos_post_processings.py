@@ -0,0 +1,83 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import time
+import unittest
+
+import pandas as pd
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+from sostrades_core.tools.post_processing.post_processing_factory import PostProcessingFactory
+
+
+class TestPerfosPostProcessings(unittest.TestCase):
+    """
+    Benchmark of the generation of the post processings of a multi scenario study: serial vs on a thread pool, and
+    memoized json post processings of unchanged disciplines
+    """
+
+    def setUp(self):
+        self.study_name = 'usecase'
+        self.repo = 'sostrades_core.sos_processes.test.tests_driver_eval.multi'
+        self.proc_name = 'test_multi_driver'
+        self.n_scenarios = 200
+        self.max_workers = 4
+
+    def _run_multi_scenario_study(self):
+        ee = ExecutionEngine(self.study_name)
+        builder = ee.factory.get_builder_from_process(self.repo, self.proc_name)
+        ee.factory.set_builders_to_coupling_builder(builder)
+        ee.configure()
+        scenario_names = [f'scenario_{i}' for i in range(self.n_scenarios)]
+        values_dict = {f'{self.study_name}.multi_scenarios.samples_df': pd.DataFrame(
+            {'selected_scenario': [True] * self.n_scenarios, 'scenario_name': scenario_names})}
+        ee.load_study_from_input_dict(values_dict)
+        for i, scenario_name in enumerate(scenario_names):
+            scenario = f'{self.study_name}.multi_scenarios.{scenario_name}'
+            values_dict.update({f'{scenario}.x': float(i), f'{scenario}.Disc1.a': 3., f'{scenario}.Disc1.b': 4.,
+                                f'{scenario}.Disc2.constant': 10., f'{scenario}.Disc2.power': 2})
+        ee.load_study_from_input_dict(values_dict)
+        ee.execute()
+        return ee
+
+    @staticmethod
+    def _generate(post_processing_factory, ee, max_workers=1):
+        start_time = time.time()
+        all_post_processings_bundle = post_processing_factory.get_all_post_processings(ee, False,
+                                                                                       max_workers=max_workers)
+        return all_post_processings_bundle, time.time() - start_time
+
+    def test_01_perfos_post_processings(self):
+        ee = self._run_multi_scenario_study()
+        ref_bundles, serial_time = self._generate(PostProcessingFactory(), ee)
+        post_processing_factory = PostProcessingFactory()
+        bundles, parallel_time = self._generate(post_processing_factory, ee, self.max_workers)
+        memoized_bundles, memoized_time = self._generate(post_processing_factory, ee, self.max_workers)
+
+        n_charts = sum(len(bundle.post_processings) for bundles_list in ref_bundles.values()
+                       for bundle in bundles_list)
+        print(f'{self.n_scenarios} scenarios, {n_charts} post processings : serial {serial_time:.2f} s / '
+              f'{self.max_workers} workers {parallel_time:.2f} s / memoized {memoized_time:.2f} s')
+        for all_post_processings_bundle in (bundles, memoized_bundles):
+            self.assertListEqual(list(all_post_processings_bundle.keys()), list(ref_bundles.keys()))
+            for key, bundles_list in all_post_processings_bundle.items():
+                self.assertListEqual([bundle.post_processings for bundle in bundles_list],
+                                     [bundle.post_processings for bundle in ref_bundles[key]])
+
+
+if '__main__' == __name__:
+    cls = TestPerfosPostProcessings()
+    cls.setUp()
+    cls.test_01_perfos_post_processings()
@@ -0,0 +1,94 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import sys
+import tempfile
+import time
+import unittest
+from os.path import join
+from pathlib import Path
+from unittest.mock import patch
+
+from sostrades_core.sos_processes import processes_factory
+from sostrades_core.sos_processes.processes_factory import SoSProcessFactory
+
+
+class TestPerfosProcessesIndex(unittest.TestCase):
+    """
+    Benchmark of the startup of the SoSProcessFactory on PYTHONPATH libraries: cold start with the scan of the
+    libraries vs warm start from the processes index
+    """
+
+    def setUp(self):
+        self.n_libraries = 10
+        self.n_packages = 5
+        self.n_processes = 40
+        self.n_data_dirs = 200
+        self.n_data_files = 20
+
+    def _create_libraries(self, tmp_dir):
+        libraries = []
+        for i in range(self.n_libraries):
+            library = join(tmp_dir, f'library_{i}')
+            for j in range(self.n_packages):
+                package_dir = Path(library, f'perfos_lib_{i}_package_{j}')
+                for k in range(self.n_processes):
+                    process_dir = Path(package_dir, 'sos_processes', 'test', f'process_{k}')
+                    process_dir.mkdir(parents=True)
+                    Path(process_dir, '__init__.py').touch()
+                    Path(process_dir, 'process.py').touch()
+                for init_dir in [package_dir, Path(package_dir, 'sos_processes'),
+                                 Path(package_dir, 'sos_processes', 'test')]:
+                    Path(init_dir, '__init__.py').touch()
+                # data and models directories scanned with the processes
+                for k in range(self.n_data_dirs // self.n_packages):
+                    data_dir = Path(package_dir, 'data', f'data_{k}')
+                    data_dir.mkdir(parents=True)
+                    for m in range(self.n_data_files):
+                        Path(data_dir, f'file_{m}.csv').touch()
+            libraries.append(library)
+        return libraries
+
+    @staticmethod
+    def _start(libraries, process_index_file=None):
+        for module_name in [module_name for module_name in sys.modules if module_name.startswith('perfos_lib_')]:
+            del sys.modules[module_name]
+        start_time = time.time()
+        with patch.dict(processes_factory.environ, {'PYTHONPATH': processes_factory.pathsep.join(libraries)}):
+            factory = SoSProcessFactory(process_index_file=process_index_file)
+        return factory, time.time() - start_time
+
+    def test_01_perfos_processes_index(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            libraries = self._create_libraries(tmp_dir)
+            sys.path[:0] = libraries
+            try:
+                index_file = join(tmp_dir, 'processes_index.json')
+                ref_factory, no_index_time = self._start(libraries)
+                _, cold_time = self._start(libraries, index_file)
+                factory, warm_time = self._start(libraries, index_file)
+            finally:
+                del sys.path[:len(libraries)]
+
+            print(f'{self.n_libraries} libraries, {self.n_libraries * self.n_packages * self.n_processes} processes : '
+                  f'without index {no_index_time:.2f} s / cold start {cold_time:.2f} s / '
+                  f'warm start {warm_time:.2f} s')
+            self.assertDictEqual(factory.get_processes_dict(), ref_factory.get_processes_dict())
+
+
+if '__main__' == __name__:
+    cls = TestPerfosProcessesIndex()
+    cls.setUp()
+    cls.test_01_perfos_processes_index()
@@ -0,0 +1,96 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import lil_matrix
+
+from sostrades_core.execution_engine.sos_wrapp import SoSWrapp
+
+
+class DataFrameWrapp(SoSWrapp):
+    """
+    Wrapp with a dataframe input and output with one column of values per asset
+    """
+
+    DESC_IN = {'x': {'type': 'dataframe'}}
+    DESC_OUT = {'y': {'type': 'dataframe'}}
+
+
+class TestPerfosSparseJacobian(unittest.TestCase):
+    """
+    Benchmark of the assembly of a partial derivative set column by column with set_partial_derivative_for_other_types
+    vs the previous sequential lil_matrix assignment
+    """
+
+    def setUp(self):
+        self.n_columns = 50
+        self.n_years = 100
+        self.columns = [f'asset_{i}' for i in range(self.n_columns)]
+        values = {'years': np.arange(2000, 2000 + self.n_years)} | {column: np.ones(self.n_years)
+                                                                     for column in self.columns}
+        self.wrapp = DataFrameWrapp('wrapp', logging.getLogger(__name__))
+        self.wrapp.attributes = {'input_full_name_map': {'x': 'usecase.x'},
+                                 'output_full_name_map': {'y': 'usecase.y'}}
+        self.wrapp.input_full_name_map = {'x': 'usecase.x'}
+        self.wrapp.output_full_name_map = {'y': 'usecase.y'}
+        self.wrapp.local_data = {'usecase.x': pd.DataFrame(values), 'usecase.y': pd.DataFrame(values)}
+        # diagonal block of each column, and a dependency of each column on the first one
+        self.blocks = [(column, column, np.identity(self.n_years)) for column in self.columns] + \
+                      [(column, self.columns[0], 0.5 * np.identity(self.n_years)) for column in self.columns[1:]]
+
+    def _assemble_lil(self):
+        # previous implementation: sequential slice assignment in a lil_matrix converted by the discipline
+        size = self.n_columns * self.n_years
+        jacobian = lil_matrix((size, size))
+        for y_column, x_column, value in self.blocks:
+            index_y = self.columns.index(y_column)
+            index_x = self.columns.index(x_column)
+            jacobian[index_y * self.n_years:(index_y + 1) * self.n_years,
+                     index_x * self.n_years:(index_x + 1) * self.n_years] = value
+        return jacobian.tocsr()
+
+    def _assemble_sparse(self):
+        self.wrapp.jac_dict = {}
+        for y_column, x_column, value in self.blocks:
+            self.wrapp.set_partial_derivative_for_other_types(('y', y_column), ('x', x_column), value)
+        return self.wrapp.jac_dict['usecase.y']['usecase.x'].tocsr()
+
+    def test_01_perfos_sparse_jacobian_assembly(self):
+        n_repeat = 5
+        start_time = time.time()
+        for _ in range(n_repeat):
+            lil_jacobian = self._assemble_lil()
+        lil_time = (time.time() - start_time) / n_repeat
+
+        start_time = time.time()
+        for _ in range(n_repeat):
+            sparse_jacobian = self._assemble_sparse()
+        sparse_time = (time.time() - start_time) / n_repeat
+
+        print(f'{len(self.blocks)} blocks of {self.n_years}x{self.n_years} in a '
+              f'{sparse_jacobian.shape[0]}x{sparse_jacobian.shape[1]} jacobian : lil assignment {lil_time:.3f} s, '
+              f'COO/CSR assembly {sparse_time:.3f} s (speedup x{lil_time / sparse_time:.1f})')
+        self.assertEqual((lil_jacobian != sparse_jacobian).nnz, 0)
+
+
+if '__main__' == __name__:
+    cls = TestPerfosSparseJacobian()
+    cls.setUp()
+    cls.test_01_perfos_sparse_jacobian_assembly()
@@ -29,6 +29,12 @@ from sostrades_core.sos_processes.test.test_sellar_coupling.usecase import (
 )
 from sostrades_core.study_manager.base_study_manager import BaseStudyManager
 from sostrades_core.tools.folder_operations import rmtree_safe
+from sostrades_core.tools.rw.load_dump_dm_data import (
+    DirectLoadDump,
+    StreamingCacheDirectLoadDump,
+    StreamingCacheLoadDump,
+    StreamingCacheMap,
+)
 
 
 class TestLoadSimpleCache(unittest.TestCase):
@@ -623,6 +629,70 @@ class TestLoadSimpleCache(unittest.TestCase):
 #
 #         self.dir_to_del.append(self.dump_dir)
 
+    def test_11_streaming_cache_dump_and_load(self):
+        '''
+        Dump the cache entry by entry and load it lazily, or from a cache pickle written with the previous format
+        '''
+        dump_dir = join(self.dump_dir, 'test_11')
+        self.dir_to_del.append(self.dump_dir)
+
+        study_dump = study_disc1_disc2()
+        study_dump.load_data()
+        dict_values = {f'{study_dump.study_name}.cache_type': 'SimpleCache',
+                       f'{study_dump.study_name}.propagate_cache_to_children': True}
+        study_dump.load_data(from_input_dict=dict_values)
+        study_dump.set_dump_directory(dump_dir)
+        cache_pkl_path = join(dump_dir, 'sostrades_core.sos_processes.test',
+                              'test_disc1_disc2_coupling', study_dump.study_name, 'cache.pkl')
+        # the default strategy writes the cache pickle with the previous format
+        study_dump.run(dump_study=True)
+        self.assertFalse(StreamingCacheLoadDump.is_streaming_cache_file(cache_pkl_path))
+
+        study_dump.rw_strategy = StreamingCacheDirectLoadDump()
+        study_dump.run(dump_study=True)
+        cache_map_from_pkl = study_dump.execution_engine.dm.cache_map
+        self.assertTrue(StreamingCacheLoadDump.is_streaming_cache_file(cache_pkl_path))
+
+        for previous_format in (False, True):
+            study_load = BaseStudyManager(
+                self.repo_name, self.proc_name_disc1_disc2, study_dump.study_name)
+            study_load.rw_strategy = StreamingCacheDirectLoadDump()
+            study_load.load_data(from_path=dump_dir)
+            study_load.load_disciplines_data(study_folder_path=dump_dir)
+            study_load.read_cache_pickle(study_folder_path=dump_dir)
+            if previous_format:
+                self.assertIsInstance(study_load.loaded_cache, dict)
+            else:
+                self.assertIsInstance(study_load.loaded_cache, StreamingCacheMap)
+            self.assertListEqual(list(study_load.loaded_cache.keys()), list(cache_map_from_pkl.keys()))
+
+            # the unanonymized cache map is read and converted at the access to the cache of a discipline
+            unanonymized_cache_map = study_load.execution_engine.unanonymize_caches_in_cache_map(
+                study_load.loaded_cache)
+            for disc_id, disc_cache in cache_map_from_pkl.items():
+                self.assertDictEqual(unanonymized_cache_map[disc_id][1]['inputs'], disc_cache.last_entry.inputs)
+
+            study_load.run()
+            for disc_cache_id, disc_cache_dump in cache_map_from_pkl.items():
+                disc_cache_load = study_load.ee.dm.cache_map[disc_cache_id]
+                self.assertDictEqual(disc_cache_dump.last_entry.outputs, disc_cache_load.last_entry.outputs)
+
+            if not previous_format:
+                # dump the cache in the folder it has been loaded from, the loaded cache maps remain valid
+                other_loaded_cache = StreamingCacheLoadDump().load(cache_pkl_path)
+                study_load.manage_dump_cache()
+                study_load.dump_cache(dirname(cache_pkl_path))
+                StreamingCacheLoadDump().dump(study_load.loaded_cache, cache_pkl_path)
+                for loaded_cache in (study_load.loaded_cache, other_loaded_cache):
+                    unanonymized_cache_map = study_load.execution_engine.unanonymize_caches_in_cache_map(loaded_cache)
+                    for disc_id, disc_cache in cache_map_from_pkl.items():
+                        self.assertDictEqual(unanonymized_cache_map[disc_id][1]['inputs'],
+                                             disc_cache.last_entry.inputs)
+
+                # write the cache pickle with the previous format, a whole pickle of the cache map
+                DirectLoadDump().dump(dict(study_load.loaded_cache.items()), cache_pkl_path)
+                self.assertFalse(StreamingCacheLoadDump.is_streaming_cache_file(cache_pkl_path))
+
 
 if '__main__' == __name__:
     cls = TestLoadSimpleCache()
@@ -14,9 +14,16 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
+import json
+import sys
+import tempfile
 import unittest
+from os.path import join
+from pathlib import Path
+from unittest.mock import patch
 
-from sostrades_core.sos_processes.processes_factory import SoSProcessFactory
+from sostrades_core.sos_processes import processes_factory
+from sostrades_core.sos_processes.processes_factory import DEFAULT_RIGHTS_FILE_NAME, SoSProcessFactory
 
 
 class TestSoSProcessFactory(unittest.TestCase):
@@ -60,3 +67,64 @@ class TestSoSProcessFactory(unittest.TestCase):
 
         for target in target_list:
             self.assertIn(target, SoSPF_process_list)
+
+    @staticmethod
+    def _create_process(library, package, process_name):
+        process_dir = Path(library, package, 'sos_processes', 'test', process_name)
+        process_dir.mkdir(parents=True)
+        for init_dir in [Path(library, package), Path(library, package, 'sos_processes'),
+                         Path(library, package, 'sos_processes', 'test'), process_dir]:
+            Path(init_dir, '__init__.py').touch()
+        Path(process_dir, 'process.py').touch()
+
+    def test_04_processes_index(self):
+        '''
+        Check that the processes of the unchanged libraries and repositories are read from the processes index
+        '''
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            library = join(tmp_dir, 'library')
+            package = 'sostrades_index_test_package'
+            self._create_process(library, package, 'process_a')
+            self._create_process(library, package, 'process_b')
+            with open(join(library, DEFAULT_RIGHTS_FILE_NAME), 'w') as rights_file:
+                rights_file.write('user-mail:\n  - user@mail.com\n')
+            index_file = join(tmp_dir, 'index', 'processes_index.json')
+            repository = f'{package}.sos_processes.test'
+
+            sys.path.insert(0, library)
+            try:
+                with patch.dict(processes_factory.environ, {'PYTHONPATH': library}):
+                    ref_factory = SoSProcessFactory()
+                    self.assertFalse(Path(index_file).exists())
+
+                    SoSProcessFactory(process_index_file=index_file)
+                    with open(index_file) as index:
+                        self.assertIn(library, json.load(index)['libraries'])
+
+                    # no scan and no import of the repositories of the unchanged library
+                    sys.modules.pop(f'{package}.sos_processes', None)
+                    with patch.object(processes_factory, 'import_module') as import_module, \
+                            patch.object(processes_factory.Path, 'rglob') as rglob:
+                        factory = SoSProcessFactory(process_index_file=index_file)
+                        import_module.assert_not_called()
+                        rglob.assert_not_called()
+                    self.assertDictEqual(factory.get_processes_dict(), ref_factory.get_processes_dict())
+                    self.assertListEqual(sorted(factory.get_processes_id_list(repository)),
+                                         ['process_a', 'process_b'])
+                    self.assertDictEqual(factory.get_user_default_rights_dict(),
+                                         ref_factory.get_user_default_rights_dict())
+                    self.assertListEqual(factory.get_user_default_rights_dict()[repository], ['user@mail.com'])
+
+                    # a modified library is scanned again
+                    self._create_process(library, package, 'process_c')
+                    with open(join(library, DEFAULT_RIGHTS_FILE_NAME), 'w') as rights_file:
+                        rights_file.write('user-mail:\n  - other_user@mail.com\n')
+                    factory = SoSProcessFactory(process_index_file=index_file)
+                    self.assertListEqual(sorted(factory.get_processes_id_list(repository)),
+                                         ['process_a', 'process_b', 'process_c'])
+                    self.assertListEqual(factory.get_user_default_rights_dict()[repository],
+                                         ['other_user@mail.com'])
+            finally:
+                sys.path.remove(library)
+                for module_name in [module_name for module_name in sys.modules if module_name.startswith(package)]:
+                    del sys.modules[module_name]
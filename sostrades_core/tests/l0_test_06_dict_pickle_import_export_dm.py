@@ -389,3 +389,31 @@ class TestSerializeDF(unittest.TestCase):
         self.assertEqual(exec_eng2.dm.get_value(self.name + '.multi_scenarios.scenario_1.Disc1.a'), a1)
         self.assertEqual(y1, a1 * x1 + b1)
         self.assertEqual(y2, a2 * x2 + b2)
+
+    def test_07_load_from_pickle_with_study_renaming(self):
+        dump_dir = join(self.out_dir, 'test_load_from_pickle_with_study_renaming')
+        makedirs_safe(dump_dir)
+        self.dir_to_del.append(self.out_dir)
+        serializer = DataSerializer()
+        serializer.dm_pkl_file = Path(dump_dir) / 'dm.pkl'
+        # the study name also appears inside the variable names, only the leading study name is renamed
+        loaded_dict = {
+            'Study.Disc.Study_param': {'value': 1.0},
+            'Study.Disc.x': {'value': array([1.0, 2.0])},
+            'Study.ns_Study.y': {'value': 'y'},
+        }
+        DirectLoadDump().dump(loaded_dict, serializer.dm_pkl_file)
+
+        data_dict = {key.replace('Study', 'NewStudy', 1): {'value': None, 'unit': '-'} for key in loaded_dict}
+        serializer.load_from_pickle(data_dict, DirectLoadDump())
+        self.assertListEqual(
+            list(data_dict.keys()), ['NewStudy.Disc.Study_param', 'NewStudy.Disc.x', 'NewStudy.ns_Study.y']
+        )
+        self.assertEqual(data_dict['NewStudy.Disc.Study_param'], {'value': 1.0, 'unit': '-'})
+        self.assertListEqual(list(data_dict['NewStudy.Disc.x']['value']), [1.0, 2.0])
+        self.assertEqual(data_dict['NewStudy.ns_Study.y']['value'], 'y')
+
+        # a loaded variable that does not exist in the data dict
+        data_dict = {'NewStudy.Disc.x': {'value': None}}
+        with self.assertRaises(KeyError):
+            serializer.load_from_pickle(data_dict, DirectLoadDump())
@@ -20,6 +20,8 @@ from logging import INFO, getLogger
 from os.path import dirname, join
 from pathlib import Path
 
+import pandas as pd
+
 from sostrades_core.execution_engine.execution_engine import ExecutionEngine
 from sostrades_core.study_manager.base_study_manager import BaseStudyManager
 from sostrades_core.tools.folder_operations import rmtree_safe
@@ -245,3 +247,47 @@ class TestExecutionEngine(unittest.TestCase):
         except Exception:
             issue_using_sos_logging = True
         assert not issue_using_sos_logging
+
+    def test_06_incremental_configure(self):
+        repo = 'sostrades_core.sos_processes.test.tests_driver_eval.multi'
+        self.assertTrue(ExecutionEngine(self.name).incremental_configure)
+        exec_engines = []
+        for incremental_configure in [False, True]:
+            exec_eng = ExecutionEngine(self.name)
+            exec_eng.incremental_configure = incremental_configure
+            builder = exec_eng.factory.get_builder_from_process(repo, 'test_multi_driver_simple')
+            exec_eng.factory.set_builders_to_coupling_builder(builder)
+            exec_eng.configure()
+            for n_scenarios in [3, 5, 2]:
+                samples_df = pd.DataFrame({'selected_scenario': [True] * n_scenarios,
+                                           'scenario_name': [f'scenario_{i}' for i in range(n_scenarios)]})
+                exec_eng.load_study_from_input_dict({f'{self.name}.multi_scenarios.samples_df': samples_df})
+                self.assertTrue(exec_eng.root_process.is_configured())
+                report = exec_eng.configure_iterations_report
+                self.assertListEqual([it['iteration'] for it in report], list(range(len(report))))
+                self.assertGreater(sum(it['reconfigured_disciplines'] for it in report), 0)
+
+            # the value written by the coupling when the preconditioner is not available is tracked by the dm
+            exec_eng.load_study_from_input_dict({f'{self.name}.linear_solver_MDA_preconditioner': 'gasm'})
+            self.assertEqual(exec_eng.dm.get_value(f'{self.name}.linear_solver_MDA_preconditioner'), 'None')
+            self.assertEqual(exec_eng.configure_iterations_report[0]['changed_variables'], 2)
+
+            # a non structuring change does not rebuild the coupling structure with the incremental configuration
+            coupling_structure = exec_eng.root_process.coupling_structure
+            exec_eng.load_study_from_input_dict({f'{self.name}.multi_scenarios.scenario_0.a': 3.0})
+            self.assertEqual(exec_eng.root_process.coupling_structure is coupling_structure, incremental_configure)
+            self.assertTrue(exec_eng.root_process.is_configured())
+            exec_engines.append(exec_eng)
+
+        # same configured study with and without incremental configuration
+        exec_eng_ref, exec_eng_incr = exec_engines
+        self.assertListEqual(sorted(exec_eng_ref.dm.data_id_map.keys()), sorted(exec_eng_incr.dm.data_id_map.keys()))
+        self.assertListEqual(sorted(exec_eng_ref.dm.disciplines_id_map.keys()),
+                             sorted(exec_eng_incr.dm.disciplines_id_map.keys()))
+        self.assertListEqual(list(exec_eng_ref.root_process.get_data_in().keys()),
+                             list(exec_eng_incr.root_process.get_data_in().keys()))
+        self.assertListEqual(list(exec_eng_ref.root_process.get_data_out().keys()),
+                             list(exec_eng_incr.root_process.get_data_out().keys()))
+        self.assertListEqual([it['reconfigured_disciplines'] for it in exec_eng_ref.configure_iterations_report],
+                             [it['reconfigured_disciplines'] for it in exec_eng_incr.configure_iterations_report])
+        self.assertIsNone(exec_eng_incr.structuring_check_token)
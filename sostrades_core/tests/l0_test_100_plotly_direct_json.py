@@ -0,0 +1,164 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import json
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from plotly.utils import PlotlyJSONEncoder
+
+from sostrades_core.tools.post_processing import post_processing_plotly_json
+from sostrades_core.tools.post_processing.charts.two_axes_instanciated_chart import (
+    InstanciatedSeries,
+    TwoAxesInstanciatedChart,
+)
+from sostrades_core.tools.post_processing.pie_charts.instanciated_pie_chart import InstanciatedPieChart
+from sostrades_core.tools.post_processing.post_processing_factory import convert_post_processings_into_json
+from sostrades_core.tools.post_processing.tables.instanciated_table import InstanciatedTable
+from sostrades_core.tools.post_processing.tables.table_style import TableStyles
+
+
+class TestPlotlyDirectJson(unittest.TestCase):
+    """
+    Parity tests of the json of the charts and tables written without building their plotly objects
+    """
+
+    DISPLAY_TYPES = [InstanciatedSeries.LINES_DISPLAY, InstanciatedSeries.SCATTER_DISPLAY,
+                     InstanciatedSeries.BAR_DISPLAY, InstanciatedSeries.LINES_DISPLAY_WITH_MARKERS,
+                     InstanciatedSeries.DASH_LINES_DISPLAY, InstanciatedSeries.DASH_LINES_DISPLAY_WITH_MARKERS,
+                     InstanciatedSeries.DASH_DOT_LINES_DISPLAY, InstanciatedSeries.DASH_DOT_LINES_DISPLAY_WITH_MARKERS,
+                     InstanciatedSeries.DOT_LINES_DISPLAY, InstanciatedSeries.DOT_LINES_DISPLAY_WITH_MARKERS]
+
+    @staticmethod
+    def _to_json(json_object):
+        json_object = json.loads(json.dumps(json_object, cls=PlotlyJSONEncoder))
+        json_object['layout'].pop('template', None)
+        return json_object
+
+    def _assert_parity(self, create_post_processing):
+        # a new instance is created for each conversion as the tables modify their cells
+        ref_json = self._to_json(create_post_processing().to_plotly_dict())
+        direct_json = create_post_processing().to_plotly_dict(direct=True)
+        self.assertNotIn('template', direct_json['layout'])
+        self.assertDictEqual(self._to_json(direct_json), ref_json)
+        return direct_json
+
+    def _create_chart(self, **kwargs):
+        years = np.arange(2020, 2051)
+        chart = TwoAxesInstanciatedChart('years', 'quantity', [2020, 2050], [0., 100.], 'Chart',
+                                         secondary_ordinate_axis_name='share', **kwargs)
+        for i, display_type in enumerate(self.DISPLAY_TYPES):
+            ordinate = np.linspace(0., 10. * (i + 1), len(years))
+            ordinate[i] = np.nan
+            chart.add_series(InstanciatedSeries(
+                years, ordinate, f'series {i}', display_type, visible=i % 3 != 0,
+                y_axis=InstanciatedSeries.Y_AXIS_SECONDARY if i % 2 else InstanciatedSeries.Y_AXIS_PRIMARY,
+                marker_symbol='square' if i % 4 else 'circle',
+                marker={'color': 'red', 'size': 5, 'line': {'color': 'blue', 'width': 1}} if i % 2 else None,
+                line={'color': 'green', 'width': 2} if i % 3 else None,
+                text=[f'{year}' if year % 2 else year for year in years.tolist()] if i % 5 else None))
+        chart.add_series(InstanciatedSeries(['a', 'b', 'c'], [np.float64(1.), np.int64(2), None], 'categories',
+                                            InstanciatedSeries.BAR_DISPLAY, marker={'color': 'grey'}, text='t'))
+        chart.add_annotation(TwoAxesInstanciatedChart.ANNOTATION_UPPER_LEFT, 'left annotation', 'value')
+        chart.add_annotation(TwoAxesInstanciatedChart.ANNOTATION_UPPER_RIGHT, 'right annotation', 'value')
+        chart.add_watermark(logo_work_in_progress=True)
+        return chart
+
+    def test_01_two_axes_chart(self):
+        direct_json = self._assert_parity(self._create_chart)
+        self.assertEqual(len(direct_json['data']), len(self.DISPLAY_TYPES) + 1)
+        self.assertTrue(direct_json[TwoAxesInstanciatedChart.LOGO_WORK_IN_PROGRESS])
+        self._assert_parity(lambda: self._create_chart(y_axis_log=True, stacked_bar=True, show_legend=False,
+                                                       bar_orientation='h'))
+
+    def test_02_cumulative_surface_chart(self):
+        def create_chart():
+            chart = TwoAxesInstanciatedChart('years', 'quantity', chart_name='Cumulative surface',
+                                             cumulative_surface=True)
+            for i in range(3):
+                chart.add_series(InstanciatedSeries(list(range(2020 + i, 2030)), [float(i + 1)] * (10 - i),
+                                                    f'series {i}', InstanciatedSeries.LINES_DISPLAY))
+            return chart
+
+        direct_json = self._assert_parity(create_chart)
+        self.assertListEqual([trace['fill'] for trace in direct_json['data']], ['tozeroy', 'tonexty', 'tonexty'])
+
+    def test_03_pie_chart(self):
+        def create_chart(with_annotations):
+            chart = InstanciatedPieChart('Pie chart', ['a', 'b', 3], [1, np.int64(2), 3.5])
+            if with_annotations:
+                chart.add_annotation(InstanciatedPieChart.ANNOTATION_UPPER_LEFT, 'left annotation', 'value')
+            return chart
+
+        self._assert_parity(lambda: create_chart(False))
+        self._assert_parity(lambda: create_chart(True))
+
+    def test_04_table(self):
+        def create_table(with_annotations):
+            table = InstanciatedTable('Table', ['Q1', 'Q2', 3], [['a', 'b', 'c'], [1, np.float64(2.5), None],
+                                                                 [1., 2., 3.]],
+                                      styles={1: TableStyles(background_color='red', font_color='white')})
+            if with_annotations:
+                table.add_annotation(InstanciatedTable.ANNOTATION_UPPER_RIGHT, 'right annotation', 'value')
+            return table
+
+        self._assert_parity(lambda: create_table(False))
+        self._assert_parity(lambda: create_table(True))
+
+        # the first column is set in bold once per conversion as with the plotly objects
+        table = create_table(False)
+        table.to_plotly_dict(direct=True)
+        self.assertListEqual(table.cells[0], ['<b>a</b>', '<b>b</b>', '<b>c</b>'])
+
+    def test_05_unsupported_properties(self):
+        def create_chart():
+            chart = TwoAxesInstanciatedChart('x', 'y', chart_name='Color scale')
+            chart.add_series(InstanciatedSeries([1, 2, 3], [1, 2, 3], 'series', InstanciatedSeries.SCATTER_DISPLAY,
+                                                marker={'color': [1, 2, 3], 'colorscale': 'Viridis'}))
+            return chart
+
+        # the plotly object is built when a property is not supported by the direct conversion
+        with patch.object(post_processing_plotly_json, 'create_plotly_figure',
+                          wraps=post_processing_plotly_json.create_plotly_figure) as create_plotly_figure:
+            self._assert_parity(create_chart)
+            self._assert_parity(self._create_chart)
+        self.assertEqual(create_plotly_figure.call_count, 1)
+
+        # the dictionary of the plotly object is built from to_plotly, that a subclass can override
+        class TitledChart(TwoAxesInstanciatedChart):
+            def to_plotly(self, logger=None):
+                fig = super().to_plotly(logger)
+                fig.update_layout(title_text='Overridden title')
+                return fig
+
+        chart = TitledChart('x', 'y', chart_name='Chart')
+        chart.add_series(InstanciatedSeries([1, 2, 3], [1, 2, 3], 'series', InstanciatedSeries.LINES_DISPLAY))
+        self.assertEqual(chart.to_plotly_dict()['layout']['title']['text'], 'Overridden title')
+
+    def test_06_convert_post_processings_into_json(self):
+        def create_post_processings():
+            return [self._create_chart(), InstanciatedPieChart('Pie chart', ['a', 'b'], [1, 2]),
+                    InstanciatedTable('Table', ['Q1'], [['a', 'b']])]
+
+        ref_json_objects = [self._to_json(json_object) for json_object in
+                            convert_post_processings_into_json(create_post_processings())]
+        json_objects = [self._to_json(json_object) for json_object in
+                        convert_post_processings_into_json(create_post_processings(), direct=True)]
+        self.assertListEqual(json_objects, ref_json_objects)
+
+
+if '__main__' == __name__:
+    unittest.main()
@@ -0,0 +1,84 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+from sostrades_core.tools import class_location_index
+from sostrades_core.tools.class_location_index import clear_classes_index, get_folder_classes_index
+
+
+class TestClassLocationIndex(unittest.TestCase):
+    """
+    Tests of the location of the classes of the modules of folders by parsing their sources
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.package = 'class_location_index_test_package'
+        package_dir = Path(self.tmp_dir.name, self.package)
+        Path(package_dir, 'sub_package').mkdir(parents=True)
+        Path(package_dir, '__init__.py').touch()
+        Path(package_dir, 'data').mkdir()
+        Path(package_dir, 'data', 'data.csv').touch()
+        Path(package_dir, 'failing_module.py').write_text(
+            "raise ImportError('module imported')\n\n\nclass FirstClass:\n    pass\n\n\n"
+            "try:\n    class SecondClass(FirstClass):\n        pass\nexcept NameError:\n    pass\n")
+        Path(package_dir, 'dynamic_module.py').write_text("DynamicClass = type('DynamicClass', (), {})\n")
+        Path(package_dir, 'sub_package', '__init__.py').write_text(
+            "def function():\n    class LocalClass:\n        pass\n\n\nclass PackageClass:\n    pass\n")
+        sys.path.insert(0, self.tmp_dir.name)
+        clear_classes_index()
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir.name)
+        for module_name in [module_name for module_name in sys.modules if module_name.startswith(self.package)]:
+            del sys.modules[module_name]
+        clear_classes_index()
+        self.tmp_dir.cleanup()
+
+    def test_01_folder_classes_index(self):
+        # the classes are indexed without importing the modules
+        self.assertDictEqual(get_folder_classes_index(self.package),
+                             {'FirstClass': f'{self.package}.failing_module.FirstClass',
+                              'SecondClass': f'{self.package}.failing_module.SecondClass',
+                              'PackageClass': f'{self.package}.sub_package.PackageClass'})
+        self.assertNotIn(f'{self.package}.failing_module', sys.modules)
+        self.assertIs(get_folder_classes_index(self.package), get_folder_classes_index(self.package))
+
+        ee = ExecutionEngine('Test')
+        self.assertEqual(ee.factory.get_module_class_path('SecondClass', ['sostrades_core.sos_wrapping', self.package]),
+                         f'{self.package}.failing_module.SecondClass')
+
+        # classes which are not defined by class statements are searched by importing the modules
+        Path(self.tmp_dir.name, self.package, 'failing_module.py').unlink()
+        self.assertEqual(class_location_index.get_module_class_path('DynamicClass', [self.package]),
+                         f'{self.package}.dynamic_module.DynamicClass')
+
+    def test_02_parity_with_modules_import(self):
+        for folder in ['sostrades_core.sos_wrapping', 'sostrades_core.sos_wrapping.test_discs',
+                       'sostrades_core.execution_engine.builder_tools']:
+            folder_classes_index = get_folder_classes_index(folder)
+            self.assertGreater(len(folder_classes_index), 0)
+            for class_name, module_class_path in folder_classes_index.items():
+                self.assertEqual(class_location_index._find_module_class_path_by_import(class_name, [folder]),
+                                 module_class_path)
+
+
+if '__main__' == __name__:
+    unittest.main()
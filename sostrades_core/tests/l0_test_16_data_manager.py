@@ -15,14 +15,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 import hashlib
+import pickle
 import unittest
-from copy import copy
+from copy import copy, deepcopy
 from os.path import dirname, join
 from pathlib import Path
 from pickle import dump as pkl_dump
 
 from sostrades_core.execution_engine.execution_engine import ExecutionEngine
 from sostrades_core.execution_engine.proxy_discipline import ProxyDiscipline
+from sostrades_core.execution_engine.variable_metadata import VariableMetadata
 from sostrades_core.tests.l0_test_06_dict_pickle_import_export_dm import init_dict
 from sostrades_core.tools.folder_operations import makedirs_safe, rmtree_safe
 from sostrades_core.tools.rw.load_dump_dm_data import CryptedLoadDump, DirectLoadDump
@@ -51,8 +53,8 @@ def init_execution_engine_disc1(name, encryption_dir=None):
     return exec_eng
 
 
-def init_execution_engine_coupling_disc1_disc2(name):
-    exec_eng = ExecutionEngine(name)
+def init_execution_engine_coupling_disc1_disc2(name, compact_data_dict=False):
+    exec_eng = ExecutionEngine(name, compact_data_dict=compact_data_dict)
     repo = 'sostrades_core.sos_processes.test'
     exec_eng.select_root_process(repo,
                                  'test_disc1_disc2_coupling')
@@ -259,6 +261,118 @@ class TestDataManagerGenerator(unittest.TestCase):
             self.assertEqual(list(disc.values())[
                                  0], ProxyDiscipline.STATUS_DONE)
 
+    def test_03_DM_with_compact_data_dict(self):
+        study_name = 'EETests'
+        exec_engine = init_execution_engine_coupling_disc1_disc2(study_name)
+        exec_engine.execute()
+        exec_engine_compact = init_execution_engine_coupling_disc1_disc2(study_name, compact_data_dict=True)
+        exec_engine_compact.execute()
+
+        data_dict = exec_engine.dm.convert_data_dict_with_full_name()
+        data_dict_compact = exec_engine_compact.dm.convert_data_dict_with_full_name()
+        self.assertListEqual(list(data_dict.keys()), list(data_dict_compact.keys()))
+        for var_name, metadata in data_dict_compact.items():
+            self.assertIsInstance(metadata, VariableMetadata)
+            self.assertListEqual(sorted(data_dict[var_name].keys()), sorted(metadata.keys()))
+            for key in ['type', 'io_type', 'var_name', 'namespace', 'visibility', 'user_level', 'range', 'unit',
+                        'coupling', 'optional', 'numerical', 'editable', 'check_integrity_msg']:
+                self.assertEqual(data_dict[var_name].get(key), metadata.get(key), msg=f'{var_name} {key}')
+        for var_name in ['x', 'y', 'z', 'Disc1.a', 'Disc2.power']:
+            self.assertEqual(data_dict[f'{study_name}.{var_name}']['value'],
+                             data_dict_compact[f'{study_name}.{var_name}']['value'])
+
+        # only the keys which have been set are in the mapping, as in a dict
+        new_metadata = VariableMetadata({'type': 'float'})
+        self.assertListEqual(list(new_metadata.keys()), ['type'])
+        for key in ['range', 'unit', 'visibility', 'formula', 'is_eval']:
+            self.assertNotIn(key, new_metadata)
+            self.assertIsNone(new_metadata.get(key))
+            with self.assertRaises(KeyError):
+                new_metadata[key]
+
+        # deletion, copies and pickling
+        metadata = data_dict_compact[f'{study_name}.x']
+        self.assertIsNone(metadata.get('range'))
+        metadata['my_attribute'] = 'my_value'
+        for metadata_copy in [deepcopy(metadata), pickle.loads(pickle.dumps(metadata)), metadata.copy()]:
+            self.assertDictEqual(metadata.to_dict(), metadata_copy.to_dict())
+        del metadata['range']
+        self.assertNotIn('range', metadata)
+        self.assertNotIn('range', deepcopy(metadata))
+        with self.assertRaises(KeyError):
+            metadata['range']
+        del metadata['my_attribute']
+        self.assertNotIn('my_attribute', metadata)
+
+    def test_04_reduced_dm_and_full_name_view(self):
+        study_name = 'EETests'
+        exec_engine = init_execution_engine_coupling_disc1_disc2(study_name)
+        dm = exec_engine.dm
+
+        def reference_attr(attr, excepted=[]):
+            # previous implementation: conversion of the data_dict with the full names for each attribute
+            data_dict = dm.convert_dict_with_maps(dm.data_dict, dm.data_id_map, keys='full_names')
+            exception_list = list(ProxyDiscipline.NUM_DESC_IN.keys()) if 'numerical' in excepted else []
+            return {key: value.get(attr, None) for key, value in data_dict.items() if
+                    key.split('.')[-1] not in exception_list}
+
+        list_attr = [ProxyDiscipline.TYPE, ProxyDiscipline.SUBTYPE, ProxyDiscipline.TYPE_METADATA,
+                     ProxyDiscipline.NUMERICAL, ProxyDiscipline.DF_EXCLUDED_COLUMNS, ProxyDiscipline.VAR_NAME,
+                     ProxyDiscipline.COUPLING]
+        dm.create_reduced_dm()
+        reference_reduced_dm = {key: {attr: reference_attr(attr)[key] for attr in list_attr}
+                                for key in reference_attr(list_attr[0])}
+        self.assertListEqual(list(dm.reduced_dm.keys()), list(reference_reduced_dm.keys()))
+        self.assertDictEqual(dm.reduced_dm, reference_reduced_dm)
+        for excepted in [[], ['numerical']]:
+            values = dm.get_data_dict_values(excepted=excepted)
+            self.assertListEqual(list(values.keys()), list(reference_attr(ProxyDiscipline.VALUE, excepted).keys()))
+        self.assertNotIn(f'{study_name}.linearization_mode', dm.get_data_dict_values(excepted=['numerical']))
+        self.assertIn(f'{study_name}.linearization_mode', dm.get_data_dict_values())
+
+        # the full name view follows the variables added and removed in the dm
+        full_names = list(dm.convert_data_dict_with_full_name().keys())
+        disc1 = exec_engine.root_process.proxy_disciplines[0]
+        metadata_a = copy(dm.get_data(f'{study_name}.Disc1.a'))
+        dm.remove_keys(disc1.disc_id, [f'{study_name}.Disc1.a'], ProxyDiscipline.IO_TYPE_IN)
+        self.assertNotIn(f'{study_name}.Disc1.a', dm.convert_data_dict_with_full_name())
+        self.assertNotIn(f'{study_name}.Disc1.a', dm.get_data_dict_attr(ProxyDiscipline.TYPE))
+        self.assertEqual(len(dm.convert_data_dict_with_full_name()), len(full_names) - 1)
+        dm.update_with_discipline_dict(disc1.disc_id, {'a': metadata_a})
+        self.assertListEqual(sorted(dm.convert_data_dict_with_full_name().keys()), sorted(full_names))
+        self.assertEqual(dm.get_data_dict_values()[f'{study_name}.Disc1.a'], 10.)
+        self.assertDictEqual(dm.get_data_dict_attr(ProxyDiscipline.TYPE), reference_attr(ProxyDiscipline.TYPE))
+
+    def test_05_short_name_index(self):
+        study_name = 'EETests'
+        exec_engine = init_execution_engine_coupling_disc1_disc2(study_name)
+        dm = exec_engine.dm
+
+        def reference_full_names(var_name):
+            # previous implementation: linear scan of the data_id_map
+            return [key for key in dm.data_id_map if key.endswith(f'.{var_name}')]
+
+        var_names = {full_name.split('.')[-1] for full_name in dm.data_id_map}
+        for var_name in list(var_names) + ['Disc1.a', 'Disc2.a', 'unknown']:
+            self.assertListEqual(dm.get_all_namespaces_from_var_name(var_name), reference_full_names(var_name))
+        self.assertListEqual(dm.get_all_namespaces_from_var_name('Disc1.a'), [f'{study_name}.Disc1.a'])
+        self.assertDictEqual(dm.get_all_var_name_with_ns_key('y'), {f'{study_name}.y': 'ns_ac'})
+        self.assertDictEqual(dm.get_all_var_name_with_ns_key('unknown'), {})
+
+        # the index follows the variables added and removed in the dm
+        disc1 = exec_engine.root_process.proxy_disciplines[0]
+        metadata_a = copy(dm.get_data(f'{study_name}.Disc1.a'))
+        dm.remove_keys(disc1.disc_id, [f'{study_name}.Disc1.a'], ProxyDiscipline.IO_TYPE_IN)
+        self.assertListEqual(dm.get_all_namespaces_from_var_name('a'), [])
+        dm.update_with_discipline_dict(disc1.disc_id, {'a': metadata_a})
+        self.assertListEqual(dm.get_all_namespaces_from_var_name('a'), [f'{study_name}.Disc1.a'])
+
+        # and is rebuilt when the data_id_map is modified outside of the dm
+        dm.data_id_map[f'{study_name}.Disc3.a'] = dm.get_data_id(f'{study_name}.Disc1.a')
+        self.assertListEqual(dm.get_all_namespaces_from_var_name('a'), reference_full_names('a'))
+        dm.generate_data_id_map()
+        self.assertListEqual(dm.get_all_namespaces_from_var_name('a'), [f'{study_name}.Disc1.a'])
+
 
 ''' HOW TO UPDATE dm.pkl file (reference dm.data_dict):
 go to ref dir (sostrades_core\tests\\data\ref_output\\<STUDY_DIR>)
@@ -1924,6 +1924,55 @@ class TestSoSDOEScenario(unittest.TestCase):
         root_mda = exec_eng.dm.get_disciplines_with_name(f'{same_usecase_name}')[0].discipline_wrapp.discipline
         self.assertEqual(0, len(root_mda.residuals_history))
 
+    def test_22_Eval_User_Defined_samples_parallel_evaluation(self):
+        """
+        This test checks that the parallel evaluation of the samples (n_processes > 1) delivers the same outputs in
+        the same scenario order as the sequential evaluation
+        """
+        study_name = 'root'
+        ns = study_name
+        x_values = [array([9.379763880395856]), array([8.88644794300546]), array([3.7137135749628882]),
+                    array([0.0417022004702574]), array([6.954954792150857])]
+        z_values = [array([1.515949043849158, 5.6317362409322165]), array([-1.1962705421254114, 6.523436208612142]),
+                    array([-1.9947578026244557, 4.822570933860785]), array([1.7490668861813, 3.617234050834533]),
+                    array([-9.316161097119341, 9.918161285133076])]
+        samples_df = pd.DataFrame({
+            ProxySampleGenerator.SELECTED_SCENARIO: [True] * 5,
+            ProxySampleGenerator.SCENARIO_NAME: [f'scenario_{i}' for i in range(1, 6)],
+            'x': x_values,
+            'z': z_values,
+        })
+
+        outputs = {}
+        for n_processes in [1, 2]:
+            exec_eng = ExecutionEngine(study_name)
+            eval_builder = exec_eng.factory.get_builder_from_process(repo=self.repo, mod_id="test_mono_driver_sellar")
+            exec_eng.factory.set_builders_to_coupling_builder(eval_builder)
+            exec_eng.configure()
+            values_dict = {
+                f'{ns}.Eval.gather_outputs': self.output_selection_obj_y1_y2,
+                f'{ns}.Eval.samples_df': samples_df,
+                f'{ns}.Eval.n_processes': n_processes,
+                f'{ns}.Eval.x': array([1.0]),
+                f'{ns}.Eval.y_1': array([1.0]),
+                f'{ns}.Eval.y_2': array([1.0]),
+                f'{ns}.Eval.z': array([1.0, 1.0]),
+                f'{ns}.Eval.subprocess.Sellar_Problem.local_dv': 10.0,
+            }
+            exec_eng.load_study_from_input_dict(values_dict)
+            exec_eng.execute()
+            doe_disc = exec_eng.dm.get_disciplines_with_name(f'{ns}.Eval')[0]
+            outputs[n_processes] = {out_name: doe_disc.get_sosdisc_outputs(out_name)
+                                    for out_name in ['samples_outputs_df', 'obj_dict', 'y_1_dict', 'y_2_dict']}
+
+        assert_frame_equal(outputs[1]['samples_outputs_df'], outputs[2]['samples_outputs_df'])
+        for out_name in ['obj_dict', 'y_1_dict', 'y_2_dict']:
+            self.assertListEqual(list(outputs[1][out_name].keys()), list(outputs[2][out_name].keys()))
+            for scenario_name, value in outputs[1][out_name].items():
+                self.assertAlmostEqual(value[0], outputs[2][out_name][scenario_name][0], delta=1e-10)
+        self.assertAlmostEqual(outputs[2]['y_1_dict']['scenario_5'][0], 101.52834766740203, delta=2e-6)
+
+
 if __name__ == '__main__':
     cls = TestSoSDOEScenario()
     cls.setUp()
@@ -15,6 +15,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 import unittest
+from copy import deepcopy
 
 from sostrades_core.execution_engine.execution_engine import ExecutionEngine
 
@@ -324,3 +325,38 @@ class TestNamespaceManagement(unittest.TestCase):
         # if clean namespaces and clean all ns with name, we should have only one namespace
         ns_disc1_list = self.ee.ns_manager.get_all_namespace_with_name('ns_disc1')
         self.assertTrue(len(ns_disc1_list) == 1)
+
+    def test_08_namespace_registry(self):
+        ns_manager = self.ee.ns_manager
+        n_scenarios = 100
+        for i in range(n_scenarios):
+            ns_manager.add_ns('ns_scenario', f'{self.ns_test}.scenario_{i}', clean_existing=False)
+            ns_manager.add_ns(f'ns_{i}', f'{self.ns_test}.scenario_{i}')
+        self.assertEqual(len(ns_manager.ns_list), 2 * n_scenarios)
+        self.assertListEqual([ns.value for ns in ns_manager.get_all_namespace_with_name('ns_scenario')],
+                             [f'{self.ns_test}.scenario_{i}' for i in range(n_scenarios)])
+
+        # a namespace can be cleaned with a copy of it
+        ns_copy = deepcopy(ns_manager.get_ns_from_id(f'ns_scenario__{self.ns_test}.scenario_1'))
+        ns_manager.clean_namespace_from_process(ns_copy)
+        self.assertNotIn(ns_copy.get_ns_id(), ns_manager.all_ns_dict)
+        self.assertEqual(len(ns_manager.get_all_namespace_with_name('ns_scenario')), n_scenarios - 1)
+
+        # the dependencies keep their order and a discipline is a dependency only once
+        ns = ns_manager.get_ns_in_shared_ns_dict('ns_0')
+        for disc_id in ['disc_b', 'disc_a', 'disc_b']:
+            ns_manager.add_disc_in_dependency_list_of_namespace(ns.get_ns_id(), disc_id)
+        self.assertListEqual(ns.get_dependency_disc_list(), ['disc_b', 'disc_a'])
+        ns.remove_dependency('disc_b')
+        self.assertListEqual(ns.get_dependency_disc_list(), ['disc_a'])
+
+        # adding a namespace cleans all the namespaces with the same name
+        ns_manager.add_ns('ns_scenario', self.ns_test)
+        self.assertListEqual(ns_manager.get_all_namespace_with_name('ns_scenario'),
+                             [ns_manager.get_ns_in_shared_ns_dict('ns_scenario')])
+        self.assertEqual(len(ns_manager.ns_list), n_scenarios + 1)
+
+        # all the namespaces without existing dependency discipline are cleaned
+        ns_manager.clean_ns_without_dependencies()
+        self.assertListEqual(ns_manager.ns_list, [])
+        self.assertDictEqual(ns_manager.all_ns_dict, {})
@@ -29,8 +29,10 @@ from sostrades_core.execution_engine.execution_engine import ExecutionEngine
 from sostrades_core.tools.compare_data_manager_tooling import dict_are_equal
 from sostrades_core.tools.conversion.conversion_sostrades_sosgemseo import (
     DEFAULT_EXCLUDED_COLUMNS,
+    DF_CONVERSION_PLAN,
     convert_array_into_df,
     convert_array_into_new_type,
+    convert_df_into_array,
     convert_new_type_into_array,
 )
 
@@ -636,6 +638,47 @@ class TestExtendDataframe(unittest.TestCase):
 
         self.assertListEqual(new_reduced_dm['dataframe_excluded_columns'], DEFAULT_EXCLUDED_COLUMNS + ['name', 'adult'])
 
+    def test_10_df_conversion_plan_reuse(self):
+        """
+        Check that the conversion plan computed at first conversion is reused for the next values with the same
+        layout and that conversions in both directions are unchanged
+        """
+        years = np.arange(2020, 2030)
+        df = pd.DataFrame({'years': years, 'c1': np.linspace(0., 1., 10), 'name': ['a'] * 10,
+                           'c2': np.linspace(1., 2., 10)})
+        reduced_dm = {'type': 'dataframe'}
+
+        converted_array, new_reduced_dm = convert_new_type_into_array('EE.df', df, reduced_dm)
+        reduced_dm.update(new_reduced_dm)
+        plan = reduced_dm[DF_CONVERSION_PLAN]
+        self.assertListEqual(reduced_dm['dataframe_excluded_columns'], DEFAULT_EXCLUDED_COLUMNS + ['name'])
+        self.assertListEqual(list(converted_array), list(df['c1']) + list(df['c2']))
+
+        # same result as the plan-free conversion with the same excluded columns
+        ref_array, ref_metadata = convert_df_into_array(df, [], [], [], DEFAULT_EXCLUDED_COLUMNS + ['name'])
+        self.assertListEqual(list(ref_array), list(converted_array))
+
+        # a new value with the same layout reuses the plan
+        df_2 = df.copy()
+        df_2['c1'] = df_2['c1'] * 2.
+        converted_array_2, new_reduced_dm_2 = convert_new_type_into_array('EE.df', df_2, reduced_dm)
+        self.assertNotIn(DF_CONVERSION_PLAN, new_reduced_dm_2)
+        self.assertIs(reduced_dm[DF_CONVERSION_PLAN], plan)
+        self.assertListEqual(list(converted_array_2), list(df_2['c1']) + list(df_2['c2']))
+
+        # reconversion with the metadata of the last conversion
+        reduced_dm.update(new_reduced_dm_2)
+        df_back = convert_array_into_new_type('EE.df', converted_array_2, reduced_dm)
+        self.assertListEqual(list(df_back['years']), list(years))
+        assert_frame_equal(df_back[['c1', 'c2']], df_2[['c1', 'c2']])
+
+        # a new column invalidates the plan
+        df_3 = df_2.copy()
+        df_3['c3'] = 1.
+        converted_array_3, new_reduced_dm_3 = convert_new_type_into_array('EE.df', df_3, reduced_dm)
+        self.assertIn(DF_CONVERSION_PLAN, new_reduced_dm_3)
+        self.assertEqual(converted_array_3.size, 30)
+
 
 if '__main__' == __name__:
     cls = TestExtendDataframe()
@@ -21,6 +21,7 @@ import pandas as pd
 
 from sostrades_core.execution_engine.execution_engine import ExecutionEngine
 from sostrades_core.execution_engine.proxy_discipline import ProxyDiscipline
+from sostrades_core.tools.check_data_integrity.check_data_integrity import CheckDataIntegrity
 
 
 class TestDataIntegrity(unittest.TestCase):
@@ -372,6 +373,72 @@ class TestDataIntegrity(unittest.TestCase):
         self.assert_string_equal(
             integrity_msg_dict_in, '')
 
+    def test_05_check_dataframe_columns_and_cached_checks(self):
+        '''
+        Check the columns of a dataframe with the dataframe descriptor, the check is redone only if the value changed
+        '''
+        check_data_integrity = CheckDataIntegrity(ProxyDiscipline, self.exec_eng.dm)
+        df_value = pd.DataFrame({'years': np.arange(2020, 2025), 'value': np.linspace(0., 1., 5),
+                                 'country': ['France', 'Spain', 'France', 'Italy', 'Spain'],
+                                 'mixed': [1., 2, 3., 4., 5.]})
+        var_data_dict = {ProxyDiscipline.VAR_NAME: 'df_in', ProxyDiscipline.IO_TYPE: ProxyDiscipline.IO_TYPE_IN,
+                         ProxyDiscipline.TYPE: 'dataframe', ProxyDiscipline.OPTIONAL: False,
+                         ProxyDiscipline.VALUE: df_value, ProxyDiscipline.RANGE: None,
+                         ProxyDiscipline.POSSIBLE_VALUES: None, ProxyDiscipline.IS_FORMULA: False,
+                         ProxyDiscipline.DATAFRAME_EDITION_LOCKED: False,
+                         ProxyDiscipline.DATAFRAME_DESCRIPTOR: {'years': ('int', [2020, 2100], False),
+                                                                'value': ('float', [0., 1.], True),
+                                                                'country': ('string', ['France', 'Spain', 'Italy'], True),
+                                                                'mixed': ('float', None, True)}}
+        self.assertEqual(check_data_integrity.check_variable_value(var_data_dict, True), '')
+
+        # values modified in place are checked again
+        df_value.loc[2, 'value'] = 2.
+        df_value.loc[3, 'country'] = 'Germany'
+        self.assert_string_equal(
+            check_data_integrity.check_variable_value(var_data_dict, True),
+            "Dataframe values in column value are not in the range [0.0, 1.0] requested in the dataframe descriptor"
+            "Dataframe values in column country are not in the possible list ['France', 'Spain', 'Italy'] "
+            "requested in the dataframe descriptor")
+        # the messages of an unchanged dataframe are kept
+        self.assertEqual(check_data_integrity.check_variable_value(var_data_dict, True),
+                         check_data_integrity.check_variable_value(var_data_dict, True))
+
+        df_value['years'] = df_value['years'].astype(float)
+        df_value['mixed'] = ['1', 2, 3., 4., 5.]
+        self.assert_string_equal(
+            check_data_integrity.check_variable_value(var_data_dict, True),
+            "Dataframe values in column years are not as type int requested in the dataframe descriptor"
+            "Dataframe values in column value are not in the range [0.0, 1.0] requested in the dataframe descriptor"
+            "Dataframe values in column country are not in the possible list ['France', 'Spain', 'Italy'] "
+            "requested in the dataframe descriptor"
+            "Dataframe values in column mixed are not as type float requested in the dataframe descriptor")
+
+        # values below the lower bound of the range are reported
+        df_value = pd.DataFrame({'years': np.arange(2020, 2025), 'value': np.linspace(-1., 0., 5),
+                                 'country': ['France'] * 5, 'mixed': [1., 2, 3., 4., 5.]})
+        var_data_dict[ProxyDiscipline.VALUE] = df_value
+        self.assert_string_equal(
+            check_data_integrity.check_variable_value(var_data_dict, True),
+            "Dataframe values in column value are not in the range [0.0, 1.0] requested in the dataframe descriptor")
+        df_value['years'] = [2019, 2020, 2021, 2022, 2023]
+        df_value['value'] = 0.
+        self.assert_string_equal(
+            check_data_integrity.check_variable_value(var_data_dict, True),
+            "Dataframe values in column years are not in the range [2020, 2100] requested in the dataframe descriptor")
+
+        # the numbers of an object column are checked again if their type changes
+        var_data_dict[ProxyDiscipline.VALUE] = pd.DataFrame({'years': [2020, 2021], 'value': [0., 1.],
+                                                             'country': ['France', 2], 'mixed': [1., 2.]})
+        var_data_dict[ProxyDiscipline.DATAFRAME_DESCRIPTOR]['country'] = ('multiple', None, True)
+        var_data_dict[ProxyDiscipline.DATAFRAME_DESCRIPTOR]['mixed'] = ('int', None, True)
+        var_data_dict[ProxyDiscipline.VALUE]['mixed'] = pd.Series([1, 2], dtype=object)
+        self.assertEqual(check_data_integrity.check_variable_value(var_data_dict, True), '')
+        var_data_dict[ProxyDiscipline.VALUE]['mixed'] = pd.Series([1., 2.], dtype=object)
+        self.assert_string_equal(
+            check_data_integrity.check_variable_value(var_data_dict, True),
+            "Dataframe values in column mixed are not as type int requested in the dataframe descriptor")
+
 
 if __name__ == "__main__":
     cls = TestDataIntegrity()
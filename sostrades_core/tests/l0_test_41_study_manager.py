@@ -23,6 +23,8 @@ from importlib.resources import files
 from pathlib import Path
 from tempfile import gettempdir
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from sostrades_core.execution_engine.data_manager import DataManager
@@ -30,7 +32,7 @@ from sostrades_core.study_manager.base_study_manager import BaseStudyManager
 from sostrades_core.study_manager.study_manager import StudyManager
 from sostrades_core.tests import data
 from sostrades_core.tools.folder_operations import rmtree_safe
-from sostrades_core.tools.rw.load_dump_dm_data import CryptedLoadDump
+from sostrades_core.tools.rw.load_dump_dm_data import ColumnarLoadDump, CryptedLoadDump, LazyLoadedDict
 
 
 class TestStudyManager(unittest.TestCase):
@@ -212,3 +214,66 @@ class TestStudyManager(unittest.TestCase):
         }
         with pytest.raises(expected_exception=ValueError, match=r"Failed to merge the design spaces;.* var1"):
             study.merge_design_spaces([ds2])
+
+    def test_08_dump_and_load_into_study_with_columnar_strategy(self):
+        """Check that the columnar strategy with memory-mapped arrays can replace the default strategy."""
+        study = BaseStudyManager(self.__repository, self.__process, self.__study_name)
+        study.load_data(from_input_dict=self.__study_data_values)
+        study.rw_strategy = ColumnarLoadDump()
+        study.dump_data(self.__dump_dir)
+
+        study_bis_name = f"{self.__study_name}_bis"
+        study_bis = BaseStudyManager(self.__repository, self.__process, study_bis_name)
+        study_bis.rw_strategy = ColumnarLoadDump()
+        study_bis.load_data(self.__dump_dir)
+
+        for key in self.__study_data_values:
+            var_id = study.execution_engine.dm.get_data_id(key)
+            var_id_bis = study_bis.execution_engine.dm.get_data_id(key.replace(self.__study_name, study_bis_name))
+            assert (
+                study.execution_engine.dm.data_dict[var_id][DataManager.VALUE]
+                == study_bis.execution_engine.dm.data_dict[var_id_bis][DataManager.VALUE]
+            ), f"error for parameter {key}"
+
+    def test_09_columnar_strategy_lazy_load(self):
+        """Check the arrays and dataframes stored in the memory-mapped container of the columnar strategy."""
+        self.__dump_dir.mkdir(parents=True, exist_ok=True)
+        dump_file = self.__dump_dir / "dm.pkl"
+        df = pd.DataFrame({
+            "years": np.arange(2020, 2120),
+            "value": np.linspace(0.0, 1.0, 100),
+            "complex": np.ones(100) + 1j,
+            "name": ["a"] * 100,
+        })
+        dumped_dict = {
+            "Study.x": {"value": np.arange(1000.0).reshape((250, 4)), "unit": "-"},
+            "Study.x_fortran": {"value": np.asfortranarray(np.arange(1000.0).reshape((250, 4)))},
+            "Study.small": {"value": np.array([1, 2])},
+            "Study.df": {"value": df},
+            "Study.name": {"value": "name"},
+        }
+        ColumnarLoadDump().dump(dumped_dict, dump_file)
+        assert Path(ColumnarLoadDump().get_container_file(dump_file)).is_file()
+
+        loaded_dict = ColumnarLoadDump().load(dump_file)
+        assert isinstance(loaded_dict, LazyLoadedDict)
+        assert list(loaded_dict) == list(dumped_dict)
+        np.testing.assert_array_equal(loaded_dict["Study.x"]["value"], dumped_dict["Study.x"]["value"])
+        np.testing.assert_array_equal(loaded_dict["Study.x_fortran"]["value"], dumped_dict["Study.x_fortran"]["value"])
+        np.testing.assert_array_equal(loaded_dict["Study.small"]["value"], np.array([1, 2]))
+        pd.testing.assert_frame_equal(loaded_dict["Study.df"]["value"], df)
+        assert loaded_dict["Study.name"] == {"value": "name"}
+
+        # the loaded values are copy-on-write, modifying them does not alter the dumped data
+        loaded_dict["Study.x"]["value"][0, 0] = -1.0
+        assert ColumnarLoadDump().load(dump_file)["Study.x"]["value"][0, 0] == 0.0
+
+        # dumping again while the previous loads are still in use, a new container is written
+        container_file = ColumnarLoadDump().get_container_file(dump_file)
+        unaccessed_loaded_dict = ColumnarLoadDump().load(dump_file)
+        ColumnarLoadDump().dump({"Study.x": {"value": np.zeros(1000)}}, dump_file)
+        assert ColumnarLoadDump().get_container_file(dump_file) != container_file
+        assert len(list(self.__dump_dir.glob("dm.pkl.*.data"))) == 1
+        assert loaded_dict["Study.x"]["value"][1, 0] == 4.0
+        assert unaccessed_loaded_dict["Study.x"]["value"][1, 0] == 4.0
+        np.testing.assert_array_equal(ColumnarLoadDump().load(dump_file)["Study.x"]["value"], np.zeros(1000))
@@ -193,6 +193,54 @@ class TestValidGrad(unittest.TestCase):
 
         return np.allclose(H_FD[0], H_true) and np.allclose(H_FD[1], H_true)
 
+    def rosen_grad_stacked(self, X):
+        dfunc = np.zeros(X.shape)
+        dfunc[:, 0] = -400 * (X[:, 1] - X[:, 0]**2) * X[:, 0] - 2 * (1 - X[:, 0])
+        dfunc[:, 1] = 200 * (X[:, 1] - X[:, 0]**2)
+        return dfunc
+
+    def test_10_FDGradient_pool_and_vectorized(self):
+        x = np.array([1., 2., 3.])
+        for scheme_order, f_pointer in [(1, self.f_mat1), (2, self.f_mat1), (2, self.f_mat2), (1j, self.f_mat2_CS)]:
+            ref_grad = FDGradient(scheme_order, f_pointer, fd_step=1e-30 if scheme_order == 1j else 1e-6).grad_f(x)
+            grad_calc = FDGradient(scheme_order, f_pointer, fd_step=1e-30 if scheme_order == 1j else 1e-6,
+                                   n_processes=2)
+            grad_calc.set_multi_proc(True)
+            try:
+                np.testing.assert_array_equal(grad_calc.grad_f(x), ref_grad)
+                # the pool is reused by the next calls
+                np.testing.assert_array_equal(grad_calc.grad_f(x), ref_grad)
+            finally:
+                grad_calc.close_pool()
+
+        # f_pointer called once on the stacked perturbed variables
+        ref_grad = FDGradient(1, self.f_mat1, fd_step=1e-6).grad_f(x)
+        grad_calc = FDGradient(1, lambda x_stacked: 3. * x_stacked, fd_step=1e-6, vectorized=True)
+        np.testing.assert_array_equal(grad_calc.grad_f(x), ref_grad)
+
+        x = np.array([1., 1.])
+        ref_hess = FDGradient(2, None, self.rosen_grad, fd_step=1e-5).hess_f(x)
+        hess_calc = FDGradient(2, None, self.rosen_grad_stacked, fd_step=1e-5, vectorized=True, n_processes=2)
+        hess_calc.set_multi_proc(True)
+        try:
+            np.testing.assert_array_equal(hess_calc.hess_f(x), ref_hess)
+        finally:
+            hess_calc.close_pool()
+
+        ref_hess_list = FDGradient(2, None, self.rosen_grad_vect, fd_step=1e-5).vect_hess_f(x, 2)
+        with FDGradient(2, None, self.rosen_grad_vect, fd_step=1e-5, n_processes=2) as hess_calc:
+            hess_calc.set_multi_proc(True)
+            for hess, ref_hess in zip(hess_calc.vect_hess_f(x, 2), ref_hess_list):
+                np.testing.assert_array_equal(hess, ref_hess)
+
+        # the pool is closed at the end of each comparison, the next one evaluates the updated function
+        coeff = [3.]
+        valid_grad = FDValidGrad(1, lambda x: coeff[0] * x, lambda x: coeff[0] * np.eye(len(x)))
+        valid_grad.set_multi_proc(True)
+        self.assertTrue(valid_grad.compare(x, iprint=False))
+        coeff[0] = 5.
+        self.assertTrue(valid_grad.compare(x, iprint=False))
+
 
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestValidGrad)
@@ -47,3 +47,61 @@ class TestBSpline(unittest.TestCase):
             for elem in x
         ]
         np.testing.assert_almost_equal(eval1.tolist(), result_scipy)
+
+    def test_02_vectorized_basis_matrix(self):
+        # the basis matrices are compared with the recursive evaluation of each pole at each point
+        for degree, n_poles in [(1, 4), (2, 5), (3, 5), (3, 8), (4, 12)]:
+            bsp = BSpline(degree=degree, n_poles=n_poles)
+            if n_poles == degree + 2:
+                bsp.set_non_uniform_knots_list(0.3)
+            # the knots are included to check the boundaries of the knot spans
+            t_array = np.concatenate((np.linspace(0.0, 1.0, 37), bsp.knots))
+            for diff, eval_function in enumerate([bsp.B, bsp.dBdt, bsp.d2Bdt2][:degree + 1]):
+                reference = np.array([[eval_function(t, i) for i in range(n_poles)] for t in t_array])
+                np.testing.assert_allclose(bsp.eval_basis_matrix(t_array, diff=diff), reference, rtol=1e-12,
+                                           atol=1e-12)
+                np.testing.assert_allclose(bsp.eval(t_array[5], diff=diff), reference[5], rtol=1e-12, atol=1e-12)
+
+        # the basis matrix is computed once per knots, degree and t grid
+        bsp = BSpline(degree=3, n_poles=8)
+        t_array = np.linspace(0.0, 1.0, 50)
+        self.assertIs(bsp.eval_basis_matrix(t_array), BSpline(degree=3, n_poles=8).eval_basis_matrix(t_array.copy()))
+        self.assertIsNot(bsp.eval_basis_matrix(t_array), bsp.eval_basis_matrix(t_array, diff=1))
+        bsp.set_knots(bsp.knots ** 2)
+        self.assertFalse(np.allclose(bsp.eval_basis_matrix(t_array),
+                                     BSpline(degree=3, n_poles=8).eval_basis_matrix(t_array)))
+
+    def test_03_eval_list_t_complex_ctrl_pts(self):
+        bsp = BSpline(degree=3, n_poles=8)
+        ctrl = np.array([-0.1, -0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.7]) + 1e-30j * np.arange(8)
+        bsp.set_ctrl_pts(list(ctrl))
+        x = np.linspace(0.0, 1.0, 30)
+
+        result, b_array = bsp.eval_list_t(x)
+        self.assertEqual(result.dtype, np.complex128)
+        self.assertEqual(b_array.shape, (30, 8))
+        reference_b_array = np.array([[bsp.B(t, i) for i in range(8)] for t in x])
+        np.testing.assert_allclose(b_array, reference_b_array, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(result, reference_b_array @ ctrl, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(result.imag, 1e-30 * (reference_b_array @ np.arange(8)), rtol=1e-12)
+        # the returned b_array is not the cached basis matrix
+        b_array[0, 0] = 10.
+        self.assertEqual(bsp.eval_basis_matrix(x)[0, 0], 1.)
+
+    def test_04_complex_step_and_high_order_derivatives(self):
+        bsp = BSpline(degree=3, n_poles=8, dtype=np.complex128)
+        t_array = np.linspace(0.05, 0.95, 20)
+        h = 1e-30
+        # the complex step derivative of the basis functions is their first derivative
+        basis_matrix = bsp.eval_basis_matrix(t_array + 1j * h)
+        self.assertEqual(basis_matrix.dtype, np.complex128)
+        np.testing.assert_allclose(basis_matrix.imag / h, bsp.eval_basis_matrix(t_array, diff=1), rtol=1e-10,
+                                   atol=1e-12)
+        reference = np.array([[bsp.B(t, i) for i in range(8)] for t in t_array + 1j * h])
+        np.testing.assert_allclose(basis_matrix, reference, rtol=1e-12, atol=1e-40)
+        np.testing.assert_allclose(bsp.eval(t_array[3] + 1j * h), reference[3], rtol=1e-12, atol=1e-40)
+
+        # the derivatives of order greater than the degree are zero
+        bsp = BSpline(degree=1, n_poles=4)
+        np.testing.assert_array_equal(bsp.eval_basis_matrix(t_array, diff=2), np.zeros((20, 4)))
+        np.testing.assert_array_equal(bsp.eval(0.3, diff=2), np.zeros(4))
@@ -15,16 +15,27 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 import unittest
+from datetime import date
+from hashlib import blake2b
 from os import getenv, remove
 from os.path import dirname, join
 from pathlib import Path
 from tempfile import gettempdir
 from time import sleep
 
+import numpy as np
+import pandas as pd
+
 from sostrades_core.execution_engine.execution_engine import ExecutionEngine
 from sostrades_core.sos_processes.test.test_sellar_opt_discopt.usecase import (
     Study as study_sellar_opt,
 )
+from sostrades_core.tools.value_fingerprint import (
+    ValueFingerprint,
+    compute_fingerprint,
+    fingerprint_matches,
+    update_hasher,
+)
 
 
 class TestStructuringInputs(unittest.TestCase):
@@ -163,6 +174,66 @@ class TestStructuringInputs(unittest.TestCase):
 
         self.exec_eng.execute()
 
+    def test_02_structuring_variables_fingerprints(self):
+        df = pd.DataFrame({'years': np.arange(2020, 2051), 'value': np.linspace(0., 1., 31), 'name': ['a'] * 31})
+        values = [None, 1, 'string', np.arange(10.), df, {'b': [1, 2], 'a': {'c': df}}, ['AC1', 'AC2'],
+                  (1., 'a'), date(2020, 1, 1)]
+        for value in values:
+            fingerprint = compute_fingerprint(value)
+            self.assertTrue(fingerprint_matches(fingerprint, value))
+        # unhashable objects are deepcopied and compared, hashable values are not copied
+        self.assertIsNone(compute_fingerprint(df).reference)
+        self.assertIsNotNone(compute_fingerprint(values[-1]).reference)
+
+        # the order of the keys of a dict does not matter
+        self.assertTrue(fingerprint_matches(compute_fingerprint({'a': 1, 'b': 2}), {'b': 2, 'a': 1}))
+        self.assertFalse(fingerprint_matches(compute_fingerprint({'a': 1, 'b': 2}), {'a': 1, 'b': 3}))
+        # numbers of different types are equal as for the values comparison
+        self.assertTrue(fingerprint_matches(compute_fingerprint(1), 1.))
+        self.assertFalse(fingerprint_matches(compute_fingerprint(1), [1]))
+        self.assertFalse(fingerprint_matches(compute_fingerprint([1]), 1))
+        # equal numbers in containers
+        self.assertTrue(fingerprint_matches(compute_fingerprint([1, {'a': 2}]), [1., {'a': np.float64(2.)}]))
+        self.assertTrue(fingerprint_matches(compute_fingerprint((True, 0.5)), (1, 0.5 + 0j)))
+        self.assertFalse(fingerprint_matches(compute_fingerprint([1]), [1.5]))
+        # the type strict digests distinguish equal numbers of different types
+        for first_value, second_value in [(1, 1.), (True, 1), (1., np.float64(1.)), ([1, 2], [1., 2.]),
+                                          (pd.DataFrame({'a': [1, 'b']}), pd.DataFrame({'a': [1., 'b']}))]:
+            strict_digests = []
+            for value in (first_value, second_value):
+                hasher = blake2b(digest_size=16)
+                update_hasher(hasher, value, type_strict=True)
+                strict_digests.append(hasher.digest())
+            self.assertNotEqual(*strict_digests)
+
+        # in place modifications are detected
+        df_fingerprint = compute_fingerprint(df)
+        self.assertIsInstance(df_fingerprint, ValueFingerprint)
+        df.loc[3, 'value'] = 10.
+        self.assertFalse(fingerprint_matches(df_fingerprint, df))
+        array = np.arange(10.)
+        array_fingerprint = compute_fingerprint(array)
+        array[-1] = 0.
+        self.assertFalse(fingerprint_matches(array_fingerprint, array))
+        self.assertFalse(fingerprint_matches(array_fingerprint, np.arange(10)))
+        self.assertFalse(fingerprint_matches(array_fingerprint, np.arange(10.).reshape(2, 5)))
+
+        # in place modification of a structuring variable in the dm
+        self.exec_eng.ns_manager.add_ns('ns_ac', self.exec_eng.study_name)
+        builder_process = self.exec_eng.factory.get_builder_from_module(
+            'Disc1', 'sostrades_core.sos_wrapping.test_discs.disc1_setup_sos_discipline.Disc1')
+        self.exec_eng.factory.set_builders_to_coupling_builder(builder_process)
+        self.exec_eng.configure()
+        self.exec_eng.load_study_from_input_dict({f'{self.study_name}.AC_list': ['AC1', 'AC2']})
+        disc_1 = self.exec_eng.dm.get_disciplines_with_name('MyCase.Disc1')[0]
+        self.assertFalse(disc_1.check_structuring_variables_changes())
+        self.exec_eng.dm.get_value(f'{self.study_name}.AC_list').append('AC3')
+        self.assertTrue(disc_1.check_structuring_variables_changes())
+        self.exec_eng.load_study_from_input_dict({})
+        self.assertFalse(disc_1.check_structuring_variables_changes())
+        self.assertListEqual(disc_1._structuring_variables['AC_list'], ['AC1', 'AC2', 'AC3'])
+        self.assertIn('AC3.dyn_input_1', [key[0] for key in disc_1._data_in])
+
     def _test_05_proxycoupling_numerical_inputs_including_petsc(self):
         """
         Test proper definition of coupling numerical inputs, possible values, etc. and execute using LGMRES with
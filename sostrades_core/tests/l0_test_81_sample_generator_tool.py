@@ -479,6 +479,29 @@ class TestSampleGeneratorTool(unittest.TestCase):
 
         assert_frame_equal(samples_df, target_samples_df)
 
+    def test_11_check_reformat_samples_with_variable_types(self):
+        """Test that the samples matrix is sliced by variable according to the types of the selected inputs"""
+        sample_generator = DoeSampleGenerator()
+        dspace_df = pd.DataFrame({'variable': ['x', 'z', 'l', 'w'],
+                                  'lower_bnd': [[0.0], [-10.0, 0.0], [0.0, 0.0], [0.0]],
+                                  'upper_bnd': [[10.0], [10.0, 10.0], [1.0, 1.0], [1.0]]})
+        design_space = sample_generator.create_design_space(['x', 'z', 'l', 'w'], dspace_df)
+        sample_generator.selected_inputs_types = {'x': 'float', 'z': 'array', 'l': 'list'}
+        samples = array([[float(6 * i + j) for j in range(6)] for i in range(4)])
+
+        samples_df = sample_generator._put_samples_in_df_format(
+            sample_generator._reformat_samples_from_design_space(samples, design_space), design_space)
+
+        self.assertListEqual(samples_df.columns.tolist(), ['x', 'z', 'l', 'w'])
+        # scalar variables are native float columns, the other variables are stored per row
+        self.assertEqual(samples_df['x'].dtype, 'float64')
+        self.assertListEqual(samples_df['x'].tolist(), samples[:, 0].tolist())
+        for i, current_point in enumerate(samples):
+            self.assertListEqual(samples_df['z'][i].tolist(), current_point[1:3].tolist())
+            self.assertIsInstance(samples_df['l'][i], list)
+            self.assertListEqual(samples_df['l'][i], current_point[3:5].tolist())
+            self.assertListEqual(samples_df['w'][i].tolist(), current_point[5:].tolist())
+
 
 if __name__ == '__main__':
     cls = TestSampleGeneratorTool()
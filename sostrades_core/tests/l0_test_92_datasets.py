@@ -15,7 +15,10 @@ limitations under the License.
 '''
 import logging
 import os
+import shutil
+import tempfile
 import unittest
+from copy import deepcopy
 
 import numpy as np
 import pandas as pd
@@ -24,23 +27,32 @@ import sostrades_core.sos_processes.test.sellar.test_sellar_coupling.usecase_dat
 import sostrades_core.sos_processes.test.sellar.test_sellar_coupling.usecase_dataset_sellar_coupling
 import sostrades_core.sos_processes.test.test_disc1_disc2_dataset.usecase_dataset
 import sostrades_core.sos_processes.test.test_disc1_nested_types.usecase_local_dataset
+from sostrades_core.datasets.dataset import Dataset
+from sostrades_core.datasets.dataset_info.abstract_dataset_info import AbstractDatasetInfo
 from sostrades_core.datasets.dataset_info.dataset_info_v0 import DatasetInfoV0
 from sostrades_core.datasets.dataset_info.dataset_info_v1 import DatasetInfoV1
+from sostrades_core.datasets.dataset_manager import DatasetsManager
 from sostrades_core.datasets.dataset_mapping import (
     DatasetsMapping,
     DatasetsMappingException,
 )
 from sostrades_core.datasets.datasets_connectors.abstract_datasets_connector import (
+    AbstractDatasetsConnector,
     DatasetGenericException,
 )
 from sostrades_core.datasets.datasets_connectors.datasets_connector_factory import DatasetConnectorType
 from sostrades_core.datasets.datasets_connectors.datasets_connector_manager import DatasetsConnectorManager
+from sostrades_core.datasets.datasets_serializers.filesystem_datasets_serializer import (
+    _load_dataframe,
+    _save_dataframe,
+)
 from sostrades_core.sos_processes.test.test_disc1_all_types.usecase_dataset import Study
 from sostrades_core.sos_processes.test.test_disc1_disc2_coupling.usecase_coupling_2_disc_test import (
     Study as StudyDisc1Disc2,
 )
 from sostrades_core.study_manager.study_manager import StudyManager
 from sostrades_core.tools.compare_data_manager_tooling import dict_are_equal
+from sostrades_core.tools.tree.deserialization import isevaluatable
 
 
 class TestDatasets(unittest.TestCase):
@@ -1058,6 +1070,122 @@ class TestDatasets(unittest.TestCase):
                                            create_if_not_exists=True)
         connector_to.clear(True)
 
+    def test_23_filesystem_dataframe_typed_loading(self):
+        """
+        check that the typed loading of the dataframes csv gives the same dataframe as the evaluation of every cell
+        """
+        df = pd.DataFrame({'years': np.arange(2020, 2025),
+                           'price': np.linspace(0., 1., 5),
+                           'flag': [True, False, True, False, True],
+                           'type': ['alpha', 'beta', 'alpha', '1.5', '[1, 2]'],
+                           'array': [np.array([1., 2.])] * 5,
+                           'mixed': ['', 1, 2.5, 'x', None],
+                           'complex': [1 + 2j] * 5,
+                           'dict': [{'a': 1}] * 5})
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            csv_path = os.path.join(tmp_dir, 'df.csv')
+            _save_dataframe(csv_path, df)
+            loaded_df = _load_dataframe(csv_path)
+            evaluated_df = pd.read_csv(csv_path, na_filter=False).map(isevaluatable)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+        self.assertTrue(loaded_df.dtypes.equals(evaluated_df.dtypes))
+        self.assertTrue(dict_are_equal({'df': loaded_df}, {'df': evaluated_df}))
+        self.assertEqual(loaded_df['years'].dtype, np.int64)
+        self.assertEqual(loaded_df['price'].dtype, np.float64)
+        self.assertEqual(loaded_df['type'].tolist(), ['alpha', 'beta', 'alpha', 1.5, [1, 2]])
+        # the mutable values are not shared between cells
+        self.assertIsNot(loaded_df['array'][0], loaded_df['array'][1])
+        np.testing.assert_array_equal(loaded_df['array'][0], np.array([1., 2.]))
+
+    def test_24_batch_fetch_from_datasets(self):
+        """
+        check that the parameters requested by several namespaces are fetched once per dataset, with the bulk read of
+        the connectors that support it
+        """
+
+        class CountingConnector(AbstractDatasetsConnector):
+            def __init__(self, datasets_values, bulk_read=False):
+                self.datasets_values = datasets_values
+                self.bulk_read = bulk_read
+                self.calls = []
+
+            def _get_values(self, dataset_identifier, data_to_get):
+                self.calls.append((dataset_identifier.dataset_id, sorted(data_to_get)))
+                dataset_values = self.datasets_values[dataset_identifier.dataset_id]
+                return {key: deepcopy(dataset_values[key]) for key in data_to_get if key in dataset_values}
+
+            def _get_values_for_datasets(self, data_to_get_per_dataset):
+                if not self.bulk_read:
+                    return None
+                self.calls.append(sorted(dataset_info.dataset_id for dataset_info in data_to_get_per_dataset))
+                return {dataset_info: {key: deepcopy(value)
+                                       for key, value in self.datasets_values[dataset_info.dataset_id].items()
+                                       if key in data_to_get}
+                        for dataset_info, data_to_get in data_to_get_per_dataset.items()}
+
+            def _write_values(self, dataset_identifier, values_to_write, data_types_dict):
+                pass
+
+            def _get_values_all(self, dataset_identifier, data_types_dict):
+                pass
+
+            def get_datasets_available(self):
+                pass
+
+            def _write_dataset(self, dataset_identifier, values_to_write, data_types_dict, create_if_not_exists=True,
+                               override=False):
+                pass
+
+        df = pd.DataFrame({'years': [2020, 2021], 'x': [1., 2.]})
+        local_connector = CountingConnector({'d1': {'a': 1., 'b': 2., 'df': df}, 'd2': {'a': 10., 'c': 30.}})
+        bulk_connector = CountingConnector({'d3': {'a': 100.}, 'd4': {'b': 200., 'c': 300.}}, bulk_read=True)
+        d1, d2 = DatasetInfoV0('local', 'd1'), DatasetInfoV0('local', 'd2')
+        d3, d4 = DatasetInfoV0('bulk', 'd3'), DatasetInfoV0('bulk', 'd4')
+        datasets_manager = DatasetsManager(logging.getLogger(__name__))
+        for dataset_info, connector in [(d1, local_connector), (d2, local_connector), (d3, bulk_connector),
+                                        (d4, bulk_connector)]:
+            datasets_manager.datasets[dataset_info] = Dataset(dataset_info=dataset_info, connector=connector)
+
+        wildcard = AbstractDatasetInfo.WILDCARD
+        namespaced_datasets_info = {'ns_1': {d1: {wildcard: wildcard}, d2: {wildcard: wildcard}},
+                                    'ns_2': {d1: {'df': 'df', 'c': 'b'}, d3: {wildcard: wildcard}, d4: {'c': 'c'}},
+                                    'ns_3': {d4: {wildcard: wildcard}}}
+        namespaced_data_dict = {'ns_1': {'a': 'float', 'df': 'dataframe'},
+                                'ns_2': {'a': 'float', 'c': 'float', 'df': 'dataframe'},
+                                'ns_3': {'b': 'float'}}
+        data_retrieved = datasets_manager.fetch_data_from_datasets_batch(namespaced_datasets_info,
+                                                                         namespaced_data_dict)
+
+        # one read per dataset for the local connector, one bulk read for the other connector
+        self.assertEqual(sorted(local_connector.calls), [('d1', ['a', 'b', 'df']), ('d2', ['a', 'df'])])
+        self.assertEqual(bulk_connector.calls, [['d3', 'd4']])
+
+        values = {namespace: {key: value[DatasetsManager.VALUE] for key, value in data.items()}
+                  for namespace, data in data_retrieved.items()}
+        # the last dataset of a namespace prevails
+        self.assertEqual(values['ns_1']['a'], 10.)
+        self.assertEqual(values['ns_2']['a'], 100.)
+        self.assertEqual(values['ns_2']['c'], 300.)
+        self.assertEqual(values['ns_3'], {'b': 200.})
+        self.assertEqual(data_retrieved['ns_2']['c'][DatasetsManager.DATASET_INFO], d4)
+        # a value fetched once for two namespaces is not shared between them
+        self.assertTrue(values['ns_1']['df'].equals(df))
+        self.assertTrue(values['ns_2']['df'].equals(df))
+        self.assertIsNot(values['ns_1']['df'], values['ns_2']['df'])
+
+        # same result with the fetch of a single namespace
+        self.assertEqual(datasets_manager.fetch_data_from_datasets(namespaced_datasets_info['ns_3'],
+                                                                   namespaced_data_dict['ns_3']),
+                         data_retrieved['ns_3'])
+
+        # an unknown connector is reported with the dataset
+        with self.assertRaisesRegex(DatasetGenericException, 'Error fetching dataset "d5" of datasets connector "unknown_connector"'):
+            datasets_manager.fetch_data_from_datasets({DatasetInfoV0('unknown_connector', 'd5'): {wildcard: wildcard}},
+                                                      namespaced_data_dict['ns_3'])
+
 
 if __name__ == "__main__":
     cls = TestDatasets()
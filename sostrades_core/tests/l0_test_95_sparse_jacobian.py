@@ -0,0 +1,151 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+import unittest
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import diags, issparse, lil_matrix
+
+from sostrades_core.execution_engine.sos_wrapp import SoSWrapp, SparseJacobianBlocks
+
+
+class DataFrameWrapp(SoSWrapp):
+    """
+    Wrapp with a dataframe input and output with one column of values per asset, and an array output
+    """
+
+    DESC_IN = {'x': {'type': 'dataframe'}}
+    DESC_OUT = {'y': {'type': 'dataframe'}, 'z': {'type': 'array'}}
+
+
+class TestSparseJacobian(unittest.TestCase):
+    """
+    Tests of the sparse assembly of the partial derivatives set with set_partial_derivative_for_other_types
+    """
+
+    def setUp(self):
+        self.years = np.arange(2020, 2030)
+        self.assets = ['a', 'b', 'c']
+        self.wrapp = DataFrameWrapp('wrapp', logging.getLogger(__name__))
+        self.wrapp.attributes = {'input_full_name_map': {'x': 'usecase.x'},
+                                 'output_full_name_map': {'y': 'usecase.y'}}
+        self.wrapp.input_full_name_map = {'x': 'usecase.x'}
+        self.wrapp.output_full_name_map = {'y': 'usecase.y'}
+        values = {'years': self.years} | {asset: np.ones(len(self.years)) for asset in self.assets}
+        self.wrapp.local_data = {'usecase.x': pd.DataFrame(values),
+                                 'usecase.y': pd.DataFrame(values)}
+
+    def _get_expected_matrix(self, block_list):
+        # reference: sequential assignment of the blocks in a lil_matrix
+        n_years = len(self.years)
+        expected = lil_matrix((n_years * len(self.assets), n_years * len(self.assets)), dtype=complex)
+        for y_asset, x_asset, value in block_list:
+            rows = slice(None) if y_asset is None else slice(self.assets.index(y_asset) * n_years,
+                                                             (self.assets.index(y_asset) + 1) * n_years)
+            cols = slice(None) if x_asset is None else slice(self.assets.index(x_asset) * n_years,
+                                                             (self.assets.index(x_asset) + 1) * n_years)
+            expected[rows, cols] = value
+        return expected.toarray()
+
+    def _set_blocks(self, block_list):
+        for y_asset, x_asset, value in block_list:
+            y_key_column = ('y',) if y_asset is None else ('y', y_asset)
+            x_key_column = ('x',) if x_asset is None else ('x', x_asset)
+            self.wrapp.set_partial_derivative_for_other_types(y_key_column, x_key_column, value)
+        jac_blocks = self.wrapp.jac_dict['usecase.y']['usecase.x']
+        self.assertIsInstance(jac_blocks, SparseJacobianBlocks)
+        return jac_blocks.tocsr()
+
+    def test_01_sparse_jacobian_column_blocks(self):
+        n_years = len(self.years)
+        block_list = [('a', 'a', np.identity(n_years)),
+                      ('b', 'a', 2. * np.identity(n_years)),
+                      ('b', 'b', diags(np.arange(n_years, dtype=float))),
+                      ('c', 'b', 3.),
+                      # a block set twice is replaced
+                      ('a', 'a', -np.identity(n_years))]
+        jacobian = self._set_blocks(block_list)
+
+        self.assertTrue(issparse(jacobian))
+        self.assertEqual(jacobian.format, 'csr')
+        self.assertEqual(jacobian.dtype, np.float64)
+        np.testing.assert_array_equal(jacobian.toarray(), self._get_expected_matrix(block_list).real)
+        self.assertEqual(self.wrapp.jac_boundaries['usecase.y,b'], {'start': n_years, 'end': 2 * n_years})
+        self.assertEqual(self.wrapp.jac_boundaries['usecase.x,a'], {'start': 0, 'end': n_years})
+
+    def test_02_sparse_jacobian_complex_and_array_blocks(self):
+        n_years = len(self.years)
+        block_list = [('a', 'a', np.identity(n_years)),
+                      ('b', 'c', 1j * np.identity(n_years))]
+        jacobian = self._set_blocks(block_list)
+        self.assertEqual(jacobian.dtype, np.complex128)
+        np.testing.assert_array_equal(jacobian.toarray(), self._get_expected_matrix(block_list))
+
+        # an array output spans all the rows of the partial derivative
+        self.wrapp.local_data['usecase.z'] = np.arange(3.)
+        self.wrapp.attributes['output_full_name_map']['z'] = 'usecase.z'
+        self.wrapp.output_full_name_map['z'] = 'usecase.z'
+        self.wrapp.set_partial_derivative_for_other_types(('z',), ('x', 'c'), np.ones((3, n_years)))
+        jacobian = self.wrapp.jac_dict['usecase.z']['usecase.x'].tocsr()
+        expected = np.zeros((3, n_years * len(self.assets)))
+        expected[:, 2 * n_years:] = 1.
+        np.testing.assert_array_equal(jacobian.toarray(), expected)
+
+    def test_03_sparse_jacobian_overlapping_blocks(self):
+        jac_blocks = SparseJacobianBlocks((4, 4))
+        jac_blocks.set_block((0, 0), slice(0, 2), slice(0, 2), np.identity(2))
+        jac_blocks.set_block((1, 1), slice(2, 4), slice(2, 4), 2. * np.identity(2))
+        # a block spanning all the rows overlaps the blocks already set, the last block set prevails
+        jac_blocks.set_block((None, 0), slice(None), slice(0, 2), np.full((4, 2), 0.5))
+        jac_blocks.set_block((1, 0), slice(2, 4), slice(0, 2), np.zeros((2, 2)))
+
+        expected = lil_matrix((4, 4))
+        expected[0:2, 0:2] = np.identity(2)
+        expected[2:4, 2:4] = 2. * np.identity(2)
+        expected[:, 0:2] = np.full((4, 2), 0.5)
+        expected[2:4, 0:2] = np.zeros((2, 2))
+        np.testing.assert_array_equal(jac_blocks.tocsr().toarray(), expected.toarray())
+
+        # a block set again prevails over the blocks set in between
+        jac_blocks = SparseJacobianBlocks((4, 4))
+        jac_blocks.set_block((None, None), slice(None), slice(None), np.full((4, 4), 3.))
+        jac_blocks.set_block((0, 0), slice(0, 2), slice(0, 2), np.identity(2))
+        jac_blocks.set_block((None, 1), slice(None), slice(2, 4), np.full((4, 2), 4.))
+        jac_blocks.set_block((None, None), slice(None), slice(None), np.full((4, 4), 5.))
+        jac_blocks.set_block((None, 1), slice(None), slice(2, 4), np.zeros((4, 2)))
+
+        expected = lil_matrix((4, 4))
+        expected[:, :] = np.full((4, 4), 3.)
+        expected[0:2, 0:2] = np.identity(2)
+        expected[:, 2:4] = np.full((4, 2), 4.)
+        expected[:, :] = np.full((4, 4), 5.)
+        expected[:, 2:4] = np.zeros((4, 2))
+        np.testing.assert_array_equal(jac_blocks.tocsr().toarray(), expected.toarray())
+
+    def test_04_sparse_jacobian_after_set_partial_derivative(self):
+        n_years = len(self.years)
+        n_assets = len(self.assets)
+        self.wrapp.set_partial_derivative('y', 'x', np.zeros((n_years * n_assets, n_years * n_assets)))
+        self.wrapp.set_partial_derivative_for_other_types(('y', 'b'), ('x', 'a'), 1j * np.identity(n_years))
+
+        jacobian = self.wrapp.jac_dict['usecase.y']['usecase.x']
+        self.assertEqual(jacobian.dtype, np.complex128)
+        np.testing.assert_array_equal(jacobian, self._get_expected_matrix([('b', 'a', 1j * np.identity(n_years))]))
+
+
+if '__main__' == __name__:
+    unittest.main()
@@ -0,0 +1,144 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import pickle
+import unittest
+from unittest.mock import patch
+
+from numpy import array
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+from sostrades_core.execution_engine.execution_profiler import ExecutionProfiler, ProfiledMDAIteration
+from sostrades_core.tools.post_processing.charts.two_axes_instanciated_chart import TwoAxesInstanciatedChart
+from sostrades_core.tools.post_processing.tables.instanciated_table import InstanciatedTable
+
+
+class TestExecutionProfiler(unittest.TestCase):
+    """
+    Tests of the profiling mode of the ExecutionEngine
+    """
+
+    def setUp(self):
+        self.name = 'Test'
+        self.coupling_name = 'SellarCoupling'
+        self.ee = ExecutionEngine(self.name)
+        mda_builder = self.ee.factory.get_builder_from_process('sostrades_core.sos_processes.test',
+                                                               'test_sellar_coupling')
+        self.ee.factory.set_builders_to_coupling_builder(mda_builder)
+        self.ee.configure()
+        prefix = f'{self.name}.{self.coupling_name}'
+        self.ee.load_study_from_input_dict({f'{prefix}.x': array([1.]),
+                                            f'{prefix}.y_1': array([1.]),
+                                            f'{prefix}.y_2': array([1.]),
+                                            f'{prefix}.z': array([1., 1.]),
+                                            f'{prefix}.Sellar_Problem.local_dv': 10.})
+        self.profiling_results_name = f'{prefix}.profiling_results'
+
+    def test_01_execution_profiler(self):
+        profiler = ExecutionProfiler()
+        with profiler.profile('disc', ExecutionProfiler.RUN):
+            pass
+        profiler.record('disc', ExecutionProfiler.RUN, 2., 1.)
+        profiler.record('disc', ExecutionProfiler.JACOBIAN, 3., 3., calls=2)
+
+        results = profiler.get_results()
+        self.assertListEqual(results.columns.tolist(), list(ExecutionProfiler.COLUMNS))
+        self.assertListEqual(results[ExecutionProfiler.STEP].tolist(),
+                             [ExecutionProfiler.JACOBIAN, ExecutionProfiler.RUN])
+        self.assertListEqual(results[ExecutionProfiler.CALLS].tolist(), [2, 2])
+        self.assertGreaterEqual(results[ExecutionProfiler.WALL_TIME][1], 2.)
+
+        # the profiler is pickled with the disciplines
+        self.assertTrue(pickle.loads(pickle.dumps(profiler)).get_results().equals(results))
+        profiler.reset()
+        self.assertTrue(profiler.get_results().empty)
+
+    def test_02_profiling_mode(self):
+        # the profiling output exists only in profiling mode
+        self.ee.execute()
+        self.assertFalse(self.ee.dm.check_data_in_dm(self.profiling_results_name))
+
+        self.ee.set_profiling_mode()
+        self.ee.execute()
+        results = self.ee.dm.get_value(self.profiling_results_name)
+        prefix = f'{self.name}.{self.coupling_name}'
+        runs = results[results[ExecutionProfiler.STEP] == ExecutionProfiler.RUN]
+        self.assertListEqual(sorted(runs[ExecutionProfiler.DISCIPLINE].tolist()),
+                             [f'{prefix}.Sellar_1', f'{prefix}.Sellar_2', f'{prefix}.Sellar_Problem'])
+        # at least one run of each discipline per MDA iteration
+        mda_iterations = results[results[ExecutionProfiler.STEP] == ExecutionProfiler.MDA_ITERATION]
+        self.assertEqual(len(mda_iterations), 1)
+        self.assertGreater(mda_iterations[ExecutionProfiler.CALLS].iloc[0], 0)
+        self.assertTrue((runs[ExecutionProfiler.CALLS] >= mda_iterations[ExecutionProfiler.CALLS].iloc[0]).all())
+        self.assertIn(ExecutionProfiler.CONVERSION, results[ExecutionProfiler.STEP].tolist())
+        self.assertTrue((results[ExecutionProfiler.WALL_TIME] >= 0.).all())
+
+        # the results of a new execution replace the previous ones
+        self.ee.execute()
+        n_calls = self.ee.dm.get_value(self.profiling_results_name)[ExecutionProfiler.CALLS].sum()
+        self.assertLessEqual(n_calls, results[ExecutionProfiler.CALLS].sum())
+
+        # jacobian computation
+        sellar_1 = self.ee.root_process.proxy_disciplines[0].discipline_wrapp.discipline
+        self.ee.profiler.reset()
+        sellar_1.linearize(compute_all_jacobians=True)
+        results = self.ee.profiler.get_results().set_index(ExecutionProfiler.STEP)
+        self.assertEqual(results.loc[ExecutionProfiler.JACOBIAN, ExecutionProfiler.DISCIPLINE], sellar_1.name)
+        self.assertEqual(results.loc[ExecutionProfiler.JACOBIAN, ExecutionProfiler.CALLS], 1)
+
+        # post-processing of the root coupling
+        charts = self.ee.root_process.get_post_processing_list()
+        self.assertIsInstance(charts[-2], TwoAxesInstanciatedChart)
+        self.assertIsInstance(charts[-1], InstanciatedTable)
+        self.assertIn('Sellar_1', [name for series in charts[-2].series for name in series.abscissa])
+        charts[-2].to_plotly()
+        charts[-1].to_plotly()
+        self.assertIn(self.ee.root_process.PROFILING_RESULTS_PRETTY,
+                      self.ee.root_process.get_chart_filter_list()[0].filter_values)
+
+    def test_03_deactivate_profiling_mode(self):
+        self.ee.set_profiling_mode()
+        self.ee.execute()
+        mda_chain = self.ee.root_process.discipline_wrapp.discipline
+        self.assertIsInstance(mda_chain.inner_mdas[0].__dict__[ProfiledMDAIteration.METHOD_NAME],
+                              ProfiledMDAIteration)
+        # the disciplines can be serialized in profiling mode
+        pickle.dumps(mda_chain)
+
+        self.ee.set_profiling_mode(False)
+        self.ee.execute()
+        self.assertFalse(self.ee.dm.check_data_in_dm(self.profiling_results_name))
+        mda_chain = self.ee.root_process.discipline_wrapp.discipline
+        self.assertNotIn(ProfiledMDAIteration.METHOD_NAME, mda_chain.inner_mdas[0].__dict__)
+        self.assertIsNone(self.ee.root_process.proxy_disciplines[0].discipline_wrapp.discipline.profiler)
+        self.assertNotIn(self.ee.root_process.PROFILING_RESULTS_PRETTY,
+                         self.ee.root_process.get_chart_filter_list()[0].filter_values)
+
+    def test_04_unsupported_mda_iterations(self):
+        # the MDA iterations are not profiled if GEMSEO no longer provides the replaced method
+        with patch.object(ProfiledMDAIteration, 'METHOD_NAME', '_removed_method'), \
+                self.assertLogs(level='WARNING') as logs:
+            self.ee.set_profiling_mode()
+            self.ee.execute()
+        self.assertTrue(any('_removed_method' in message for message in logs.output))
+        mda_chain = self.ee.root_process.discipline_wrapp.discipline
+        self.assertNotIn('_removed_method', mda_chain.inner_mdas[0].__dict__)
+        results = self.ee.dm.get_value(self.profiling_results_name)
+        self.assertNotIn(ExecutionProfiler.MDA_ITERATION, results[ExecutionProfiler.STEP].tolist())
+        self.assertIn(ExecutionProfiler.RUN, results[ExecutionProfiler.STEP].tolist())
+
+
+if '__main__' == __name__:
+    unittest.main()
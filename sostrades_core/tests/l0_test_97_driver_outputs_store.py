@@ -0,0 +1,129 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+
+import numpy as np
+import pandas as pd
+from gemseo.core.parallel_execution.callable_parallel_execution import (
+    CallableParallelExecution,
+)
+
+from sostrades_core.execution_engine.disciplines_wrappers.driver_outputs_store import DriverOutputsStore
+from sostrades_core.execution_engine.disciplines_wrappers.mono_instance_driver_wrapper import (
+    SubprocessSampleEvaluator,
+)
+
+
+class ScenarioOutputsDiscipline:
+    """Discipline stub whose execution returns an array, a float and a dataframe depending on the input x"""
+
+    def execute(self, input_data):
+        x = input_data['Eval.x']
+        return {'Eval.array': np.arange(3.) + x, 'Eval.float': x,
+                'Eval.df': pd.DataFrame({'years': [2020, 2021], 'value': [x, x]})}
+
+
+class TestDriverOutputsStore(unittest.TestCase):
+    """
+    Tests of the store of the outputs of the scenarios evaluated by a driver
+    """
+
+    def setUp(self):
+        self.output_names = ['Eval.array', 'Eval.float', 'Eval.df', 'Eval.string']
+        self.scenario_names = ['scenario_1', 'scenario_2', 'reference_scenario']
+        self.years = np.arange(2020, 2025)
+        self.outputs = [{'Eval.array': np.arange(3.) + i, 'Eval.float': float(i),
+                         'Eval.df': pd.DataFrame({'years': self.years, 'value': np.full(len(self.years), float(i))}),
+                         'Eval.string': f'output_{i}'} for i in range(len(self.scenario_names))]
+
+    def _get_expected_samples_outputs_df(self, columns):
+        return pd.DataFrame([[scenario_name, *outputs.values()] for scenario_name, outputs in
+                             zip(self.scenario_names, self.outputs)], columns=['scenario_name', *columns])
+
+    def test_01_store_outputs(self):
+        store = DriverOutputsStore(self.output_names, len(self.scenario_names))
+        # the outputs of the parallel evaluation are stored in any order
+        for index in (2, 0, 1):
+            store.store(index, self.outputs[index])
+
+        gathered_array = store.get_gathered_output('Eval.array', self.scenario_names)
+        self.assertListEqual(list(gathered_array.keys()), self.scenario_names)
+        for i, value in enumerate(gathered_array.values()):
+            np.testing.assert_array_equal(value, self.outputs[i]['Eval.array'])
+        # the gathered arrays are views of the same buffer
+        self.assertIs(gathered_array['scenario_1'].base, gathered_array['scenario_2'].base)
+
+        self.assertDictEqual(store.get_gathered_output('Eval.float', self.scenario_names),
+                             {'scenario_1': 0., 'scenario_2': 1., 'reference_scenario': 2.})
+        for i, value in enumerate(store.get_gathered_output('Eval.df', self.scenario_names).values()):
+            pd.testing.assert_frame_equal(value, self.outputs[i]['Eval.df'])
+        self.assertEqual(store.get_value('Eval.string', 2), 'output_2')
+
+        columns = ['array', 'float', 'df', 'string']
+        samples_outputs_df = store.get_samples_outputs_df(self.scenario_names, columns)
+        expected_df = self._get_expected_samples_outputs_df(columns)
+        self.assertListEqual(samples_outputs_df.columns.tolist(), expected_df.columns.tolist())
+        self.assertListEqual(samples_outputs_df.dtypes.tolist(), expected_df.dtypes.tolist())
+        self.assertListEqual(samples_outputs_df['float'].tolist(), expected_df['float'].tolist())
+        for i in range(len(self.scenario_names)):
+            np.testing.assert_array_equal(samples_outputs_df['array'][i], expected_df['array'][i])
+            pd.testing.assert_frame_equal(samples_outputs_df['df'][i], expected_df['df'][i])
+
+    def test_02_store_heterogeneous_outputs(self):
+        # values that do not fit in the buffer allocated with the first value are stored as python objects
+        self.outputs[1]['Eval.array'] = np.arange(5.)
+        self.outputs[2]['Eval.float'] = 2
+        store = DriverOutputsStore(self.output_names, len(self.scenario_names))
+        for index, outputs in enumerate(self.outputs):
+            store.store(index, outputs)
+
+        for i, outputs in enumerate(self.outputs):
+            np.testing.assert_array_equal(store.get_value('Eval.array', i), outputs['Eval.array'])
+            self.assertEqual(store.get_value('Eval.float', i), outputs['Eval.float'])
+        self.assertIsInstance(store.get_value('Eval.float', 2), int)
+
+        # a value that fits in the buffer again replaces the python object
+        store.store(1, {'Eval.array': np.zeros(3)})
+        np.testing.assert_array_equal(store.get_value('Eval.array', 1), np.zeros(3))
+
+        columns = ['array', 'float', 'df', 'string']
+        samples_outputs_df = store.get_samples_outputs_df(self.scenario_names, columns)
+        self.assertListEqual(samples_outputs_df['float'].tolist(), [0., 1., 2])
+
+    def test_03_workers_write_in_shared_buffers(self):
+        output_names = ['Eval.array', 'Eval.float', 'Eval.df']
+        n_scenarios = 6
+        sub_discipline = ScenarioOutputsDiscipline()
+        store = DriverOutputsStore(output_names, n_scenarios, shared=True)
+        store.store(n_scenarios - 1, sub_discipline.execute({'Eval.x': float(n_scenarios - 1)}))
+
+        sample_evaluator = SubprocessSampleEvaluator(sub_discipline, {}, output_names, outputs_store=store)
+        parallel = CallableParallelExecution([sample_evaluator], n_processes=2)
+        worker_outputs = parallel.execute([(i, {'Eval.x': float(i)}) for i in range(n_scenarios - 1)])
+        # only the dataframes are sent back by the workers
+        for index, out_local_data in enumerate(worker_outputs):
+            self.assertListEqual(list(out_local_data.keys()), ['Eval.df'])
+            store.store(index, out_local_data, written_in_buffers=True)
+
+        for i in range(n_scenarios):
+            np.testing.assert_array_equal(store.get_value('Eval.array', i), np.arange(3.) + i)
+            self.assertEqual(store.get_value('Eval.float', i), float(i))
+            pd.testing.assert_frame_equal(store.get_value('Eval.df', i),
+                                          pd.DataFrame({'years': [2020, 2021], 'value': [float(i)] * 2}))
+
+
+if '__main__' == __name__:
+    unittest.main()
@@ -0,0 +1,182 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+from os.path import join
+from pathlib import Path
+from tempfile import gettempdir
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from sostrades_core.execution_engine.disciplines_wrappers.driver_samples_cache import DriverSamplesCache
+from sostrades_core.execution_engine.disciplines_wrappers.mono_instance_driver_wrapper import (
+    MonoInstanceDriverWrapper,
+)
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+from sostrades_core.sos_processes.test.tests_driver_eval.mono.test_mono_driver_sample_generator_sellar_coupling.usecase1_doe_mono import (
+    Study,
+)
+from sostrades_core.tools.folder_operations import rmtree_safe
+
+
+class TestDriverSamplesCache(unittest.TestCase):
+    """
+    Tests of the persistent cache of the samples outputs of the mono-instance driver
+    """
+
+    def setUp(self):
+        self.cache_dir = join(gettempdir(), 'test_98_driver_samples_cache')
+        if Path(self.cache_dir).exists():
+            rmtree_safe(self.cache_dir)
+        self.study_name = 'usecase'
+        self.reference_input_data = {'x': np.array([1., 2.]), 'df': pd.DataFrame({'a': [1., 2.], 'b': ['c', 'd']}),
+                                     'dict': {'b': 1, 'a': [None, 'e']}}
+
+    def tearDown(self):
+        if Path(self.cache_dir).exists():
+            rmtree_safe(self.cache_dir)
+
+    def _create_cache(self, max_size=1e9):
+        cache = DriverSamplesCache(self.cache_dir, max_size)
+        cache.set_reference(['structure'], self.reference_input_data)
+        return cache
+
+    def test_01_samples_cache(self):
+        cache = self._create_cache()
+        key = cache.get_key({'x': np.array([3., 4.])})
+        self.assertEqual(key, cache.get_key({'x': np.array([3., 4.])}))
+        self.assertNotEqual(key, cache.get_key({'x': np.array([3., 5.])}))
+        self.assertNotEqual(key, cache.get_key({'x': np.array([3, 4])}))
+        self.assertIsNone(cache.get(key))
+
+        output_data = {'y': np.arange(3.), 'z': pd.DataFrame({'years': [2020], 'value': [1.]})}
+        cache.put(key, output_data)
+        self.assertEqual(cache.get_stats()['entries'], 1)
+
+        # the cache is persistent and the keys are stable
+        new_cache = self._create_cache()
+        new_key = new_cache.get_key({'x': np.array([3., 4.])})
+        self.assertEqual(new_key, key)
+        cached_output_data = new_cache.get(new_key)
+        np.testing.assert_array_equal(cached_output_data['y'], output_data['y'])
+        pd.testing.assert_frame_equal(cached_output_data['z'], output_data['z'])
+        self.assertDictEqual(new_cache.get_stats(), {'hits': 1, 'misses': 0, 'evictions': 0, 'entries': 1,
+                                                     'size': new_cache.size})
+
+        # a different reference gives different keys
+        self.reference_input_data['dict']['a'][1] = 'f'
+        self.assertNotEqual(self._create_cache().get_key({'x': np.array([3., 4.])}), key)
+
+    def test_02_samples_cache_eviction(self):
+        cache = self._create_cache()
+        keys = [cache.get_key({'x': i}) for i in range(4)]
+        for key in keys[:3]:
+            cache.put(key, {'y': np.zeros(1000)})
+        entry_size = cache.size / 3
+
+        # the least recently used entry is removed when the maximum size is exceeded
+        cache = self._create_cache(max_size=3.5 * entry_size)
+        self.assertIsNotNone(cache.get(keys[0]))
+        cache.put(keys[3], {'y': np.zeros(1000)})
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get(keys[1]))
+        for key in (keys[0], keys[2], keys[3]):
+            self.assertIsNotNone(cache.get(key))
+
+        # a corrupted file is removed from the cache
+        cache_file = next(Path(self.cache_dir).glob(f'*/{keys[0]}{DriverSamplesCache.FILE_SUFFIX}'))
+        cache_file.write_bytes(b'corrupted')
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertFalse(cache_file.exists())
+        self.assertEqual(len(cache), 2)
+
+    def _run_doe(self, evaluation_cache_dir, n_processes=1):
+        ee = ExecutionEngine(self.study_name)
+        builder = ee.factory.get_builder_from_process('sostrades_core.sos_processes.test.tests_driver_eval.mono',
+                                                      'test_mono_driver_sample_generator_sellar_coupling')
+        ee.factory.set_builders_to_coupling_builder(builder)
+        ee.configure()
+        usecase = Study(execution_engine=ee)
+        usecase.study_name = self.study_name
+        values_dict = usecase.setup_usecase()[0]
+        values_dict[f'{self.study_name}.SampleGenerator.algo_options'] = {'n_samples': 5}
+        values_dict[f'{self.study_name}.Eval.evaluation_cache_dir'] = evaluation_cache_dir
+        values_dict[f'{self.study_name}.Eval.n_processes'] = n_processes
+        ee.load_study_from_input_dict(values_dict)
+        ee.execute()
+        return ee
+
+    def test_03_driver_samples_cache(self):
+        stats_name = f'{self.study_name}.Eval.evaluation_cache_stats'
+        outputs_df_name = f'{self.study_name}.Eval.samples_outputs_df'
+        ee_ref = self._run_doe('')
+        self.assertFalse(ee_ref.dm.check_data_in_dm(stats_name))
+
+        ee = self._run_doe(self.cache_dir, n_processes=2)
+        # the samples but the reference scenario are in the cache for a new run
+        ee_cached = self._run_doe(self.cache_dir)
+        stats = ee_cached.dm.get_value(stats_name)
+        self.assertEqual(stats['hits'], 5)
+        self.assertEqual(stats['misses'], 0)
+        self.assertEqual(stats['entries'], 6)
+
+        ref_outputs_df = ee_ref.dm.get_value(outputs_df_name)
+        for outputs_df in (ee.dm.get_value(outputs_df_name), ee_cached.dm.get_value(outputs_df_name)):
+            self.assertListEqual(outputs_df['scenario_name'].tolist(), ref_outputs_df['scenario_name'].tolist())
+            # the initial values of the couplings are not part of the keys, the outputs are equal up to the MDA tolerance
+            for column in ref_outputs_df.columns[1:]:
+                np.testing.assert_allclose(np.stack(outputs_df[column]), np.stack(ref_outputs_df[column]), rtol=1e-6)
+
+    def test_04_duplicate_samples_evaluated_once(self):
+        ee = ExecutionEngine(self.study_name)
+        builder = ee.factory.get_builder_from_process('sostrades_core.sos_processes.test.tests_driver_eval.mono',
+                                                      'test_mono_driver_sample_generator_sellar_coupling')
+        ee.factory.set_builders_to_coupling_builder(builder)
+        ee.configure()
+        usecase = Study(execution_engine=ee)
+        usecase.study_name = self.study_name
+        values_dict = usecase.setup_usecase()[0]
+        values_dict[f'{self.study_name}.SampleGenerator.sampling_method'] = 'simple'
+        values_dict[f'{self.study_name}.Eval.evaluation_cache_dir'] = self.cache_dir
+        ee.load_study_from_input_dict(values_dict)
+        # the sample c is a duplicate of a and the sample d has the values of the reference scenario
+        samples_df = pd.DataFrame({'selected_scenario': [True] * 4, 'scenario_name': ['a', 'b', 'c', 'd'],
+                                   'SellarCoupling.x': [np.array([3.]), np.array([5.]), np.array([3.]),
+                                                        np.array([2.])]})
+        ee.load_study_from_input_dict({f'{self.study_name}.Eval.samples_df': samples_df})
+
+        evaluated_x = []
+        evaluate_output_data = MonoInstanceDriverWrapper._evaluate_output_data
+
+        def counting_evaluate_output_data(wrapper, x):
+            evaluated_x.append(x[f'{self.study_name}.Eval.SellarCoupling.x'][0])
+            return evaluate_output_data(wrapper, x)
+
+        with patch.object(MonoInstanceDriverWrapper, '_evaluate_output_data', counting_evaluate_output_data):
+            ee.execute()
+        self.assertListEqual(evaluated_x, [3., 5., 2.])
+
+        outputs_df = ee.dm.get_value(f'{self.study_name}.Eval.samples_outputs_df').set_index('scenario_name')
+        for column in outputs_df.columns:
+            np.testing.assert_array_equal(outputs_df.loc['c', column], outputs_df.loc['a', column])
+            np.testing.assert_array_equal(outputs_df.loc['d', column], outputs_df.loc['reference_scenario', column])
+        # the duplicate samples do not share their output values
+        self.assertIsNot(outputs_df.loc['c', 'SellarCoupling.y_1'], outputs_df.loc['a', 'SellarCoupling.y_1'])
+
+
+if '__main__' == __name__:
+    unittest.main()
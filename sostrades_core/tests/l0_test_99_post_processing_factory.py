@@ -0,0 +1,95 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+from unittest.mock import patch
+
+from sostrades_core.execution_engine.execution_engine import ExecutionEngine
+from sostrades_core.execution_engine.proxy_discipline import ProxyDiscipline
+from sostrades_core.sos_processes.test.tests_driver_eval.multi.test_multi_driver.usecase_autogather import Study
+from sostrades_core.tools.post_processing.post_processing_factory import PostProcessingFactory
+
+
+class TestPostProcessingFactory(unittest.TestCase):
+    """
+    Tests of the parallel and memoized generation of the post processings of a multi scenario study
+    """
+
+    def setUp(self):
+        self.study_name = 'usecase'
+        self.ee = ExecutionEngine(self.study_name)
+        builder = self.ee.factory.get_builder_from_process('sostrades_core.sos_processes.test.tests_driver_eval.multi',
+                                                           'test_multi_driver')
+        self.ee.factory.set_builders_to_coupling_builder(builder)
+        self.ee.configure()
+        usecase = Study(execution_engine=self.ee)
+        usecase.study_name = self.study_name
+        values_dict = {}
+        for dict_values in usecase.setup_usecase():
+            values_dict.update(dict_values)
+        self.ee.load_study_from_input_dict(values_dict)
+        self.ee.execute()
+
+    @staticmethod
+    def _get_json_post_processings(all_post_processings_bundle):
+        return {key: [(bundle.name, bundle.post_processings) for bundle in bundles]
+                for key, bundles in all_post_processings_bundle.items()}
+
+    def test_01_parallel_post_processings(self):
+        ref_post_processings = self._get_json_post_processings(
+            PostProcessingFactory().get_all_post_processings(self.ee, False, for_test=True))
+        self.assertIn(f'{self.study_name}.multi_scenarios.scenario_1.Disc1', ref_post_processings)
+
+        post_processings = self._get_json_post_processings(
+            PostProcessingFactory().get_all_post_processings(self.ee, False, for_test=True, max_workers=4))
+        self.assertListEqual(list(post_processings.keys()), list(ref_post_processings.keys()))
+        self.assertDictEqual(post_processings, ref_post_processings)
+
+    def test_02_memoized_post_processings(self):
+        post_processing_factory = PostProcessingFactory()
+        with patch.object(ProxyDiscipline, 'get_post_processing_list', autospec=True,
+                          side_effect=ProxyDiscipline.get_post_processing_list) as get_post_processing_list:
+            ref_post_processings = self._get_json_post_processings(
+                post_processing_factory.get_all_post_processings(self.ee, False, for_test=True))
+            n_generations = get_post_processing_list.call_count
+            self.assertGreater(n_generations, 0)
+
+            # the post processings of the unchanged disciplines are not generated again
+            post_processings = self._get_json_post_processings(
+                post_processing_factory.get_all_post_processings(self.ee, False, for_test=True))
+            self.assertEqual(get_post_processing_list.call_count, n_generations)
+            self.assertDictEqual(post_processings, ref_post_processings)
+
+            # only the disciplines whose values changed are generated again
+            self.ee.load_study_from_input_dict({f'{self.study_name}.multi_scenarios.scenario_1.Disc1.a': 5})
+            self.ee.execute()
+            get_post_processing_list.reset_mock()
+            post_processings = self._get_json_post_processings(
+                post_processing_factory.get_all_post_processings(self.ee, False, for_test=True))
+            generated_disciplines = {call.args[0].get_disc_full_name()
+                                     for call in get_post_processing_list.call_args_list}
+            self.assertIn(f'{self.study_name}.multi_scenarios.scenario_1.Disc1', generated_disciplines)
+            self.assertNotIn(f'{self.study_name}.multi_scenarios.scenario_2.Disc1', generated_disciplines)
+            disc1_key = f'{self.study_name}.multi_scenarios.scenario_1.Disc1'
+            self.assertNotEqual(post_processings[disc1_key], ref_post_processings[disc1_key])
+
+            post_processing_factory.clear_cache()
+            get_post_processing_list.reset_mock()
+            post_processing_factory.get_all_post_processings(self.ee, False, for_test=True)
+            self.assertEqual(get_post_processing_list.call_count, n_generations)
+
+
+if '__main__' == __name__:
+    unittest.main()
@@ -14,8 +14,55 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
+from functools import lru_cache
+
 import numpy as np
-from scipy.interpolate import BSpline as bspline_sp
+
+# number of basis matrices kept in cache, one per (knots, degree, t grid, derivative order)
+BASIS_MATRIX_CACHE_SIZE = 128
+
+
+def _special_div_array(num, den):
+    """ Vectorized BSpline.special_div: num/den element-wise with 0 where num or den is zero. """
+    zero = (num.real == 0.) | (den.real == 0.)
+    return np.where(zero, 0., num / np.where(den.real == 0., 1., den))
+
+
+@lru_cache(maxsize=BASIS_MATRIX_CACHE_SIZE)
+def _compute_basis_matrix(knots_bytes, knots_dtype, degree, t_bytes, t_dtype, diff):
+    """
+    Compute the matrix of the basis functions (or their derivatives) of all the poles at all the points of the t grid
+    with the Cox-de Boor recursion applied to whole columns, same rules as BSpline.B, BSpline.dBdt and BSpline.d2Bdt2
+    """
+    knots = np.frombuffer(knots_bytes, dtype=knots_dtype)
+    t = np.frombuffer(t_bytes, dtype=t_dtype)[:, np.newaxis]
+    knots_real = knots.real
+    # basis functions of degree 0, the last point is included in the last non-empty knot span
+    basis = ((knots_real[:-1] <= t) & (t < knots_real[1:])).astype(np.result_type(knots, t))
+    last_span = np.zeros(len(knots) - 1, dtype=bool)
+    last_span[1:] = (knots_real[:-2] < knots_real[1:-1]) & (knots_real[1:-1] == knots_real[-1])
+    basis[(t[:, 0] == knots_real[-1])[:, np.newaxis] & last_span] = 1.
+    bases = [basis]
+    for n in range(1, degree + 1):
+        n_basis = len(knots) - 1 - n
+        knots_diff = knots[n:] - knots[:-n]
+        left = _special_div_array((t - knots[:n_basis]) * basis[:, :n_basis], knots_diff[:n_basis])
+        right = (1. - _special_div_array(t - knots[1:n_basis + 1], knots_diff[1:n_basis + 1])) * basis[:, 1:n_basis + 1]
+        basis = left + right
+        bases.append(basis)
+
+    def derivative(n, order):
+        if order == 0:
+            return bases[n]
+        lower = n * derivative(n - 1, order - 1)
+        n_basis = len(knots) - 1 - n
+        knots_diff = knots[n:] - knots[:-n]
+        return _special_div_array(lower[:, :n_basis], knots_diff[:n_basis]) - \
+            _special_div_array(lower[:, 1:n_basis + 1], knots_diff[1:n_basis + 1])
+
+    basis_matrix = derivative(degree, diff)
+    basis_matrix.setflags(write=False)
+    return basis_matrix
 
 
 class BSpline(object):
@@ -71,12 +118,31 @@ class BSpline(object):
             self.set_uniform_knots_list()
 
     def eval(self, t, diff=0):
-        eval_functions = [self.B, self.dBdt, self.d2Bdt2]
-        eval_function = eval_functions[diff]
-        B_array = np.array([eval_function(t, i)
-                            for i in range(self.n_poles)], dtype=self.dtype)
+        B_array = np.array(self.eval_basis_matrix(np.array([t]), diff=diff)[0], dtype=self.dtype)
         return B_array
 
+    def eval_basis_matrix(self, t_array, diff=0):
+        """
+        Evaluate the basis functions of all the poles (diff=0) or their first (diff=1) or second (diff=2) derivative at
+        all the points of t_array, the matrices are cached per knots, degree and t grid.
+        A complex t_array (complex step) gives a complex matrix.
+        Returns a read-only array of shape (len(t_array), n_poles)
+        """
+        knots = np.asarray(self.knots)
+        if not np.iscomplexobj(knots):
+            knots = knots.astype(np.float64)
+        t_array = np.ascontiguousarray(t_array, dtype=np.complex128 if np.iscomplexobj(t_array) else np.float64)
+        if diff > self.degree:
+            # the basis functions are polynomials of degree self.degree on each knot span
+            basis_matrix = np.zeros((len(t_array), self.n_poles), dtype=np.result_type(knots, t_array))
+            basis_matrix.setflags(write=False)
+            return basis_matrix
+        basis_matrix = _compute_basis_matrix(np.ascontiguousarray(knots).tobytes(), knots.dtype.str, self.degree,
+                                             t_array.tobytes(), t_array.dtype.str, diff)
+        if basis_matrix.shape[1] != self.n_poles:
+            basis_matrix = basis_matrix[:, :self.n_poles]
+        return basis_matrix
+
     def float_is_zero(self, v):
         """ Test if floating point number is zero. """
         return v.real == 0.
@@ -141,25 +207,19 @@ class BSpline(object):
         """
         Method to evaluate the bspline in an array
         """
-        barray_list = np.zeros((len(t_adim), self.n_poles))
-        bsp_scipy = bspline_sp(self.knots, self.ctrl_pts, self.degree)
         if isinstance(self.ctrl_pts, list):
             self.ctrl_pts = np.asarray(self.ctrl_pts)
 
         if self.ctrl_pts.dtype == 'complex128':
-
-            result = np.zeros(len(t_adim), dtype='complex128')
-
+            result_dtype = 'complex128'
         else:
-            result = np.zeros(len(t_adim), dtype=self.dtype)
+            result_dtype = self.dtype
 
-        # -- compute information
-        for i, t in enumerate(t_adim):
-            B_array = self.eval(t, diff=0)
-            barray_list[i] = B_array
-            result[i] = np.dot(self.ctrl_pts, B_array)
+        # -- compute information for all the points at once
+        basis_matrix = self.eval_basis_matrix(t_adim, diff=0)
+        barray_list = np.array(basis_matrix.real, dtype=np.float64)
+        result = (basis_matrix.astype(self.dtype) @ self.ctrl_pts).astype(result_dtype)
 
-            # result[i] = bsp_scipy(t)
         return result, barray_list
 
     def update_b_array(self, b_array, index_desactivated=None):
@@ -15,16 +15,23 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 
-from copy import deepcopy
+from copy import copy, deepcopy
+from hashlib import blake2b
 
-from numpy import can_cast
+from numpy import can_cast, floating, integer, ndarray
+from pandas import unique
 
 from sostrades_core.tools.controllers.simpy_formula import SympyFormula
+from sostrades_core.tools.value_fingerprint import update_hasher
 
 STANDARD_LIST_TYPES = ['list', 'array']
 TEMPORARY_LIST_TYPES = ['float_list', 'string_list', 'int_list']
 POSSIBLE_VALUES_TYPES = ['int', 'float', 'string', 'bool']
 RANGE_TYPES = ['int', 'float']
+# dtype kinds of the dataframe columns whose values all convert to the same Python type
+NUMERIC_KINDS = 'biufc'
+# dtype kinds of the dataframe columns whose range can be checked with array comparisons
+RANGE_KINDS = 'biuf'
 
 
 def add_integrity_msg(integrity_msg_dict, key, error_msg):
@@ -70,8 +77,11 @@ class CheckDataIntegrity():
         self.IS_FORMULA = self.sos_disc_class.IS_FORMULA
         self.IS_EVAL = self.sos_disc_class.IS_EVAL
         self.FORMULA = self.sos_disc_class.FORMULA
+        self.VAR_NAME = self.sos_disc_class.VAR_NAME
 
         self.formula_dict = {}
+        # variable name -> (dataframe descriptor, dynamic columns, digest of the value, messages) of the last check
+        self.__dataframe_checks = {}
 
     def check_variable_type_and_unit(self, var_data_dict):
         '''
@@ -218,16 +228,38 @@ class CheckDataIntegrity():
     def __check_dataframe_descriptor(self, var_data_dict):
         '''
         Check dataframe descriptor of the data_dict vs the value if the dataframe is unlocked
+        The messages are reused if the dataframe descriptor and the value are unchanged since the last check
         '''
 
         dataframe_descriptor = var_data_dict[self.DATAFRAME_DESCRIPTOR]
-        dataframe_edition_locked = var_data_dict[self.DATAFRAME_EDITION_LOCKED]
         # Mean that dataframe columns can be dynamic depending on the case and cannot be checked
         if self.DYNAMIC_DATAFRAME_COLUMNS in var_data_dict:
             dynamic_dataframe_column = var_data_dict[self.DYNAMIC_DATAFRAME_COLUMNS]
         else:
             dynamic_dataframe_column = False
 
+        hasher = blake2b(digest_size=16)
+        # the type check of the columns distinguishes the numbers that are equal but of different types
+        update_hasher(hasher, self.variable_value, type_strict=True)
+        digest = hasher.digest()
+        var_name = var_data_dict[self.VAR_NAME]
+        if var_name in self.__dataframe_checks:
+            checked_descriptor, checked_dynamic_column, checked_digest, msg_list = self.__dataframe_checks[var_name]
+            if (checked_digest == digest and checked_dynamic_column == dynamic_dataframe_column
+                    and checked_descriptor == dataframe_descriptor):
+                self.check_integrity_msg_list.extend(msg_list)
+                return
+
+        n_msg = len(self.check_integrity_msg_list)
+        self.__check_dataframe_value_with_df_descriptor(dataframe_descriptor, dynamic_dataframe_column)
+        # the column descriptors are tuples, a copy of the dict is enough to detect a modification of the descriptor
+        self.__dataframe_checks[var_name] = (copy(dataframe_descriptor), dynamic_dataframe_column, digest,
+                                             self.check_integrity_msg_list[n_msg:])
+
+    def __check_dataframe_value_with_df_descriptor(self, dataframe_descriptor, dynamic_dataframe_column):
+        '''
+        Check the dataframe descriptor and the columns of the dataframe value
+        '''
         # Dataframe editable in GUI but no dataframe descriptor
         if dataframe_descriptor is None and not dynamic_dataframe_column:
             check_integrity_msg = 'No dataframe descriptor set'
@@ -288,22 +320,30 @@ class CheckDataIntegrity():
         '''
         Check the tuple of the column in the dataframe descriptor with the dataframe column value
         ex : ('string', None, False)
+        The numeric columns are checked on their dtype and with array comparisons, the other columns element by element
         '''
         column_type = column_descriptor[0]
         column_range = column_descriptor[1]
-        values_in_column = column.values.tolist()
+        column_values = column.values
+        is_numeric = isinstance(column_values, ndarray) and column_values.dtype.kind in NUMERIC_KINDS
         value_good_type = True
         if column_type in self.VAR_TYPE_MAP.keys():
-            if not all(isinstance(item, self.VAR_TYPE_MAP[column_type]) for item in values_in_column):
+            if is_numeric:
+                # the items of a numeric column are all converted to the same Python type
+                value_good_type = len(column_values) == 0 or issubclass(
+                    type(column_values[:1].tolist()[0]), self.VAR_TYPE_MAP[column_type])
+            else:
+                value_good_type = all(isinstance(item, self.VAR_TYPE_MAP[column_type])
+                                      for item in column_values.tolist())
+            if not value_good_type:
                 check_integrity_msg = f'Dataframe values in column {key} are not as type {column_type} requested in the dataframe descriptor'
                 self.__add_msg_to_check_integrity_msg_list(check_integrity_msg)
-                value_good_type = False
         if column_range is not None and value_good_type:
             if not isinstance(column_range, list):
                 check_integrity_msg = f"Dataframe descriptor incorrect completion of range for column '{key}'. Should be a list."
                 self.__add_msg_to_check_integrity_msg_list(check_integrity_msg)
             elif column_type == 'string':
-                if not all(item in column_range for item in values_in_column):
+                if not all(item in column_range for item in unique(column_values)):
                     check_integrity_msg = f'Dataframe values in column {key} are not in the possible list {column_range} requested in the dataframe descriptor'
                     self.__add_msg_to_check_integrity_msg_list(check_integrity_msg)
             elif column_type in ['float', 'int']:
@@ -311,8 +351,7 @@ class CheckDataIntegrity():
                 if len(column_range) != 2:
                     check_integrity_msg = f"Dataframe descriptor incorrect completion of range for column '{key}' of type 'float' or 'int'. Should be list of len 2."
                     self.__add_msg_to_check_integrity_msg_list(check_integrity_msg)
-                elif not all(item <= column_range[1] for item in values_in_column) and all(
-                    column_range[0] <= item for item in values_in_column):
+                elif self.__is_out_of_range(column_values, column_range):
                     check_integrity_msg = f'Dataframe values in column {key} are not in the range {column_range} requested in the dataframe descriptor'
                     self.__add_msg_to_check_integrity_msg_list(check_integrity_msg)
 
@@ -320,6 +359,16 @@ class CheckDataIntegrity():
                 check_integrity_msg = 'Range values for dataframe descriptor type different than [float,int or string] is not handled in data integrity checks for now'
                 self.__add_msg_to_check_integrity_msg_list(check_integrity_msg)
 
+    @staticmethod
+    def __is_out_of_range(column_values, column_range):
+        '''
+        Whether some values of a column are below the lower bound or above the upper bound of the range
+        '''
+        if (isinstance(column_values, ndarray) and column_values.dtype.kind in RANGE_KINDS
+                and all(isinstance(bound, (int, float, integer, floating)) for bound in column_range)):
+            return not ((column_range[0] <= column_values) & (column_values <= column_range[1])).all()
+        return not all(column_range[0] <= item <= column_range[1] for item in column_values.tolist())
+
     def __check_subtype_descriptor(self, var_data_dict):
         '''
         Check subtype descriptor of the data_dict vs the value for list and dict
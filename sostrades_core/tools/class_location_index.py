@@ -0,0 +1,135 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import ast
+import inspect
+import os
+from importlib import import_module
+
+"""
+mode: python; py-indent-offset: 4; tab-width: 4; coding: utf-8
+Location of the classes of the modules of a folder, found by parsing their sources instead of importing them
+"""
+
+# folder module name -> {class name: module path of the class}, built once per folder for the lifetime of the process
+_FOLDER_CLASSES_INDEX = {}
+
+# statements whose blocks define classes in the module namespace
+_BLOCK_STATEMENTS = (ast.If, ast.Try, ast.With) + ((ast.TryStar,) if hasattr(ast, 'TryStar') else ())
+
+
+def get_module_class_path(class_name, folder_list):
+    """
+    Return the module path (module.class_name) of a class defined in a submodule of one of the folders, the first found
+    in the order of the folders and of the files of each folder
+
+    The classes of each folder are indexed by parsing the sources of its submodules, which are not imported. Classes
+    which are not defined by a class statement of a python source (built dynamically, compiled modules...) are searched
+    by importing the submodules of the folders
+
+    :params: class_name, name of the class
+    :type: string
+
+    :params: folder_list, module names of the folders
+    :type: list of strings
+
+    :return: module path of the class, None if not found
+    """
+    for folder in folder_list:
+        module_class_path = get_folder_classes_index(folder).get(class_name)
+        if module_class_path is not None:
+            return module_class_path
+
+    return _find_module_class_path_by_import(class_name, folder_list)
+
+
+def get_folder_classes_index(folder):
+    """
+    Return the dict {class name: module path of the class} of the classes defined in the submodules of a folder
+
+    :params: folder, module name of the folder
+    :type: string
+    """
+    if folder not in _FOLDER_CLASSES_INDEX:
+        folder_path = _get_folder_path(folder)
+        folder_classes_index = {}
+        for file in os.listdir(folder_path):
+            file_path = os.path.join(folder_path, file)
+            if file.endswith('.py') and file != '__init__.py':
+                sub_module_name = file[:-len('.py')]
+            elif os.path.isfile(os.path.join(file_path, '__init__.py')):
+                sub_module_name = file
+                file_path = os.path.join(file_path, '__init__.py')
+            else:
+                continue
+            if not sub_module_name.isidentifier():
+                continue
+            for sub_module_class_name in _get_source_class_names(file_path):
+                folder_classes_index.setdefault(sub_module_class_name,
+                                                '.'.join([folder, sub_module_name, sub_module_class_name]))
+        _FOLDER_CLASSES_INDEX[folder] = folder_classes_index
+
+    return _FOLDER_CLASSES_INDEX[folder]
+
+
+def clear_classes_index():
+    """
+    Clear the classes indexes of the folders, to call if their modules are modified during the process
+    """
+    _FOLDER_CLASSES_INDEX.clear()
+
+
+def _get_folder_path(folder):
+    try:
+        return os.path.dirname(import_module(folder).__file__)
+    except (ImportError, TypeError):
+        raise Warning(f'The folder {folder} is not a module')
+
+
+def _get_source_class_names(file_path):
+    try:
+        with open(file_path, 'rb') as source_file:
+            tree = ast.parse(source_file.read(), filename=file_path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    return _get_statements_class_names(tree.body)
+
+
+def _get_statements_class_names(statements):
+    # classes of the module namespace, including those defined in conditional or try blocks
+    class_names = []
+    for statement in statements:
+        if isinstance(statement, ast.ClassDef):
+            class_names.append(statement.name)
+        elif isinstance(statement, _BLOCK_STATEMENTS):
+            for block in ('body', 'orelse', 'finalbody'):
+                class_names.extend(_get_statements_class_names(getattr(statement, block, [])))
+            for handler in getattr(statement, 'handlers', []):
+                class_names.extend(_get_statements_class_names(handler.body))
+    return class_names
+
+
+def _find_module_class_path_by_import(class_name, folder_list):
+    for folder in folder_list:
+        folder_path = _get_folder_path(folder)
+        for file in os.listdir(folder_path):
+            sub_module = import_module('.'.join([folder, file.split('.')[0]]))
+            # Find all members of the submodule which are classes belonging to the sub_module
+            class_list = [value for value, cls in inspect.getmembers(sub_module)
+                          if inspect.isclass(cls) and cls.__module__ == sub_module.__name__]
+            if class_name in class_list:
+                return '.'.join([sub_module.__name__, class_name])
+
+    return None
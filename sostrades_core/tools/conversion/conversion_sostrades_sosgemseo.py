@@ -24,7 +24,7 @@ from numpy import complex128 as np_complex128
 from numpy import float64 as np_float64
 from numpy import int32 as np_int32
 from numpy import int64 as np_int64
-from pandas import DataFrame
+from pandas import DataFrame, RangeIndex
 
 BASE_TYPE_EXCLUDED = ['int', 'string']
 DEFAULT_EXCLUDED_COLUMNS = ['year', 'years']
@@ -32,6 +32,9 @@ VAR_TYPE_ID = 'type'
 VAR_SUBTYPE_ID = 'subtype_descriptor'
 TYPE_METADATA = "type_metadata"
 DF_EXCLUDED_COLUMNS = 'dataframe_excluded_columns'
+DF_CONVERSION_PLAN = 'dataframe_conversion_plan'
+# dtypes of dataframe columns that cannot be converted into array and are excluded from the conversion
+DF_DTYPES_TO_EXCLUDE = [object, bool, str]
 INT_MAP = (int, np_int32, np_int64, np_complex128)
 FLOAT_MAP = (float, np_float64, np_complex128)
 VAR_TYPE_MAP = {
@@ -153,8 +156,8 @@ def convert_array_into_df(arr_to_convert, metadata, excluded_columns=DEFAULT_EXC
     # convert list into dataframe using columns from dm.data_dict
     _shape = metadata['__shape__']
     _size = metadata['__size__']
-    _col = metadata['__columns__'].copy()
-    _dtypes = metadata['__dtypes__'].copy()
+    _col = metadata['__columns__']
+    _dtypes = metadata['__dtypes__']
     _arr = arr_to_convert[:_size]
     # to flatten by lines erase the option 'F' or put the 'C' option
     _arr = _arr.reshape(_shape, order='F')
@@ -480,38 +483,69 @@ def convert_array_into_dict(to_convert, metadata, subtype):
         return converted_dict
 
 
-def convert_df_into_array(var_df, values_list, metadata, keys, excluded_columns=DEFAULT_EXCLUDED_COLUMNS):
+def build_df_conversion_plan(var_df, excluded_columns=DEFAULT_EXCLUDED_COLUMNS):
     '''
-    Converts dataframe into array, and stores metada
-    useful to build the dataframe afterwards
+    Computes once the layout used to flatten a dataframe: positions, names and dtypes of the converted columns and
+    list of excluded columns. The plan can be reused as long as the columns and dtypes of the dataframe are unchanged
     '''
-    # gather df data including index column
-    #         data = var_df.to_numpy()
-
-    val_data = {column: list(var_df[column].values)
-                for column in excluded_columns if column in var_df}
+    columns = var_df.columns
+    dtypes = var_df.dtypes.tolist()
+    column_indices = [i for i, column in enumerate(columns) if column not in excluded_columns]
+    return {'__all_columns__': columns,
+            '__all_dtypes__': dtypes,
+            DF_EXCLUDED_COLUMNS: excluded_columns,
+            '__column_indices__': column_indices,
+            '__columns__': columns[column_indices],
+            '__dtypes__': [dtypes[i] for i in column_indices]}
+
+
+def is_df_conversion_plan_valid(plan, var_df):
+    '''
+    Checks that a conversion plan built on a previous value can be applied to var_df
+    '''
+    return plan is not None and var_df.columns.equals(plan['__all_columns__']) and \
+        var_df.dtypes.tolist() == plan['__all_dtypes__']
 
-    new_var_df = var_df[[column for column in var_df.columns if column not in excluded_columns]]
 
-    data = new_var_df.to_numpy()
+def convert_df_into_array_with_plan(var_df, plan, keys):
+    '''
+    Converts dataframe into a flat array following a conversion plan, and returns the metadata
+    useful to build the dataframe afterwards
+    '''
+    val_data = {column: list(var_df[column].values)
+                for column in plan[DF_EXCLUDED_COLUMNS] if column in var_df}
 
-    # indices = var_df.index.to_numpy()
-    columns = new_var_df.columns
-    # To delete indices in convert delete the line below
-    # data = hstack((atleast_2d(indices).T, values))
+    column_indices = plan['__column_indices__']
+    if len(column_indices) == len(plan['__all_columns__']):
+        data = var_df.to_numpy()
+    else:
+        data = var_df.iloc[:, column_indices].to_numpy()
 
     val_data['__key__'] = keys
     val_data['__type__'] = DataFrame
-    val_data['__columns__'] = columns
+    val_data['__columns__'] = plan['__columns__']
     val_data['__shape__'] = data.shape
     val_data['__size__'] = data.size
-    val_data['__dtypes__'] = [new_var_df[col].dtype for col in columns]
+    val_data['__dtypes__'] = plan['__dtypes__']
+
+    index = var_df.index
+    if not (isinstance(index, RangeIndex) and index.start == 0 and index.step == 1) and \
+            not (index == arange(0, data.shape[0])).all():
+        val_data['__indices__'] = index
+
     # to flatten by lines erase the option 'F' or put the 'C' option
+    return data.ravel(order='F'), val_data
+
 
-    if not (new_var_df.index == arange(0, data.shape[0])).all():
-        val_data['__indices__'] = new_var_df.index
+def convert_df_into_array(var_df, values_list, metadata, keys, excluded_columns=DEFAULT_EXCLUDED_COLUMNS):
+    '''
+    Converts dataframe into array, and stores metada
+    useful to build the dataframe afterwards
+    '''
+    plan = build_df_conversion_plan(var_df, excluded_columns)
+    data, val_data = convert_df_into_array_with_plan(var_df, plan, keys)
 
-    values_list = append(values_list, data.flatten(order='F'))
+    values_list = append(values_list, data)
     metadata.append(val_data)
     return values_list, metadata
 
@@ -569,23 +603,20 @@ def convert_new_type_into_array(
                     msg = f"\n Dictionary values {key} : {var} \n must be among {list(VAR_TYPE_MAP.keys())}"
                     raise ValueError(msg)
             elif var_type is DataFrame:
-                # if value is a DataFrame
-                # TO DO: Create a function to get the dtypes of columns without the "big" function 'convert_df_into_array'
-                init_var_converted, init_metadata = deepcopy(var_converted), deepcopy(metadata)
-
-                excluded_columns = reduced_dm.get(DF_EXCLUDED_COLUMNS, DEFAULT_EXCLUDED_COLUMNS)
-                var_converted, metadata = convert_df_into_array(
-                    var, var_converted, metadata, prev_key, excluded_columns)
-                # Define a list of dtypes to exclude and perform convert again if there are new cols to exclude
-                dtypes_to_exclude = [object, bool, str]
-                new_excluded_columns = deepcopy(excluded_columns)
-                for col, metadata_dtype in zip(metadata[0]['__columns__'], metadata[0]['__dtypes__']):
-                    if metadata_dtype in dtypes_to_exclude:
-                        new_excluded_columns += [col]
-                if new_excluded_columns != excluded_columns:
-                    var_converted, metadata = convert_df_into_array(
-                        var, init_var_converted, init_metadata, prev_key, new_excluded_columns)
-                    new_reduced_dm[DF_EXCLUDED_COLUMNS] = new_excluded_columns
+                # if value is a DataFrame, reuse the conversion plan of the previous call if the layout is unchanged
+                plan = reduced_dm.get(DF_CONVERSION_PLAN)
+                if not is_df_conversion_plan_valid(plan, var):
+                    excluded_columns = reduced_dm.get(DF_EXCLUDED_COLUMNS, DEFAULT_EXCLUDED_COLUMNS)
+                    # columns with dtypes that cannot be converted are excluded as well
+                    new_excluded_columns = excluded_columns + [
+                        col for col, dtype in zip(var.columns, var.dtypes)
+                        if dtype in DF_DTYPES_TO_EXCLUDE and col not in excluded_columns]
+                    plan = build_df_conversion_plan(var, new_excluded_columns)
+                    if new_excluded_columns != excluded_columns:
+                        new_reduced_dm[DF_EXCLUDED_COLUMNS] = new_excluded_columns
+                    new_reduced_dm[DF_CONVERSION_PLAN] = plan
+                var_converted, val_data = convert_df_into_array_with_plan(var, plan, prev_key)
+                metadata.append(val_data)
 
             elif var_type is list:
 
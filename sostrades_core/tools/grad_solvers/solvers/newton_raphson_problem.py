@@ -156,9 +156,9 @@ class NewtonRaphsonProblem():
 
         R = self.__R(self.__W)
         if self.__dRdW is None:
-            FD_grad = FDGradient(self.fd_mode, self.__R, fd_step=self.fd_step)
-            FD_grad.multi_proc = self.multi_proc
-            dRdW = FD_grad.grad_f(self.__W)
+            with FDGradient(self.fd_mode, self.__R, fd_step=self.fd_step) as FD_grad:
+                FD_grad.multi_proc = self.multi_proc
+                dRdW = FD_grad.grad_f(self.__W)
         else:
             dRdW = self.__dRdW(self.__W)
 
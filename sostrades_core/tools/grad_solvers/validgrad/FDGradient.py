@@ -17,6 +17,7 @@ limitations under the License.
 # -*-mode: python; py-indent-offset: 4; tab-width: 8; coding: iso-8859-1 -*-
 
 import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
 import numpy as np
@@ -24,6 +25,34 @@ import numpy as np
 from .FDFirstOrderUpwind import FDFirstOrderUpwind, FDFirstOrderUpwindComplexStep
 from .FDSecondOrderCentered import FDSecondOrderCentered
 
+# functions evaluated by the workers of the pool of a FDGradient, set at their start
+_worker_pointers = {}
+
+
+def _init_worker(f_pointer, df_pointer):
+    _worker_pointers['f'] = f_pointer
+    _worker_pointers['df'] = df_pointer
+
+
+def _evaluate_worker_samples(pointer_name, samples, args, vectorized):
+    return _evaluate_samples(_worker_pointers[pointer_name], samples, args, vectorized)
+
+
+def _evaluate_samples(pointer, samples, args, vectorized):
+    """
+    Evaluate a function at the samples, in one call on the stacked samples if vectorized
+    """
+    if args is None:
+        args = ()
+    if vectorized:
+        return np.asarray(pointer(np.array(samples), *args))
+    # the outputs are copied as the function may return the same object updated at each call
+    outputs = []
+    for x in samples:
+        out = pointer(x, *args)
+        outputs.append(out.copy() if isinstance(out, np.ndarray) else deepcopy(out))
+    return outputs
+
 
 class FDGradient(object):
     """
@@ -31,13 +60,21 @@ class FDGradient(object):
     Computes the gradient by finite differences for a given scheme order.
     """
 
-    def __init__(self, scheme_order, f_pointer, df_pointer=None, fd_step=1.e-8, bounds=None):
+    def __init__(self, scheme_order, f_pointer, df_pointer=None, fd_step=1.e-8, bounds=None, vectorized=False,
+                 n_processes=None, start_method=None):
         """
         Constructor.
         Args :
             scheme : the numerical scheme
             f_pointer : the pointer to the function on which
             finite differences are computed.
+            vectorized : if True, f_pointer and df_pointer are called once on the perturbed
+            variables sets stacked in an array and return their outputs stacked along the first axis
+            n_processes : number of worker processes in multi-process mode, default to the number of cpus
+            start_method : start method of the worker processes ('fork', 'spawn'...), default to the
+            platform one. The functions are sent to the workers when they start : they must be picklable
+            with 'spawn', and the workers keep their state as of the first multi-process call until
+            close_pool is called, or until the end of the with block in which the FDGradient is used.
         """
         self.__scheme_order = scheme_order
         self.fd_step = fd_step
@@ -55,14 +92,66 @@ class FDGradient(object):
 
         self.__fpointer = f_pointer
         self.__dfpointer = df_pointer
+        self.vectorized = vectorized
 
         self.multi_proc = False
+        self.n_processes = n_processes
+        self.start_method = start_method
+        self.__pool = None
+        self.__n_workers = 0
 
     def set_bounds(self, bounds):
         self.__scheme.set_bounds(bounds)
 
     def set_multi_proc(self, multi):
         self.multi_proc = multi
+        if not multi:
+            self.close_pool()
+
+    def close_pool(self):
+        """
+        Shut down the worker processes of the multi-process mode, a new pool is started at next multi-process call.
+        """
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_pool()
+
+    def __get_pool(self):
+        if self.__pool is None:
+            n_procs = self.n_processes if self.n_processes is not None else multiprocessing.cpu_count()
+            self.__n_workers = n_procs
+            self.__pool = ProcessPoolExecutor(max_workers=n_procs,
+                                              mp_context=multiprocessing.get_context(self.start_method),
+                                              initializer=_init_worker,
+                                              initargs=(self.__fpointer, self.__dfpointer))
+        return self.__pool
+
+    def __evaluate(self, pointer_name, samples, args=None):
+        """
+        Evaluate f_pointer ('f') or df_pointer ('df') at the perturbed variables sets, on the pool of worker processes
+        in multi-process mode with one batch of samples per worker.
+        Returns :
+            the array of the outputs stacked along the first axis
+        """
+        if not self.multi_proc:
+            pointer = self.__fpointer if pointer_name == 'f' else self.__dfpointer
+            return np.asarray(_evaluate_samples(pointer, samples, args, self.vectorized))
+
+        pool = self.__get_pool()
+        n_batches = min(len(samples), self.__n_workers)
+        batches_bounds = np.linspace(0, len(samples), n_batches + 1).astype(int)
+        futures = [pool.submit(_evaluate_worker_samples, pointer_name, samples[start:end], args, self.vectorized)
+                   for start, end in zip(batches_bounds[:-1], batches_bounds[1:])]
+        outputs = []
+        for future in futures:
+            outputs.extend(future.result())
+        return np.asarray(outputs)
 
     def get_scheme(self):
         """
@@ -72,10 +161,6 @@ class FDGradient(object):
         """
         return self.__scheme
 
-    def __worker(self, index, x_in, return_dict):
-        out = self.__fpointer(x_in)
-        return_dict[index] = out
-
     def grad_f(self, x, args=None):
         """
         Gradient calculation. Calls the numerical scheme.
@@ -87,58 +172,17 @@ class FDGradient(object):
         self.__scheme.set_x(x)
         self.__scheme.generate_samples()
 
-        samples = self.__scheme.get_samples()
-        n_samples = len(samples)
-        if self.multi_proc:
-            n_procs = multiprocessing.cpu_count()
-            print('FDGradient: multi-process grad_f, parallel run on ',
-                  n_procs, ' procs.')
-            manager = multiprocessing.Manager()
-            return_dict = manager.dict()
-            n = 0
-            while n < n_samples:
-                if n + n_procs < n_samples:
-                    n_subs = n_procs
-                else:
-                    n_subs = n_samples - n
-                jobs = []
-                for i in range(n_subs):
-                    index = n + i
-                    x_in = samples[index]
-                    p = multiprocessing.Process(
-                        target=self.__worker, args=(index, x_in, return_dict))
-                    jobs.append(p)
-                    p.start()
-
-                for proc in jobs:
-                    proc.join()
-                n += n_subs
-            y = [
-                return_dict[i]
-                for i in range(n_samples)
-            ]
-        else:
-            y = []
-            for x in samples:
-                # print('x =',x)
-                if args is None:
-                    y.append(deepcopy(self.__fpointer(x)))
-                else:
-                    y.append(deepcopy(self.__fpointer(x, *args)))
-                grad_index = len(y)
-                # print('grad index = ',grad_index)
-
-        s = np.shape(y[0])
+        y = self.__evaluate('f', self.__scheme.get_samples(), args)
+
+        s = np.shape(y)[1:]
         if len(s) < 2:
-            y_array = np.array(y)
+            y_array = y
         elif len(s) == 2:
-            p = len(y)
+            # the samples are along the last axis
             if self.get_scheme().order == 1j:
-                y_array = np.zeros((s[0], s[1], p), dtype=np.complex128)
+                y_array = np.moveaxis(y, 0, -1).astype(np.complex128)
             else:
-                y_array = np.zeros((s[0], s[1], p))
-            for i in range(p):
-                y_array[:, :, i] = y[i]
+                y_array = np.moveaxis(y, 0, -1).astype(np.float64)
         else:
             raise Exception(
                 "Functional outputs of dimension >2 are not yet handled.")
@@ -156,9 +200,10 @@ class FDGradient(object):
         self.__scheme.set_x(x)
         self.__scheme.generate_samples()
 
-        dy_array = np.zeros((len(self.__scheme.get_samples()), len(x)))
-        for i, x in enumerate(self.__scheme.get_samples()):
-            dy_array[i, :] = self.__dfpointer(x)
+        dy = self.__evaluate('df', self.__scheme.get_samples())
+        dy_array = np.zeros((len(dy), len(x)))
+        for i, dy_i in enumerate(dy):
+            dy_array[i, :] = dy_i
         return self.__scheme.compute_hessian(dy_array)
 
     def vect_hess_f(self, x, nb_func):
@@ -173,10 +218,11 @@ class FDGradient(object):
         self.__scheme.set_x(x)
         self.__scheme.generate_samples()
 
+        dy = self.__evaluate('df', self.__scheme.get_samples())
         dy_array_list = np.zeros(
-            (nb_func, len(self.__scheme.get_samples()), len(x)))
-        for i, x in enumerate(self.__scheme.get_samples()):
-            dy_array_list[:, i, :] = self.__dfpointer(x)
+            (nb_func, len(dy), len(x)))
+        for i, dy_i in enumerate(dy):
+            dy_array_list[:, i, :] = dy_i
 
         H_list = [
             self.__scheme.compute_hessian(dy_array_list[f, :, :])
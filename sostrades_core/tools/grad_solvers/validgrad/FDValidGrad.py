@@ -82,7 +82,11 @@ class FDValidGrad(object):
             df_fd : optional finite differences gradient output
             df: optional analytical gradient output
         """
-        df_fd = self.compute_fd_grad(x, args)
+        try:
+            df_fd = self.compute_fd_grad(x, args)
+        finally:
+            # the workers keep the f_pointer of their start, a new pool is started for the next comparison
+            self.__fd_grad.close_pool()
 
         if args is None:
             df = self.__df_pointer(x)
@@ -14,12 +14,14 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
-import plotly.graph_objects as go
-
 from sostrades_core.tools.post_processing.charts.two_axes_chart_template import (
     SeriesTemplate,
     TwoAxesChartTemplate,
 )
+from sostrades_core.tools.post_processing.post_processing_plotly_json import (
+    create_plotly_figure,
+    get_plotly_figure_dict,
+)
 from sostrades_core.tools.post_processing.post_processing_tools import (
     escape_str_with_comma,
 )
@@ -68,7 +70,19 @@ class TwoAxesInstanciatedChart(TwoAxesChartTemplate):
         :return plotly.graph_objects.go instance
         """
 
-        fig = go.Figure()
+        return create_plotly_figure(*self.__get_plotly_traces_and_layout(logger))
+
+    def __get_plotly_traces_and_layout(self, logger=None):
+        """
+        Build the plotly traces and layout properties of current instance
+
+        :param logger: logging object to log message
+        :type logger: Logging.logger
+
+        :return list of (trace type, trace properties), layout properties
+        """
+
+        traces = []
 
         # -- Series and cumulative surface management
 
@@ -129,86 +143,86 @@ class TwoAxesInstanciatedChart(TwoAxesChartTemplate):
             if self.cumulative_surface and \
                     (cumulative_surface_value == TwoAxesInstanciatedChart.CUMULATIVE_TO_ZERO_Y or cumulative_surface_value == TwoAxesInstanciatedChart.CUMULATIVE_TO_NEXT_Y):
 
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name, visible=True if serie.visible else 'legendonly',
-                                         fill=cumulative_surface_value, text=serie.text))
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name, visible=True if serie.visible else 'legendonly',
+                                         fill=cumulative_surface_value, text=serie.text)))
 
                 if cumulative_surface_value == TwoAxesInstanciatedChart.CUMULATIVE_TO_ZERO_Y:
                     cumulative_surface_value = TwoAxesInstanciatedChart.CUMULATIVE_TO_NEXT_Y
 
             elif serie.display_type == InstanciatedSeries.SCATTER_DISPLAY:
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                          marker_symbol=serie.marker_symbol, mode='markers',
                                          marker=serie.marker, yaxis=serie.y_axis,
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.BAR_DISPLAY:
-                fig.add_trace(go.Bar(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('bar', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                      orientation=self.bar_orientation,
                                      visible=True if serie.visible else 'legendonly', yaxis=serie.y_axis,
                                      marker=serie.marker if serie.marker is not None else {},
-                                     text=serie.text))
+                                     text=serie.text)))
             elif serie.display_type == InstanciatedSeries.LINES_DISPLAY:
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         mode='lines', yaxis=serie.y_axis, line=serie.line,
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.LINES_DISPLAY_WITH_MARKERS:
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         marker_symbol=serie.marker_symbol, mode='lines+markers',
                                          marker=serie.marker, line=serie.line, yaxis=serie.y_axis,
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.DASH_LINES_DISPLAY:
                 line = {'dash': 'dash'}
                 if serie.line is not None:
                    line.update(serie.line)
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         mode='lines', yaxis=serie.y_axis, line=line,
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.DASH_LINES_DISPLAY_WITH_MARKERS:
                 line = {'dash': 'dash'}
                 if serie.line is not None:
                    line.update(serie.line)
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         marker_symbol=serie.marker_symbol, mode='lines+markers',
                                          marker=serie.marker, yaxis=serie.y_axis, line=line,
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.DASH_DOT_LINES_DISPLAY:
                 line = {'dash': 'dashdot'}
                 if serie.line is not None:
                    line.update(serie.line)
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         mode='lines', yaxis=serie.y_axis, line=line,
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.DASH_DOT_LINES_DISPLAY_WITH_MARKERS:
                 line = {'dash': 'dashdot'}
                 if serie.line is not None:
                     line.update(serie.line)
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         marker_symbol=serie.marker_symbol, mode='lines+markers',
                                          marker=serie.marker, yaxis=serie.y_axis, line={'dash': 'dashdot'},
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.DOT_LINES_DISPLAY:
                 line = {'dash': 'dot'}
                 if serie.line is not None:
                     line.update(serie.line)
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         mode='lines', yaxis=serie.y_axis, line=line,
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
             elif serie.display_type == InstanciatedSeries.DOT_LINES_DISPLAY_WITH_MARKERS:
                 line = {'dash': 'dot'}
                 if serie.line is not None:
                     line.update(serie.line)
-                fig.add_trace(go.Scatter(x=abscissa, y=cumulated_values, name=serie.series_name,
+                traces.append(('scatter', dict(x=abscissa, y=cumulated_values, name=serie.series_name,
                                         marker_symbol=serie.marker_symbol, mode='lines+markers',
                                          marker=serie.marker, yaxis=serie.y_axis, line={'dash': 'dot'},
                                          visible=True if serie.visible else 'legendonly',
-                                         text=serie.text))
+                                         text=serie.text)))
 
         # -- Annotations management
         chart_annotations = []
@@ -234,7 +248,7 @@ class TwoAxesInstanciatedChart(TwoAxesChartTemplate):
         yaxis.update({'title': self.primary_ordinate_axis_name})
         yaxis.update({'automargin': True})
         if self.y_axis_log:
-            fig.update_yaxes(type='log')
+            yaxis.update({'type': 'log'})
 
         yaxis2 = {}
         if len(self.secondary_ordinate_axis_range) > 0:
@@ -264,9 +278,7 @@ class TwoAxesInstanciatedChart(TwoAxesChartTemplate):
         if len(chart_annotations) > 0:
             layout.update({'annotations': chart_annotations})
 
-        fig.update_layout(layout)
-
-        return fig
+        return traces, layout
 
     def __to_csv(self):
         global_list = []
@@ -306,14 +318,20 @@ class TwoAxesInstanciatedChart(TwoAxesChartTemplate):
 
         self.set_csv_data(csv_list)
 
-    def to_plotly_dict(self, logger=None):
+    def to_plotly_dict(self, logger=None, direct=False):
         """
          Method that convert current instance to plotly object and then to a dictionary
 
         :param logger: logger instance
         :type logger: Logging.loger
+
+        :param direct: whether to write the dictionary without building the plotly object (no template section)
+        :type direct: bool
         """
-        json = self.to_plotly(logger).to_dict()
+        if direct:
+            json = get_plotly_figure_dict(*self.__get_plotly_traces_and_layout(logger), direct=True)
+        else:
+            json = self.to_plotly(logger).to_dict()
 
         if self._plot_csv_data is None:
             self.__to_csv()
@@ -15,8 +15,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 
-import plotly.graph_objects as go
-
+from sostrades_core.tools.post_processing.post_processing_plotly_json import (
+    create_plotly_figure,
+    get_plotly_figure_dict,
+)
 from sostrades_core.tools.post_processing.post_processing_plotly_tooling import (
     AbstractPostProcessingPlotlyTooling,
 )
@@ -87,9 +89,14 @@ class InstanciatedPieChart(AbstractPostProcessingPlotlyTooling):
 
         @return plotly.graph_objects.go instance
         """
-        pie_chart = go.Pie(labels=self.labels, values=self.values, sort=False)
+        return create_plotly_figure(*self.__get_plotly_traces_and_layout())
+
+    def __get_plotly_traces_and_layout(self):
+        """ Build the plotly traces and layout properties of current instance
 
-        fig = go.Figure(data=[pie_chart])
+        @return list of (trace type, trace properties), layout properties
+        """
+        pie_chart = ('pie', {'labels': self.labels, 'values': self.values, 'sort': False})
 
         # -- Annotations management
         chart_annotations = []
@@ -114,9 +121,7 @@ class InstanciatedPieChart(AbstractPostProcessingPlotlyTooling):
         layout.update({'font': self.get_default_font_layout()})
         layout.update({'annotations': chart_annotations})
 
-        fig.update_layout(layout)
-
-        return fig
+        return [pie_chart], layout
 
     def __to_csv(self):
         label_text_list = [escape_str_with_comma(
@@ -128,13 +133,19 @@ class InstanciatedPieChart(AbstractPostProcessingPlotlyTooling):
 
         self.set_csv_data(csv_list)
 
-    def to_plotly_dict(self, logger=None):
+    def to_plotly_dict(self, logger=None, direct=False):
         """ Method that convert current instance to plotly object and then to a dictionary
 
         @param logger: logger instance
         @type Logging.loger
+
+        @param direct: whether to write the dictionary without building the plotly object (no template section)
+        @type bool
         """
-        json = self.to_plotly(logger).to_dict()
+        if direct:
+            json = get_plotly_figure_dict(*self.__get_plotly_traces_and_layout(), direct=True)
+        else:
+            json = self.to_plotly(logger).to_dict()
 
         if self._plot_csv_data is None:
             self.__to_csv()
@@ -16,23 +16,39 @@ limitations under the License.
 '''
 import importlib
 import inspect
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from hashlib import blake2b
 from os.path import dirname, isfile, join
 
 from sostrades_core.execution_engine.data_manager import DataManager
 from sostrades_core.execution_engine.proxy_discipline_gather import (
     ProxyDisciplineGather,
 )
+from sostrades_core.tools.post_processing.charts.two_axes_instanciated_chart import (
+    TwoAxesInstanciatedChart,
+)
 from sostrades_core.tools.post_processing.pareto_front_optimal_charts.instanciated_pareto_front_optimal_chart import (
     InstantiatedParetoFrontOptimalChart,
 )
+from sostrades_core.tools.post_processing.pie_charts.instanciated_pie_chart import (
+    InstanciatedPieChart,
+)
 from sostrades_core.tools.post_processing.post_processing_bundle import (
     PostProcessingBundle,
 )
+from sostrades_core.tools.post_processing.tables.instanciated_table import (
+    InstanciatedTable,
+)
+from sostrades_core.tools.value_fingerprint import update_hasher
 
 """
 Factory for post processing (2 axes chart, pie chart, table)
 """
 
+# post processings whose json can be written without building their plotly objects
+DIRECT_JSON_POST_PROCESSINGS = (TwoAxesInstanciatedChart, InstanciatedPieChart, InstanciatedTable)
+
 
 class PostProcessingFactory:
     """ Class that centralized extraction of post processsing information from discipline
@@ -45,10 +61,29 @@ class PostProcessingFactory:
     NAMESPACED_POST_PROCESSING = 'namespaced_post_processing'
     NAMESPACED_POST_PROCESSING_NAME = 'Data'
 
-    def get_all_post_processings(self, execution_engine, filters_only, as_json=True, for_test=False):
+    def __init__(self, direct_json=False):
+        """ Constructor
+
+        @param direct_json: whether to write the json of the charts and tables supporting it without building their
+            plotly objects
+        @type bool
+        """
+        self.direct_json = direct_json
+        # (discipline full name, module) -> (digest of the discipline values and filters, json post processings)
+        self.__json_post_processings = {}
+
+    def clear_cache(self):
+        """ Remove the json post processings memoized for the disciplines
+        """
+        self.__json_post_processings = {}
+
+    def get_all_post_processings(self, execution_engine, filters_only, as_json=True, for_test=False, max_workers=1):
         """ Extract all post processing filters that are defined into the execution engine
             (using discipline and post processing manager)
 
+            The json post processings of a discipline are memoized by the factory and generated again only if the
+            values of the discipline inputs and outputs or the filters changed.
+
             :params: execution_engine, execution engine that hold post processing data
             :type: ExecutionEngine
 
@@ -63,6 +98,9 @@ class PostProcessingFactory:
             :params: for_test: specify if it is for test purpose
             :type: boolean
 
+            :params: max_workers: maximal number of processes converting the post processings into json
+            :type: int
+
             :returns: Dictionary {namespace: PostProcessingBundle[]}
 
         """
@@ -70,28 +108,26 @@ class PostProcessingFactory:
         logger = execution_engine.logger.getChild("PostProcessing")
         execution_engine.clean_unused_namespaces()
         all_post_processings_bundle = {}
+        # (discipline label, module) -> bundle
+        bundles_by_name = {}
+        # post processings to convert into json once generated for all the disciplines and namespaces:
+        # (bundle, index of the first post processing in the bundle, post processings, logger, memoization key, digest)
+        post_processings_to_convert = []
 
         # Manage disciplines
         for value in execution_engine.dm.disciplines_dict.values():
 
             discipline = value[DataManager.DISC_REF]
-            discipline_full_name = discipline.get_disc_full_name()
             discipline_label = discipline.get_disc_label()
+            discipline_module = discipline.get_module()
 
-            if discipline_full_name not in all_post_processings_bundle:
-                all_post_processings_bundle[discipline_label] = []
-
-            found_bundles = list(
-                filter(lambda b: b.name == discipline.get_module(), all_post_processings_bundle[discipline_label]))
-
-            current_bundle = None
-            if len(found_bundles) == 0:
+            current_bundle = bundles_by_name.get((discipline_label, discipline_module))
+            if current_bundle is None:
                 current_bundle = PostProcessingBundle(
-                    discipline.get_module(), discipline_label, [], [])
-                all_post_processings_bundle[discipline_label].append(
+                    discipline_module, discipline_label, [], [])
+                all_post_processings_bundle.setdefault(discipline_label, []).append(
                     current_bundle)
-            else:
-                current_bundle = found_bundles[0]
+                bundles_by_name[(discipline_label, discipline_module)] = current_bundle
 
             # Extract filters
             filters = self.get_post_processing_filters_by_discipline(
@@ -101,11 +137,22 @@ class PostProcessingFactory:
 
             # If filters only is False then generate associated post processing
             if not filters_only:
-                post_processings = self.get_post_processing_by_discipline(
-                    discipline, filters, as_json, for_test=for_test)
+                cache_key = digest = json_objects = None
+                if as_json:
+                    cache_key, digest, json_objects = self.__get_memoized_json_post_processings(discipline, filters)
 
-                if post_processings and len(post_processings) > 0:
-                    current_bundle.post_processings.extend(post_processings)
+                if json_objects is not None:
+                    current_bundle.post_processings.extend(json_objects)
+                else:
+                    post_processings = self.get_post_processing_by_discipline(
+                        discipline, filters, as_json=False, for_test=for_test)
+                    if as_json:
+                        post_processings_to_convert.append(
+                            (current_bundle, len(current_bundle.post_processings), post_processings,
+                             discipline.logger.getChild("PostProcessing"), cache_key, digest))
+
+                    if post_processings and len(post_processings) > 0:
+                        current_bundle.post_processings.extend(post_processings)
 
         # Manage filters from post processing manager (namespace filter)
         for namespace_name, post_processings in execution_engine.post_processing_manager.namespace_post_processing.items():
@@ -148,13 +195,33 @@ class PostProcessingFactory:
                             execution_engine, associated_namespace.value, filters)
 
                         if as_json:
-                            generated_post_processings = self.__convert_post_processing_into_json(
-                                generated_post_processings, logger=logger)
+                            post_processings_to_convert.append(
+                                (current_bundle, len(current_bundle.post_processings), generated_post_processings,
+                                 logger, None, None))
 
                         if generated_post_processings and len(generated_post_processings) > 0:
                             current_bundle.post_processings.extend(
                                 generated_post_processings)
 
+        # Convert the post processings into json, on a process pool as the conversion is cpu bound
+        if len(post_processings_to_convert) > 0:
+            post_processings_list = [item[2] for item in post_processings_to_convert]
+            loggers = [item[3] for item in post_processings_to_convert]
+            if max_workers > 1 and len(post_processings_list) > 1:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    json_objects_list = list(executor.map(
+                        convert_post_processings_into_json, post_processings_list, loggers,
+                        [self.direct_json] * len(post_processings_list), chunksize=max(1, len(post_processings_list) // (4 * max_workers))))
+            else:
+                json_objects_list = list(map(convert_post_processings_into_json, post_processings_list, loggers,
+                                             [self.direct_json] * len(post_processings_list)))
+
+            for (bundle, start, post_processings, _, cache_key, digest), json_objects in zip(
+                    post_processings_to_convert, json_objects_list):
+                bundle.post_processings[start:start + len(post_processings)] = json_objects
+                if digest is not None:
+                    self.__json_post_processings[cache_key] = (digest, deepcopy(json_objects))
+
         key_to_delete = []
         # Remove disctionary key without any post processing bundle
         for key, value in all_post_processings_bundle.items():
@@ -278,7 +345,7 @@ class PostProcessingFactory:
                 if results and len(results) > 0:
                     if as_json:
                         all_post_processings.extend(
-                            self.__convert_post_processing_into_json(results))
+                            convert_post_processings_into_json(results, direct=self.direct_json))
                     else:
                         all_post_processings.extend(results)
 
@@ -367,6 +434,11 @@ class PostProcessingFactory:
         # Initialize logger for the discipline
         logger = discipline.logger.getChild("PostProcessing")
 
+        if as_json:
+            cache_key, digest, json_objects = self.__get_memoized_json_post_processings(discipline, filters)
+            if json_objects is not None:
+                return json_objects
+
         post_processing_results = []
 
         ###############################################################
@@ -446,39 +518,91 @@ class PostProcessingFactory:
                     raise Exception(e)
 
         if as_json:
-            json_objects = self.__convert_post_processing_into_json(
-                post_processing_results, logger=logger)
+            json_objects = convert_post_processings_into_json(
+                post_processing_results, logger=logger, direct=self.direct_json)
+            if digest is not None:
+                self.__json_post_processings[cache_key] = (digest, deepcopy(json_objects))
 
             return json_objects
 
         return post_processing_results
 
-    def __convert_post_processing_into_json(self, post_processings, logger=None):
-        """ Manage to get plotly object into post processing object and convert it into
-        json with the removing of the template section
+    def __get_memoized_json_post_processings(self, discipline, filters):
+        """ Retrieve the json post processings memoized for a discipline if its values and the filters are unchanged
+
+        @param discipline: discipline whose post processings are generated
+        @type ProxyDiscipline
+
+        @param filters: filters applied to the post processing generation
+        @type ChartFilter[]
 
-        @param post_processings: post processing object to convert
-        @type sostrades_core.tools.post_processing.*
+        @return memoization key, digest of the discipline values and filters and json post processings or None
+        """
+        cache_key = (discipline.get_disc_full_name(), discipline.get_module())
+        digest = self.__get_discipline_values_digest(discipline, filters)
+        if digest is not None and cache_key in self.__json_post_processings:
+            cached_digest, json_objects = self.__json_post_processings[cache_key]
+            if cached_digest == digest:
+                return cache_key, digest, deepcopy(json_objects)
+        return cache_key, digest, None
+
+    @staticmethod
+    def __get_discipline_values_digest(discipline, filters):
+        """ Compute the digest of the values of the inputs and outputs of a discipline and of the post processing filters
+
+        @param discipline: discipline whose post processings are generated
+        @type ProxyDiscipline
 
-        @param logger: logger instance
-        @type Logging.logger
+        @param filters: filters applied to the post processing generation
+        @type ChartFilter[]
 
-        @return json object list
+        @return digest, None if a value cannot be hashed
         """
+        hasher = blake2b(digest_size=16)
+        try:
+            for io_type in (discipline.IO_TYPE_IN, discipline.IO_TYPE_OUT):
+                for var_full_name in sorted(discipline.get_data_io_with_full_name(io_type)):
+                    update_hasher(hasher, var_full_name)
+                    update_hasher(hasher, discipline.dm.get_value(var_full_name))
+            update_hasher(hasher, filters)
+        except Exception:
+            return None
+        return hasher.digest()
+
 
-        json_objects = []
+def convert_post_processings_into_json(post_processings, logger=None, direct=False):
+    """ Manage to get plotly object into post processing object and convert it into
+    json with the removing of the template section
 
-        for post_processing in post_processings:
+    @param post_processings: post processing object to convert
+    @type sostrades_core.tools.post_processing.*
+
+    @param logger: logger instance
+    @type Logging.logger
+
+    @param direct: whether to write the json of the charts and tables supporting it without building their plotly
+        objects
+    @type bool
+
+    @return json object list
+    """
+
+    json_objects = []
+
+    for post_processing in post_processings:
+        if direct and isinstance(post_processing, DIRECT_JSON_POST_PROCESSINGS):
+            json_object = post_processing.to_plotly_dict(logger, direct=True)
+        else:
             json_object = post_processing.to_plotly_dict(logger)
 
-            if isinstance(post_processing, InstantiatedParetoFrontOptimalChart):
-                json_object['is_pareto_trade_chart'] = True
-            else:
-                json_object['is_pareto_trade_chart'] = False
+        if isinstance(post_processing, InstantiatedParetoFrontOptimalChart):
+            json_object['is_pareto_trade_chart'] = True
+        else:
+            json_object['is_pareto_trade_chart'] = False
 
-            if 'template' in json_object['layout']:
-                json_object['layout'].pop('template', None)
+        if 'template' in json_object['layout']:
+            json_object['layout'].pop('template', None)
 
-            json_objects.append(json_object)
+        json_objects.append(json_object)
 
-        return json_objects
+    return json_objects
@@ -0,0 +1,226 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import numpy as np
+import plotly.graph_objects as go
+
+"""
+mode: python; py-indent-offset: 4; tab-width: 4; coding: utf-8
+Conversion of the traces and layout properties of the post processings into plotly json
+"""
+
+PLOTLY_TRACES_CLASSES = {'scatter': go.Scatter, 'bar': go.Bar, 'pie': go.Pie, 'table': go.Table}
+
+NATIVE_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class PlotlyJsonException(Exception):
+    """ Raised when a property value is not supported by the direct plotly json conversion
+    """
+
+
+def create_plotly_figure(traces, layout):
+    """ Create the plotly figure of traces and layout properties
+
+    @param traces: trace type ('scatter', 'bar', 'pie' or 'table') and properties of each trace
+    @type list of (str, dict)
+
+    @param layout: layout properties
+    @type dict
+
+    @return plotly.graph_objects.Figure instance
+    """
+    fig = go.Figure()
+    for trace_type, trace_properties in traces:
+        fig.add_trace(PLOTLY_TRACES_CLASSES[trace_type](**trace_properties))
+    fig.update_layout(layout)
+
+    return fig
+
+
+def get_plotly_figure_dict(traces, layout, direct=False):
+    """ Return the plotly dictionary of traces and layout properties
+
+    The plotly figure is built and validated then converted into a dictionary, unless direct is True: the
+    dictionary is then written directly from the properties, as the one of the figure without its template
+    section. The values are not validated and the figure is still built if a property is not supported.
+
+    @param traces: trace type ('scatter', 'bar', 'pie' or 'table') and properties of each trace
+    @type list of (str, dict)
+
+    @param layout: layout properties
+    @type dict
+
+    @param direct: whether to write the dictionary without building the plotly figure
+    @type bool
+
+    @return dict with 'data' and 'layout' keys
+    """
+    if direct:
+        try:
+            return {'data': [_convert_trace(trace_type, trace_properties)
+                             for trace_type, trace_properties in traces],
+                    'layout': _convert_compound(layout, LAYOUT_PROPERTIES) or {}}
+        except PlotlyJsonException:
+            figure_dict = create_plotly_figure(traces, layout).to_dict()
+            figure_dict['layout'].pop('template', None)
+            return figure_dict
+
+    return create_plotly_figure(traces, layout).to_dict()
+
+
+def _convert_trace(trace_type, trace_properties):
+    trace = {'type': trace_type}
+    trace.update(_convert_compound(trace_properties, TRACES_PROPERTIES[trace_type]) or {})
+    marker_symbol = trace_properties.get('marker_symbol')
+    if marker_symbol is not None:
+        # marker_symbol overrides the symbol of the marker property as for plotly magic underscores
+        trace.setdefault('marker', {})['symbol'] = _convert_scalar(marker_symbol)
+
+    return trace
+
+
+def _convert_compound(properties, properties_converters):
+    # None values and empty compound properties are omitted, as in the plotly dictionaries
+    if not isinstance(properties, dict):
+        raise PlotlyJsonException(f'{properties!r} is not a dictionary of properties')
+    result = {}
+    for name, value in properties.items():
+        if value is None:
+            continue
+        if name not in properties_converters:
+            raise PlotlyJsonException(f'Unsupported property {name}')
+        converter = properties_converters[name]
+        if isinstance(converter, dict):
+            value = _convert_compound(value, converter)
+        elif converter is not None:
+            value = converter(value)
+        else:
+            # properties handled by the caller
+            continue
+        if value is not None:
+            result[name] = value
+
+    return result if result else None
+
+
+def _convert_scalar(value):
+    if type(value) in NATIVE_SCALAR_TYPES:
+        return value
+    raise PlotlyJsonException(f'Unsupported value {value!r}')
+
+
+def _convert_string(value):
+    # non-strict plotly strings convert numbers into strings
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return str(value)
+    raise PlotlyJsonException(f'Unsupported string {value!r}')
+
+
+def _convert_string_array(value):
+    if isinstance(value, (list, tuple)):
+        return [element if element is None or isinstance(element, str) else str(element) for element in value]
+    return _convert_string(value)
+
+
+def _convert_data_array(values):
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+        return values.tolist()
+    if isinstance(values, (list, tuple)):
+        if all(type(value) in NATIVE_SCALAR_TYPES for value in values):
+            return list(values)
+        return [_convert_data_array_element(value) for value in values]
+    raise PlotlyJsonException(f'Unsupported data array {type(values)}')
+
+
+def _convert_data_array_element(value):
+    if type(value) in NATIVE_SCALAR_TYPES:
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return _convert_data_array(value)
+
+
+def _convert_scalar_or_array(value):
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return _convert_data_array(value)
+    return _convert_scalar(value)
+
+
+def _convert_subplot_id(value):
+    if isinstance(value, str) and value.startswith('y'):
+        suffix = value[1:]
+        if suffix in ('', '1'):
+            return 'y'
+        if suffix.isdigit() and not suffix.startswith('0'):
+            return value
+    raise PlotlyJsonException(f'Unsupported subplot id {value!r}')
+
+
+def _convert_annotations(annotations):
+    if not isinstance(annotations, (list, tuple)):
+        raise PlotlyJsonException(f'Unsupported annotations {annotations!r}')
+    result = [_convert_compound(annotation, ANNOTATION_PROPERTIES) or {} for annotation in annotations]
+
+    return result if result else None
+
+
+def _convert_title(title):
+    if isinstance(title, dict):
+        return _convert_compound(title, TITLE_PROPERTIES)
+    return {'text': _convert_string(title)}
+
+
+# Supported properties of the traces and of the layout, with the conversion of their values
+LINE_PROPERTIES = {'color': _convert_scalar, 'width': _convert_scalar, 'dash': _convert_scalar,
+                   'shape': _convert_scalar}
+MARKER_PROPERTIES = {'color': _convert_scalar, 'size': _convert_scalar, 'symbol': _convert_scalar,
+                     'opacity': _convert_scalar,
+                     'line': {'color': _convert_scalar, 'width': _convert_scalar}}
+FONT_PROPERTIES = {'family': _convert_scalar, 'size': _convert_scalar, 'color': _convert_scalar}
+TABLE_CELLS_PROPERTIES = {'values': _convert_data_array, 'align': _convert_scalar,
+                          'line': {'color': _convert_scalar, 'width': _convert_scalar},
+                          'fill': {'color': _convert_scalar_or_array},
+                          'font': {'family': _convert_scalar, 'size': _convert_scalar,
+                                   'color': _convert_scalar_or_array}}
+TRACES_PROPERTIES = {
+    'scatter': {'x': _convert_data_array, 'y': _convert_data_array, 'name': _convert_string,
+                'visible': _convert_scalar, 'fill': _convert_scalar, 'text': _convert_string_array,
+                'mode': _convert_scalar, 'marker_symbol': None, 'marker': MARKER_PROPERTIES,
+                'line': LINE_PROPERTIES, 'yaxis': _convert_subplot_id},
+    'bar': {'x': _convert_data_array, 'y': _convert_data_array, 'name': _convert_string,
+            'visible': _convert_scalar, 'text': _convert_string_array, 'orientation': _convert_scalar,
+            'marker': MARKER_PROPERTIES, 'yaxis': _convert_subplot_id},
+    'pie': {'labels': _convert_data_array, 'values': _convert_data_array, 'sort': _convert_scalar},
+    'table': {'header': TABLE_CELLS_PROPERTIES, 'cells': TABLE_CELLS_PROPERTIES},
+}
+TITLE_PROPERTIES = {'text': _convert_string, 'x': _convert_scalar, 'y': _convert_scalar,
+                    'xanchor': _convert_scalar, 'yanchor': _convert_scalar}
+AXIS_PROPERTIES = {'range': _convert_data_array, 'title': _convert_title, 'automargin': _convert_scalar,
+                   'type': _convert_scalar, 'anchor': _convert_scalar, 'overlaying': _convert_scalar,
+                   'side': _convert_scalar}
+ANNOTATION_PROPERTIES = {'text': _convert_string, 'align': _convert_scalar, 'showarrow': _convert_scalar,
+                         'xref': _convert_scalar, 'yref': _convert_scalar, 'x': _convert_scalar,
+                         'y': _convert_scalar, 'bordercolor': _convert_scalar, 'borderwidth': _convert_scalar}
+LAYOUT_PROPERTIES = {'barmode': _convert_scalar, 'title': _convert_title, 'xaxis': AXIS_PROPERTIES,
+                     'yaxis': AXIS_PROPERTIES, 'yaxis2': AXIS_PROPERTIES, 'width': _convert_scalar,
+                     'height': _convert_scalar, 'autosize': _convert_scalar, 'showlegend': _convert_scalar,
+                     'plot_bgcolor': _convert_scalar,
+                     'legend': {'orientation': _convert_scalar, 'xanchor': _convert_scalar,
+                                'yanchor': _convert_scalar, 'bgcolor': _convert_scalar,
+                                'bordercolor': _convert_scalar, 'x': _convert_scalar, 'y': _convert_scalar},
+                     'font': FONT_PROPERTIES, 'annotations': _convert_annotations}
@@ -18,8 +18,11 @@ limitations under the License.
 from copy import deepcopy
 
 import pandas as pd
-import plotly.graph_objects as go
 
+from sostrades_core.tools.post_processing.post_processing_plotly_json import (
+    create_plotly_figure,
+    get_plotly_figure_dict,
+)
 from sostrades_core.tools.post_processing.post_processing_plotly_tooling import (
     AbstractPostProcessingPlotlyTooling,
 )
@@ -107,6 +110,16 @@ class InstanciatedTable(AbstractPostProcessingPlotlyTooling):
         @return plotly.graph_objects.go instance
         """
 
+        traces_and_layout = self.__get_plotly_traces_and_layout()
+        if traces_and_layout is not None:
+            return create_plotly_figure(*traces_and_layout)
+
+    def __get_plotly_traces_and_layout(self):
+        """ Build the plotly traces and layout properties of current instance
+
+        @return list of (trace type, trace properties), layout properties, None if the table has no cells
+        """
+
         default_font_color = 'black'
         default_background_color = 'white'
         row_colors = []
@@ -158,19 +171,16 @@ class InstanciatedTable(AbstractPostProcessingPlotlyTooling):
             if len(upper_right_annotations.keys()) > 0:
                 chart_annotations.append(upper_right_annotations)
 
-            table = go.Table(header=header, cells=cells)
-
-            fig = go.Figure(data=[table])
+            table = ('table', {'header': header, 'cells': cells})
 
-            fig.update_layout(
-                title_text=self.table_name,
-                plot_bgcolor='rgba(228, 222, 249, 0.65)',
-                showlegend=False,
-                autosize=True,
-                height=number_of_rows * 30 + 250,
-                annotations=chart_annotations)
+            layout = {'title': {'text': self.table_name},
+                      'plot_bgcolor': 'rgba(228, 222, 249, 0.65)',
+                      'showlegend': False,
+                      'autosize': True,
+                      'height': number_of_rows * 30 + 250,
+                      'annotations': chart_annotations}
 
-            return fig
+            return [table], layout
 
     @staticmethod
     def from_pd_df(table_name: str, df: pd.DataFrame):
@@ -195,13 +205,19 @@ class InstanciatedTable(AbstractPostProcessingPlotlyTooling):
 
         self.set_csv_data(csv_list)
 
-    def to_plotly_dict(self, logger=None):
+    def to_plotly_dict(self, logger=None, direct=False):
         """ Method that convert current instance to plotly object and then to a dictionary
 
         @param logger: logger instance
         @type Logging.loger
+
+        @param direct: whether to write the dictionary without building the plotly object (no template section)
+        @type bool
         """
-        json = self.to_plotly(logger).to_dict()
+        if direct:
+            json = get_plotly_figure_dict(*self.__get_plotly_traces_and_layout(), direct=True)
+        else:
+            json = self.to_plotly(logger).to_dict()
 
         if self._plot_csv_data is None:
             self.__to_csv()
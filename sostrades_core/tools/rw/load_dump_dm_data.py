@@ -14,10 +14,20 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
-from pickle import UnpicklingError
+import io
+import os
+import weakref
+from collections.abc import Mapping
+from glob import escape as glob_escape
+from glob import glob
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler, UnpicklingError
+from pickle import dump as pkl_dump
 from pickle import dumps as pkl_dumps
+from pickle import load as pkl_load
 from pickle import loads as pkl_loads
+from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 from Crypto.Cipher import AES, PKCS1_OAEP
 from Crypto.Protocol.KDF import PBKDF2
@@ -45,8 +55,46 @@ class AbstractLoadDump:
     def dump(self, dict_obj, f_name):
         raise NotImplementedError()
 
+    def load_cache(self, f_name):
+        """
+        Load the cache map of a study
+        """
+        return self.load(f_name)
+
+    def dump_cache(self, cache_map, f_name):
+        """
+        Dump the cache map of a study, a mapping whose values may be computed at their access
+        """
+        cache_dict = dict(cache_map.items())
+        StreamingCacheMap.detach_from_file(f_name)
+        self.dump(cache_dict, f_name)
+
+
+class StreamingCacheDumpMixin:
+    """
+    Load and dump of the cache map with StreamingCacheLoadDump for the strategies without encryption, the cache files
+    written with the previous whole pickle format can still be loaded
+    """
+
+    def load_cache(self, f_name):
+        if StreamingCacheLoadDump.is_streaming_cache_file(f_name):
+            return StreamingCacheLoadDump().load(f_name)
+        return super().load_cache(f_name)
+
+    def dump_cache(self, cache_map, f_name):
+        StreamingCacheLoadDump().dump(cache_map, f_name)
+
 
 class DirectLoadDump(AbstractLoadDump):
+    '''
+    Load and dump of the study data and of the cache map as whole pickles, the format that every version reads.
+    The cache files written by StreamingCacheLoadDump can still be loaded.
+    '''
+
+    def load_cache(self, f_name):
+        if StreamingCacheLoadDump.is_streaming_cache_file(f_name):
+            return StreamingCacheLoadDump().load(f_name)
+        return super().load_cache(f_name)
 
     def load(self, f_name):
         with open(f_name, 'rb') as d_s:
@@ -67,6 +115,401 @@ class DirectLoadDump(AbstractLoadDump):
             pd.to_pickle(dict_obj, d_s)
 
 
+class StreamingCacheDirectLoadDump(StreamingCacheDumpMixin, DirectLoadDump):
+    '''
+    Load and dump of the study data as whole pickles, and of the cache map one cache entry at a time with
+    StreamingCacheLoadDump. The cache files are not readable by the versions that do not have StreamingCacheLoadDump.
+    '''
+
+
+class _ArrayContainerPickler(Pickler):
+    """
+    Pickler that writes the buffer of the numerical arrays (alone or in DataFrame blocks) into a binary container
+    instead of the pickle stream, the pickle only keeps a reference (offset, dtype, shape, order) to the buffer
+    """
+
+    def __init__(self, file, container, min_nbytes):
+        super().__init__(file, protocol=HIGHEST_PROTOCOL)
+        self.container = container
+        self.min_nbytes = min_nbytes
+
+    def persistent_id(self, obj):
+        if type(obj) not in (np.ndarray, np.memmap) or obj.dtype.hasobject or obj.nbytes < self.min_nbytes:
+            return None
+        order = 'F' if obj.flags.f_contiguous and not obj.flags.c_contiguous else 'C'
+        offset = self.container.tell()
+        padding = -offset % ColumnarLoadDump.ALIGNMENT
+        if padding:
+            self.container.write(b'\0' * padding)
+            offset += padding
+        self.container.write(obj.tobytes(order=order))
+        return 'ndarray', offset, obj.dtype.str, obj.shape, order
+
+
+class _ArrayContainerUnpickler(Unpickler):
+    """
+    Unpickler that rebuilds the arrays stored in the binary container as copy-on-write views of the memory-mapped
+    container: the values read are loaded from the disk only when they are accessed, and they can be modified
+    without altering the file
+    """
+
+    def __init__(self, file, container_map):
+        super().__init__(file)
+        self.container_map = container_map
+
+    def persistent_load(self, pid):
+        kind, offset, dtype, shape, order = pid
+        if kind != 'ndarray':
+            raise UnpicklingError(f'Unknown persistent object {kind}')
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self.container_map, offset=offset, order=order)
+
+
+class LazyLoadedDict(Mapping):
+    """
+    Read-only dict of the variables loaded by ColumnarLoadDump, each variable is unpickled at its first access
+    """
+
+    def __init__(self, pickled_values, container_file):
+        self.__pickled_values = pickled_values
+        # the container is mapped at the load, so that the loaded values remain valid if the container file is removed
+        # by a next dump, the pages of the container are read only when they are accessed
+        if os.path.getsize(container_file) == 0:
+            # no array in the container, np.memmap cannot map an empty file
+            self.__container_map = np.empty(0, dtype=np.uint8)
+        else:
+            self.__container_map = np.memmap(container_file, dtype=np.uint8, mode='c')
+        self.__loaded_values = {}
+
+    def __getitem__(self, key):
+        if key not in self.__loaded_values:
+            pickled_value = self.__pickled_values[key]
+            self.__loaded_values[key] = _ArrayContainerUnpickler(io.BytesIO(pickled_value), self.__container_map).load()
+        return self.__loaded_values[key]
+
+    def __iter__(self):
+        return iter(self.__pickled_values)
+
+    def __len__(self):
+        return len(self.__pickled_values)
+
+    def __contains__(self, key):
+        return key in self.__pickled_values
+
+    def to_dict(self):
+        """
+        Load all the variables into a dict
+        """
+        return {key: self[key] for key in self}
+
+
+class ColumnarLoadDump(StreamingCacheDumpMixin, AbstractLoadDump):
+    '''
+    Load and dump of the study data with the buffers of the numerical arrays and DataFrame blocks stored in a
+    memory-mapped binary container (f_name + '.<version>.data', a new version at each dump) next to a small pickled
+    index of the variables (f_name).
+    The loaded dict is a LazyLoadedDict, a variable is read only when it is accessed, and of its arrays only the pages
+    actually used are read from the disk.
+    '''
+    container_suffix = '.data'
+    index_format = 'columnar_load_dump'
+    index_version = 1
+    # offset alignment of the arrays in the container
+    ALIGNMENT = 64
+
+    def __init__(self, min_nbytes=1024):
+        """
+        Constructor
+
+        Arguments:
+            min_nbytes (int): minimal size in bytes of an array to store it in the container, the smaller arrays are
+                kept in the pickled index
+        """
+        self.min_nbytes = min_nbytes
+
+    def get_container_file(self, f_name):
+        """
+        Return the binary container of the arrays of the variables dumped in an index file
+
+        Arguments:
+            f_name (str): the index file written by dump
+
+        Returns:
+            str: the path of the container file
+        """
+        return os.path.join(os.path.dirname(f_name), self.__load_index(f_name)['container'])
+
+    def __load_index(self, f_name):
+        with open(f_name, 'rb') as index_s:
+            try:
+                index = pkl_load(index_s)
+            except (UnpicklingError, UnicodeDecodeError, ValueError, EOFError):
+                raise LoadDumpException('columnar', 'loading')
+        if not isinstance(index, dict) or index.get('format') != self.index_format:
+            raise LoadDumpException('columnar', 'loading')
+        return index
+
+    def load(self, f_name):
+        index = self.__load_index(f_name)
+        container_file = os.path.join(os.path.dirname(f_name), index['container'])
+        if not os.path.isfile(container_file):
+            raise LoadDumpException('columnar', 'loading')
+        return LazyLoadedDict(index['variables'], container_file)
+
+    def dump(self, dict_obj, f_name):
+        # each dump writes a new container, named after a unique version, then replaces the index: the arrays of a
+        # previous load keep mapping the previous container, which is never replaced while it may be mapped
+        container_file = f'{f_name}.{uuid4().hex}{self.container_suffix}'
+        tmp_index_file = str(f_name) + '.tmp'
+        pickled_values = {}
+        with open(container_file, 'wb') as container_s:
+            for key, value in dict_obj.items():
+                pickle_s = io.BytesIO()
+                _ArrayContainerPickler(pickle_s, container_s, self.min_nbytes).dump(value)
+                pickled_values[key] = pickle_s.getvalue()
+        index = {'format': self.index_format,
+                 'version': self.index_version,
+                 'container': os.path.basename(container_file),
+                 'variables': pickled_values}
+        with open(tmp_index_file, 'wb') as index_s:
+            pkl_dump(index, index_s, protocol=HIGHEST_PROTOCOL)
+        os.replace(tmp_index_file, f_name)
+        self.__remove_previous_containers(f_name, container_file)
+
+    def __remove_previous_containers(self, f_name, container_file):
+        # the containers of the previous dumps, and the unversioned container of the dumps of the previous versions
+        previous_container_files = glob(f'{glob_escape(str(f_name))}.{"[0-9a-f]" * 32}{self.container_suffix}')
+        previous_container_files.append(str(f_name) + self.container_suffix)
+        for previous_container_file in previous_container_files:
+            if previous_container_file == container_file or not os.path.isfile(previous_container_file):
+                continue
+            try:
+                os.remove(previous_container_file)
+            except OSError:
+                # still memory-mapped by a previous load (on Windows), it is removed by a next dump
+                pass
+
+
+class LazyConvertedCacheMap(Mapping):
+    """
+    Read-only cache map whose variable names are converted (anonymized or unanonymized) at the access to the cache of
+    a discipline: the caches of the disciplines that are not accessed are neither converted nor loaded, and each
+    variable name is converted only once.
+    The values of the cache map are dicts {index: {'inputs': {name: value}, 'outputs': {name: value},
+    'jacobian': {output name: {input name: value}}}}.
+    """
+
+    CACHE_TYPES = ('inputs', 'outputs', 'jacobian')
+
+    def __init__(self, cache_map, key_converter):
+        """
+        Constructor
+
+        Arguments:
+            cache_map (Mapping): the cache map to convert, with GEMSEO caches (iterables of cache entries with
+                inputs, outputs and jacobian attributes) or serialized caches as values
+            key_converter (Callable[[str], str]): the conversion of the variable names
+        """
+        self.__cache_map = cache_map
+        self.__key_converter = key_converter
+        self.__converted_keys = {}
+
+    def __reduce__(self):
+        # the cache map is pickled with its converted values, as the dict built previously
+        return dict, ({disc_id: self[disc_id] for disc_id in self},)
+
+    def __convert_key(self, key):
+        converted_key = self.__converted_keys.get(key)
+        if converted_key is None:
+            converted_key = self.__converted_keys[key] = self.__key_converter(key)
+        return converted_key
+
+    def __convert_dict(self, dict_to_convert):
+        return {self.__convert_key(key): value for key, value in dict_to_convert.items()}
+
+    def __getitem__(self, disc_id):
+        cache = self.__cache_map[disc_id]
+        if isinstance(cache, dict):
+            entries = cache.items()
+        else:
+            # GEMSEO cache, its entries are numbered from 1
+            entries = enumerate(({cache_type: getattr(entry, cache_type) for cache_type in self.CACHE_TYPES}
+                                 for entry in cache), start=1)
+        return {index: {'inputs': self.__convert_dict(entry['inputs']),
+                        'outputs': self.__convert_dict(entry['outputs']),
+                        'jacobian': {self.__convert_key(key): self.__convert_dict(value)
+                                     for key, value in entry['jacobian'].items()}}
+                for index, entry in entries}
+
+    def __iter__(self):
+        return iter(self.__cache_map)
+
+    def __len__(self):
+        return len(self.__cache_map)
+
+    def __contains__(self, disc_id):
+        return disc_id in self.__cache_map
+
+
+class StreamingCacheMap(Mapping):
+    """
+    Read-only cache map loaded by StreamingCacheLoadDump, the cache entries of a discipline are read from the file
+    only when the discipline is accessed. The file is opened at each access and is not kept open.
+    """
+
+    # the cache maps still in use, so that those reading a file are not invalidated by a new dump of this file
+    __loaded_cache_maps = weakref.WeakValueDictionary()
+
+    def __init__(self, f_name, variable_names, offsets):
+        """
+        Constructor
+
+        Arguments:
+            f_name (str): the cache file
+            variable_names (list[str]): the table of the variable names referred to by their index in the entries
+            offsets (dict): the discipline ids and the offsets of their entries in the file
+        """
+        self.__f_name = os.path.abspath(f_name)
+        self.__variable_names = variable_names
+        self.__offsets = offsets
+        # the cache entries of the disciplines once the map has been detached from its file
+        self.__detached_cache_map = None
+        StreamingCacheMap.__loaded_cache_maps[id(self)] = self
+
+    def __reduce__(self):
+        # the cache map is pickled with its values, as the dict loaded from the previous format
+        return dict, ({disc_id: self[disc_id] for disc_id in self},)
+
+    def __decode_dict(self, encoded_dict):
+        return {self.__variable_names[key_index]: value for key_index, value in encoded_dict}
+
+    def __getitem__(self, disc_id):
+        if self.__detached_cache_map is not None:
+            return self.__detached_cache_map[disc_id]
+        serialized_cache = {}
+        with open(self.__f_name, 'rb') as cache_file:
+            for offset in self.__offsets[disc_id]:
+                cache_file.seek(offset)
+                index, inputs, outputs, jacobian = pkl_load(cache_file)
+                serialized_cache[index] = {
+                    'inputs': self.__decode_dict(inputs),
+                    'outputs': self.__decode_dict(outputs),
+                    'jacobian': {self.__variable_names[key_index]: self.__decode_dict(value)
+                                 for key_index, value in jacobian}}
+        return serialized_cache
+
+    def __iter__(self):
+        return iter(self.__offsets)
+
+    def __len__(self):
+        return len(self.__offsets)
+
+    def __contains__(self, disc_id):
+        return disc_id in self.__offsets
+
+    def set_file(self, f_name, variable_names, offsets):
+        """
+        Read the cache entries from another file, written with the same entries
+
+        Arguments:
+            f_name (str): the cache file
+            variable_names (list[str]): the table of the variable names referred to by their index in the entries
+            offsets (dict): the discipline ids and the offsets of their entries in the file
+        """
+        self.__f_name = os.path.abspath(f_name)
+        self.__variable_names = variable_names
+        self.__offsets = offsets
+        self.__detached_cache_map = None
+
+    @classmethod
+    def detach_from_file(cls, f_name, excluded_cache_map=None):
+        """
+        Load all the entries of the cache maps reading a file, so that they remain valid when the file is replaced
+
+        Arguments:
+            f_name (str): the cache file
+            excluded_cache_map (Mapping): a cache map not to detach
+        """
+        f_name = os.path.abspath(f_name)
+        for cache_map in list(cls.__loaded_cache_maps.values()):
+            if cache_map is not excluded_cache_map and cache_map.__f_name == f_name and \
+                    cache_map.__detached_cache_map is None:
+                cache_map.__detached_cache_map = {disc_id: cache_map[disc_id] for disc_id in cache_map}
+
+
+class StreamingCacheLoadDump(AbstractLoadDump):
+    """
+    Load and dump of a cache map one cache entry at a time: the entries are appended to the file as soon as they are
+    computed, with the variable names replaced by their index in a table of names stored once at the end of the
+    file with the offsets of the entries of each discipline. The loaded cache map is a StreamingCacheMap that reads
+    the entries of a discipline at its access.
+    """
+
+    MAGIC = b'SOSCACHE'
+    index_format = 'streaming_cache'
+    index_version = 1
+    # size of the offset of the index written at the end of the file
+    OFFSET_SIZE = 8
+
+    @classmethod
+    def is_streaming_cache_file(cls, f_name):
+        """
+        Whether a file has been written by StreamingCacheLoadDump
+        """
+        with open(f_name, 'rb') as cache_file:
+            return cache_file.read(len(cls.MAGIC)) == cls.MAGIC
+
+    def load(self, f_name):
+        with open(f_name, 'rb') as cache_file:
+            if cache_file.read(len(self.MAGIC)) != self.MAGIC:
+                raise LoadDumpException('streaming cache', 'loading')
+            try:
+                cache_file.seek(-self.OFFSET_SIZE, os.SEEK_END)
+                cache_file.seek(int.from_bytes(cache_file.read(self.OFFSET_SIZE), 'little'))
+                index = pkl_load(cache_file)
+            except (OSError, UnpicklingError, EOFError, ValueError):
+                raise LoadDumpException('streaming cache', 'loading')
+        if not isinstance(index, dict) or index.get('format') != self.index_format:
+            raise LoadDumpException('streaming cache', 'loading')
+        return StreamingCacheMap(f_name, index['variables'], index['disciplines'])
+
+    def dump(self, dict_obj, f_name):
+        """
+        Write a cache map whose values are computed one discipline at a time, the mapping
+        {index: {'inputs': {name: value}, 'outputs': {name: value}, 'jacobian': {output name: {input name: value}}}}
+        of a discipline is released once its entries are written
+        """
+        variable_indices = {}
+
+        def encode_dict(dict_to_encode):
+            return [(variable_indices.setdefault(key, len(variable_indices)), value)
+                    for key, value in dict_to_encode.items()]
+
+        # write into a temporary file then replace the previous one, the cache map dumped may be read from it
+        tmp_f_name = str(f_name) + '.tmp'
+        offsets = {}
+        with open(tmp_f_name, 'wb') as cache_file:
+            cache_file.write(self.MAGIC)
+            for disc_id in dict_obj:
+                disc_offsets = offsets[disc_id] = []
+                for index, entry in dict_obj[disc_id].items():
+                    disc_offsets.append(cache_file.tell())
+                    pkl_dump((index, encode_dict(entry['inputs']), encode_dict(entry['outputs']),
+                              [(variable_indices.setdefault(key, len(variable_indices)), encode_dict(value))
+                               for key, value in entry.get('jacobian', {}).items()]),
+                             cache_file, protocol=HIGHEST_PROTOCOL)
+            index_offset = cache_file.tell()
+            pkl_dump({'format': self.index_format,
+                      'version': self.index_version,
+                      'variables': list(variable_indices),
+                      'disciplines': offsets}, cache_file, protocol=HIGHEST_PROTOCOL)
+            cache_file.write(index_offset.to_bytes(self.OFFSET_SIZE, 'little'))
+        StreamingCacheMap.detach_from_file(f_name, excluded_cache_map=dict_obj)
+        os.replace(tmp_f_name, f_name)
+        if isinstance(dict_obj, StreamingCacheMap):
+            # the dumped cache map now reads the entries it has written in the new file
+            dict_obj.set_file(f_name, list(variable_indices), offsets)
+
+
 class CryptedLoadDump(AbstractLoadDump):
     '''
     Encryption feature to securise load and dump of exported study data
@@ -22,7 +22,7 @@ from io import BytesIO, StringIO
 from pathlib import Path
 from shutil import make_archive
 from tempfile import gettempdir
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from numpy import ndarray
 from pandas import DataFrame, concat, read_pickle
@@ -31,6 +31,9 @@ from sostrades_core.execution_engine.ns_manager import NS_SEP
 from sostrades_core.tools.folder_operations import makedirs_safe, rmtree_safe
 from sostrades_core.tools.rw.load_dump_dm_data import AbstractLoadDump, DirectLoadDump
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 """
 mode: python; py-indent-offset: 4; tab-width: 4; coding: utf-8
 Data manager pickle (de)serializer
@@ -201,7 +204,7 @@ class DataSerializer:
 
         rw_strategy.dump(status_dict, status_dict_f)
 
-    def load_cache_dict(self, study_to_load: Path | str, rw_strategy: AbstractLoadDump) -> dict[str, Any] | None:
+    def load_cache_dict(self, study_to_load: Path | str, rw_strategy: AbstractLoadDump) -> Mapping[str, Any] | None:
         """Load disciplines cache from binary file (containing disc/status info into dictionary).
 
         Args:
@@ -212,7 +215,7 @@ class DataSerializer:
             The discipline cache dictionary, or None if no cache pickle file is found.
         """
         cache_dict_f = self.get_dm_file(study_to_load=study_to_load, file_type=self.cache_filename)
-        return rw_strategy.load(cache_dict_f) if cache_dict_f is not None else None
+        return rw_strategy.load_cache(cache_dict_f) if cache_dict_f is not None else None
 
     def load_disc_status_dict(self, study_to_load: Path | str, rw_strategy: AbstractLoadDump):
         """Load disciplines status from binary file (containing disc/status info into dictionary).
@@ -287,30 +290,31 @@ class DataSerializer:
         """
         loaded_dict = rw_strategy.load(self.dm_pkl_file)
 
-        def is_variable_wo_studyname_exists(var, a_d):
-            """Check if variable exists in data dict
-            by ignoring the study name, i.e. the first element splitted by .
-            """
-            key_wo_st = strip_study_from_namespace(var)
-            no_study_keys = [strip_study_from_namespace(k) for k in a_d]
-            return key_wo_st in no_study_keys
-
-        current_st_n = None
-        loaded_st_n = None
-        if not just_return_data_dict:
-            current_st_n = get_study_from_namespace(next(iter(data_dict.keys())))
-            loaded_st_n = get_study_from_namespace(next(iter(loaded_dict.keys())))
-        for param_id, param_dict in loaded_dict.items():
-            if just_return_data_dict or is_variable_wo_studyname_exists(param_id, data_dict):
-                if current_st_n != loaded_st_n:
-                    param_id = param_id.replace(loaded_st_n, current_st_n)
-                if just_return_data_dict:
-                    data_dict[param_id] = {}
+        if just_return_data_dict:
+            for param_id, param_dict in loaded_dict.items():
+                data_dict[param_id] = {}
                 data_dict[param_id].update(param_dict)
-            else:
+            return
+
+        current_st_n = get_study_from_namespace(next(iter(data_dict.keys())))
+        loaded_st_n = get_study_from_namespace(next(iter(loaded_dict.keys())))
+        # variables of data_dict by name without study, built once to check the existence of each loaded variable
+        # by ignoring the study name, i.e. the first element splitted by .
+        no_study_keys = None
+        loaded_st_prefix = loaded_st_n + NS_SEP
+        for param_id, param_dict in loaded_dict.items():
+            if current_st_n != loaded_st_n and param_id.startswith(loaded_st_prefix):
+                # rename the study at the beginning of the variable name only
+                param_id = current_st_n + param_id[len(loaded_st_n) :]
+            if param_id not in data_dict:
+                if no_study_keys is None:
+                    no_study_keys = {strip_study_from_namespace(k): k for k in data_dict}
                 sp_var = strip_study_from_namespace(param_id)
-                msg = f"Variable {sp_var} does not exist into {data_dict.keys()}"
-                raise KeyError(msg)
+                if sp_var not in no_study_keys:
+                    msg = f"Variable {sp_var} does not exist into {data_dict.keys()}"
+                    raise KeyError(msg)
+                param_id = no_study_keys[sp_var]
+            data_dict[param_id].update(param_dict)
 
     def get_dm_file(self, study_to_load: Path | str, file_type: str | None = None) -> Path | None:
         """Return the path of the file containing data for a given study.
@@ -389,7 +393,7 @@ class DataSerializer:
         # Serialise raw tree_node.data dict with pickle
         rw_strategy.dump(data_dict, self.dm_pkl_file)
 
-    def put_cache_from_study(self, study_to_load: Path | str, rw_strategy: AbstractLoadDump, cache_map: dict[str, Any]):
+    def put_cache_from_study(self, study_to_load: Path | str, rw_strategy: AbstractLoadDump, cache_map: Mapping[str, Any]):
         """Write a cache to a pickle file.
 
         Args:
@@ -404,8 +408,8 @@ class DataSerializer:
         # Export full cache_map to unique pickle file
         self.cache_file = study_to_load / self.cache_filename
 
-        # Serialise raw cache_map with pickle
-        rw_strategy.dump(cache_map, self.cache_file)
+        # Serialise cache_map, entry by entry for the strategies without encryption
+        rw_strategy.dump_cache(cache_map, self.cache_file)
 
     def get_dict_from_study(self, study_to_load: Path | str, rw_strategy: AbstractLoadDump) -> dict[str, Any]:
         """Load a pickle file from a location and return a dictionary updated with loaded info.
@@ -0,0 +1,217 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+
+from __future__ import annotations
+
+import pickle
+from copy import deepcopy
+from hashlib import blake2b
+from typing import Any
+
+from numpy import array, ascontiguousarray, bool_, generic, int64, ndarray, number
+from pandas import DataFrame, Index, RangeIndex, Series
+from pandas.api.types import infer_dtype
+
+from sostrades_core.tools.compare_data_manager_tooling import dict_are_equal
+
+# immutable values that are their own fingerprint
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+class _NotFingerprintable(Exception):
+    """Raised when a value contains an object whose content cannot be hashed."""
+
+
+class ValueFingerprint:
+    """
+    Fingerprint of a value that is not an immutable scalar.
+
+    It holds a content digest of the value (ndarray buffers, DataFrame columns, nested dicts, lists and tuples) or, if
+    the value contains an object that cannot be hashed, a deepcopy of the value compared with dict_are_equal.
+    """
+
+    __slots__ = ('digest', 'reference')
+
+    def __init__(self, digest: bytes | None = None, reference: Any = None):
+        """
+        Args:
+            digest: The content digest of the value.
+            reference: The deepcopy of the value if it cannot be hashed.
+        """
+        self.digest = digest
+        self.reference = reference
+
+    def matches(self, value: Any) -> bool:
+        """Whether the value has the same content as the fingerprinted value.
+
+        Args:
+            value: The value to compare.
+
+        Returns:
+            Whether the value is unchanged.
+        """
+        if self.digest is None:
+            return dict_are_equal({'value': self.reference}, {'value': value})
+        try:
+            return self.digest == _compute_digest(value)
+        except _NotFingerprintable:
+            return False
+
+    def __repr__(self):
+        if self.digest is None:
+            return f'{self.__class__.__name__}(reference={self.reference!r})'
+        return f'{self.__class__.__name__}(digest={self.digest.hex()})'
+
+
+def compute_fingerprint(value: Any) -> Any:
+    """Compute the fingerprint of a value to detect later changes with fingerprint_matches.
+
+    Immutable scalars are their own fingerprint, other values get a ValueFingerprint.
+
+    Args:
+        value: The value to fingerprint.
+
+    Returns:
+        The fingerprint of the value.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    try:
+        return ValueFingerprint(digest=_compute_digest(value))
+    except _NotFingerprintable:
+        return ValueFingerprint(reference=deepcopy(value))
+
+
+def fingerprint_matches(fingerprint: Any, value: Any) -> bool:
+    """Whether a value is unchanged with respect to a fingerprint computed with compute_fingerprint.
+
+    Args:
+        fingerprint: The fingerprint of the reference value.
+        value: The value to compare.
+
+    Returns:
+        Whether the value is unchanged.
+    """
+    if isinstance(fingerprint, ValueFingerprint):
+        return fingerprint.matches(value)
+    if not isinstance(value, _SCALAR_TYPES):
+        return False
+    # same equality as the comparison of the values, identity first to consider a NaN equal to itself
+    return fingerprint is value or fingerprint == value
+
+
+def update_hasher(hasher: Any, value: Any, type_strict: bool = False) -> None:
+    """Update a hash object with the content digest of a value, stable from a process to another.
+
+    A value that contains an object that cannot be hashed is hashed on its pickle.
+
+    Args:
+        hasher: The hash object to update.
+        value: The value to hash.
+        type_strict: Whether the numbers that are equal but of different types (True, 1, 1.0, numpy.int64(1)...)
+            get different digests, otherwise they get the same digest as their comparison does not see a change.
+    """
+    try:
+        digest = _compute_digest(value, type_strict)
+    except _NotFingerprintable:
+        digest = blake2b(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).digest()
+    hasher.update(digest)
+
+
+def _compute_digest(value: Any, type_strict: bool = False) -> bytes:
+    hasher = blake2b(digest_size=16)
+    _update_hasher(hasher, value, type_strict)
+    return hasher.digest()
+
+
+def _update_hasher(hasher, value: Any, type_strict: bool = False) -> None:  # noqa: C901
+    if value is None:
+        hasher.update(b'None;')
+    elif type_strict and isinstance(value, (bool, int, float, complex, number, bool_)):
+        hasher.update(f'number:{type(value).__module__}.{type(value).__qualname__}:{value!r};'.encode())
+    elif isinstance(value, (bool, int, float, complex)):
+        hasher.update(f'number:{_normalize_number(value)!r};'.encode())
+    elif isinstance(value, str):
+        hasher.update(b'str:%d:' % len(value))
+        hasher.update(value.encode('utf-8', 'surrogatepass'))
+    elif isinstance(value, bytes):
+        hasher.update(b'bytes:%d:' % len(value))
+        hasher.update(value)
+    elif isinstance(value, generic):
+        _update_hasher(hasher, value.item())
+    elif isinstance(value, ndarray):
+        hasher.update(f'ndarray:{value.dtype.str}:{value.shape};'.encode())
+        if value.dtype.hasobject:
+            elements = value.ravel().tolist()
+            if infer_dtype(elements, skipna=False) == 'string':
+                # arrays of strings are hashed at once on the lengths and the bytes of the strings
+                encoded_elements = [element.encode('utf-8', 'surrogatepass') for element in elements]
+                hasher.update(b'strings:')
+                hasher.update(array([len(element) for element in encoded_elements], dtype=int64).data)
+                hasher.update(b''.join(encoded_elements))
+            else:
+                for element in elements:
+                    _update_hasher(hasher, element, type_strict)
+        else:
+            hasher.update(ascontiguousarray(value).data)
+    elif isinstance(value, DataFrame):
+        hasher.update(b'dataframe:')
+        _update_hasher_with_index(hasher, value.columns, type_strict)
+        _update_hasher_with_index(hasher, value.index, type_strict)
+        for i_column in range(value.shape[1]):
+            _update_hasher(hasher, value.iloc[:, i_column].to_numpy(), type_strict)
+    elif isinstance(value, Series):
+        hasher.update(f'series:{value.name!r}:'.encode())
+        _update_hasher_with_index(hasher, value.index, type_strict)
+        _update_hasher(hasher, value.to_numpy(), type_strict)
+    elif isinstance(value, Index):
+        _update_hasher_with_index(hasher, value, type_strict)
+    elif isinstance(value, dict):
+        # the equality of dicts does not depend on the order of the keys
+        item_digests = []
+        for key, item in value.items():
+            item_hasher = blake2b(digest_size=16)
+            _update_hasher(item_hasher, key, type_strict)
+            _update_hasher(item_hasher, item, type_strict)
+            item_digests.append(item_hasher.digest())
+        hasher.update(b'dict:%d:' % len(item_digests))
+        for item_digest in sorted(item_digests):
+            hasher.update(item_digest)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'%s:%d:' % (type(value).__name__.encode(), len(value)))
+        for element in value:
+            _update_hasher(hasher, element, type_strict)
+    else:
+        raise _NotFingerprintable(type(value))
+
+
+def _normalize_number(value: bool | int | float | complex) -> int | float | complex:
+    # numbers that are equal get the same digest (True, 1, 1.0 and 1+0j), as their comparison does not see a change
+    if isinstance(value, complex):
+        if value.imag != 0:
+            return value
+        value = value.real
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    return int(value)
+
+
+def _update_hasher_with_index(hasher, index: Index, type_strict: bool = False) -> None:
+    if isinstance(index, RangeIndex):
+        hasher.update(f'range_index:{index.start}:{index.stop}:{index.step}:{index.name!r};'.encode())
+    else:
+        hasher.update(f'index:{list(index.names)!r}:'.encode())
+        _update_hasher(hasher, index.to_numpy(), type_strict)